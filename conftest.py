@@ -0,0 +1,11 @@
+import pytest
+from budget.repositories.category_cache import incoming_categories, revenue_categories
+
+
+@pytest.fixture(autouse=True)
+def clear_category_caches():
+    # Rolling back a test transaction sends no signals, so the cached categories of one
+    # test would otherwise leak into the next.
+    yield
+    incoming_categories.clear()
+    revenue_categories.clear()
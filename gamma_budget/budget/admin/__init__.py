@@ -1,5 +1,9 @@
 from .alert import *
+from .alert_delivery import *
 from .category import *
 from .incoming import *
+from .job import *
 from .limit import *
 from .revenue import *
+from .rollup import *
+from .scheduled_run import *
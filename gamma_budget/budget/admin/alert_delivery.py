@@ -0,0 +1,38 @@
+from typing import ClassVar
+
+from budget.models.alert_delivery import AlertDelivery
+from django.contrib import admin
+
+
+class AlertDeliveryAdmin(admin.ModelAdmin):
+    """Alert delivery admin class."""
+
+    list_display: ClassVar[list[str]] = [
+        "id",
+        "alert",
+        "alert_date",
+        "status",
+        "attempts",
+        "sent_at",
+    ]
+    list_filter: ClassVar[list[str]] = [
+        "alert_date",
+        "status",
+    ]
+    search_fields: ClassVar[list[str]] = [
+        "alert__user_email",
+    ]
+    ordering: ClassVar[list[str]] = [
+        "-alert_date",
+    ]
+    readonly_fields: ClassVar[list[str]] = [
+        "id",
+        "attempts",
+        "claim_token",
+        "claimed_until",
+        "sent_at",
+        "last_error",
+    ]
+
+
+admin.site.register(AlertDelivery, AlertDeliveryAdmin)
@@ -1,20 +1,26 @@
 from typing import ClassVar
 
+from budget.admin.rollup import RollupAdminMixin
 from budget.models import Incoming
+from budget.repositories.rollup import INCOMING_ROLLUP_FIELDS, incoming_rollup
 from django.contrib import admin
 
 
-class IncomingAdmin(admin.ModelAdmin):
+class IncomingAdmin(RollupAdminMixin, admin.ModelAdmin):
     """Admin interface for the Incoming model.
 
     Attributes:
     ----------
+        rollup (Callable[..., Any]): Builds the rollup change of a record.
+        rollup_fields (tuple[str, ...]): The fields passed to ``rollup`` after the user ID.
         list_display (list[str]): Fields to display in the list view.
         list_filter (list[str]): Fields to filter by in the list view.
         search_fields (list[str]): Fields to search by in the list view.
         ordering (list[str]): Default ordering for the list view.
     """
 
+    rollup = staticmethod(incoming_rollup)
+    rollup_fields = INCOMING_ROLLUP_FIELDS
     list_display: ClassVar[list[str]] = [
         "id",
         "user_id",
@@ -0,0 +1,39 @@
+from typing import ClassVar
+
+from budget.models.job import Job
+from django.contrib import admin
+
+
+class JobAdmin(admin.ModelAdmin):
+    """Job admin class."""
+
+    list_display: ClassVar[list[str]] = [
+        "id",
+        "kind",
+        "status",
+        "attempts",
+        "run_after",
+        "created_at",
+    ]
+    list_filter: ClassVar[list[str]] = [
+        "kind",
+        "status",
+    ]
+    search_fields: ClassVar[list[str]] = [
+        "id",
+    ]
+    ordering: ClassVar[list[str]] = [
+        "-created_at",
+    ]
+    readonly_fields: ClassVar[list[str]] = [
+        "id",
+        "attempts",
+        "locked_until",
+        "result",
+        "last_error",
+        "created_at",
+        "finished_at",
+    ]
+
+
+admin.site.register(Job, JobAdmin)
@@ -1,14 +1,18 @@
 from typing import ClassVar
 
+from budget.admin.rollup import RollupAdminMixin
 from budget.models import Revenue
+from budget.repositories.rollup import REVENUE_ROLLUP_FIELDS, revenue_rollup
 from django.contrib import admin
 
 
-class RevenueAdmin(admin.ModelAdmin):
+class RevenueAdmin(RollupAdminMixin, admin.ModelAdmin):
     """Admin interface for the Revenue model.
 
     Attributes:
     ----------
+        rollup (Callable[..., Any]): Builds the rollup change of a record.
+        rollup_fields (tuple[str, ...]): The fields passed to ``rollup`` after the user ID.
         readonly_fields (list[str]): Fields that are read-only in the admin interface.
         list_display (list[str]): Fields to display in the list view.
         list_filter (list[str]): Fields to filter by in the list view.
@@ -16,6 +20,8 @@ class RevenueAdmin(admin.ModelAdmin):
         ordering (list[str]): Default ordering for the list view.
     """
 
+    rollup = staticmethod(revenue_rollup)
+    rollup_fields = REVENUE_ROLLUP_FIELDS
     readonly_fields: ClassVar[list[str]] = [
         "id",
     ]
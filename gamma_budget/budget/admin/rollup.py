@@ -0,0 +1,84 @@
+from collections.abc import Callable
+from typing import Any, ClassVar
+
+from budget.models.rollup import MonthlyRollup
+from budget.repositories.rollup import apply_rollup_deltas
+from django.contrib import admin
+from django.db import transaction
+
+
+class RollupAdminMixin:
+    """Keep the monthly rollups in sync with the changes made in the admin.
+
+    The repositories update the rollups next to every write, but the admin saves and
+    deletes the models directly. The previous values are read before the change and
+    the difference is applied in the same transaction.
+
+    Attributes:
+    ----------
+        rollup (Callable[..., Any]): Builds the rollup change of a record, such as ``staticmethod(incoming_rollup)``.
+        rollup_fields (tuple[str, ...]): The fields passed to ``rollup`` after the user ID.
+    """
+
+    rollup: Callable[..., Any]
+    rollup_fields: tuple[str, ...]
+
+    def _rollup_values(self, queryset):
+        return list(queryset.values_list("user_id", *self.rollup_fields))
+
+    def save_model(self, request, obj, form, change):
+        """Save the record and move its amount between the rollups."""
+        with transaction.atomic():
+            previous = self._rollup_values(type(obj).objects.filter(pk=obj.pk)) if change else []
+            super().save_model(request, obj, form, change)
+            current = (obj.user_id, *(getattr(obj, field) for field in self.rollup_fields))
+            apply_rollup_deltas(*(self.rollup(*values, sign=-1) for values in previous), self.rollup(*current))
+
+    def delete_model(self, request, obj):
+        """Delete the record and remove its amount from the rollups."""
+        with transaction.atomic():
+            previous = self._rollup_values(type(obj).objects.filter(pk=obj.pk))
+            super().delete_model(request, obj)
+            apply_rollup_deltas(*(self.rollup(*values, sign=-1) for values in previous))
+
+    def delete_queryset(self, request, queryset):
+        """Delete the selected records and remove their amounts from the rollups."""
+        with transaction.atomic():
+            previous = self._rollup_values(queryset)
+            super().delete_queryset(request, queryset)
+            apply_rollup_deltas(*(self.rollup(*values, sign=-1) for values in previous))
+
+
+class MonthlyRollupAdmin(admin.ModelAdmin):
+    """Monthly rollup admin class."""
+
+    list_display: ClassVar[list[str]] = [
+        "user_id",
+        "month",
+        "category_id",
+        "incomings",
+        "revenues_paid",
+        "revenues_unpaid",
+    ]
+    list_filter: ClassVar[list[str]] = [
+        "month",
+    ]
+    search_fields: ClassVar[list[str]] = [
+        "user_id",
+    ]
+    ordering: ClassVar[list[str]] = [
+        "user_id",
+        "month",
+    ]
+    readonly_fields: ClassVar[list[str]] = [
+        "id",
+        "user_id",
+        "month",
+        "category_id",
+        "incomings",
+        "revenues_paid",
+        "revenues_unpaid",
+    ]
+
+
+admin.site.register(MonthlyRollup, MonthlyRollupAdmin)
@@ -0,0 +1,33 @@
+from typing import ClassVar
+
+from budget.models.scheduled_run import ScheduledRun
+from django.contrib import admin
+
+
+class ScheduledRunAdmin(admin.ModelAdmin):
+    """Scheduled run admin class."""
+
+    list_display: ClassVar[list[str]] = [
+        "name",
+        "scheduled_for",
+        "status",
+        "started_at",
+        "finished_at",
+    ]
+    list_filter: ClassVar[list[str]] = [
+        "name",
+        "status",
+    ]
+    ordering: ClassVar[list[str]] = [
+        "-scheduled_for",
+    ]
+    readonly_fields: ClassVar[list[str]] = [
+        "id",
+        "started_at",
+        "finished_at",
+        "result",
+        "error",
+    ]
+
+
+admin.site.register(ScheduledRun, ScheduledRunAdmin)
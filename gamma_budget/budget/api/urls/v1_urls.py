@@ -11,6 +11,21 @@ urlpatterns = [
         include("budget.api.v1.urls.revenue"),
         name="revenue",
     ),
+    path(
+        "export/",
+        include("budget.api.v1.urls.export"),
+        name="export",
+    ),
+    path(
+        "forecast/",
+        include("budget.api.v1.urls.forecast"),
+        name="forecast",
+    ),
+    path(
+        "installment/",
+        include("budget.api.v1.urls.installment"),
+        name="installment",
+    ),
     path(
         "limit/",
         include("budget.api.v1.urls.limit"),
@@ -21,4 +36,29 @@ urlpatterns = [
         include("budget.api.v1.urls.alert"),
         name="alert",
     ),
+    path(
+        "recurring/",
+        include("budget.api.v1.urls.recurring"),
+        name="recurring",
+    ),
+    path(
+        "statement/",
+        include("budget.api.v1.urls.statement"),
+        name="statement",
+    ),
+    path(
+        "report/",
+        include("budget.api.v1.urls.report"),
+        name="report",
+    ),
+    path(
+        "summary/",
+        include("budget.api.v1.urls.summary"),
+        name="summary",
+    ),
+    path(
+        "job/",
+        include("budget.api.v1.urls.job"),
+        name="job",
+    ),
 ]
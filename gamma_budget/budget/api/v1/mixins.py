@@ -1,6 +1,10 @@
+import hashlib
 from typing import Any
 
+from asgiref.sync import sync_to_async
 from budget.api_output import DjangoApiOutput
+from django.utils.cache import patch_cache_control
+from django.utils.http import parse_etags
 from rest_framework import status
 from rest_framework.response import Response
 
@@ -30,16 +34,19 @@ class ExecuteUseCaseOnGetMixin:
             Resposta HTTP.
         """
         try:
+            etag = self.get_etag(request, *args, **kwargs)
+            if etag and self.etag_matches(request, etag):
+                return self.not_modified_response(etag)
             uc = self.execute_use_case_retrieve(request, *args, **kwargs)
             response = uc.get_response() if hasattr(uc, "get_response") else Response(uc.data, status=status.HTTP_200_OK)
             if self.image_fields:
                 response = self.apply_domain_host_in_image_fields(request, response, *args, **kwargs)
-            if response.data is None:
+            if isinstance(response, Response) and response.data is None:
                 return Response(
                     {"detail": "object not found"},
                     status=status.HTTP_404_NOT_FOUND,
                 )
-            return response
+            return self.set_etag(response, etag)
         except self.Http400Error as e:
             print(e)
             return Response(e.args[0], status=status.HTTP_400_BAD_REQUEST)
@@ -72,6 +79,85 @@ class ExecuteUseCaseOnGetMixin:
         uc = use_case_class(**self.get_use_case_kwargs_retrieve(request, *args, **kwargs))
         return uc.execute()
 
+    def get_etag(self, request, *args, **kwargs):
+        """
+        Obtém o ETag forte da resposta sem executar o caso de uso.
+
+        O ETag é derivado da versão informada por ``get_version`` do caso de uso,
+        que é barata de consultar, junto com a URL e o formato da resposta. Casos de
+        uso sem ``get_version`` não recebem ETag.
+
+        Args:
+        ----
+            request: Objeto de solicitação HTTP.
+            *args: Argumentos posicionais adicionais.
+            **kwargs: Argumentos de palavra-chave adicionais.
+
+        Returns:
+        -------
+            O ETag entre aspas, ou None se não houver versão.
+        """
+        use_case_class = self.get_use_case_retrieve()
+        if not hasattr(use_case_class, "get_version"):
+            return None
+        output_response = self.get_use_case_output_retrieve()
+        if output_response:
+            use_case_class.output_response = output_response
+        version = use_case_class(**self.get_use_case_kwargs_retrieve(request, *args, **kwargs)).get_version()
+        if version is None:
+            return None
+        key = f"{version}|{request.get_full_path()}|{getattr(request, 'accepted_media_type', '')}"
+        return f'"{hashlib.sha256(key.encode()).hexdigest()[:32]}"'
+
+    def etag_matches(self, request, etag):
+        """
+        Verifica se o cliente já possui a resposta com o ETag informado.
+
+        Args:
+        ----
+            request: Objeto de solicitação HTTP.
+            etag: ETag da resposta atual.
+
+        Returns:
+        -------
+            True se algum ETag de ``If-None-Match`` for igual ao atual.
+        """
+        etags = parse_etags(request.headers.get("If-None-Match", ""))
+        # If-None-Match usa comparação fraca: W/"x" equivale a "x".
+        return "*" in etags or etag in (tag.removeprefix("W/") for tag in etags)
+
+    def not_modified_response(self, etag):
+        """
+        Cria a resposta 304 Not Modified, sem corpo.
+
+        Args:
+        ----
+            etag: ETag da resposta atual.
+
+        Returns:
+        -------
+            Resposta HTTP.
+        """
+        return self.set_etag(Response(status=status.HTTP_304_NOT_MODIFIED), etag)
+
+    def set_etag(self, response, etag):
+        """
+        Adiciona o ETag à resposta e pede que o cliente a revalide antes de reutilizá-la.
+
+        Args:
+        ----
+            response: Resposta HTTP.
+            etag: ETag da resposta, ou None.
+
+        Returns:
+        -------
+            Resposta HTTP.
+        """
+        if etag and response.status_code in (status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED):
+            response["ETag"] = etag
+            patch_cache_control(response, private=True, no_cache=True)
+        return response
+
     def get_use_case_retrieve(self):
         """
         Obtém a classe de caso de uso do método retrieve.
@@ -578,3 +664,201 @@ class ExecuteUseCaseOnCreateMixin:
         """Exceção para erros de solicitação HTTP 400."""
 
         pass
+
+
+class AsyncExecuteUseCaseOnGetMixin(ExecuteUseCaseOnGetMixin):
+    """Mixin para executar casos de uso assíncronos ao lidar com solicitações GET."""
+
+    async def get(self, request, *args, **kwargs):
+        """
+        Manipula solicitações GET sem bloquear o loop de eventos.
+
+        Args:
+        ----
+            request: Objeto de solicitação HTTP.
+            *args: Argumentos posicionais adicionais.
+            **kwargs: Argumentos de palavra-chave adicionais.
+
+        Returns:
+        -------
+            Resposta HTTP.
+        """
+        try:
+            etag = await sync_to_async(self.get_etag)(request, *args, **kwargs)
+            if etag and self.etag_matches(request, etag):
+                return self.not_modified_response(etag)
+            uc = await self.aexecute_use_case_retrieve(request, *args, **kwargs)
+            response = uc.get_response() if hasattr(uc, "get_response") else Response(uc.data, status=status.HTTP_200_OK)
+            if self.image_fields:
+                response = self.apply_domain_host_in_image_fields(request, response, *args, **kwargs)
+            if isinstance(response, Response) and response.data is None:
+                return Response(
+                    {"detail": "object not found"},
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+            return self.set_etag(response, etag)
+        except self.Http400Error as e:
+            return Response(e.args[0], status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            if hasattr(e, "code") and e.code < 500:
+                return Response(
+                    {"detail": e.args[0], "exception_name": e.__class__.__name__},
+                    status=e.code,
+                )
+            raise
+
+    async def aexecute_use_case_retrieve(self, request, *args, **kwargs):
+        """
+        Executa o caso de uso assíncrono do método retrieve.
+
+        Args:
+        ----
+            request: Objeto de solicitação HTTP.
+            *args: Argumentos posicionais adicionais.
+            **kwargs: Argumentos de palavra-chave adicionais.
+
+        Returns:
+        -------
+            Saída do caso de uso.
+        """
+        use_case_class = self.get_use_case_retrieve()
+        output_response = self.get_use_case_output_retrieve()
+        if output_response:
+            use_case_class.output_response = output_response
+        uc = use_case_class(**self.get_use_case_kwargs_retrieve(request, *args, **kwargs))
+        return await uc.aexecute()
+
+
+class AsyncExecuteUseCaseOnDestroyMixin(ExecuteUseCaseOnDestroyMixin):
+    """Mixin para executar casos de uso assíncronos ao lidar com solicitações DELETE."""
+
+    async def delete(self, request, *args, **kwargs):
+        """
+        Manipula solicitações DELETE sem bloquear o loop de eventos.
+
+        Args:
+        ----
+            request: Objeto de solicitação HTTP.
+            *args: Argumentos posicionais adicionais.
+            **kwargs: Argumentos de palavra-chave adicionais.
+        """
+        try:
+            uc = await self.aexecute_use_case_destroy(request, *args, **kwargs)
+            response = uc.get_response()
+            if response.data is None:
+                return Response(
+                    {"detail": "object not found"},
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+            return response
+        except self.Http400Error as e:
+            return Response(e.args[0], status=e.code)
+        except Exception as e:
+            if hasattr(e, "code") and e.code < 500:
+                return Response({"detail": e.args[0]}, status=e.code)
+            raise
+
+    async def aexecute_use_case_destroy(self, request, *args, **kwargs):
+        """
+        Executa o caso de uso assíncrono do método destroy.
+
+        Args:
+        ----
+            request: Objeto de solicitação HTTP.
+            *args: Argumentos posicionais adicionais.
+            **kwargs: Argumentos de palavra-chave adicionais.
+        """
+        use_case_class = self.get_use_case_destroy()
+        use_case_class.output_response = self.get_use_case_output_destroy()
+        uc = use_case_class(**self.get_use_case_kwargs_destroy(request, *args, **kwargs))
+        return await uc.aexecute()
+
+
+class AsyncExecuteUseCaseOnPutMixin(ExecuteUseCaseOnPutMixin):
+    """Mixin para executar casos de uso assíncronos ao lidar com solicitações PUT."""
+
+    async def put(self, request, *args, **kwargs):
+        """
+        Manipula solicitações PUT sem bloquear o loop de eventos.
+
+        Args:
+        ----
+            request: Objeto de solicitação HTTP.
+            *args: Argumentos posicionais adicionais.
+            **kwargs: Argumentos de palavra-chave adicionais.
+        """
+        self.use_case.output_response = self.use_case_output
+        try:
+            uc = await self.aexecute(request, *args, **kwargs)
+            response = uc.get_response()
+            if response.data is None:
+                return Response(
+                    {"detail": "object not found"},
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+            return response
+        except self.Http400Error as e:
+            return Response(e.args[0], status=e.code)
+        except Exception as e:
+            if hasattr(e, "code") and e.code < 500:
+                return Response({"detail": e.args[0]}, status=e.code)
+            raise
+
+    async def aexecute(self, request, *args, **kwargs):
+        """Executa o caso de uso assíncrono."""
+        uc = self.use_case(**self.get_use_case_kwargs(request, *args, **kwargs))
+        return await uc.aexecute()
+
+
+class AsyncExecuteUseCaseOnCreateMixin(ExecuteUseCaseOnCreateMixin):
+    """Mixin para executar casos de uso assíncronos ao lidar com solicitações POST."""
+
+    async def post(self, request, *args, **kwargs):
+        """
+        Manipula solicitações POST sem bloquear o loop de eventos.
+
+        A validação da serializer roda em uma thread, pois validadores podem consultar o banco.
+
+        Args:
+        ----
+            request: Objeto de solicitação HTTP.
+            *args: Argumentos posicionais adicionais.
+            **kwargs: Argumentos de palavra-chave adicionais.
+        """
+        self.serializer_instance = self.get_serializer_create()(data=request.data, context={"request": request})
+        if await sync_to_async(self.serializer_instance.is_valid)():
+            try:
+                uc = await self.aexecute_use_case_create(request, *args, data=self.serializer_instance.data, **kwargs)
+                response = uc.get_response() if hasattr(uc, "get_response") else Response(uc.data, status=status.HTTP_200_OK)
+                if response.data is None:
+                    return Response(
+                        {"detail": "object not found"},
+                        status=status.HTTP_404_NOT_FOUND,
+                    )
+                return response
+            except self.Http400Error as e:
+                return Response(e.args[0], status=e.code)
+            except Exception as e:
+                response = self.catch_error(e)
+
+                if isinstance(response, Response):
+                    return response
+                raise
+
+        return Response(self.serializer_instance.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    async def aexecute_use_case_create(self, request, data, *args, **kwargs):
+        """
+        Executa o caso de uso assíncrono do método create.
+
+        Args:
+        ----
+            request: Objeto de solicitação HTTP.
+            data: Dados.
+            *args: Argumentos posicionais adicionais.
+            **kwargs: Argumentos de palavra-chave adicionais.
+        """
+        use_case_class = self.get_use_case_create()
+        use_case_class.output_response = self.get_use_case_output_create()
+        uc = use_case_class(data=data, **self.get_use_case_kwargs_create(request, *args, **kwargs))
+        return await uc.aexecute()
@@ -0,0 +1,16 @@
+from budget.domain.entities.export import EXPORT_FORMATS
+from budget.domain.entities.statement import CSV
+from rest_framework import serializers
+
+
+class LedgerExportQuerySerializer(serializers.Serializer):
+    """Serializer for the query parameters of the ledger export.
+
+    Attributes:
+    ----------
+        file_format (ChoiceField): The format of the export: csv or ndjson.
+        gzip (BooleanField): Whether the export is compressed with gzip.
+    """
+
+    file_format = serializers.ChoiceField(choices=EXPORT_FORMATS, default=CSV)
+    gzip = serializers.BooleanField(default=False)
@@ -0,0 +1,18 @@
+from budget.domain.entities.forecast import GRANULARITIES, MONTH
+from django.conf import settings
+from rest_framework import serializers
+
+
+class ForecastQuerySerializer(serializers.Serializer):
+    """Serializer for the query parameters of the cash-flow forecast.
+
+    Attributes:
+    ----------
+        months (IntegerField): The number of months to project.
+        granularity (ChoiceField): The length of the buckets: month or day.
+        start (DateField): A day of the first month projected, defaults to today.
+    """
+
+    months = serializers.IntegerField(min_value=1, max_value=settings.FORECAST_MAX_MONTHS, default=12)
+    granularity = serializers.ChoiceField(choices=GRANULARITIES, default=MONTH)
+    start = serializers.DateField(required=False, allow_null=True)
@@ -1,4 +1,7 @@
 from budget.models import Incoming
+from budget.repositories.bulk import find_unknown_categories
+from budget.repositories.category_cache import incoming_categories
+from django.conf import settings
 from rest_framework import serializers
 
 
@@ -35,6 +38,33 @@ class IncomingCreateSerializer(serializers.ModelSerializer):
         )
 
 
+class IncomingBulkCreateSerializer(serializers.Serializer):
+    """Serializer for creating many Incoming instances in one request.
+
+    Attributes:
+    ----------
+        items (ListField): The incomings to create, each validated by ``IncomingCreateSerializer``.
+    """
+
+    items = serializers.ListField(child=IncomingCreateSerializer(), allow_empty=False, max_length=settings.BULK_CREATE_MAX_ITEMS)
+
+    def validate_items(self, items: list[dict]) -> list[dict]:
+        """Reject the items whose category does not exist, reading the categories at most once.
+
+        Args:
+        ----
+            items (list[dict]): The validated items.
+
+        Returns:
+        -------
+            list[dict]: The items, unchanged.
+        """
+        errors = find_unknown_categories(items, incoming_categories)
+        if errors:
+            raise serializers.ValidationError(errors)
+        return items
+
+
 class IncomingListSerializer(serializers.ModelSerializer):
     """Serializer for listing Incoming instances.
 
@@ -0,0 +1,36 @@
+from decimal import Decimal
+
+from budget.domain.entities.recurring import MONTHS, PERIOD_UNITS
+from rest_framework import serializers
+
+
+class InstallmentCreateSerializer(serializers.Serializer):
+    """Serializer for creating an installment plan.
+
+    Attributes:
+    ----------
+        revenue (UUIDField): The revenue paid in installments.
+        periods (IntegerField): The number of installments.
+        amount (DecimalField): The amount of the purchase, defaults to the revenue amount.
+        first_due_date (DateField): The due date of the first installment, defaults to the revenue expiration date.
+        period_unit (ChoiceField): The unit between two due dates.
+        payment_method (CharField): The payment method of the installments.
+    """
+
+    revenue = serializers.UUIDField()
+    periods = serializers.IntegerField(min_value=1, max_value=480)
+    amount = serializers.DecimalField(max_digits=15, decimal_places=2, min_value=Decimal("0.01"), required=False, allow_null=True)
+    first_due_date = serializers.DateField(required=False, allow_null=True)
+    period_unit = serializers.ChoiceField(choices=PERIOD_UNITS, default=MONTHS)
+    payment_method = serializers.CharField(max_length=100, required=False, allow_null=True)
+
+
+class InstallmentPaySerializer(serializers.Serializer):
+    """Serializer for paying installments.
+
+    Attributes:
+    ----------
+        count (IntegerField): The number of installments to pay.
+    """
+
+    count = serializers.IntegerField(min_value=1, default=1)
@@ -0,0 +1,26 @@
+from budget.repositories.pagination import InvalidCursorError, decode_cursor
+from django.conf import settings
+from rest_framework import serializers
+
+
+class KeysetPaginationQuerySerializer(serializers.Serializer):
+    """Serializer for the keyset pagination query parameters of list endpoints.
+
+    Attributes:
+    ----------
+        cursor (CharField): The opaque cursor returned with the previous page.
+        page_size (IntegerField): The number of records per page.
+    """
+
+    cursor = serializers.CharField(required=False, allow_null=True)
+    page_size = serializers.IntegerField(required=False, allow_null=True, min_value=1, max_value=settings.BUDGET_LIST_MAX_PAGE_SIZE)
+
+    def validate_cursor(self, value):
+        """Check that the cursor can be decoded."""
+        if value is None:
+            return value
+        try:
+            decode_cursor(value)
+        except InvalidCursorError as e:
+            raise serializers.ValidationError(str(e)) from e
+        return value
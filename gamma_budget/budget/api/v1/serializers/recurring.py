@@ -0,0 +1,83 @@
+from datetime import date, timedelta
+
+from budget.domain.entities.recurring import PERIOD_UNITS
+from budget.models import Recurring
+from django.conf import settings
+from rest_framework import serializers
+
+
+class RecurringCreateSerializer(serializers.ModelSerializer):
+    """Serializer for creating Recurring instances.
+
+    Attributes:
+    ----------
+        revenue (UUIDField): The revenue repeated by the rule.
+        amount (DecimalField): The amount of every occurrence, defaults to the revenue amount.
+        payment_method (CharField): The payment method of the occurrences.
+        payment_date (DateField): The first occurrence, defaults to the revenue expiration date.
+        period (IntegerField): The number of units between two occurrences.
+        period_unit (ChoiceField): The unit of the period.
+    """
+
+    revenue = serializers.UUIDField()
+    amount = serializers.DecimalField(max_digits=15, decimal_places=2, required=False, allow_null=True)
+    payment_method = serializers.CharField(max_length=100, required=False, allow_null=True)
+    payment_date = serializers.DateField(required=False, allow_null=True)
+    period = serializers.IntegerField(min_value=1)
+    period_unit = serializers.ChoiceField(choices=PERIOD_UNITS, default="months")
+
+    class Meta:
+        """Meta class for RecurringCreateSerializer."""
+
+        model = Recurring
+        fields = (
+            "revenue",
+            "amount",
+            "payment_method",
+            "payment_date",
+            "period",
+            "period_unit",
+        )
+
+
+class RecurringExpandSerializer(serializers.Serializer):
+    """Serializer for expanding the recurring revenues of a user.
+
+    Attributes:
+    ----------
+        until (DateField): The last day of the expansion, defaults to ``RECURRING_HORIZON_DAYS`` from today
+            and at most ``RECURRING_MAX_DAYS`` from today.
+    """
+
+    until = serializers.DateField(required=False, allow_null=True)
+
+    def validate(self, attrs):
+        """Fill in the default horizon and check that it is not too far ahead."""
+        until = attrs.get("until") or date.today() + timedelta(days=settings.RECURRING_HORIZON_DAYS)
+        if until > date.today() + timedelta(days=settings.RECURRING_MAX_DAYS):
+            raise serializers.ValidationError({"until": f"The expansion must end at most {settings.RECURRING_MAX_DAYS} days from today."})
+        return {**attrs, "until": until}
+
+
+class RecurringProjectionQuerySerializer(serializers.Serializer):
+    """Serializer for the query parameters of the recurring revenue projection.
+
+    Attributes:
+    ----------
+        start (DateField): The first day of the projection, defaults to today.
+        end (DateField): The last day of the projection, defaults to ``RECURRING_HORIZON_DAYS`` after the start
+            and at most ``RECURRING_MAX_DAYS`` after it.
+    """
+
+    start = serializers.DateField(required=False, allow_null=True)
+    end = serializers.DateField(required=False, allow_null=True)
+
+    def validate(self, attrs):
+        """Fill in the default window and check that it is neither reversed nor too long."""
+        start = attrs.get("start") or date.today()
+        end = attrs.get("end") or start + timedelta(days=settings.RECURRING_HORIZON_DAYS)
+        if end < start:
+            raise serializers.ValidationError({"end": "The end must not be before the start."})
+        if (end - start).days > settings.RECURRING_MAX_DAYS:
+            raise serializers.ValidationError({"end": f"The projection must span at most {settings.RECURRING_MAX_DAYS} days."})
+        return {**attrs, "start": start, "end": end}
@@ -0,0 +1,15 @@
+from budget.domain.entities.report import PDF, REPORT_FORMATS
+from rest_framework import serializers
+
+
+class MonthlyReportQuerySerializer(serializers.Serializer):
+    """Serializer for the query parameters of the monthly report.
+
+    Attributes:
+    ----------
+        month (DateField): The month of the report, as ``YYYY-MM``.
+        file_format (ChoiceField): The format of the report: pdf or html.
+    """
+
+    month = serializers.DateField(input_formats=["%Y-%m"])
+    file_format = serializers.ChoiceField(choices=REPORT_FORMATS, default=PDF)
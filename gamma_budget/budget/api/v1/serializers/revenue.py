@@ -1,4 +1,7 @@
 from budget.models import Revenue
+from budget.repositories.bulk import find_unknown_categories
+from budget.repositories.category_cache import revenue_categories
+from django.conf import settings
 from rest_framework import serializers
 
 
@@ -39,6 +42,33 @@ class RevenueCreateSerializer(serializers.ModelSerializer):
         )
 
 
+class RevenueBulkCreateSerializer(serializers.Serializer):
+    """Serializer for creating many Revenue instances in one request.
+
+    Attributes:
+    ----------
+        items (ListField): The revenues to create, each validated by ``RevenueCreateSerializer``.
+    """
+
+    items = serializers.ListField(child=RevenueCreateSerializer(), allow_empty=False, max_length=settings.BULK_CREATE_MAX_ITEMS)
+
+    def validate_items(self, items: list[dict]) -> list[dict]:
+        """Reject the items whose category does not exist, reading the categories at most once.
+
+        Args:
+        ----
+            items (list[dict]): The validated items.
+
+        Returns:
+        -------
+            list[dict]: The items, unchanged.
+        """
+        errors = find_unknown_categories(items, revenue_categories)
+        if errors:
+            raise serializers.ValidationError(errors)
+        return items
+
+
 class RevenueListSerializer(serializers.ModelSerializer):
     """Serializer for listing Revenue instances.
 
@@ -0,0 +1,31 @@
+from pathlib import PurePosixPath
+
+from budget.domain.entities.statement import STATEMENT_FORMATS
+from rest_framework import serializers
+
+
+class StatementUploadSerializer(serializers.Serializer):
+    """Serializer for uploading a bank statement to import.
+
+    Attributes:
+    ----------
+        file (FileField): The statement, in CSV or OFX format.
+        format (ChoiceField): The format of the statement, defaults to the file extension.
+        rules (JSONField): The category rules, a list of ``{"pattern": ..., "category": ...}``.
+    """
+
+    file = serializers.FileField()
+    format = serializers.ChoiceField(choices=STATEMENT_FORMATS, required=False)
+    rules = serializers.JSONField(required=False)
+
+    def validate(self, attrs):
+        """Fill in the format from the file extension and check the rules."""
+        statement_format = attrs.get("format") or PurePosixPath(attrs["file"].name).suffix.lstrip(".").lower()
+        if statement_format not in STATEMENT_FORMATS:
+            raise serializers.ValidationError({"format": "Cannot tell the format from the file name."})
+        rules = attrs.get("rules") or []
+        if not isinstance(rules, list) or not all(
+            isinstance(rule, dict) and isinstance(rule.get("pattern"), str) and isinstance(rule.get("category"), str) for rule in rules
+        ):
+            raise serializers.ValidationError({"rules": "Expected a list of objects with a pattern and a category."})
+        return {**attrs, "format": statement_format, "rules": rules}
@@ -0,0 +1,6 @@
+from budget.api.v1.views.export import LedgerExportAPIView
+from django.urls import path
+
+urlpatterns: list[str] = [
+    path("<int:user_id>/", LedgerExportAPIView.as_view(), name="export"),
+]
@@ -0,0 +1,6 @@
+from budget.api.v1.views.forecast import ForecastAPIView
+from django.urls import path
+
+urlpatterns: list[str] = [
+    path("<int:user_id>/", ForecastAPIView.as_view(), name="forecast"),
+]
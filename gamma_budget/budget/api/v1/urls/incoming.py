@@ -1,34 +1,57 @@
 from budget.api.v1.views.categories import IncomingCategoryListAPIView
 from budget.api.v1.views.incoming import (
+    IncomingBulkCreateAPIView,
     IncomingCreateAPIView,
+    IncomingCreateAsyncAPIView,
     IncomingDeleteAPIView,
+    IncomingDeleteAsyncAPIView,
     IncomingDetailAPIView,
+    IncomingDetailAsyncAPIView,
     IncomingListAPIView,
+    IncomingListAsyncAPIView,
     IncomingUpdateAPIView,
+    IncomingUpdateAsyncAPIView,
 )
+from django.conf import settings
 from django.urls import path
 
+# BUDGET_ASYNC_VIEWS serves the CRUD endpoints with the async views, which wait on the
+# database without holding a thread when the project runs under ASGI.
+if settings.BUDGET_ASYNC_VIEWS:
+    ListView = IncomingListAsyncAPIView
+    CreateView = IncomingCreateAsyncAPIView
+    DetailView = IncomingDetailAsyncAPIView
+    UpdateView = IncomingUpdateAsyncAPIView
+    DeleteView = IncomingDeleteAsyncAPIView
+else:
+    ListView = IncomingListAPIView
+    CreateView = IncomingCreateAPIView
+    DetailView = IncomingDetailAPIView
+    UpdateView = IncomingUpdateAPIView
+    DeleteView = IncomingDeleteAPIView
+
 urlpatterns: list[str] = [
     path(
         "list-categories/",
         IncomingCategoryListAPIView.as_view(),
         name="list-categories",
     ),
-    path("list/<int:user_id>/", IncomingListAPIView.as_view(), name="list"),
-    path("create/<int:user_id>/", IncomingCreateAPIView.as_view(), name="create"),
+    path("list/<int:user_id>/", ListView.as_view(), name="list"),
+    path("create/<int:user_id>/", CreateView.as_view(), name="create"),
+    path("create-bulk/<int:user_id>/", IncomingBulkCreateAPIView.as_view(), name="create-bulk"),
     path(
         "detail/<int:user_id>/<uuid:id>/",
-        IncomingDetailAPIView.as_view(),
+        DetailView.as_view(),
         name="detail",
     ),
     path(
         "update/<int:user_id>/<uuid:id>/",
-        IncomingUpdateAPIView.as_view(),
+        UpdateView.as_view(),
         name="update",
     ),
     path(
         "delete/<int:user_id>/<uuid:id>/",
-        IncomingDeleteAPIView.as_view(),
+        DeleteView.as_view(),
         name="delete",
     ),
     # uuid: incoming_id
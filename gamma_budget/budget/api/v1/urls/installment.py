@@ -0,0 +1,8 @@
+from budget.api.v1.views.installment import InstallmentCreateAPIView, InstallmentDetailAPIView, InstallmentPayAPIView
+from django.urls import path
+
+urlpatterns: list[str] = [
+    path("create/<int:user_id>/", InstallmentCreateAPIView.as_view(), name="create"),
+    path("detail/<int:user_id>/<uuid:revenue_id>/", InstallmentDetailAPIView.as_view(), name="detail"),
+    path("pay/<int:user_id>/<uuid:revenue_id>/", InstallmentPayAPIView.as_view(), name="pay"),
+]
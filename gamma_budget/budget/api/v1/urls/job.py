@@ -0,0 +1,7 @@
+from budget.api.v1.views.job import JobRetrieveAPIView
+from django.urls import path
+
+urlpatterns: list[str] = [
+    path("<uuid:id>/", JobRetrieveAPIView.as_view(), name="retrieve"),
+    # uuid: job_id
+]
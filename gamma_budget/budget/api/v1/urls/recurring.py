@@ -0,0 +1,8 @@
+from budget.api.v1.views.recurring import RecurringCreateAPIView, RecurringExpandAPIView, RecurringProjectionAPIView
+from django.urls import path
+
+urlpatterns: list[str] = [
+    path("create/<int:user_id>/", RecurringCreateAPIView.as_view(), name="create"),
+    path("expand/<int:user_id>/", RecurringExpandAPIView.as_view(), name="expand"),
+    path("projection/<int:user_id>/", RecurringProjectionAPIView.as_view(), name="projection"),
+]
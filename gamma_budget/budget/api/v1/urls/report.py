@@ -0,0 +1,6 @@
+from budget.api.v1.views.report import MonthlyReportAPIView
+from django.urls import path
+
+urlpatterns: list[str] = [
+    path("<int:user_id>/", MonthlyReportAPIView.as_view(), name="monthly-report"),
+]
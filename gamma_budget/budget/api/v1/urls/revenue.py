@@ -1,19 +1,42 @@
 from budget.api.v1.views.categories import RevenueCategoryListAPIView
 from budget.api.v1.views.revenue import (
+    RevenueBulkCreateAPIView,
     RevenueCreateAPIView,
+    RevenueCreateAsyncAPIView,
     RevenueDeleteAPIView,
+    RevenueDeleteAsyncAPIView,
     RevenueDetailAPIView,
+    RevenueDetailAsyncAPIView,
     RevenueListAPIView,
+    RevenueListAsyncAPIView,
     RevenueUpdateAPIView,
+    RevenueUpdateAsyncAPIView,
 )
+from django.conf import settings
 from django.urls import path
 
+# BUDGET_ASYNC_VIEWS serves the CRUD endpoints with the async views, which wait on the
+# database without holding a thread when the project runs under ASGI.
+if settings.BUDGET_ASYNC_VIEWS:
+    ListView = RevenueListAsyncAPIView
+    CreateView = RevenueCreateAsyncAPIView
+    DetailView = RevenueDetailAsyncAPIView
+    UpdateView = RevenueUpdateAsyncAPIView
+    DeleteView = RevenueDeleteAsyncAPIView
+else:
+    ListView = RevenueListAPIView
+    CreateView = RevenueCreateAPIView
+    DetailView = RevenueDetailAPIView
+    UpdateView = RevenueUpdateAPIView
+    DeleteView = RevenueDeleteAPIView
+
 urlpatterns: list[str] = [
     path("list-categories/", RevenueCategoryListAPIView.as_view(), name="list-categories"),
-    path("list/<int:user_id>/", RevenueListAPIView.as_view(), name="list"),
-    path("create/<int:user_id>/", RevenueCreateAPIView.as_view(), name="create"),
-    path("detail/<int:user_id>/<uuid:id>/", RevenueDetailAPIView.as_view(), name="detail"),
-    path("update/<int:user_id>/<uuid:id>/", RevenueUpdateAPIView.as_view(), name="update"),
-    path("delete/<int:user_id>/<uuid:id>/", RevenueDeleteAPIView.as_view(), name="delete"),
+    path("list/<int:user_id>/", ListView.as_view(), name="list"),
+    path("create/<int:user_id>/", CreateView.as_view(), name="create"),
+    path("create-bulk/<int:user_id>/", RevenueBulkCreateAPIView.as_view(), name="create-bulk"),
+    path("detail/<int:user_id>/<uuid:id>/", DetailView.as_view(), name="detail"),
+    path("update/<int:user_id>/<uuid:id>/", UpdateView.as_view(), name="update"),
+    path("delete/<int:user_id>/<uuid:id>/", DeleteView.as_view(), name="delete"),
     # uuid: revenue_id
 ]
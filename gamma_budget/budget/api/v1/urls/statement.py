@@ -0,0 +1,6 @@
+from budget.api.v1.views.statement import StatementUploadAPIView
+from django.urls import path
+
+urlpatterns: list[str] = [
+    path("import/<int:user_id>/", StatementUploadAPIView.as_view(), name="import"),
+]
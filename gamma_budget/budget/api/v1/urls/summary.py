@@ -0,0 +1,6 @@
+from budget.api.v1.views.summary import SummaryAPIView
+from django.urls import path
+
+urlpatterns: list[str] = [
+    path("<int:user_id>/", SummaryAPIView.as_view(), name="summary"),
+]
@@ -9,6 +9,7 @@ from budget.api.v1.serializers.alert import (
     AlertTriggerSerializer,
     AlertUpdateSerializer,
 )
+from budget.api.v1.serializers.pagination import KeysetPaginationQuerySerializer
 from budget.api_output import DjangoApiOutput
 from budget.domain.use_cases import (
     AlertCreateUseCase,
@@ -72,11 +73,15 @@ class AlertListAPIView(APIView, ExecuteUseCaseOnGetMixin):
     serializer_class = AlertSerializer
     use_case_retrieve = AlertListUseCase
     use_case_output = DjangoApiOutput
+    query_serializer = KeysetPaginationQuerySerializer
 
     def get_use_case_kwargs(self, request, user_id):
         """
         Get keyword arguments for the use case.
 
+        The list is keyset paginated when ``cursor`` or ``page_size`` is given in
+        the query string; otherwise every record of the user is returned.
+
         Args:
         ----
             request: HTTP request object.
@@ -86,7 +91,11 @@ class AlertListAPIView(APIView, ExecuteUseCaseOnGetMixin):
         -------
             dict: Keyword arguments.
         """
-        return {"user_id": user_id}
+        return {
+            "user_id": user_id,
+            "cursor": request.query_params.get("cursor"),
+            "page_size": request.query_params.get("page_size"),
+        }
 
 
 class AlertUpdateAPIView(APIView, ExecuteUseCaseOnPutMixin):
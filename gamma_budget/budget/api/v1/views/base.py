@@ -0,0 +1,53 @@
+import inspect
+
+from asgiref.sync import sync_to_async
+from rest_framework.views import APIView
+
+
+class AsyncAPIView(APIView):
+    """
+    APIView whose handlers may be coroutines.
+
+    DRF dispatches synchronously, so under ASGI every request would hold a thread
+    while it waits on the database. This dispatch follows the steps of
+    ``APIView.dispatch`` but awaits the handler; authentication, permissions and
+    throttling still run synchronously, through ``sync_to_async``.
+
+    Extends:
+        APIView
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        """
+        Dispatch the request to the handler of its method, awaiting it if async.
+
+        Args:
+        ----
+            request: HTTP request object.
+            *args: Additional positional arguments.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+        -------
+            Response: The finalized response.
+        """
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+            response = handler(request, *args, **kwargs)
+            if inspect.isawaitable(response):
+                response = await response
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
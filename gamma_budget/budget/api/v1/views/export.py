@@ -0,0 +1,44 @@
+from budget.api.v1.mixins import ExecuteUseCaseOnGetMixin
+from budget.api.v1.serializers.export import LedgerExportQuerySerializer
+from budget.api_output import DjangoExportOutput
+from budget.domain.use_cases import LedgerExportUseCase
+from django.core.handlers.asgi import ASGIRequest
+from rest_framework.permissions import AllowAny
+from rest_framework.views import APIView
+
+
+class LedgerExportAPIView(APIView, ExecuteUseCaseOnGetMixin):
+    """
+    API endpoint for downloading every revenue, incoming, limit and alert of a user.
+
+    Requests served under ASGI read the records with an async iterator, so the response
+    is streamed instead of buffered by the handler.
+
+    Extends:
+        APIView
+        ExecuteUseCaseOnGetMixin
+    """
+
+    permission_classes = (AllowAny,)
+    use_case_retrieve = LedgerExportUseCase
+    use_case_output = DjangoExportOutput
+    query_serializer = LedgerExportQuerySerializer
+
+    def get_use_case_kwargs(self, request, user_id):
+        """
+        Get keyword arguments for the use case.
+
+        Args:
+        ----
+            request: HTTP request object.
+            user_id: ID of the user.
+
+        Returns:
+        -------
+            dict: Keyword arguments.
+        """
+        data = {"user_id": user_id, "stream_async": isinstance(request._request, ASGIRequest)}
+        for param in ("file_format", "gzip"):
+            if param in request.query_params:
+                data[param] = request.query_params[param]
+        return data
@@ -0,0 +1,40 @@
+from budget.api.v1.mixins import ExecuteUseCaseOnGetMixin
+from budget.api.v1.serializers.forecast import ForecastQuerySerializer
+from budget.api_output import DjangoApiOutput
+from budget.domain.use_cases import ForecastUseCase
+from rest_framework.permissions import AllowAny
+from rest_framework.views import APIView
+
+
+class ForecastAPIView(APIView, ExecuteUseCaseOnGetMixin):
+    """
+    API endpoint for the projected balance of a user.
+
+    Extends:
+        APIView
+        ExecuteUseCaseOnGetMixin
+    """
+
+    permission_classes = (AllowAny,)
+    use_case_retrieve = ForecastUseCase
+    use_case_output = DjangoApiOutput
+    query_serializer = ForecastQuerySerializer
+
+    def get_use_case_kwargs(self, request, user_id):
+        """
+        Get keyword arguments for the use case.
+
+        Args:
+        ----
+            request: HTTP request object.
+            user_id: ID of the user.
+
+        Returns:
+        -------
+            dict: Keyword arguments.
+        """
+        data = {"user_id": user_id}
+        for param in ("months", "granularity", "start"):
+            if param in request.query_params:
+                data[param] = request.query_params[param]
+        return data
@@ -1,18 +1,26 @@
 from budget.api.v1.mixins import (
+    AsyncExecuteUseCaseOnCreateMixin,
+    AsyncExecuteUseCaseOnDestroyMixin,
+    AsyncExecuteUseCaseOnGetMixin,
+    AsyncExecuteUseCaseOnPutMixin,
     ExecuteUseCaseOnCreateMixin,
     ExecuteUseCaseOnDestroyMixin,
     ExecuteUseCaseOnGetMixin,
     ExecuteUseCaseOnPutMixin,
 )
 from budget.api.v1.serializers.incoming import (
+    IncomingBulkCreateSerializer,
     IncomingCreateSerializer,
     IncomingDeleteSerializer,
     IncomingDetailSerializer,
     IncomingListSerializer,
     IncomingUpdateSerializer,
 )
+from budget.api.v1.serializers.pagination import KeysetPaginationQuerySerializer
+from budget.api.v1.views.base import AsyncAPIView
 from budget.api_output import DjangoApiOutput
 from budget.domain.use_cases import (
+    IncomingBulkCreateUseCase,
     IncomingCreateUseCase,
     IncomingDeleteUseCase,
     IncomingListUseCase,
@@ -63,6 +71,37 @@ class IncomingCreateAPIView(APIView, ExecuteUseCaseOnCreateMixin):
         return data
 
 
+class IncomingBulkCreateAPIView(APIView, ExecuteUseCaseOnCreateMixin):
+    """
+    API endpoint for creating many incoming records in one request.
+
+    Extends:
+        APIView
+        ExecuteUseCaseOnCreateMixin
+    """
+
+    permission_classes = (AllowAny,)
+    serializer_class = IncomingBulkCreateSerializer
+    serializer_create = IncomingBulkCreateSerializer
+    use_case_create = IncomingBulkCreateUseCase
+    use_case_output = DjangoApiOutput
+
+    def get_use_case_kwargs(self, request, user_id, *args, **kwargs):
+        """
+        Get keyword arguments for the use case.
+
+        Args:
+        ----
+            request: HTTP request object.
+            user_id: ID of the user.
+
+        Returns:
+        -------
+            dict: Keyword arguments.
+        """
+        return {"user_id": user_id, "items": self.serializer_instance.validated_data["items"]}
+
+
 class IncomingListAPIView(APIView, ExecuteUseCaseOnGetMixin):
     """
     API endpoint for listing incoming budget records.
@@ -76,11 +115,15 @@ class IncomingListAPIView(APIView, ExecuteUseCaseOnGetMixin):
     serializer_class = IncomingListSerializer
     use_case_retrieve = IncomingListUseCase
     use_case_output = DjangoApiOutput
+    query_serializer = KeysetPaginationQuerySerializer
 
     def get_use_case_kwargs(self, request, user_id):
         """
         Get keyword arguments for the use case.
 
+        The list is keyset paginated when ``cursor`` or ``page_size`` is given in
+        the query string; otherwise every record of the user is returned.
+
         Args:
         ----
             request: HTTP request object.
@@ -90,7 +133,11 @@ class IncomingListAPIView(APIView, ExecuteUseCaseOnGetMixin):
         -------
             dict: Keyword arguments.
         """
-        return {"user_id": user_id}
+        return {
+            "user_id": user_id,
+            "cursor": request.query_params.get("cursor"),
+            "page_size": request.query_params.get("page_size"),
+        }
 
 
 class IncomingDetailAPIView(APIView, ExecuteUseCaseOnGetMixin):
@@ -193,3 +240,58 @@ class IncomingDeleteAPIView(APIView, ExecuteUseCaseOnDestroyMixin):
             dict: Keyword arguments.
         """
         return {"user_id": user_id, "incoming_id": id}
+
+
+class IncomingCreateAsyncAPIView(AsyncAPIView, AsyncExecuteUseCaseOnCreateMixin, IncomingCreateAPIView):
+    """
+    Async API endpoint for creating incoming budget records.
+
+    Extends:
+        AsyncAPIView
+        AsyncExecuteUseCaseOnCreateMixin
+        IncomingCreateAPIView
+    """
+
+
+class IncomingListAsyncAPIView(AsyncAPIView, AsyncExecuteUseCaseOnGetMixin, IncomingListAPIView):
+    """
+    Async API endpoint for listing incoming budget records.
+
+    Extends:
+        AsyncAPIView
+        AsyncExecuteUseCaseOnGetMixin
+        IncomingListAPIView
+    """
+
+
+class IncomingDetailAsyncAPIView(AsyncAPIView, AsyncExecuteUseCaseOnGetMixin, IncomingDetailAPIView):
+    """
+    Async API endpoint for retrieving incoming budget records.
+
+    Extends:
+        AsyncAPIView
+        AsyncExecuteUseCaseOnGetMixin
+        IncomingDetailAPIView
+    """
+
+
+class IncomingUpdateAsyncAPIView(AsyncAPIView, AsyncExecuteUseCaseOnPutMixin, IncomingUpdateAPIView):
+    """
+    Async API endpoint for updating incoming budget records.
+
+    Extends:
+        AsyncAPIView
+        AsyncExecuteUseCaseOnPutMixin
+        IncomingUpdateAPIView
+    """
+
+
+class IncomingDeleteAsyncAPIView(AsyncAPIView, AsyncExecuteUseCaseOnDestroyMixin, IncomingDeleteAPIView):
+    """
+    Async API endpoint for deleting incoming budget records.
+
+    Extends:
+        AsyncAPIView
+        AsyncExecuteUseCaseOnDestroyMixin
+        IncomingDeleteAPIView
+    """
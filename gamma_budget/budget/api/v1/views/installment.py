@@ -0,0 +1,99 @@
+from budget.api.v1.mixins import ExecuteUseCaseOnCreateMixin, ExecuteUseCaseOnGetMixin
+from budget.api.v1.serializers.installment import InstallmentCreateSerializer, InstallmentPaySerializer
+from budget.api_output import DjangoApiOutput
+from budget.domain.use_cases import InstallmentCreateUseCase, InstallmentPayUseCase, InstallmentRetrieveUseCase
+from rest_framework.permissions import AllowAny
+from rest_framework.views import APIView
+
+
+class InstallmentCreateAPIView(APIView, ExecuteUseCaseOnCreateMixin):
+    """
+    API endpoint for splitting a revenue into installments.
+
+    Extends:
+        APIView
+        ExecuteUseCaseOnCreateMixin
+    """
+
+    permission_classes = (AllowAny,)
+    serializer_class = InstallmentCreateSerializer
+    serializer_create = InstallmentCreateSerializer
+    use_case_create = InstallmentCreateUseCase
+    use_case_output = DjangoApiOutput
+
+    def get_use_case_kwargs(self, request, user_id, *args, **kwargs):
+        """
+        Get keyword arguments for the use case.
+
+        Args:
+        ----
+            request: HTTP request object.
+            user_id: ID of the user.
+
+        Returns:
+        -------
+            dict: Keyword arguments.
+        """
+        return {"user_id": user_id, **self.serializer_instance.validated_data}
+
+
+class InstallmentDetailAPIView(APIView, ExecuteUseCaseOnGetMixin):
+    """
+    API endpoint for retrieving the installment plan of a revenue.
+
+    Extends:
+        APIView
+        ExecuteUseCaseOnGetMixin
+    """
+
+    permission_classes = (AllowAny,)
+    use_case_retrieve = InstallmentRetrieveUseCase
+    use_case_output = DjangoApiOutput
+
+    def get_use_case_kwargs(self, request, user_id, revenue_id):
+        """
+        Get keyword arguments for the use case.
+
+        Args:
+        ----
+            request: HTTP request object.
+            user_id: ID of the user.
+            revenue_id: ID of the revenue.
+
+        Returns:
+        -------
+            dict: Keyword arguments.
+        """
+        return {"user_id": user_id, "revenue_id": revenue_id}
+
+
+class InstallmentPayAPIView(APIView, ExecuteUseCaseOnCreateMixin):
+    """
+    API endpoint for paying the next installments of a plan.
+
+    Extends:
+        APIView
+        ExecuteUseCaseOnCreateMixin
+    """
+
+    permission_classes = (AllowAny,)
+    serializer_class = InstallmentPaySerializer
+    serializer_create = InstallmentPaySerializer
+    use_case_create = InstallmentPayUseCase
+    use_case_output = DjangoApiOutput
+
+    def get_use_case_kwargs(self, request, user_id, revenue_id, *args, **kwargs):
+        """
+        Get keyword arguments for the use case.
+
+        Args:
+        ----
+            request: HTTP request object.
+            user_id: ID of the user.
+            revenue_id: ID of the revenue.
+
+        Returns:
+        -------
+            dict: Keyword arguments.
+        """
+        return {"user_id": user_id, "revenue_id": revenue_id, "count": self.serializer_instance.validated_data["count"]}
@@ -0,0 +1,34 @@
+from budget.api.v1.mixins import ExecuteUseCaseOnGetMixin
+from budget.api_output import DjangoApiOutput
+from budget.domain.use_cases import JobRetrieveUseCase
+from rest_framework.permissions import AllowAny
+from rest_framework.views import APIView
+
+
+class JobRetrieveAPIView(APIView, ExecuteUseCaseOnGetMixin):
+    """
+    API endpoint for the status of a background job.
+
+    Extends:
+        APIView
+        ExecuteUseCaseOnGetMixin
+    """
+
+    permission_classes = (AllowAny,)
+    use_case_retrieve = JobRetrieveUseCase
+    use_case_output = DjangoApiOutput
+
+    def get_use_case_kwargs(self, request, id):
+        """
+        Get keyword arguments for the use case.
+
+        Args:
+        ----
+            request: HTTP request object.
+            id: ID of the job.
+
+        Returns:
+        -------
+            dict: Keyword arguments.
+        """
+        return {"job_id": id}
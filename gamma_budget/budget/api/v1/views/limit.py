@@ -5,6 +5,7 @@ from budget.api.v1.mixins import (
     ExecuteUseCaseOnPutMixin,
 )
 from budget.api.v1.serializers.limit import LimitSerializer, LimitUpdateSerializer
+from budget.api.v1.serializers.pagination import KeysetPaginationQuerySerializer
 from budget.api_output import DjangoApiOutput
 from budget.domain.use_cases import (
     LimitCreateUseCase,
@@ -67,11 +68,15 @@ class LimitListAPIView(APIView, ExecuteUseCaseOnGetMixin):
     serializer_class = LimitSerializer
     use_case_retrieve = LimitListUseCase
     use_case_output = DjangoApiOutput
+    query_serializer = KeysetPaginationQuerySerializer
 
     def get_use_case_kwargs(self, request, user_id):
         """
         Get keyword arguments for the use case.
 
+        The list is keyset paginated when ``cursor`` or ``page_size`` is given in
+        the query string; otherwise every record of the user is returned.
+
         Args:
         ----
             request: HTTP request object.
@@ -81,7 +86,11 @@ class LimitListAPIView(APIView, ExecuteUseCaseOnGetMixin):
         -------
             dict: Keyword arguments.
         """
-        return {"user_id": user_id}
+        return {
+            "user_id": user_id,
+            "cursor": request.query_params.get("cursor"),
+            "page_size": request.query_params.get("page_size"),
+        }
 
 
 class LimitUpdateAPIView(APIView, ExecuteUseCaseOnPutMixin):
@@ -0,0 +1,98 @@
+from budget.api.v1.mixins import ExecuteUseCaseOnCreateMixin, ExecuteUseCaseOnGetMixin
+from budget.api.v1.serializers.recurring import RecurringCreateSerializer, RecurringExpandSerializer, RecurringProjectionQuerySerializer
+from budget.api_output import DjangoApiOutput
+from budget.domain.use_cases import RecurringCreateUseCase, RecurringExpandUseCase, RecurringProjectionUseCase
+from rest_framework.permissions import AllowAny
+from rest_framework.views import APIView
+
+
+class RecurringCreateAPIView(APIView, ExecuteUseCaseOnCreateMixin):
+    """
+    API endpoint for creating recurring revenue rules.
+
+    Extends:
+        APIView
+        ExecuteUseCaseOnCreateMixin
+    """
+
+    permission_classes = (AllowAny,)
+    serializer_class = RecurringCreateSerializer
+    serializer_create = RecurringCreateSerializer
+    use_case_create = RecurringCreateUseCase
+    use_case_output = DjangoApiOutput
+
+    def get_use_case_kwargs(self, request, user_id, *args, **kwargs):
+        """
+        Get keyword arguments for the use case.
+
+        Args:
+        ----
+            request: HTTP request object.
+            user_id: ID of the user.
+
+        Returns:
+        -------
+            dict: Keyword arguments.
+        """
+        return {"user_id": user_id, **self.serializer_instance.validated_data}
+
+
+class RecurringExpandAPIView(APIView, ExecuteUseCaseOnCreateMixin):
+    """
+    API endpoint for storing the recurring revenues of a user up to a date.
+
+    Extends:
+        APIView
+        ExecuteUseCaseOnCreateMixin
+    """
+
+    permission_classes = (AllowAny,)
+    serializer_class = RecurringExpandSerializer
+    serializer_create = RecurringExpandSerializer
+    use_case_create = RecurringExpandUseCase
+    use_case_output = DjangoApiOutput
+
+    def get_use_case_kwargs(self, request, user_id, *args, **kwargs):
+        """
+        Get keyword arguments for the use case.
+
+        Args:
+        ----
+            request: HTTP request object.
+            user_id: ID of the user.
+
+        Returns:
+        -------
+            dict: Keyword arguments.
+        """
+        return {"user_id": user_id, "until": self.serializer_instance.validated_data["until"]}
+
+
+class RecurringProjectionAPIView(APIView, ExecuteUseCaseOnGetMixin):
+    """
+    API endpoint for projecting future recurring revenues of a user without storing them.
+
+    Extends:
+        APIView
+        ExecuteUseCaseOnGetMixin
+    """
+
+    permission_classes = (AllowAny,)
+    use_case_retrieve = RecurringProjectionUseCase
+    use_case_output = DjangoApiOutput
+    query_serializer = RecurringProjectionQuerySerializer
+
+    def get_use_case_kwargs(self, request, user_id):
+        """
+        Get keyword arguments for the use case.
+
+        Args:
+        ----
+            request: HTTP request object.
+            user_id: ID of the user.
+
+        Returns:
+        -------
+            dict: Keyword arguments.
+        """
+        return {"user_id": user_id, "start": request.query_params.get("start"), "end": request.query_params.get("end")}
@@ -0,0 +1,40 @@
+from budget.api.v1.mixins import ExecuteUseCaseOnGetMixin
+from budget.api.v1.serializers.report import MonthlyReportQuerySerializer
+from budget.api_output import DjangoReportOutput
+from budget.domain.use_cases import MonthlyReportUseCase
+from rest_framework.permissions import AllowAny
+from rest_framework.views import APIView
+
+
+class MonthlyReportAPIView(APIView, ExecuteUseCaseOnGetMixin):
+    """
+    API endpoint for downloading the monthly statement of a user as PDF or HTML.
+
+    Extends:
+        APIView
+        ExecuteUseCaseOnGetMixin
+    """
+
+    permission_classes = (AllowAny,)
+    use_case_retrieve = MonthlyReportUseCase
+    use_case_output = DjangoReportOutput
+    query_serializer = MonthlyReportQuerySerializer
+
+    def get_use_case_kwargs(self, request, user_id):
+        """
+        Get keyword arguments for the use case.
+
+        Args:
+        ----
+            request: HTTP request object.
+            user_id: ID of the user.
+
+        Returns:
+        -------
+            dict: Keyword arguments.
+        """
+        data = {"user_id": user_id}
+        for param in ("month", "file_format"):
+            if param in request.query_params:
+                data[param] = request.query_params[param]
+        return data
@@ -1,18 +1,26 @@
 from budget.api.v1.mixins import (
+    AsyncExecuteUseCaseOnCreateMixin,
+    AsyncExecuteUseCaseOnDestroyMixin,
+    AsyncExecuteUseCaseOnGetMixin,
+    AsyncExecuteUseCaseOnPutMixin,
     ExecuteUseCaseOnCreateMixin,
     ExecuteUseCaseOnDestroyMixin,
     ExecuteUseCaseOnGetMixin,
     ExecuteUseCaseOnPutMixin,
 )
+from budget.api.v1.serializers.pagination import KeysetPaginationQuerySerializer
 from budget.api.v1.serializers.revenue import (
+    RevenueBulkCreateSerializer,
     RevenueCreateSerializer,
     RevenueDeleteSerializer,
     RevenueDetailSerializer,
     RevenueListSerializer,
     RevenueUpdateSerializer,
 )
+from budget.api.v1.views.base import AsyncAPIView
 from budget.api_output import DjangoApiOutput
 from budget.domain.use_cases import (
+    RevenueBulkCreateUseCase,
     RevenueCreateUseCase,
     RevenueDeleteUseCase,
     RevenueListUseCase,
@@ -66,6 +74,37 @@ class RevenueCreateAPIView(APIView, ExecuteUseCaseOnCreateMixin):
         return data
 
 
+class RevenueBulkCreateAPIView(APIView, ExecuteUseCaseOnCreateMixin):
+    """
+    API endpoint for creating many revenue records in one request.
+
+    Extends:
+        APIView
+        ExecuteUseCaseOnCreateMixin
+    """
+
+    permission_classes = (AllowAny,)
+    serializer_class = RevenueBulkCreateSerializer
+    serializer_create = RevenueBulkCreateSerializer
+    use_case_create = RevenueBulkCreateUseCase
+    use_case_output = DjangoApiOutput
+
+    def get_use_case_kwargs(self, request, user_id, *args, **kwargs):
+        """
+        Get keyword arguments for the use case.
+
+        Args:
+        ----
+            request: HTTP request object.
+            user_id: ID of the user.
+
+        Returns:
+        -------
+            dict: Keyword arguments.
+        """
+        return {"user_id": user_id, "items": self.serializer_instance.validated_data["items"]}
+
+
 class RevenueListAPIView(APIView, ExecuteUseCaseOnGetMixin):
     """
     API endpoint for listing revenue records.
@@ -79,11 +118,15 @@ class RevenueListAPIView(APIView, ExecuteUseCaseOnGetMixin):
     serializer_class = RevenueListSerializer
     use_case_retrieve = RevenueListUseCase
     use_case_output = DjangoApiOutput
+    query_serializer = KeysetPaginationQuerySerializer
 
     def get_use_case_kwargs(self, request, user_id):
         """
         Get keyword arguments for the use case.
 
+        The list is keyset paginated when ``cursor`` or ``page_size`` is given in
+        the query string; otherwise every record of the user is returned.
+
         Args:
         ----
             request: HTTP request object.
@@ -93,7 +136,11 @@ class RevenueListAPIView(APIView, ExecuteUseCaseOnGetMixin):
         -------
             dict: Keyword arguments.
         """
-        return {"user_id": user_id}
+        return {
+            "user_id": user_id,
+            "cursor": request.query_params.get("cursor"),
+            "page_size": request.query_params.get("page_size"),
+        }
 
 
 class RevenueDetailAPIView(APIView, ExecuteUseCaseOnGetMixin):
@@ -200,3 +247,58 @@ class RevenueDeleteAPIView(APIView, ExecuteUseCaseOnDestroyMixin):
             dict: Keyword arguments.
         """
         return {"user_id": user_id, "revenue_id": id}
+
+
+class RevenueCreateAsyncAPIView(AsyncAPIView, AsyncExecuteUseCaseOnCreateMixin, RevenueCreateAPIView):
+    """
+    Async API endpoint for creating revenue records.
+
+    Extends:
+        AsyncAPIView
+        AsyncExecuteUseCaseOnCreateMixin
+        RevenueCreateAPIView
+    """
+
+
+class RevenueListAsyncAPIView(AsyncAPIView, AsyncExecuteUseCaseOnGetMixin, RevenueListAPIView):
+    """
+    Async API endpoint for listing revenue records.
+
+    Extends:
+        AsyncAPIView
+        AsyncExecuteUseCaseOnGetMixin
+        RevenueListAPIView
+    """
+
+
+class RevenueDetailAsyncAPIView(AsyncAPIView, AsyncExecuteUseCaseOnGetMixin, RevenueDetailAPIView):
+    """
+    Async API endpoint for retrieving revenue records.
+
+    Extends:
+        AsyncAPIView
+        AsyncExecuteUseCaseOnGetMixin
+        RevenueDetailAPIView
+    """
+
+
+class RevenueUpdateAsyncAPIView(AsyncAPIView, AsyncExecuteUseCaseOnPutMixin, RevenueUpdateAPIView):
+    """
+    Async API endpoint for updating revenue records.
+
+    Extends:
+        AsyncAPIView
+        AsyncExecuteUseCaseOnPutMixin
+        RevenueUpdateAPIView
+    """
+
+
+class RevenueDeleteAsyncAPIView(AsyncAPIView, AsyncExecuteUseCaseOnDestroyMixin, RevenueDeleteAPIView):
+    """
+    Async API endpoint for deleting revenue records.
+
+    Extends:
+        AsyncAPIView
+        AsyncExecuteUseCaseOnDestroyMixin
+        RevenueDeleteAPIView
+    """
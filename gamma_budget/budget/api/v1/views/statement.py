@@ -0,0 +1,40 @@
+from budget.api.v1.mixins import ExecuteUseCaseOnCreateMixin
+from budget.api.v1.serializers.statement import StatementUploadSerializer
+from budget.api_output import DjangoApiOutput
+from budget.domain.use_cases import StatementUploadUseCase
+from rest_framework.parsers import FormParser, MultiPartParser
+from rest_framework.permissions import AllowAny
+from rest_framework.views import APIView
+
+
+class StatementUploadAPIView(APIView, ExecuteUseCaseOnCreateMixin):
+    """
+    API endpoint for importing a bank statement in the background.
+
+    Extends:
+        APIView
+        ExecuteUseCaseOnCreateMixin
+    """
+
+    permission_classes = (AllowAny,)
+    parser_classes = (MultiPartParser, FormParser)
+    serializer_class = StatementUploadSerializer
+    serializer_create = StatementUploadSerializer
+    use_case_create = StatementUploadUseCase
+    use_case_output = DjangoApiOutput
+
+    def get_use_case_kwargs(self, request, user_id, *args, **kwargs):
+        """
+        Get keyword arguments for the use case.
+
+        Args:
+        ----
+            request: HTTP request object.
+            user_id: ID of the user.
+
+        Returns:
+        -------
+            dict: Keyword arguments.
+        """
+        validated_data = self.serializer_instance.validated_data
+        return {"user_id": user_id, "file": validated_data["file"], "format": validated_data["format"], "rules": validated_data["rules"]}
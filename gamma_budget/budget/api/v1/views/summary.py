@@ -0,0 +1,34 @@
+from budget.api.v1.mixins import ExecuteUseCaseOnGetMixin
+from budget.api_output import DjangoApiOutput
+from budget.domain.use_cases import SummaryUseCase
+from rest_framework.permissions import AllowAny
+from rest_framework.views import APIView
+
+
+class SummaryAPIView(APIView, ExecuteUseCaseOnGetMixin):
+    """
+    API endpoint for the monthly budget summary of a user.
+
+    Extends:
+        APIView
+        ExecuteUseCaseOnGetMixin
+    """
+
+    permission_classes = (AllowAny,)
+    use_case_retrieve = SummaryUseCase
+    use_case_output = DjangoApiOutput
+
+    def get_use_case_kwargs(self, request, user_id):
+        """
+        Get keyword arguments for the use case.
+
+        Args:
+        ----
+            request: HTTP request object.
+            user_id: ID of the user.
+
+        Returns:
+        -------
+            dict: Keyword arguments.
+        """
+        return {"user_id": user_id}
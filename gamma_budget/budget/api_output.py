@@ -1,4 +1,13 @@
+from collections.abc import AsyncIterable
+
+from budget.domain.entities.export import NDJSON
+from budget.domain.entities.report import HTML
 from budget.domain.use_cases.base.base import AbstractBaseOutput
+from budget.utils.export import acsv_chunks, agzip_chunks, andjson_chunks, csv_chunks, gzip_chunks, ndjson_chunks
+from budget.utils.reports import get_report_pdf, render_report_html
+from django.conf import settings
+from django.core.files.storage import storages
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
 from rest_framework import status
 from rest_framework.response import Response
 
@@ -19,3 +28,66 @@ class DjangoApiOutput(AbstractBaseOutput):
 
     def get_response(self):
         return Response(self.data, status=status.HTTP_200_OK)
+
+
+class DjangoExportOutput(AbstractBaseOutput):
+    """Class responsible for streaming an export as a file download.
+
+    When the rows are an async iterable the body is an async iterator, which the ASGI
+    handler streams without buffering; WSGI servers get a plain iterator.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._data = None
+
+    @property
+    def data(self) -> dict:
+        return self._data
+
+    @data.setter
+    def data(self, value: dict):
+        self._data = value
+
+    def get_response(self):
+        rows = self.data["rows"]
+        is_async = isinstance(rows, AsyncIterable)
+        if self.data["format"] == NDJSON:
+            chunks = andjson_chunks(rows) if is_async else ndjson_chunks(rows)
+            content_type = "application/x-ndjson"
+        else:
+            chunks = acsv_chunks(rows, self.data["columns"]) if is_async else csv_chunks(rows, self.data["columns"])
+            content_type = "text/csv; charset=utf-8"
+        if self.data["gzip"]:
+            chunks = agzip_chunks(chunks) if is_async else gzip_chunks(chunks)
+            content_type = "application/gzip"
+        return StreamingHttpResponse(
+            chunks,
+            content_type=content_type,
+            headers={"Content-Disposition": f'attachment; filename="{self.data["filename"]}"'},
+        )
+
+
+class DjangoReportOutput(AbstractBaseOutput):
+    """Class responsible for rendering a monthly report as an HTML page or a PDF download."""
+
+    def __init__(self, *args, **kwargs):
+        self._data = None
+
+    @property
+    def data(self) -> dict:
+        return self._data
+
+    @data.setter
+    def data(self, value: dict):
+        self._data = value
+
+    def get_response(self):
+        if self.data["format"] == HTML:
+            return HttpResponse(render_report_html(self.data["report"]), content_type="text/html; charset=utf-8")
+        path, _ = get_report_pdf(self.data["report"])
+        return FileResponse(
+            storages[settings.REPORT_STORAGE].open(path, "rb"),
+            as_attachment=True,
+            filename=self.data["filename"],
+            content_type="application/pdf",
+        )
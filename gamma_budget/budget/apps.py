@@ -18,8 +18,10 @@ class BudgetConfig(AppConfig):
         """
         Method to perform app initialization.
 
-        Imports the configure function from budget.main and calls it.
+        Imports the configure function from budget.main and calls it, and connects
+        the signal receivers of budget.signals.
         """
+        import budget.signals  # noqa: F401
         from budget.main import configure
 
         configure()
@@ -1,6 +1,7 @@
 from abc import ABCMeta, abstractmethod
 
 from budget.domain.entities.alert import Alert
+from budget.domain.entities.page import Page
 
 
 class AbstractBaseAlertCreateDataAccess(metaclass=ABCMeta):
@@ -18,6 +19,10 @@ class AbstractBaseAlertListDataAccess(metaclass=ABCMeta):
     def get_alerts(self, user_id: int) -> list[Alert] | None:
         pass
 
+    @abstractmethod
+    def get_alerts_page(self, user_id: int, cursor: str | None = None, page_size: int | None = None) -> Page:
+        pass
+
 
 class AbstractBaseAlertUpdateDataAccess(metaclass=ABCMeta):
     """Base class for alert update data access."""
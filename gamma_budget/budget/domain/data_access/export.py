@@ -0,0 +1,15 @@
+from abc import ABCMeta, abstractmethod
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+
+
+class AbstractBaseLedgerExportDataAccess(metaclass=ABCMeta):
+    """Base class for ledger export data access."""
+
+    @abstractmethod
+    def iter_ledger(self, user_id: int) -> Iterator[dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    def aiter_ledger(self, user_id: int) -> AsyncIterator[dict[str, Any]]:
+        pass
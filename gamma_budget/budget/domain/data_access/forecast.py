@@ -0,0 +1,12 @@
+import datetime
+from abc import ABCMeta, abstractmethod
+
+from budget.domain.entities.forecast import Forecast
+
+
+class AbstractBaseForecastDataAccess(metaclass=ABCMeta):
+    """Base class for cash-flow forecast data access."""
+
+    @abstractmethod
+    def get_forecast(self, user_id: int, start: datetime.date, months: int, granularity: str) -> Forecast:
+        pass
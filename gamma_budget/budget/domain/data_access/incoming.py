@@ -1,6 +1,8 @@
 from abc import ABCMeta, abstractmethod
 
+from budget.domain.entities.bulk import BulkCreateResult
 from budget.domain.entities.incoming import Incoming
+from budget.domain.entities.page import Page
 
 
 class AbstractBaseIncomingCreateDataAccess(metaclass=ABCMeta):
@@ -10,6 +12,18 @@ class AbstractBaseIncomingCreateDataAccess(metaclass=ABCMeta):
     def create_incoming(self, data: dict, user_id: int) -> Incoming | None:
         pass
 
+    @abstractmethod
+    async def acreate_incoming(self, data: dict, user_id: int) -> Incoming | None:
+        pass
+
+
+class AbstractBaseIncomingBulkCreateDataAccess(metaclass=ABCMeta):
+    """Base class for incoming bulk create data access."""
+
+    @abstractmethod
+    def create_incomings(self, items: list[dict], user_id: int) -> BulkCreateResult:
+        pass
+
 
 class AbstractBaseIncomingListDataAccess(metaclass=ABCMeta):
     """Base class for incoming list data access."""
@@ -18,6 +32,22 @@ class AbstractBaseIncomingListDataAccess(metaclass=ABCMeta):
     def get_incomings(self, user_id: int) -> list[Incoming] | None:
         pass
 
+    @abstractmethod
+    def get_incomings_page(self, user_id: int, cursor: str | None = None, page_size: int | None = None) -> Page:
+        pass
+
+    @abstractmethod
+    def get_incomings_version(self, user_id: int) -> str:
+        pass
+
+    @abstractmethod
+    async def aget_incomings(self, user_id: int) -> list[Incoming] | None:
+        pass
+
+    @abstractmethod
+    async def aget_incomings_page(self, user_id: int, cursor: str | None = None, page_size: int | None = None) -> Page:
+        pass
+
 
 class AbstractBaseIncomingRetrieveDataAccess(metaclass=ABCMeta):
     """Base class for incoming retrieve data access."""
@@ -26,6 +56,14 @@ class AbstractBaseIncomingRetrieveDataAccess(metaclass=ABCMeta):
     def get_incoming(self, incoming_id: int, user_id: int) -> Incoming | None:
         pass
 
+    @abstractmethod
+    def get_incoming_version(self, incoming_id: int, user_id: int) -> str | None:
+        pass
+
+    @abstractmethod
+    async def aget_incoming(self, incoming_id: int, user_id: int) -> Incoming | None:
+        pass
+
 
 class AbstractBaseIncomingUpdateDataAccess(metaclass=ABCMeta):
     """Base class for incoming update data access."""
@@ -38,6 +76,10 @@ class AbstractBaseIncomingUpdateDataAccess(metaclass=ABCMeta):
     def update_incoming(self, user_id: int, incoming_id: str, data: dict) -> Incoming | None:
         pass
 
+    @abstractmethod
+    async def aupdate_incoming(self, user_id: int, incoming_id: str, data: dict) -> Incoming | None:
+        pass
+
 
 class AbstractBaseIncomingDeleteDataAccess(metaclass=ABCMeta):
     """Base class for incoming delete data access."""
@@ -49,3 +91,7 @@ class AbstractBaseIncomingDeleteDataAccess(metaclass=ABCMeta):
     @abstractmethod
     def delete_incoming(self, user_id: int, incoming_id: str) -> bool:
         pass
+
+    @abstractmethod
+    async def adelete_incoming(self, user_id: int, incoming_id: str) -> bool:
+        pass
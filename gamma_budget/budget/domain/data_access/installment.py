@@ -0,0 +1,27 @@
+from abc import ABCMeta, abstractmethod
+
+from budget.domain.entities.installment import InstallmentPlan
+
+
+class AbstractBaseInstallmentCreateDataAccess(metaclass=ABCMeta):
+    """Base class for installment plan create data access."""
+
+    @abstractmethod
+    def create_installment_plan(self, data: dict, user_id: int) -> InstallmentPlan | None:
+        pass
+
+
+class AbstractBaseInstallmentRetrieveDataAccess(metaclass=ABCMeta):
+    """Base class for installment plan retrieve data access."""
+
+    @abstractmethod
+    def get_installment_plan(self, revenue_id: str, user_id: int) -> InstallmentPlan | None:
+        pass
+
+
+class AbstractBaseInstallmentPayDataAccess(metaclass=ABCMeta):
+    """Base class for installment payment data access."""
+
+    @abstractmethod
+    def pay_installments(self, revenue_id: str, user_id: int, count: int) -> InstallmentPlan | None:
+        pass
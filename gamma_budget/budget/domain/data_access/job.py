@@ -0,0 +1,20 @@
+from abc import ABCMeta, abstractmethod
+from typing import Any
+
+from budget.domain.entities.job import Job
+
+
+class AbstractBaseJobEnqueueDataAccess(metaclass=ABCMeta):
+    """Base class for job enqueue data access."""
+
+    @abstractmethod
+    def enqueue_job(self, kind: str, payload: dict[str, Any]) -> Job:
+        pass
+
+
+class AbstractBaseJobRetrieveDataAccess(metaclass=ABCMeta):
+    """Base class for job retrieve data access."""
+
+    @abstractmethod
+    def get_job(self, job_id: str) -> Job | None:
+        pass
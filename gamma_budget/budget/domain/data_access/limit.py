@@ -1,6 +1,7 @@
 from abc import ABCMeta, abstractmethod
 
 from budget.domain.entities.limit import Limit
+from budget.domain.entities.page import Page
 
 
 class AbstractBaseLimitCreateDataAccess(metaclass=ABCMeta):
@@ -18,6 +19,10 @@ class AbstractBaseLimitListDataAccess(metaclass=ABCMeta):
     def get_limits(self, user_id: int) -> list[Limit] | None:
         pass
 
+    @abstractmethod
+    def get_limits_page(self, user_id: int, cursor: str | None = None, page_size: int | None = None) -> Page:
+        pass
+
 
 class AbstractBaseLimitUpdateDataAccess(metaclass=ABCMeta):
     """Base class for limit update data access."""
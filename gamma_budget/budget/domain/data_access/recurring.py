@@ -0,0 +1,28 @@
+import datetime
+from abc import ABCMeta, abstractmethod
+
+from budget.domain.entities.recurring import Recurring, RecurringOccurrence
+
+
+class AbstractBaseRecurringCreateDataAccess(metaclass=ABCMeta):
+    """Base class for recurring revenue create data access."""
+
+    @abstractmethod
+    def create_recurring(self, data: dict, user_id: int) -> Recurring | None:
+        pass
+
+
+class AbstractBaseRecurringExpandDataAccess(metaclass=ABCMeta):
+    """Base class for recurring revenue expansion data access."""
+
+    @abstractmethod
+    def expand_recurring(self, until: datetime.date, user_id: int | None = None) -> int:
+        pass
+
+
+class AbstractBaseRecurringProjectionDataAccess(metaclass=ABCMeta):
+    """Base class for recurring revenue projection data access."""
+
+    @abstractmethod
+    def get_projection(self, user_id: int, start: datetime.date, end: datetime.date) -> list[RecurringOccurrence]:
+        pass
@@ -0,0 +1,12 @@
+import datetime
+from abc import ABCMeta, abstractmethod
+
+from budget.domain.entities.report import MonthlyReport
+
+
+class AbstractBaseMonthlyReportDataAccess(metaclass=ABCMeta):
+    """Base class for monthly report data access."""
+
+    @abstractmethod
+    def get_monthly_report(self, user_id: int, month: datetime.date) -> MonthlyReport:
+        pass
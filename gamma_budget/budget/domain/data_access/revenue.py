@@ -1,5 +1,7 @@
 from abc import ABCMeta, abstractmethod
 
+from budget.domain.entities.bulk import BulkCreateResult
+from budget.domain.entities.page import Page
 from budget.domain.entities.revenue import Revenue
 
 
@@ -10,6 +12,18 @@ class AbstractBaseRevenueCreateDataAccess(metaclass=ABCMeta):
     def create_revenue(self, data: dict, user_id: int) -> Revenue | None:
         pass
 
+    @abstractmethod
+    async def acreate_revenue(self, data: dict, user_id: int) -> Revenue | None:
+        pass
+
+
+class AbstractBaseRevenueBulkCreateDataAccess(metaclass=ABCMeta):
+    """Base class for revenue bulk create data access."""
+
+    @abstractmethod
+    def create_revenues(self, items: list[dict], user_id: int) -> BulkCreateResult:
+        pass
+
 
 class AbstractBaseRevenueListDataAccess(metaclass=ABCMeta):
     """Base class for revenue list data access."""
@@ -18,6 +32,22 @@ class AbstractBaseRevenueListDataAccess(metaclass=ABCMeta):
     def get_revenues(self, user_id: int) -> list[Revenue] | None:
         pass
 
+    @abstractmethod
+    def get_revenues_page(self, user_id: int, cursor: str | None = None, page_size: int | None = None) -> Page:
+        pass
+
+    @abstractmethod
+    def get_revenues_version(self, user_id: int) -> str:
+        pass
+
+    @abstractmethod
+    async def aget_revenues(self, user_id: int) -> list[Revenue] | None:
+        pass
+
+    @abstractmethod
+    async def aget_revenues_page(self, user_id: int, cursor: str | None = None, page_size: int | None = None) -> Page:
+        pass
+
 
 class AbstractBaseRevenueRetrieveDataAccess(metaclass=ABCMeta):
     """Base class for revenue retrieve data access."""
@@ -26,6 +56,14 @@ class AbstractBaseRevenueRetrieveDataAccess(metaclass=ABCMeta):
     def get_revenue(self, revenue_id: int, user_id: int) -> Revenue | None:
         pass
 
+    @abstractmethod
+    def get_revenue_version(self, revenue_id: int, user_id: int) -> str | None:
+        pass
+
+    @abstractmethod
+    async def aget_revenue(self, revenue_id: int, user_id: int) -> Revenue | None:
+        pass
+
 
 class AbstractBaseRevenueUpdateDataAccess(metaclass=ABCMeta):
     """Base class for revenue update data access."""
@@ -38,6 +76,10 @@ class AbstractBaseRevenueUpdateDataAccess(metaclass=ABCMeta):
     def update_revenue(self, user_id: int, revenue_id: str, data: dict) -> Revenue | None:
         pass
 
+    @abstractmethod
+    async def aupdate_revenue(self, user_id: int, revenue_id: str, data: dict) -> Revenue | None:
+        pass
+
 
 class AbstractBaseRevenueDeleteDataAccess(metaclass=ABCMeta):
     """Base class for revenue delete data access."""
@@ -49,3 +91,7 @@ class AbstractBaseRevenueDeleteDataAccess(metaclass=ABCMeta):
     @abstractmethod
     def delete_revenue(self, user_id: int, revenue_id: str) -> bool:
         pass
+
+    @abstractmethod
+    async def adelete_revenue(self, user_id: int, revenue_id: str) -> bool:
+        pass
@@ -0,0 +1,22 @@
+from abc import ABCMeta, abstractmethod
+from collections.abc import Iterable
+from typing import Any
+
+from budget.domain.entities.job import Job
+from budget.domain.entities.statement import StatementImportResult, StatementLine
+
+
+class AbstractBaseStatementUploadDataAccess(metaclass=ABCMeta):
+    """Base class for statement upload data access."""
+
+    @abstractmethod
+    def store_statement(self, user_id: int, upload: Any, statement_format: str, rules: list[dict]) -> Job:
+        pass
+
+
+class AbstractBaseStatementImportDataAccess(metaclass=ABCMeta):
+    """Base class for statement import data access."""
+
+    @abstractmethod
+    def import_statement(self, user_id: int, lines: Iterable[StatementLine], rules: list[dict]) -> StatementImportResult:
+        pass
@@ -0,0 +1,11 @@
+from abc import ABCMeta, abstractmethod
+
+from budget.domain.entities.summary import MonthlySummary
+
+
+class AbstractBaseSummaryDataAccess(metaclass=ABCMeta):
+    """Base class for monthly summary data access."""
+
+    @abstractmethod
+    def get_monthly_summary(self, user_id: int) -> list[MonthlySummary]:
+        pass
@@ -0,0 +1,31 @@
+class BulkCreateResult:
+    """
+    Class representing the outcome of creating many records in one request.
+
+    Every record is created or, when any of them is invalid, the request is rejected
+    before reaching the repository.
+
+    Attributes:
+    ----------
+        ids (list[str]): The IDs of the created records, in the order of the request.
+    """
+
+    def __init__(self, ids: list[str]) -> None:
+        """
+        Initialize the result.
+
+        Args:
+        ----
+            ids (list[str]): The IDs of the created records, in the order of the request.
+        """
+        self.ids = ids
+
+    def to_dict(self) -> dict:
+        """
+        Convert the result to a dictionary.
+
+        Returns:
+        -------
+            dict: A dictionary representation of the result.
+        """
+        return {"created": len(self.ids), "ids": self.ids}
@@ -0,0 +1,22 @@
+from budget.domain.entities.statement import CSV
+
+NDJSON = "ndjson"
+EXPORT_FORMATS = (CSV, NDJSON)
+
+# Columns of the ledger export. Every record has a ``record_type``; the other columns
+# are empty for the record types that do not have them.
+EXPORT_COLUMNS = (
+    "record_type",
+    "id",
+    "date",
+    "name",
+    "description",
+    "amount",
+    "paid",
+    "payment_date",
+    "category_name",
+    "limit",
+    "message",
+    "user_email",
+    "revenue_id",
+)
@@ -0,0 +1,93 @@
+import datetime
+from decimal import Decimal
+from itertools import accumulate
+
+MONTH = "month"
+DAY = "day"
+GRANULARITIES = (MONTH, DAY)
+
+
+class ForecastBucket:
+    """
+    Class representing the expected cash flow of one day or month.
+
+    Attributes:
+    ----------
+        period (datetime.date): The day, or the first day of the month, of the bucket.
+        incomings (Decimal): The incomings launched in the bucket.
+        revenues (Decimal): The revenues, installments and recurring revenues due in the bucket.
+    """
+
+    def __init__(self, period: datetime.date, incomings: Decimal, revenues: Decimal) -> None:
+        """
+        Initialize the bucket.
+
+        Args:
+        ----
+            period (datetime.date): The day, or the first day of the month, of the bucket.
+            incomings (Decimal): The incomings launched in the bucket.
+            revenues (Decimal): The revenues, installments and recurring revenues due in the bucket.
+        """
+        self.period = period
+        self.incomings = incomings
+        self.revenues = revenues
+
+    @property
+    def net(self) -> Decimal:
+        """The cash flow of the bucket: incomings minus revenues."""
+        return self.incomings - self.revenues
+
+
+class Forecast:
+    """
+    Class representing the projected balance of a user, bucket by bucket.
+
+    Attributes:
+    ----------
+        granularity (str): The length of the buckets: month or day.
+        opening_balance (Decimal): The balance before the first bucket.
+        buckets (list[ForecastBucket]): The buckets, in order.
+    """
+
+    def __init__(self, granularity: str, opening_balance: Decimal, buckets: list[ForecastBucket]) -> None:
+        """
+        Initialize the forecast.
+
+        Args:
+        ----
+            granularity (str): The length of the buckets: month or day.
+            opening_balance (Decimal): The balance before the first bucket.
+            buckets (list[ForecastBucket]): The buckets, in order.
+        """
+        self.granularity = granularity
+        self.opening_balance = opening_balance
+        self.buckets = buckets
+
+    @property
+    def balances(self) -> list[Decimal]:
+        """The balance at the end of each bucket."""
+        return list(accumulate((bucket.net for bucket in self.buckets), initial=self.opening_balance))[1:]
+
+    def to_dict(self) -> dict:
+        """
+        Convert the forecast to a dictionary.
+
+        Returns:
+        -------
+            dict: A dictionary representation of the forecast.
+        """
+        period_format = "%Y-%m" if self.granularity == MONTH else "%Y-%m-%d"
+        return {
+            "granularity": self.granularity,
+            "opening_balance": self.opening_balance,
+            "buckets": [
+                {
+                    "period": bucket.period.strftime(period_format),
+                    "incomings": bucket.incomings,
+                    "revenues": bucket.revenues,
+                    "net": bucket.net,
+                    "balance": balance,
+                }
+                for bucket, balance in zip(self.buckets, self.balances, strict=True)
+            ],
+        }
@@ -0,0 +1,146 @@
+import datetime
+from decimal import ROUND_DOWN, Decimal
+
+CENT = Decimal("0.01")
+
+
+def split_amount(total: Decimal, count: int) -> list[Decimal]:
+    """
+    Split an amount into installments that add up to it exactly.
+
+    Every installment gets the amount divided by ``count`` rounded down to the cent; the
+    cents left over are added one by one to the first installments.
+
+    Args:
+    ----
+        total (Decimal): The amount to split.
+        count (int): The number of installments.
+
+    Returns:
+    -------
+        list[Decimal]: The amount of each installment, in order.
+    """
+    base = (total / count).quantize(CENT, rounding=ROUND_DOWN)
+    remainder = int((total - base * count) / CENT)
+    return [base + CENT if index < remainder else base for index in range(count)]
+
+
+class Installment:
+    """
+    Class representing one installment of a plan.
+
+    Attributes:
+    ----------
+        id (str): The ID of the installment.
+        number (int): The position of the installment in the plan, starting at 1.
+        amount (Decimal): The amount of the installment.
+        due_date (datetime.date): The due date of the installment.
+        paid (bool): Flag indicating if the installment is paid.
+    """
+
+    def __init__(self, id: str, number: int, amount: Decimal, due_date: datetime.date, paid: bool) -> None:
+        """
+        Initialize the installment.
+
+        Args:
+        ----
+            id (str): The ID of the installment.
+            number (int): The position of the installment in the plan, starting at 1.
+            amount (Decimal): The amount of the installment.
+            due_date (datetime.date): The due date of the installment.
+            paid (bool): Flag indicating if the installment is paid.
+        """
+        self.id = id
+        self.number = number
+        self.amount = amount
+        self.due_date = due_date
+        self.paid = paid
+
+    def to_dict(self) -> dict:
+        """
+        Convert the installment to a dictionary.
+
+        Returns:
+        -------
+            dict: A dictionary representation of the installment.
+        """
+        return {
+            "id": self.id,
+            "number": self.number,
+            "amount": self.amount,
+            "due_date": self.due_date,
+            "paid": self.paid,
+        }
+
+
+class InstallmentPlan:
+    """
+    Class representing the installment plan of a revenue.
+
+    Attributes:
+    ----------
+        revenue_id (str): The ID of the revenue paid in installments.
+        name (str): The name of the revenue.
+        period_unit (str): The unit between two due dates.
+        payment_method (str | None): The payment method of the installments.
+        periods_paid (int): The number of installments paid.
+        installments (list[Installment]): The installments, in order.
+    """
+
+    def __init__(
+        self,
+        revenue_id: str,
+        name: str,
+        period_unit: str,
+        payment_method: str | None,
+        periods_paid: int,
+        installments: list[Installment],
+    ) -> None:
+        """
+        Initialize the installment plan.
+
+        Args:
+        ----
+            revenue_id (str): The ID of the revenue paid in installments.
+            name (str): The name of the revenue.
+            period_unit (str): The unit between two due dates.
+            payment_method (str | None): The payment method of the installments.
+            periods_paid (int): The number of installments paid.
+            installments (list[Installment]): The installments, in order.
+        """
+        self.revenue_id = revenue_id
+        self.name = name
+        self.period_unit = period_unit
+        self.payment_method = payment_method
+        self.periods_paid = periods_paid
+        self.installments = installments
+
+    @property
+    def amount(self) -> Decimal:
+        """The total amount of the plan."""
+        return sum((installment.amount for installment in self.installments), Decimal("0.00"))
+
+    @property
+    def amount_paid(self) -> Decimal:
+        """The amount of the installments paid."""
+        return sum((installment.amount for installment in self.installments if installment.paid), Decimal("0.00"))
+
+    def to_dict(self) -> dict:
+        """
+        Convert the installment plan to a dictionary.
+
+        Returns:
+        -------
+            dict: A dictionary representation of the installment plan.
+        """
+        return {
+            "revenue_id": self.revenue_id,
+            "name": self.name,
+            "amount": self.amount,
+            "amount_paid": self.amount_paid,
+            "period_unit": self.period_unit,
+            "payment_method": self.payment_method,
+            "periods": len(self.installments),
+            "periods_paid": self.periods_paid,
+            "installments": [installment.to_dict() for installment in self.installments],
+        }
@@ -0,0 +1,81 @@
+import datetime
+from typing import Any
+
+# Job kinds, dispatched to their handlers by budget.utils.jobs.
+SEND_ALERT_EMAILS = "send_alert_emails"
+IMPORT_STATEMENT = "import_statement"
+
+
+class Job:
+    """
+    Class representing a background job.
+
+    Attributes:
+    ----------
+        id (str): The ID of the job.
+        kind (str): The name of the handler that runs the job.
+        status (str): The state of the job: pending, running, succeeded or failed.
+        attempts (int): How many times the job was claimed by a worker.
+        run_after (datetime.datetime): The job is not claimed before this moment.
+        result (Any): The value returned by the handler, once the job succeeded.
+        last_error (str | None): The error of the last failed attempt.
+        created_at (datetime.datetime): The date and time the job was enqueued.
+        finished_at (datetime.datetime | None): The date and time the job succeeded or failed for good.
+    """
+
+    def __init__(
+        self,
+        id: str,
+        kind: str,
+        status: str,
+        attempts: int,
+        run_after: datetime.datetime,
+        result: Any,
+        last_error: str | None,
+        created_at: datetime.datetime,
+        finished_at: datetime.datetime | None,
+    ) -> None:
+        """
+        Initialize the job.
+
+        Args:
+        ----
+            id (str): The ID of the job.
+            kind (str): The name of the handler that runs the job.
+            status (str): The state of the job: pending, running, succeeded or failed.
+            attempts (int): How many times the job was claimed by a worker.
+            run_after (datetime.datetime): The job is not claimed before this moment.
+            result (Any): The value returned by the handler, once the job succeeded.
+            last_error (str | None): The error of the last failed attempt.
+            created_at (datetime.datetime): The date and time the job was enqueued.
+            finished_at (datetime.datetime | None): The date and time the job succeeded or failed for good.
+        """
+        self.id = id
+        self.kind = kind
+        self.status = status
+        self.attempts = attempts
+        self.run_after = run_after
+        self.result = result
+        self.last_error = last_error
+        self.created_at = created_at
+        self.finished_at = finished_at
+
+    def to_dict(self) -> dict:
+        """
+        Convert the job to a dictionary.
+
+        Returns:
+        -------
+            dict: A dictionary representation of the job.
+        """
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "attempts": self.attempts,
+            "run_after": self.run_after,
+            "result": self.result,
+            "last_error": self.last_error,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+        }
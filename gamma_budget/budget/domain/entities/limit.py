@@ -1,4 +1,5 @@
 import datetime
+from decimal import Decimal
 from typing import Any
 
 
@@ -14,6 +15,7 @@ class Limit:
         amount (float): The amount of the limit record.
         launch_date (datetime.datetime): The launch date of the limit record.
         category (int): The category of the limit record.
+        consumed (Decimal | None): The revenues of the category in the limit month, when computed.
     """
 
     def __init__(
@@ -24,6 +26,7 @@ class Limit:
         amount: float,
         limit_date: datetime.datetime,
         category: dict[str, Any],
+        consumed: Decimal | None = None,
     ) -> None:
         """
         Initialize the limit record.
@@ -36,6 +39,7 @@ class Limit:
             amount (float): The amount of the limit record.
             launch_date (datetime.datetime): The launch date of the limit record.
             category (int): The category of the limit record.
+            consumed (Decimal | None): The revenues of the category in the limit month, when computed.
         """
         self.id = id
         self.user_id = user_id
@@ -43,6 +47,14 @@ class Limit:
         self.amount = amount
         self.limit_date = limit_date
         self.category = category
+        self.consumed = consumed
+
+    @property
+    def over_limit(self) -> bool | None:
+        """Whether the consumption exceeds the limit, or None when it was not computed."""
+        if self.consumed is None:
+            return None
+        return self.consumed > self.limit
 
     def to_dict(self) -> dict:
         """
@@ -59,4 +71,6 @@ class Limit:
             "amount": self.amount,
             "limit_date": self.limit_date,
             "category": self.category,
+            "consumed": self.consumed,
+            "over_limit": self.over_limit,
         }
@@ -0,0 +1,41 @@
+from typing import Any
+
+
+class Page:
+    """
+    Class representing a keyset paginated slice of records.
+
+    Attributes:
+    ----------
+        items (list[Any]): The entities of the current page.
+        next_cursor (str | None): The opaque cursor of the next page, or None on the last page.
+    """
+
+    def __init__(
+        self,
+        items: list[Any],
+        next_cursor: str | None,
+    ) -> None:
+        """
+        Initialize the page.
+
+        Args:
+        ----
+            items (list[Any]): The entities of the current page.
+            next_cursor (str | None): The opaque cursor of the next page, or None on the last page.
+        """
+        self.items = items
+        self.next_cursor = next_cursor
+
+    def to_dict(self) -> dict:
+        """
+        Convert the page to a dictionary.
+
+        Returns:
+        -------
+            dict: A dictionary with the serialized entities and the next cursor.
+        """
+        return {
+            "results": [item.to_dict() for item in self.items],
+            "next_cursor": self.next_cursor,
+        }
@@ -0,0 +1,237 @@
+import calendar
+import datetime
+from collections.abc import Iterator
+from decimal import Decimal
+from typing import Any
+
+DAYS = "days"
+WEEKS = "weeks"
+MONTHS = "months"
+YEARS = "years"
+PERIOD_UNITS = (DAYS, WEEKS, MONTHS, YEARS)
+
+
+def add_periods(day: datetime.date, count: int, period_unit: str) -> datetime.date:
+    """
+    Move a date by a number of periods.
+
+    Months and years keep the day of the month, clamped to the length of shorter months.
+
+    Args:
+    ----
+        day (datetime.date): The starting date.
+        count (int): The number of periods.
+        period_unit (str): The unit of the period: days, weeks, months or years.
+
+    Returns:
+    -------
+        datetime.date: The moved date.
+    """
+    if period_unit == DAYS:
+        return day + datetime.timedelta(days=count)
+    if period_unit == WEEKS:
+        return day + datetime.timedelta(weeks=count)
+    months = day.month - 1 + (count * 12 if period_unit == YEARS else count)
+    year, month = day.year + months // 12, months % 12 + 1
+    return day.replace(year=year, month=month, day=min(day.day, calendar.monthrange(year, month)[1]))
+
+
+class Recurring:
+    """
+    Class representing a recurring revenue rule.
+
+    The rule repeats its revenue every ``period`` ``period_unit``, starting at
+    ``payment_date``.
+
+    Attributes:
+    ----------
+        id (str): The ID of the rule.
+        user_id (int): The ID of the user.
+        revenue_id (str): The ID of the revenue repeated by the rule.
+        name (str): The name of the repeated revenue.
+        category (dict[str, Any]): The category of the repeated revenue.
+        amount (Decimal): The amount of every occurrence.
+        payment_method (str | None): The payment method of the occurrences.
+        payment_date (datetime.date): The date of the first occurrence.
+        period (int): The number of units between two occurrences.
+        period_unit (str): The unit of the period: days, weeks, months or years.
+        active (bool): Flag indicating if the rule still generates occurrences.
+        expanded_until (datetime.date | None): The last day already expanded into revenues.
+    """
+
+    def __init__(
+        self,
+        id: str,
+        user_id: int,
+        revenue_id: str,
+        name: str,
+        category: dict[str, Any],
+        amount: Decimal,
+        payment_method: str | None,
+        payment_date: datetime.date,
+        period: int,
+        period_unit: str,
+        active: bool,
+        expanded_until: datetime.date | None = None,
+    ) -> None:
+        """
+        Initialize the recurring revenue rule.
+
+        Args:
+        ----
+            id (str): The ID of the rule.
+            user_id (int): The ID of the user.
+            revenue_id (str): The ID of the revenue repeated by the rule.
+            name (str): The name of the repeated revenue.
+            category (dict[str, Any]): The category of the repeated revenue.
+            amount (Decimal): The amount of every occurrence.
+            payment_method (str | None): The payment method of the occurrences.
+            payment_date (datetime.date): The date of the first occurrence.
+            period (int): The number of units between two occurrences.
+            period_unit (str): The unit of the period: days, weeks, months or years.
+            active (bool): Flag indicating if the rule still generates occurrences.
+            expanded_until (datetime.date | None): The last day already expanded into revenues.
+        """
+        self.id = id
+        self.user_id = user_id
+        self.revenue_id = revenue_id
+        self.name = name
+        self.category = category
+        self.amount = amount
+        self.payment_method = payment_method
+        self.payment_date = payment_date
+        self.period = period
+        self.period_unit = period_unit
+        self.active = active
+        self.expanded_until = expanded_until
+
+    def occurrence(self, index: int) -> datetime.date:
+        """
+        Compute the date of an occurrence.
+
+        Args:
+        ----
+            index (int): The position of the occurrence, 0 being the first one.
+
+        Returns:
+        -------
+            datetime.date: The date of the occurrence.
+        """
+        return add_periods(self.payment_date, self.period * index, self.period_unit)
+
+    def occurrences_between(self, start: datetime.date, end: datetime.date) -> Iterator[datetime.date]:
+        """
+        Yield the dates of the occurrences inside a window.
+
+        Args:
+        ----
+            start (datetime.date): The first day of the window.
+            end (datetime.date): The last day of the window.
+
+        Yields:
+        ------
+            datetime.date: The occurrence dates, in order.
+        """
+        if self.period <= 0:
+            return
+        # Jump close to the window instead of walking every occurrence since the first one.
+        index = max(0, self._index_before(start))
+        while (day := self.occurrence(index)) <= end:
+            if day >= start:
+                yield day
+            index += 1
+
+    def first_unexpanded_day(self) -> datetime.date:
+        """
+        Compute the first day not expanded into revenues yet.
+
+        Occurrences before it are never generated again, even if their revenue was deleted
+        or moved to another date.
+
+        Returns:
+        -------
+            datetime.date: The day after ``expanded_until``, or the first occurrence if the rule was never expanded.
+        """
+        if self.expanded_until is None:
+            return self.payment_date
+        return max(self.payment_date, self.expanded_until + datetime.timedelta(days=1))
+
+    def _index_before(self, day: datetime.date) -> int:
+        if self.period_unit in (DAYS, WEEKS):
+            unit_days = 7 if self.period_unit == WEEKS else 1
+            return (day - self.payment_date).days // (unit_days * self.period) - 1
+        months = (day.year - self.payment_date.year) * 12 + day.month - self.payment_date.month
+        return months // (self.period * (12 if self.period_unit == YEARS else 1)) - 1
+
+    def to_dict(self) -> dict:
+        """
+        Convert the recurring revenue rule to a dictionary.
+
+        Returns:
+        -------
+            dict: A dictionary representation of the rule.
+        """
+        return {
+            "id": self.id,
+            "user_id": self.user_id,
+            "revenue_id": self.revenue_id,
+            "name": self.name,
+            "category": self.category,
+            "amount": self.amount,
+            "payment_method": self.payment_method,
+            "payment_date": self.payment_date,
+            "period": self.period,
+            "period_unit": self.period_unit,
+            "active": self.active,
+            "expanded_until": self.expanded_until,
+        }
+
+
+class RecurringOccurrence:
+    """
+    Class representing a future occurrence of a recurring revenue that is not stored.
+
+    Attributes:
+    ----------
+        recurring_id (str): The ID of the rule.
+        name (str): The name of the revenue.
+        category (dict[str, Any]): The category of the revenue.
+        amount (Decimal): The amount of the occurrence.
+        expiration_date (datetime.date): The date of the occurrence.
+    """
+
+    def __init__(self, recurring_id: str, name: str, category: dict[str, Any], amount: Decimal, expiration_date: datetime.date) -> None:
+        """
+        Initialize the occurrence.
+
+        Args:
+        ----
+            recurring_id (str): The ID of the rule.
+            name (str): The name of the revenue.
+            category (dict[str, Any]): The category of the revenue.
+            amount (Decimal): The amount of the occurrence.
+            expiration_date (datetime.date): The date of the occurrence.
+        """
+        self.recurring_id = recurring_id
+        self.name = name
+        self.category = category
+        self.amount = amount
+        self.expiration_date = expiration_date
+
+    def to_dict(self) -> dict:
+        """
+        Convert the occurrence to a dictionary.
+
+        Returns:
+        -------
+            dict: A dictionary representation of the occurrence.
+        """
+        return {
+            "recurring_id": self.recurring_id,
+            "name": self.name,
+            "category": self.category,
+            "amount": self.amount,
+            "expiration_date": self.expiration_date,
+            "paid": False,
+            "virtual": True,
+        }
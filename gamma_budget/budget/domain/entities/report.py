@@ -0,0 +1,166 @@
+import datetime
+import hashlib
+import json
+from decimal import Decimal
+
+HTML = "html"
+PDF = "pdf"
+REPORT_FORMATS = (PDF, HTML)
+
+
+class ReportCategory:
+    """
+    Class representing the totals of one category in a monthly report.
+
+    Attributes:
+    ----------
+        name (str): The name of the category.
+        incomings (Decimal): The total amount of incomings launched in the month.
+        revenues_paid (Decimal): The total amount of paid revenues expiring in the month.
+        revenues_unpaid (Decimal): The total amount of unpaid revenues expiring in the month.
+    """
+
+    def __init__(self, name: str, incomings: Decimal, revenues_paid: Decimal, revenues_unpaid: Decimal) -> None:
+        """
+        Initialize the category totals.
+
+        Args:
+        ----
+            name (str): The name of the category.
+            incomings (Decimal): The total amount of incomings launched in the month.
+            revenues_paid (Decimal): The total amount of paid revenues expiring in the month.
+            revenues_unpaid (Decimal): The total amount of unpaid revenues expiring in the month.
+        """
+        self.name = name
+        self.incomings = incomings
+        self.revenues_paid = revenues_paid
+        self.revenues_unpaid = revenues_unpaid
+
+    def to_dict(self) -> dict:
+        """
+        Convert the category totals to a dictionary.
+
+        Returns:
+        -------
+            dict: A dictionary representation of the category totals.
+        """
+        return {
+            "name": self.name,
+            "incomings": self.incomings,
+            "revenues_paid": self.revenues_paid,
+            "revenues_unpaid": self.revenues_unpaid,
+        }
+
+
+class ReportLimit:
+    """
+    Class representing a spending limit in a monthly report.
+
+    Attributes:
+    ----------
+        category_name (str): The name of the limited category.
+        limit (Decimal): The limit amount.
+        amount (Decimal): The amount of the limit.
+    """
+
+    def __init__(self, category_name: str, limit: Decimal, amount: Decimal) -> None:
+        """
+        Initialize the limit.
+
+        Args:
+        ----
+            category_name (str): The name of the limited category.
+            limit (Decimal): The limit amount.
+            amount (Decimal): The amount of the limit.
+        """
+        self.category_name = category_name
+        self.limit = limit
+        self.amount = amount
+
+    @property
+    def exceeded(self) -> bool:
+        """Whether the amount is over the limit."""
+        return self.amount > self.limit
+
+    def to_dict(self) -> dict:
+        """
+        Convert the limit to a dictionary.
+
+        Returns:
+        -------
+            dict: A dictionary representation of the limit.
+        """
+        return {
+            "category_name": self.category_name,
+            "limit": self.limit,
+            "amount": self.amount,
+            "exceeded": self.exceeded,
+        }
+
+
+class MonthlyReport:
+    """
+    Class representing the monthly statement of a user.
+
+    Attributes:
+    ----------
+        user_id (int): The ID of the user.
+        month (datetime.date): The first day of the month.
+        categories (list[ReportCategory]): The totals of each category with records in the month.
+        limits (list[ReportLimit]): The limits of the month.
+    """
+
+    def __init__(self, user_id: int, month: datetime.date, categories: list[ReportCategory], limits: list[ReportLimit]) -> None:
+        """
+        Initialize the monthly report.
+
+        Args:
+        ----
+            user_id (int): The ID of the user.
+            month (datetime.date): The first day of the month.
+            categories (list[ReportCategory]): The totals of each category with records in the month.
+            limits (list[ReportLimit]): The limits of the month.
+        """
+        self.user_id = user_id
+        self.month = month
+        self.categories = categories
+        self.limits = limits
+
+    @property
+    def incomings(self) -> Decimal:
+        """The total amount of incomings launched in the month."""
+        return sum((category.incomings for category in self.categories), Decimal("0.00"))
+
+    @property
+    def revenues(self) -> Decimal:
+        """The total amount of revenues expiring in the month."""
+        return sum((category.revenues_paid + category.revenues_unpaid for category in self.categories), Decimal("0.00"))
+
+    @property
+    def net(self) -> Decimal:
+        """The balance of the month: incomings minus revenues."""
+        return self.incomings - self.revenues
+
+    @property
+    def content_hash(self) -> str:
+        """The hex SHA-256 of the data of the report, which changes only when the data does."""
+        content = json.dumps(self.to_dict(), sort_keys=True, default=str)
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def to_dict(self) -> dict:
+        """
+        Convert the monthly report to a dictionary.
+
+        Returns:
+        -------
+            dict: A dictionary representation of the monthly report.
+        """
+        return {
+            "user_id": self.user_id,
+            "month": self.month.strftime("%Y-%m"),
+            "incomings": self.incomings,
+            "revenues": self.revenues,
+            "net": self.net,
+            "categories": [category.to_dict() for category in self.categories],
+            "limits": [limit.to_dict() for limit in self.limits],
+        }
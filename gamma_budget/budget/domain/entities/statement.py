@@ -0,0 +1,82 @@
+import datetime
+from decimal import Decimal
+
+CSV = "csv"
+OFX = "ofx"
+STATEMENT_FORMATS = (CSV, OFX)
+
+
+class StatementLine:
+    """
+    Class representing one transaction read from a bank statement.
+
+    Attributes:
+    ----------
+        line_number (int): The position of the transaction in the file, for error messages.
+        date (datetime.date): The date of the transaction.
+        amount (Decimal): The signed amount: positive for incomings, negative for revenues.
+        description (str): The description of the transaction.
+        bank_id (str | None): The ID given by the bank to the transaction, if the file has one.
+    """
+
+    def __init__(self, line_number: int, date: datetime.date, amount: Decimal, description: str, bank_id: str | None = None) -> None:
+        """
+        Initialize the statement line.
+
+        Args:
+        ----
+            line_number (int): The position of the transaction in the file, for error messages.
+            date (datetime.date): The date of the transaction.
+            amount (Decimal): The signed amount: positive for incomings, negative for revenues.
+            description (str): The description of the transaction.
+            bank_id (str | None): The ID given by the bank to the transaction, if the file has one.
+        """
+        self.line_number = line_number
+        self.date = date
+        self.amount = amount
+        self.description = description
+        self.bank_id = bank_id
+
+
+class StatementImportResult:
+    """
+    Class representing the outcome of importing a bank statement.
+
+    Attributes:
+    ----------
+        incomings (int): The number of incomings created.
+        revenues (int): The number of revenues created.
+        duplicates (int): The number of lines skipped because they were already imported.
+        errors (list[str]): The lines that could not be read.
+    """
+
+    def __init__(self, incomings: int = 0, revenues: int = 0, duplicates: int = 0, errors: list[str] | None = None) -> None:
+        """
+        Initialize the result.
+
+        Args:
+        ----
+            incomings (int): The number of incomings created.
+            revenues (int): The number of revenues created.
+            duplicates (int): The number of lines skipped because they were already imported.
+            errors (list[str] | None): The lines that could not be read.
+        """
+        self.incomings = incomings
+        self.revenues = revenues
+        self.duplicates = duplicates
+        self.errors = errors if errors is not None else []
+
+    def to_dict(self) -> dict:
+        """
+        Convert the result to a dictionary.
+
+        Returns:
+        -------
+            dict: A dictionary representation of the result.
+        """
+        return {
+            "incomings": self.incomings,
+            "revenues": self.revenues,
+            "duplicates": self.duplicates,
+            "errors": self.errors,
+        }
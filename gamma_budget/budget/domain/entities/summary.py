@@ -0,0 +1,64 @@
+import datetime
+from decimal import Decimal
+
+
+class MonthlySummary:
+    """
+    Class representing the budget totals of one month.
+
+    Attributes:
+    ----------
+        month (datetime.date): The first day of the month.
+        incomings (Decimal): The total amount of incomings launched in the month.
+        revenues_paid (Decimal): The total amount of paid revenues expiring in the month.
+        revenues_unpaid (Decimal): The total amount of unpaid revenues expiring in the month.
+    """
+
+    def __init__(
+        self,
+        month: datetime.date,
+        incomings: Decimal,
+        revenues_paid: Decimal,
+        revenues_unpaid: Decimal,
+    ) -> None:
+        """
+        Initialize the monthly summary.
+
+        Args:
+        ----
+            month (datetime.date): The first day of the month.
+            incomings (Decimal): The total amount of incomings launched in the month.
+            revenues_paid (Decimal): The total amount of paid revenues expiring in the month.
+            revenues_unpaid (Decimal): The total amount of unpaid revenues expiring in the month.
+        """
+        self.month = month
+        self.incomings = incomings
+        self.revenues_paid = revenues_paid
+        self.revenues_unpaid = revenues_unpaid
+
+    @property
+    def revenues(self) -> Decimal:
+        """The total amount of revenues expiring in the month."""
+        return self.revenues_paid + self.revenues_unpaid
+
+    @property
+    def net(self) -> Decimal:
+        """The balance of the month: incomings minus revenues."""
+        return self.incomings - self.revenues
+
+    def to_dict(self) -> dict:
+        """
+        Convert the monthly summary to a dictionary.
+
+        Returns:
+        -------
+            dict: A dictionary representation of the monthly summary.
+        """
+        return {
+            "month": self.month.strftime("%Y-%m"),
+            "incomings": self.incomings,
+            "revenues": self.revenues,
+            "revenues_paid": self.revenues_paid,
+            "revenues_unpaid": self.revenues_unpaid,
+            "net": self.net,
+        }
@@ -1,5 +1,13 @@
 from .alert import *
 from .categories import *
+from .export import *
+from .forecast import *
 from .incoming import *
+from .installment import *
+from .job import *
 from .limit import *
+from .recurring import *
+from .report import *
 from .revenue import *
+from .statement import *
+from .summary import *
@@ -1,3 +1,4 @@
+from datetime import date
 from typing import Any
 
 from budget.domain.data_access.alert import (
@@ -6,6 +7,8 @@ from budget.domain.data_access.alert import (
     AbstractBaseAlertListDataAccess,
     AbstractBaseAlertUpdateDataAccess,
 )
+from budget.domain.data_access.job import AbstractBaseJobEnqueueDataAccess
+from budget.domain.entities.job import SEND_ALERT_EMAILS
 from budget.domain.use_cases.base import (
     AbstractAlertCreateUseCase,
     AbstractAlertDeleteUseCase,
@@ -20,7 +23,6 @@ from budget.domain.use_cases.features import (
     ValidateDataAccessUseCaseMixin,
     ValidateOutputResponseUseCaseMixin,
 )
-from budget.utils import SendEmail
 
 
 class AlertCreateUseCase(
@@ -115,13 +117,17 @@ class AlertListUseCase(
     data_access: type[AbstractBaseAlertListDataAccess] | None = None
     output_response: type[AbstractBaseOutput] | None = None
 
-    def __init__(self, user_id: int):
+    def __init__(self, user_id: int, cursor: str | None = None, page_size: int | None = None):
         super().__init__()
         self.user_id = user_id
+        self.cursor = cursor
+        self.page_size = page_size
         self.result: list[dict] = []
 
     def execute(self, *args, **kwargs):
         self.output_response.data = []
+        if self.cursor is not None or self.page_size is not None:
+            return self._execute_paginated()
         alerts = self.data_access().get_alerts(self.user_id)
         if not alerts:
             return self._build_output()
@@ -129,6 +135,12 @@ class AlertListUseCase(
             self.result.append(alert.to_dict())
         return self._build_output()
 
+    def _execute_paginated(self):
+        page = self.data_access().get_alerts_page(self.user_id, cursor=self.cursor, page_size=self.page_size)
+        self.output = self.get_output_response()
+        self.output.data = page.to_dict()
+        return self.output
+
     def _build_output(self):
         self.output = self.get_output_response()
         self.output.data = self.result
@@ -274,16 +286,25 @@ class AlertDeleteUseCase(
 
 class AlertSendEmailUseCase(
     AbstractAlertSendEmailUseCase,
+    GetDataAccessUseCaseMixin[AbstractBaseJobEnqueueDataAccess],
+    ValidateDataAccessUseCaseMixin,
     GetOutputResponseUseCaseMixin,
     ValidateOutputResponseUseCaseMixin,
 ):
     """
     Use case for sending email alerts.
 
+    The emails are sent by the ``run_worker`` command; the use case only enqueues the job.
+
     Extends:
         AbstractAlertSendEmailUseCase
+        GetDataAccessUseCaseMixin[AbstractBaseJobEnqueueDataAccess]
+        ValidateDataAccessUseCaseMixin
+        GetOutputResponseUseCaseMixin
+        ValidateOutputResponseUseCaseMixin
     """
 
+    data_access: type[AbstractBaseJobEnqueueDataAccess] | None = None
     output_response: type[AbstractBaseOutput] | None = None
 
     def __init__(self, data: dict):
@@ -298,17 +319,22 @@ class AlertSendEmailUseCase(
         -------
             Message: The output response.
         """
-        SendEmail().send_today_alerts()
-        return self._build_output()
+        job = self.data_access().enqueue_job(SEND_ALERT_EMAILS, {"alert_date": date.today().isoformat()})
+        return self._build_output(job.id, job.status)
 
-    def _build_output(self):
+    def _build_output(self, job_id: str, job_status: str):
         """
         Build the output response.
 
+        Args:
+        ----
+            job_id (str): The ID of the enqueued job.
+            job_status (str): The status of the enqueued job.
+
         Returns:
         -------
             AbstractBaseOutput: The output response.
         """
         self.output = self.get_output_response()
-        self.output.data = {"message": "Emails trigered."}
+        self.output.data = {"message": "Emails trigered.", "job_id": job_id, "status": job_status}
         return self.output
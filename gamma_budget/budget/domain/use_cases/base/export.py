@@ -0,0 +1,10 @@
+from abc import ABCMeta, abstractmethod
+
+
+class AbstractLedgerExportUseCase(metaclass=ABCMeta):
+    """Base class for use cases export ledger output."""
+
+    @property
+    @abstractmethod
+    def execute(self):
+        pass
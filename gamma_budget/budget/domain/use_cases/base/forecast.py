@@ -0,0 +1,12 @@
+from abc import ABCMeta, abstractmethod
+
+from budget.domain.entities.forecast import Forecast
+
+
+class AbstractForecastUseCase(metaclass=ABCMeta):
+    """Base class for use cases cash-flow forecast output."""
+
+    @property
+    @abstractmethod
+    def execute(self) -> Forecast:
+        pass
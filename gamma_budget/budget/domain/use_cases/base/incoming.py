@@ -20,6 +20,20 @@ class AbstractIncomingCreateUseCase(metaclass=ABCMeta):
     def execute(self):
         pass
 
+    @property
+    @abstractmethod
+    async def aexecute(self):
+        pass
+
+
+class AbstractIncomingBulkCreateUseCase(metaclass=ABCMeta):
+    """Base class for use cases bulk create incomings output."""
+
+    @property
+    @abstractmethod
+    def execute(self):
+        pass
+
 
 class AbstractIncomingListUseCase(metaclass=ABCMeta):
     """Base class for use cases list incomings output."""
@@ -29,6 +43,11 @@ class AbstractIncomingListUseCase(metaclass=ABCMeta):
     def execute(self) -> list[Incoming]:
         pass
 
+    @property
+    @abstractmethod
+    async def aexecute(self) -> list[Incoming]:
+        pass
+
 
 class AbstractIncomingRetrieveUseCase(metaclass=ABCMeta):
     """Base class for use cases retrieve incoming output."""
@@ -38,6 +57,11 @@ class AbstractIncomingRetrieveUseCase(metaclass=ABCMeta):
     def execute(self):
         pass
 
+    @property
+    @abstractmethod
+    async def aexecute(self):
+        pass
+
 
 class AbstractIncomingUpdateUseCase(metaclass=ABCMeta):
     """Base class for use cases update incoming output."""
@@ -47,6 +71,11 @@ class AbstractIncomingUpdateUseCase(metaclass=ABCMeta):
     def execute(self):
         pass
 
+    @property
+    @abstractmethod
+    async def aexecute(self):
+        pass
+
 
 class AbstractIncomingDeleteUseCase(metaclass=ABCMeta):
     """Base class for use cases delete incoming output."""
@@ -55,3 +84,8 @@ class AbstractIncomingDeleteUseCase(metaclass=ABCMeta):
     @abstractmethod
     def execute(self):
         pass
+
+    @property
+    @abstractmethod
+    async def aexecute(self):
+        pass
@@ -0,0 +1,28 @@
+from abc import ABCMeta, abstractmethod
+
+
+class AbstractInstallmentCreateUseCase(metaclass=ABCMeta):
+    """Base class for use cases create installment plan output."""
+
+    @property
+    @abstractmethod
+    def execute(self):
+        pass
+
+
+class AbstractInstallmentRetrieveUseCase(metaclass=ABCMeta):
+    """Base class for use cases retrieve installment plan output."""
+
+    @property
+    @abstractmethod
+    def execute(self):
+        pass
+
+
+class AbstractInstallmentPayUseCase(metaclass=ABCMeta):
+    """Base class for use cases pay installments output."""
+
+    @property
+    @abstractmethod
+    def execute(self):
+        pass
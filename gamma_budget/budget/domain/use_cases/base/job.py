@@ -0,0 +1,10 @@
+from abc import ABCMeta, abstractmethod
+
+
+class AbstractJobRetrieveUseCase(metaclass=ABCMeta):
+    """Base class for use cases retrieve job output."""
+
+    @property
+    @abstractmethod
+    def execute(self):
+        pass
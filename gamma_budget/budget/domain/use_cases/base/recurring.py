@@ -0,0 +1,30 @@
+from abc import ABCMeta, abstractmethod
+
+from budget.domain.entities.recurring import RecurringOccurrence
+
+
+class AbstractRecurringCreateUseCase(metaclass=ABCMeta):
+    """Base class for use cases create recurring revenue output."""
+
+    @property
+    @abstractmethod
+    def execute(self):
+        pass
+
+
+class AbstractRecurringExpandUseCase(metaclass=ABCMeta):
+    """Base class for use cases expand recurring revenues output."""
+
+    @property
+    @abstractmethod
+    def execute(self):
+        pass
+
+
+class AbstractRecurringProjectionUseCase(metaclass=ABCMeta):
+    """Base class for use cases project recurring revenues output."""
+
+    @property
+    @abstractmethod
+    def execute(self) -> list[RecurringOccurrence]:
+        pass
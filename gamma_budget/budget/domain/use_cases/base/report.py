@@ -0,0 +1,12 @@
+from abc import ABCMeta, abstractmethod
+
+from budget.domain.entities.report import MonthlyReport
+
+
+class AbstractMonthlyReportUseCase(metaclass=ABCMeta):
+    """Base class for use cases monthly report output."""
+
+    @property
+    @abstractmethod
+    def execute(self) -> MonthlyReport:
+        pass
@@ -20,6 +20,20 @@ class AbstractRevenueCreateUseCase(metaclass=ABCMeta):
     def execute(self):
         pass
 
+    @property
+    @abstractmethod
+    async def aexecute(self):
+        pass
+
+
+class AbstractRevenueBulkCreateUseCase(metaclass=ABCMeta):
+    """Base class for use cases bulk create revenues output."""
+
+    @property
+    @abstractmethod
+    def execute(self):
+        pass
+
 
 class AbstractRevenueListUseCase(metaclass=ABCMeta):
     """Base class for use cases list revenues output."""
@@ -29,6 +43,11 @@ class AbstractRevenueListUseCase(metaclass=ABCMeta):
     def execute(self) -> list[Revenue]:
         pass
 
+    @property
+    @abstractmethod
+    async def aexecute(self) -> list[Revenue]:
+        pass
+
 
 class AbstractRevenueRetrieveUseCase(metaclass=ABCMeta):
     """Base class for use cases retrieve revenue output."""
@@ -38,6 +57,11 @@ class AbstractRevenueRetrieveUseCase(metaclass=ABCMeta):
     def execute(self):
         pass
 
+    @property
+    @abstractmethod
+    async def aexecute(self):
+        pass
+
 
 class AbstractRevenueUpdateUseCase(metaclass=ABCMeta):
     """Base class for use cases update revenue output."""
@@ -47,6 +71,11 @@ class AbstractRevenueUpdateUseCase(metaclass=ABCMeta):
     def execute(self):
         pass
 
+    @property
+    @abstractmethod
+    async def aexecute(self):
+        pass
+
 
 class AbstractRevenueDeleteUseCase(metaclass=ABCMeta):
     """Base class for use cases delete revenue output."""
@@ -55,3 +84,8 @@ class AbstractRevenueDeleteUseCase(metaclass=ABCMeta):
     @abstractmethod
     def execute(self):
         pass
+
+    @property
+    @abstractmethod
+    async def aexecute(self):
+        pass
@@ -0,0 +1,10 @@
+from abc import ABCMeta, abstractmethod
+
+
+class AbstractStatementUploadUseCase(metaclass=ABCMeta):
+    """Base class for use cases upload statement output."""
+
+    @property
+    @abstractmethod
+    def execute(self):
+        pass
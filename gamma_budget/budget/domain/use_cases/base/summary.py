@@ -0,0 +1,12 @@
+from abc import ABCMeta, abstractmethod
+
+from budget.domain.entities.summary import MonthlySummary
+
+
+class AbstractSummaryUseCase(metaclass=ABCMeta):
+    """Base class for use cases monthly summary output."""
+
+    @property
+    @abstractmethod
+    def execute(self) -> list[MonthlySummary]:
+        pass
@@ -0,0 +1,89 @@
+from budget.domain.data_access.export import AbstractBaseLedgerExportDataAccess
+from budget.domain.entities.export import EXPORT_COLUMNS
+from budget.domain.use_cases.base import AbstractBaseOutput, AbstractLedgerExportUseCase
+from budget.domain.use_cases.features import (
+    GetDataAccessUseCaseMixin,
+    GetOutputResponseUseCaseMixin,
+    ValidateDataAccessUseCaseMixin,
+    ValidateOutputResponseUseCaseMixin,
+)
+
+
+class LedgerExportUseCase(
+    AbstractLedgerExportUseCase,
+    GetDataAccessUseCaseMixin[AbstractBaseLedgerExportDataAccess],
+    ValidateDataAccessUseCaseMixin,
+    GetOutputResponseUseCaseMixin,
+    ValidateOutputResponseUseCaseMixin,
+):
+    """
+    Use case for exporting every record of a user.
+
+    The records are not read here: the output receives a lazy iterator and the data
+    access reads them while the output writes them.
+
+    Extends:
+        AbstractLedgerExportUseCase
+        GetDataAccessUseCaseMixin[AbstractBaseLedgerExportDataAccess]
+        ValidateDataAccessUseCaseMixin
+        GetOutputResponseUseCaseMixin
+        ValidateOutputResponseUseCaseMixin
+    """
+
+    data_access: type[AbstractBaseLedgerExportDataAccess] | None = None
+    output_response: type[AbstractBaseOutput] | None = None
+
+    def __init__(self, user_id: int, file_format: str, gzip: bool = False, stream_async: bool = False):
+        """
+        Initialize the use case.
+
+        Args:
+        ----
+            user_id (int): The ID of the user.
+            file_format (str): The format of the export: csv or ndjson.
+            gzip (bool): Flag indicating if the export is compressed.
+            stream_async (bool): Flag indicating if the records are read with an async
+                iterator, for responses served under ASGI.
+        """
+        super().__init__()
+        self.user_id = user_id
+        self.file_format = file_format
+        self.gzip = gzip
+        self.stream_async = stream_async
+
+    def execute(self, *args, **kwargs):
+        """
+        Execute the use case.
+
+        Returns:
+        -------
+            AbstractBaseOutput: The output response.
+        """
+        data_access = self.data_access()
+        rows = data_access.aiter_ledger(self.user_id) if self.stream_async else data_access.iter_ledger(self.user_id)
+        filename = f"ledger-{self.user_id}.{self.file_format}" + (".gz" if self.gzip else "")
+        return self._build_output(
+            {
+                "rows": rows,
+                "columns": EXPORT_COLUMNS,
+                "format": self.file_format,
+                "gzip": self.gzip,
+                "filename": filename,
+            }
+        )
+
+    def _build_output(self, export: dict):
+        """
+        Build the output response.
+
+        Args:
+        ----
+            export (dict): The rows to export and how to write them.
+
+        Returns:
+        -------
+            AbstractBaseOutput: The output response.
+        """
+        self.output = self.get_output_response()
+        self.output.data = export
+        return self.output
@@ -0,0 +1,76 @@
+import datetime
+
+from budget.domain.data_access.forecast import AbstractBaseForecastDataAccess
+from budget.domain.use_cases.base import AbstractBaseOutput, AbstractForecastUseCase
+from budget.domain.use_cases.features import (
+    GetDataAccessUseCaseMixin,
+    GetOutputResponseUseCaseMixin,
+    ValidateDataAccessUseCaseMixin,
+    ValidateOutputResponseUseCaseMixin,
+)
+
+
+class ForecastUseCase(
+    AbstractForecastUseCase,
+    GetDataAccessUseCaseMixin[AbstractBaseForecastDataAccess],
+    ValidateDataAccessUseCaseMixin,
+    GetOutputResponseUseCaseMixin,
+    ValidateOutputResponseUseCaseMixin,
+):
+    """
+    Use case for projecting the balance of a user over the coming months.
+
+    Extends:
+        AbstractForecastUseCase
+        GetDataAccessUseCaseMixin[AbstractBaseForecastDataAccess]
+        ValidateDataAccessUseCaseMixin
+        GetOutputResponseUseCaseMixin
+        ValidateOutputResponseUseCaseMixin
+    """
+
+    data_access: type[AbstractBaseForecastDataAccess] | None = None
+    output_response: type[AbstractBaseOutput] | None = None
+
+    def __init__(self, user_id: int, months: int, granularity: str, start: datetime.date | None = None):
+        """
+        Initialize the use case.
+
+        Args:
+        ----
+            user_id (int): The ID of the user.
+            months (int): The number of months to project.
+            granularity (str): The length of the buckets: month or day.
+            start (datetime.date | None): A day of the first month projected. Defaults to today.
+        """
+        super().__init__()
+        self.user_id = user_id
+        self.months = months
+        self.granularity = granularity
+        self.start = (start or datetime.date.today()).replace(day=1)
+
+    def execute(self, *args, **kwargs):
+        """
+        Execute the use case.
+
+        Returns:
+        -------
+            AbstractBaseOutput: The output response.
+        """
+        forecast = self.data_access().get_forecast(self.user_id, self.start, self.months, self.granularity)
+        return self._build_output(forecast.to_dict())
+
+    def _build_output(self, forecast: dict):
+        """
+        Build the output response.
+
+        Args:
+        ----
+            forecast (dict): The forecast data.
+
+        Returns:
+        -------
+            AbstractBaseOutput: The output response.
+        """
+        self.output = self.get_output_response()
+        self.output.data = forecast
+        return self.output
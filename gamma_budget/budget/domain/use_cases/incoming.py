@@ -2,6 +2,7 @@ import datetime
 from typing import Any
 
 from budget.domain.data_access.incoming import (
+    AbstractBaseIncomingBulkCreateDataAccess,
     AbstractBaseIncomingCreateDataAccess,
     AbstractBaseIncomingDeleteDataAccess,
     AbstractBaseIncomingListDataAccess,
@@ -10,6 +11,7 @@ from budget.domain.data_access.incoming import (
 )
 from budget.domain.use_cases.base import (
     AbstractBaseOutput,
+    AbstractIncomingBulkCreateUseCase,
     AbstractIncomingCreateUseCase,
     AbstractIncomingDeleteUseCase,
     AbstractIncomingListUseCase,
@@ -93,6 +95,20 @@ class IncomingCreateUseCase(
         parsed_incoming = incoming.to_dict()
         return self._build_output(parsed_incoming)
 
+    async def aexecute(self, *args, **kwargs):
+        """
+        Execute the use case without blocking the event loop.
+
+        Returns:
+        -------
+            AbstractBaseOutput: The output response.
+        """
+        incoming = await self.data_access().acreate_incoming(data=self.data, user_id=self.user_id)
+        if not incoming:
+            return self._build_output(incoming={"message": "Category not found."})
+        parsed_incoming = incoming.to_dict()
+        return self._build_output(parsed_incoming)
+
     def _build_output(self, incoming: dict):
         """
         Build the output response.
@@ -110,6 +126,69 @@ class IncomingCreateUseCase(
         return self.output
 
 
+class IncomingBulkCreateUseCase(
+    AbstractIncomingBulkCreateUseCase,
+    GetDataAccessUseCaseMixin[AbstractBaseIncomingBulkCreateDataAccess],
+    ValidateDataAccessUseCaseMixin,
+    GetOutputResponseUseCaseMixin,
+    ValidateOutputResponseUseCaseMixin,
+):
+    """
+    Use case for creating many incoming records at once.
+
+    Extends:
+        AbstractIncomingBulkCreateUseCase
+        GetDataAccessUseCaseMixin[AbstractBaseIncomingBulkCreateDataAccess]
+        ValidateDataAccessUseCaseMixin
+        GetOutputResponseUseCaseMixin
+        ValidateOutputResponseUseCaseMixin
+    """
+
+    data_access: type[AbstractBaseIncomingBulkCreateDataAccess] | None = None
+    output_response: type[AbstractBaseOutput] | None = None
+
+    def __init__(self, user_id: int, data: dict, items: list[dict]):
+        """
+        Initialize the use case.
+
+        Args:
+        ----
+            user_id (int): The ID of the user.
+            data (dict): The request data.
+            items (list[dict]): The incoming records to create.
+        """
+        super().__init__()
+        self.user_id = user_id
+        self.items = items
+
+    def execute(self, *args, **kwargs):
+        """
+        Execute the use case.
+
+        Returns:
+        -------
+            AbstractBaseOutput: The output response.
+        """
+        result = self.data_access().create_incomings(items=self.items, user_id=self.user_id)
+        return self._build_output(result.to_dict())
+
+    def _build_output(self, result: dict):
+        """
+        Build the output response.
+
+        Args:
+        ----
+            result (dict): The number and IDs of the created records.
+
+        Returns:
+        -------
+            AbstractBaseOutput: The output response.
+        """
+        self.output = self.get_output_response()
+        self.output.data = result
+        return self.output
+
+
 class IncomingListUseCase(
     AbstractIncomingListUseCase,
     GetDataAccessUseCaseMixin[AbstractBaseIncomingListDataAccess],
@@ -122,13 +201,17 @@ class IncomingListUseCase(
     data_access: type[AbstractBaseIncomingListDataAccess] | None = None
     output_response: type[AbstractBaseOutput] | None = None
 
-    def __init__(self, user_id: int):
+    def __init__(self, user_id: int, cursor: str | None = None, page_size: int | None = None):
         super().__init__()
         self.user_id = user_id
+        self.cursor = cursor
+        self.page_size = page_size
         self.result: list[dict] = []
 
     def execute(self, *args, **kwargs):
         self.output_response.data = []
+        if self.cursor is not None or self.page_size is not None:
+            return self._execute_paginated()
         incomings = self.data_access().get_incomings(self.user_id)
         if not incomings:
             return self._build_output()
@@ -136,6 +219,39 @@ class IncomingListUseCase(
             self.result.append(incoming.to_dict())
         return self._build_output()
 
+    def get_version(self):
+        """
+        Get the version of the incomings of the user without listing them.
+
+        Returns:
+        -------
+            str: The version, which changes whenever the list does.
+        """
+        return self.data_access().get_incomings_version(self.user_id)
+
+    async def aexecute(self, *args, **kwargs):
+        self.output_response.data = []
+        if self.cursor is not None or self.page_size is not None:
+            return await self._aexecute_paginated()
+        incomings = await self.data_access().aget_incomings(self.user_id)
+        if not incomings:
+            return self._build_output()
+        for incoming in incomings:
+            self.result.append(incoming.to_dict())
+        return self._build_output()
+
+    def _execute_paginated(self):
+        page = self.data_access().get_incomings_page(self.user_id, cursor=self.cursor, page_size=self.page_size)
+        self.output = self.get_output_response()
+        self.output.data = page.to_dict()
+        return self.output
+
+    async def _aexecute_paginated(self):
+        page = await self.data_access().aget_incomings_page(self.user_id, cursor=self.cursor, page_size=self.page_size)
+        self.output = self.get_output_response()
+        self.output.data = page.to_dict()
+        return self.output
+
     def _build_output(self):
         self.output = self.get_output_response()
         self.output.data = self.result
@@ -190,6 +306,29 @@ class IncomingRetrieveUseCase(
             return self._build_output(incoming={"message": "Incoming not found."})
         return self._build_output(incoming=incoming.to_dict())
 
+    def get_version(self):
+        """
+        Get the version of the incoming record without retrieving it.
+
+        Returns:
+        -------
+            str | None: The version, which changes whenever the record does, or None if not found.
+        """
+        return self.data_access().get_incoming_version(incoming_id=self.incoming_id, user_id=self.user_id)
+
+    async def aexecute(self):
+        """
+        Execute the use case without blocking the event loop.
+
+        Returns:
+        -------
+            AbstractBaseOutput: The output response.
+        """
+        incoming = await self.data_access().aget_incoming(incoming_id=self.incoming_id, user_id=self.user_id)
+        if not incoming:
+            return self._build_output(incoming={"message": "Incoming not found."})
+        return self._build_output(incoming=incoming.to_dict())
+
     def _build_output(self, incoming: dict):
         """
         Build the output response.
@@ -262,6 +401,20 @@ class IncomingUpdateUseCase(
         incoming = updated_incoming.to_dict()
         return self._build_output(incoming=incoming)
 
+    async def aexecute(self):
+        """
+        Execute the use case without blocking the event loop.
+
+        Returns:
+        -------
+            AbstractBaseOutput: The output response.
+        """
+        updated_incoming = await self.data_access().aupdate_incoming(user_id=self.user_id, incoming_id=self.incoming_id, data=self.data)
+        if not updated_incoming:
+            return self._build_output(incoming={"message": "Incoming not found."})
+        incoming = updated_incoming.to_dict()
+        return self._build_output(incoming=incoming)
+
     def _build_output(self, incoming: dict):
         """
         Build the output response.
@@ -324,6 +477,17 @@ class IncomingDeleteUseCase(
         incoming = self.data_access().delete_incoming(self.user_id, self.incoming_id)
         return self._build_output(incoming=incoming)
 
+    async def aexecute(self):
+        """
+        Execute the use case without blocking the event loop.
+
+        Returns:
+        -------
+            AbstractBaseOutput: The output response.
+        """
+        incoming = await self.data_access().adelete_incoming(self.user_id, self.incoming_id)
+        return self._build_output(incoming=incoming)
+
     def _build_output(self, incoming):
         """
         Build the output response.
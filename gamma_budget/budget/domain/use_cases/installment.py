@@ -0,0 +1,237 @@
+import datetime
+from decimal import Decimal
+
+from budget.domain.data_access.installment import (
+    AbstractBaseInstallmentCreateDataAccess,
+    AbstractBaseInstallmentPayDataAccess,
+    AbstractBaseInstallmentRetrieveDataAccess,
+)
+from budget.domain.use_cases.base import (
+    AbstractBaseOutput,
+    AbstractInstallmentCreateUseCase,
+    AbstractInstallmentPayUseCase,
+    AbstractInstallmentRetrieveUseCase,
+)
+from budget.domain.use_cases.features import (
+    GetDataAccessUseCaseMixin,
+    GetOutputResponseUseCaseMixin,
+    ValidateDataAccessUseCaseMixin,
+    ValidateOutputResponseUseCaseMixin,
+)
+
+
+class InstallmentCreateUseCase(
+    AbstractInstallmentCreateUseCase,
+    GetDataAccessUseCaseMixin[AbstractBaseInstallmentCreateDataAccess],
+    ValidateDataAccessUseCaseMixin,
+    GetOutputResponseUseCaseMixin,
+    ValidateOutputResponseUseCaseMixin,
+):
+    """
+    Use case for creating the installment plan of a revenue.
+
+    Extends:
+        AbstractInstallmentCreateUseCase
+        GetDataAccessUseCaseMixin[AbstractBaseInstallmentCreateDataAccess]
+        ValidateDataAccessUseCaseMixin
+        GetOutputResponseUseCaseMixin
+        ValidateOutputResponseUseCaseMixin
+    """
+
+    data_access: type[AbstractBaseInstallmentCreateDataAccess] | None = None
+    output_response: type[AbstractBaseOutput] | None = None
+
+    def __init__(
+        self,
+        user_id: int,
+        data: dict,
+        revenue: str,
+        periods: int,
+        amount: Decimal | None = None,
+        first_due_date: datetime.date | None = None,
+        period_unit: str | None = None,
+        payment_method: str | None = None,
+    ):
+        """
+        Initialize the use case.
+
+        Args:
+        ----
+            user_id (int): The ID of the user.
+            data (dict): The data for creating the plan.
+            revenue (str): The ID of the revenue paid in installments.
+            periods (int): The number of installments.
+            amount (Decimal | None): The amount of the purchase. Defaults to the revenue amount.
+            first_due_date (datetime.date | None): The due date of the first installment. Defaults to the revenue expiration date.
+            period_unit (str | None): The unit between two due dates. Defaults to months.
+            payment_method (str | None): The payment method of the installments.
+        """
+        super().__init__()
+        self.user_id = user_id
+        self.data = {
+            "revenue": revenue,
+            "periods": periods,
+            "amount": amount,
+            "first_due_date": first_due_date,
+            "period_unit": period_unit,
+            "payment_method": payment_method,
+        }
+
+    def execute(self, *args, **kwargs):
+        """
+        Execute the use case.
+
+        Returns:
+        -------
+            AbstractBaseOutput: The output response.
+        """
+        try:
+            plan = self.data_access().create_installment_plan(data=self.data, user_id=self.user_id)
+        except ValueError as e:
+            return self._build_output(plan={"message": str(e)})
+        if not plan:
+            return self._build_output(plan={"message": "Revenue not found."})
+        return self._build_output(plan.to_dict())
+
+    def _build_output(self, plan: dict):
+        """
+        Build the output response.
+
+        Args:
+        ----
+            plan (dict): The plan data.
+
+        Returns:
+        -------
+            AbstractBaseOutput: The output response.
+        """
+        self.output = self.get_output_response()
+        self.output.data = plan
+        return self.output
+
+
+class InstallmentRetrieveUseCase(
+    AbstractInstallmentRetrieveUseCase,
+    GetDataAccessUseCaseMixin[AbstractBaseInstallmentRetrieveDataAccess],
+    ValidateDataAccessUseCaseMixin,
+    GetOutputResponseUseCaseMixin,
+    ValidateOutputResponseUseCaseMixin,
+):
+    """
+    Use case for retrieving the installment plan of a revenue.
+
+    Extends:
+        AbstractInstallmentRetrieveUseCase
+        GetDataAccessUseCaseMixin[AbstractBaseInstallmentRetrieveDataAccess]
+        ValidateDataAccessUseCaseMixin
+        GetOutputResponseUseCaseMixin
+        ValidateOutputResponseUseCaseMixin
+    """
+
+    data_access: type[AbstractBaseInstallmentRetrieveDataAccess] | None = None
+    output_response: type[AbstractBaseOutput] | None = None
+
+    def __init__(self, user_id: int, revenue_id: str):
+        """
+        Initialize the use case.
+
+        Args:
+        ----
+            user_id (int): The ID of the user.
+            revenue_id (str): The ID of the revenue.
+        """
+        super().__init__()
+        self.user_id = user_id
+        self.revenue_id = revenue_id
+
+    def execute(self, *args, **kwargs):
+        """
+        Execute the use case.
+
+        Returns:
+        -------
+            AbstractBaseOutput: The output response, with no data if the revenue has no plan.
+        """
+        plan = self.data_access().get_installment_plan(self.revenue_id, self.user_id)
+        return self._build_output(plan.to_dict() if plan else None)
+
+    def _build_output(self, plan: dict | None):
+        """
+        Build the output response.
+
+        Args:
+        ----
+            plan (dict | None): The plan data.
+
+        Returns:
+        -------
+            AbstractBaseOutput: The output response.
+        """
+        self.output = self.get_output_response()
+        self.output.data = plan
+        return self.output
+
+
+class InstallmentPayUseCase(
+    AbstractInstallmentPayUseCase,
+    GetDataAccessUseCaseMixin[AbstractBaseInstallmentPayDataAccess],
+    ValidateDataAccessUseCaseMixin,
+    GetOutputResponseUseCaseMixin,
+    ValidateOutputResponseUseCaseMixin,
+):
+    """
+    Use case for paying the next installments of a plan.
+
+    Extends:
+        AbstractInstallmentPayUseCase
+        GetDataAccessUseCaseMixin[AbstractBaseInstallmentPayDataAccess]
+        ValidateDataAccessUseCaseMixin
+        GetOutputResponseUseCaseMixin
+        ValidateOutputResponseUseCaseMixin
+    """
+
+    data_access: type[AbstractBaseInstallmentPayDataAccess] | None = None
+    output_response: type[AbstractBaseOutput] | None = None
+
+    def __init__(self, user_id: int, revenue_id: str, data: dict, count: int):
+        """
+        Initialize the use case.
+
+        Args:
+        ----
+            user_id (int): The ID of the user.
+            revenue_id (str): The ID of the revenue.
+            data (dict): The request data.
+            count (int): The number of installments to pay.
+        """
+        super().__init__()
+        self.user_id = user_id
+        self.revenue_id = revenue_id
+        self.count = count
+
+    def execute(self, *args, **kwargs):
+        """
+        Execute the use case.
+
+        Returns:
+        -------
+            AbstractBaseOutput: The output response, with no data if the revenue has no plan.
+        """
+        plan = self.data_access().pay_installments(self.revenue_id, self.user_id, self.count)
+        return self._build_output(plan.to_dict() if plan else None)
+
+    def _build_output(self, plan: dict | None):
+        """
+        Build the output response.
+
+        Args:
+        ----
+            plan (dict | None): The plan data.
+
+        Returns:
+        -------
+            AbstractBaseOutput: The output response.
+        """
+        self.output = self.get_output_response()
+        self.output.data = plan
+        return self.output
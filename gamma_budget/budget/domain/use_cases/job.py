@@ -0,0 +1,70 @@
+from budget.domain.data_access.job import AbstractBaseJobRetrieveDataAccess
+from budget.domain.use_cases.base import AbstractBaseOutput, AbstractJobRetrieveUseCase
+from budget.domain.use_cases.features import (
+    GetDataAccessUseCaseMixin,
+    GetOutputResponseUseCaseMixin,
+    ValidateDataAccessUseCaseMixin,
+    ValidateOutputResponseUseCaseMixin,
+)
+
+
+class JobRetrieveUseCase(
+    AbstractJobRetrieveUseCase,
+    GetDataAccessUseCaseMixin[AbstractBaseJobRetrieveDataAccess],
+    ValidateDataAccessUseCaseMixin,
+    GetOutputResponseUseCaseMixin,
+    ValidateOutputResponseUseCaseMixin,
+):
+    """
+    Use case for retrieving the status of a background job.
+
+    Extends:
+        AbstractJobRetrieveUseCase
+        GetDataAccessUseCaseMixin[AbstractBaseJobRetrieveDataAccess]
+        ValidateDataAccessUseCaseMixin
+        GetOutputResponseUseCaseMixin
+        ValidateOutputResponseUseCaseMixin
+    """
+
+    data_access: type[AbstractBaseJobRetrieveDataAccess] | None = None
+    output_response: type[AbstractBaseOutput] | None = None
+
+    def __init__(self, job_id: str):
+        """
+        Initialize the use case.
+
+        Args:
+        ----
+            job_id (str): The ID of the job.
+        """
+        super().__init__()
+        self.job_id = job_id
+
+    def execute(self):
+        """
+        Execute the use case.
+
+        Returns:
+        -------
+            AbstractBaseOutput: The output response.
+        """
+        job = self.data_access().get_job(job_id=self.job_id)
+        if not job:
+            return self._build_output(job=None)
+        return self._build_output(job=job.to_dict())
+
+    def _build_output(self, job: dict | None):
+        """
+        Build the output response.
+
+        Args:
+        ----
+            job (dict | None): The job data, or None when the job does not exist.
+
+        Returns:
+        -------
+            AbstractBaseOutput: The output response.
+        """
+        self.output = self.get_output_response()
+        self.output.data = job
+        return self.output
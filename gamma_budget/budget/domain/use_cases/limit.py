@@ -113,13 +113,17 @@ class LimitListUseCase(
     data_access: type[AbstractBaseLimitListDataAccess] | None = None
     output_response: type[AbstractBaseOutput] | None = None
 
-    def __init__(self, user_id: int):
+    def __init__(self, user_id: int, cursor: str | None = None, page_size: int | None = None):
         super().__init__()
         self.user_id = user_id
+        self.cursor = cursor
+        self.page_size = page_size
         self.result: list[dict] = []
 
     def execute(self, *args, **kwargs):
         self.output_response.data = []
+        if self.cursor is not None or self.page_size is not None:
+            return self._execute_paginated()
         limits = self.data_access().get_limits(self.user_id)
         if not limits:
             return self._build_output()
@@ -127,6 +131,12 @@ class LimitListUseCase(
             self.result.append(limit.to_dict())
         return self._build_output()
 
+    def _execute_paginated(self):
+        page = self.data_access().get_limits_page(self.user_id, cursor=self.cursor, page_size=self.page_size)
+        self.output = self.get_output_response()
+        self.output.data = page.to_dict()
+        return self.output
+
     def _build_output(self):
         self.output = self.get_output_response()
         self.output.data = self.result
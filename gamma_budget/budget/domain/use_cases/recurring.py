@@ -0,0 +1,234 @@
+import datetime
+from decimal import Decimal
+
+from budget.domain.data_access.recurring import (
+    AbstractBaseRecurringCreateDataAccess,
+    AbstractBaseRecurringExpandDataAccess,
+    AbstractBaseRecurringProjectionDataAccess,
+)
+from budget.domain.use_cases.base import (
+    AbstractBaseOutput,
+    AbstractRecurringCreateUseCase,
+    AbstractRecurringExpandUseCase,
+    AbstractRecurringProjectionUseCase,
+)
+from budget.domain.use_cases.features import (
+    GetDataAccessUseCaseMixin,
+    GetOutputResponseUseCaseMixin,
+    ValidateDataAccessUseCaseMixin,
+    ValidateOutputResponseUseCaseMixin,
+)
+
+
+class RecurringCreateUseCase(
+    AbstractRecurringCreateUseCase,
+    GetDataAccessUseCaseMixin[AbstractBaseRecurringCreateDataAccess],
+    ValidateDataAccessUseCaseMixin,
+    GetOutputResponseUseCaseMixin,
+    ValidateOutputResponseUseCaseMixin,
+):
+    """
+    Use case for creating a recurring revenue rule.
+
+    Extends:
+        AbstractRecurringCreateUseCase
+        GetDataAccessUseCaseMixin[AbstractBaseRecurringCreateDataAccess]
+        ValidateDataAccessUseCaseMixin
+        GetOutputResponseUseCaseMixin
+        ValidateOutputResponseUseCaseMixin
+    """
+
+    data_access: type[AbstractBaseRecurringCreateDataAccess] | None = None
+    output_response: type[AbstractBaseOutput] | None = None
+
+    def __init__(
+        self,
+        user_id: int,
+        data: dict,
+        revenue: str,
+        period: int,
+        period_unit: str,
+        amount: Decimal | None = None,
+        payment_method: str | None = None,
+        payment_date: datetime.date | None = None,
+    ):
+        """
+        Initialize the use case.
+
+        Args:
+        ----
+            user_id (int): The ID of the user.
+            data (dict): The data for creating the rule.
+            revenue (str): The ID of the revenue to repeat.
+            period (int): The number of units between two occurrences.
+            period_unit (str): The unit of the period: days, weeks, months or years.
+            amount (Decimal | None): The amount of every occurrence. Defaults to the revenue amount.
+            payment_method (str | None): The payment method of the occurrences.
+            payment_date (datetime.date | None): The first occurrence. Defaults to the revenue expiration date.
+        """
+        super().__init__()
+        self.user_id = user_id
+        self.data = {
+            "revenue": revenue,
+            "period": period,
+            "period_unit": period_unit,
+            "amount": amount,
+            "payment_method": payment_method,
+            "payment_date": payment_date,
+        }
+
+    def execute(self, *args, **kwargs):
+        """
+        Execute the use case.
+
+        Returns:
+        -------
+            AbstractBaseOutput: The output response.
+        """
+        recurring = self.data_access().create_recurring(data=self.data, user_id=self.user_id)
+        if not recurring:
+            return self._build_output(recurring={"message": "Revenue not found."})
+        return self._build_output(recurring.to_dict())
+
+    def _build_output(self, recurring: dict):
+        """
+        Build the output response.
+
+        Args:
+        ----
+            recurring (dict): The rule data.
+
+        Returns:
+        -------
+            AbstractBaseOutput: The output response.
+        """
+        self.output = self.get_output_response()
+        self.output.data = recurring
+        return self.output
+
+
+class RecurringExpandUseCase(
+    AbstractRecurringExpandUseCase,
+    GetDataAccessUseCaseMixin[AbstractBaseRecurringExpandDataAccess],
+    ValidateDataAccessUseCaseMixin,
+    GetOutputResponseUseCaseMixin,
+    ValidateOutputResponseUseCaseMixin,
+):
+    """
+    Use case for materializing the recurring revenues of a user up to a date.
+
+    Extends:
+        AbstractRecurringExpandUseCase
+        GetDataAccessUseCaseMixin[AbstractBaseRecurringExpandDataAccess]
+        ValidateDataAccessUseCaseMixin
+        GetOutputResponseUseCaseMixin
+        ValidateOutputResponseUseCaseMixin
+    """
+
+    data_access: type[AbstractBaseRecurringExpandDataAccess] | None = None
+    output_response: type[AbstractBaseOutput] | None = None
+
+    def __init__(self, user_id: int, data: dict, until: datetime.date):
+        """
+        Initialize the use case.
+
+        Args:
+        ----
+            user_id (int): The ID of the user.
+            data (dict): The request data.
+            until (datetime.date): The last day of the expansion horizon.
+        """
+        super().__init__()
+        self.user_id = user_id
+        self.until = until
+
+    def execute(self, *args, **kwargs):
+        """
+        Execute the use case.
+
+        Returns:
+        -------
+            AbstractBaseOutput: The output response.
+        """
+        created = self.data_access().expand_recurring(self.until, user_id=self.user_id)
+        return self._build_output({"created": created, "until": self.until})
+
+    def _build_output(self, expansion: dict):
+        """
+        Build the output response.
+
+        Args:
+        ----
+            expansion (dict): The number of revenues created and the horizon.
+
+        Returns:
+        -------
+            AbstractBaseOutput: The output response.
+        """
+        self.output = self.get_output_response()
+        self.output.data = expansion
+        return self.output
+
+
+class RecurringProjectionUseCase(
+    AbstractRecurringProjectionUseCase,
+    GetDataAccessUseCaseMixin[AbstractBaseRecurringProjectionDataAccess],
+    ValidateDataAccessUseCaseMixin,
+    GetOutputResponseUseCaseMixin,
+    ValidateOutputResponseUseCaseMixin,
+):
+    """
+    Use case for projecting the future recurring revenues of a user without storing them.
+
+    Extends:
+        AbstractRecurringProjectionUseCase
+        GetDataAccessUseCaseMixin[AbstractBaseRecurringProjectionDataAccess]
+        ValidateDataAccessUseCaseMixin
+        GetOutputResponseUseCaseMixin
+        ValidateOutputResponseUseCaseMixin
+    """
+
+    data_access: type[AbstractBaseRecurringProjectionDataAccess] | None = None
+    output_response: type[AbstractBaseOutput] | None = None
+
+    def __init__(self, user_id: int, start: datetime.date, end: datetime.date):
+        """
+        Initialize the use case.
+
+        Args:
+        ----
+            user_id (int): The ID of the user.
+            start (datetime.date): The first day of the projection.
+            end (datetime.date): The last day of the projection.
+        """
+        super().__init__()
+        self.user_id = user_id
+        self.start = start
+        self.end = end
+
+    def execute(self, *args, **kwargs):
+        """
+        Execute the use case.
+
+        Returns:
+        -------
+            AbstractBaseOutput: The output response.
+        """
+        occurrences = self.data_access().get_projection(self.user_id, self.start, self.end)
+        return self._build_output([occurrence.to_dict() for occurrence in occurrences])
+
+    def _build_output(self, occurrences: list[dict]):
+        """
+        Build the output response.
+
+        Args:
+        ----
+            occurrences (list[dict]): The projected occurrences.
+
+        Returns:
+        -------
+            AbstractBaseOutput: The output response.
+        """
+        self.output = self.get_output_response()
+        self.output.data = occurrences
+        return self.output
@@ -0,0 +1,83 @@
+import datetime
+
+from budget.domain.data_access.report import AbstractBaseMonthlyReportDataAccess
+from budget.domain.entities.report import PDF
+from budget.domain.use_cases.base import AbstractBaseOutput, AbstractMonthlyReportUseCase
+from budget.domain.use_cases.features import (
+    GetDataAccessUseCaseMixin,
+    GetOutputResponseUseCaseMixin,
+    ValidateDataAccessUseCaseMixin,
+    ValidateOutputResponseUseCaseMixin,
+)
+
+
+class MonthlyReportUseCase(
+    AbstractMonthlyReportUseCase,
+    GetDataAccessUseCaseMixin[AbstractBaseMonthlyReportDataAccess],
+    ValidateDataAccessUseCaseMixin,
+    GetOutputResponseUseCaseMixin,
+    ValidateOutputResponseUseCaseMixin,
+):
+    """
+    Use case for the monthly statement of a user.
+
+    The output receives the report and renders it in the requested format.
+
+    Extends:
+        AbstractMonthlyReportUseCase
+        GetDataAccessUseCaseMixin[AbstractBaseMonthlyReportDataAccess]
+        ValidateDataAccessUseCaseMixin
+        GetOutputResponseUseCaseMixin
+        ValidateOutputResponseUseCaseMixin
+    """
+
+    data_access: type[AbstractBaseMonthlyReportDataAccess] | None = None
+    output_response: type[AbstractBaseOutput] | None = None
+
+    def __init__(self, user_id: int, month: datetime.date, file_format: str = PDF):
+        """
+        Initialize the use case.
+
+        Args:
+        ----
+            user_id (int): The ID of the user.
+            month (datetime.date): A day of the month of the report.
+            file_format (str): The format of the report: pdf or html.
+        """
+        super().__init__()
+        self.user_id = user_id
+        self.month = month.replace(day=1)
+        self.file_format = file_format
+
+    def execute(self, *args, **kwargs):
+        """
+        Execute the use case.
+
+        Returns:
+        -------
+            AbstractBaseOutput: The output response.
+        """
+        report = self.data_access().get_monthly_report(self.user_id, self.month)
+        return self._build_output(
+            {
+                "report": report,
+                "format": self.file_format,
+                "filename": f"statement-{self.user_id}-{self.month:%Y-%m}.{self.file_format}",
+            }
+        )
+
+    def _build_output(self, report: dict):
+        """
+        Build the output response.
+
+        Args:
+        ----
+            report (dict): The report and how to render it.
+
+        Returns:
+        -------
+            AbstractBaseOutput: The output response.
+        """
+        self.output = self.get_output_response()
+        self.output.data = report
+        return self.output
@@ -1,4 +1,5 @@
 from budget.domain.data_access.revenue import (
+    AbstractBaseRevenueBulkCreateDataAccess,
     AbstractBaseRevenueCreateDataAccess,
     AbstractBaseRevenueDeleteDataAccess,
     AbstractBaseRevenueListDataAccess,
@@ -7,6 +8,7 @@ from budget.domain.data_access.revenue import (
 )
 from budget.domain.use_cases.base import (
     AbstractBaseOutput,
+    AbstractRevenueBulkCreateUseCase,
     AbstractRevenueCreateUseCase,
     AbstractRevenueDeleteUseCase,
     AbstractRevenueListUseCase,
@@ -96,6 +98,21 @@ class RevenueCreateUseCase(
         parsed_revenue = revenue.to_dict()
         return self._build_output(parsed_revenue)
 
+    async def aexecute(self, *args, **kwargs):
+        """
+        Execute the use case without blocking the event loop.
+
+        Returns:
+        -------
+            AbstractBaseOutput: The output response.
+        """
+        try:
+            revenue = await self.data_access().acreate_revenue(data=self.data, user_id=self.user_id)
+        except Exception as e:
+            return self._build_output(revenue={"message": str(e)})
+        parsed_revenue = revenue.to_dict()
+        return self._build_output(parsed_revenue)
+
     def _build_output(self, revenue: dict):
         """
         Build the output response.
@@ -113,6 +130,69 @@ class RevenueCreateUseCase(
         return self.output
 
 
+class RevenueBulkCreateUseCase(
+    AbstractRevenueBulkCreateUseCase,
+    GetDataAccessUseCaseMixin[AbstractBaseRevenueBulkCreateDataAccess],
+    ValidateDataAccessUseCaseMixin,
+    GetOutputResponseUseCaseMixin,
+    ValidateOutputResponseUseCaseMixin,
+):
+    """
+    Use case for creating many revenue records at once.
+
+    Extends:
+        AbstractRevenueBulkCreateUseCase
+        GetDataAccessUseCaseMixin[AbstractBaseRevenueBulkCreateDataAccess]
+        ValidateDataAccessUseCaseMixin
+        GetOutputResponseUseCaseMixin
+        ValidateOutputResponseUseCaseMixin
+    """
+
+    data_access: type[AbstractBaseRevenueBulkCreateDataAccess] | None = None
+    output_response: type[AbstractBaseOutput] | None = None
+
+    def __init__(self, user_id: int, data: dict, items: list[dict]):
+        """
+        Initialize the use case.
+
+        Args:
+        ----
+            user_id (int): The ID of the user.
+            data (dict): The request data.
+            items (list[dict]): The revenue records to create.
+        """
+        super().__init__()
+        self.user_id = user_id
+        self.items = items
+
+    def execute(self, *args, **kwargs):
+        """
+        Execute the use case.
+
+        Returns:
+        -------
+            AbstractBaseOutput: The output response.
+        """
+        result = self.data_access().create_revenues(items=self.items, user_id=self.user_id)
+        return self._build_output(result.to_dict())
+
+    def _build_output(self, result: dict):
+        """
+        Build the output response.
+
+        Args:
+        ----
+            result (dict): The number and IDs of the created records.
+
+        Returns:
+        -------
+            AbstractBaseOutput: The output response.
+        """
+        self.output = self.get_output_response()
+        self.output.data = result
+        return self.output
+
+
 class RevenueListUseCase(
     AbstractRevenueListUseCase,
     GetDataAccessUseCaseMixin[AbstractBaseRevenueListDataAccess],
@@ -125,13 +205,17 @@ class RevenueListUseCase(
     data_access: type[AbstractBaseRevenueListDataAccess] | None = None
     output_response: type[AbstractBaseOutput] | None = None
 
-    def __init__(self, user_id: int):
+    def __init__(self, user_id: int, cursor: str | None = None, page_size: int | None = None):
         super().__init__()
         self.user_id = user_id
+        self.cursor = cursor
+        self.page_size = page_size
         self.result: list[dict] = []
 
     def execute(self, *args, **kwargs):
         self.output_response.data = []
+        if self.cursor is not None or self.page_size is not None:
+            return self._execute_paginated()
         revenues = self.data_access().get_revenues(self.user_id)
         if not revenues:
             return self._build_output()
@@ -139,6 +223,39 @@ class RevenueListUseCase(
             self.result.append(revenue.to_dict())
         return self._build_output()
 
+    def get_version(self):
+        """
+        Get the version of the revenues of the user without listing them.
+
+        Returns:
+        -------
+            str: The version, which changes whenever the list does.
+        """
+        return self.data_access().get_revenues_version(self.user_id)
+
+    async def aexecute(self, *args, **kwargs):
+        self.output_response.data = []
+        if self.cursor is not None or self.page_size is not None:
+            return await self._aexecute_paginated()
+        revenues = await self.data_access().aget_revenues(self.user_id)
+        if not revenues:
+            return self._build_output()
+        for revenue in revenues:
+            self.result.append(revenue.to_dict())
+        return self._build_output()
+
+    def _execute_paginated(self):
+        page = self.data_access().get_revenues_page(self.user_id, cursor=self.cursor, page_size=self.page_size)
+        self.output = self.get_output_response()
+        self.output.data = page.to_dict()
+        return self.output
+
+    async def _aexecute_paginated(self):
+        page = await self.data_access().aget_revenues_page(self.user_id, cursor=self.cursor, page_size=self.page_size)
+        self.output = self.get_output_response()
+        self.output.data = page.to_dict()
+        return self.output
+
     def _build_output(self):
         self.output = self.get_output_response()
         self.output.data = self.result
@@ -194,6 +311,30 @@ class RevenueRetrieveUseCase(
             return self._build_output(revenue={"message": str(e)})
         return self._build_output(revenue=revenue.to_dict())
 
+    def get_version(self):
+        """
+        Get the version of the revenue record without retrieving it.
+
+        Returns:
+        -------
+            str | None: The version, which changes whenever the record does, or None if not found.
+        """
+        return self.data_access().get_revenue_version(revenue_id=self.revenue_id, user_id=self.user_id)
+
+    async def aexecute(self):
+        """
+        Execute the use case without blocking the event loop.
+
+        Returns:
+        -------
+            AbstractBaseOutput: The output response.
+        """
+        try:
+            revenue = await self.data_access().aget_revenue(revenue_id=self.revenue_id, user_id=self.user_id)
+        except Exception as e:
+            return self._build_output(revenue={"message": str(e)})
+        return self._build_output(revenue=revenue.to_dict())
+
     def _build_output(self, revenue: dict):
         """
         Build the output response.
@@ -266,6 +407,20 @@ class RevenueUpdateUseCase(
         revenue = updated_revenue.to_dict()
         return self._build_output(revenue=revenue)
 
+    async def aexecute(self):
+        """
+        Execute the use case without blocking the event loop.
+
+        Returns:
+        -------
+            AbstractBaseOutput: The output response.
+        """
+        updated_revenue = await self.data_access().aupdate_revenue(user_id=self.user_id, revenue_id=self.revenue_id, data=self.data)
+        if not updated_revenue:
+            return self._build_output(revenue={"message": "Revenue not found."})
+        revenue = updated_revenue.to_dict()
+        return self._build_output(revenue=revenue)
+
     def _build_output(self, revenue: dict):
         """
         Build the output response.
@@ -328,6 +483,17 @@ class RevenueDeleteUseCase(
         revenue = self.data_access().delete_revenue(self.user_id, self.revenue_id)
         return self._build_output(revenue=revenue)
 
+    async def aexecute(self):
+        """
+        Execute the use case without blocking the event loop.
+
+        Returns:
+        -------
+            AbstractBaseOutput: The output response.
+        """
+        revenue = await self.data_access().adelete_revenue(self.user_id, self.revenue_id)
+        return self._build_output(revenue=revenue)
+
     def _build_output(self, revenue):
         """
         Build the output response.
@@ -0,0 +1,81 @@
+from typing import Any
+
+from budget.domain.data_access.statement import AbstractBaseStatementUploadDataAccess
+from budget.domain.use_cases.base import AbstractBaseOutput, AbstractStatementUploadUseCase
+from budget.domain.use_cases.features import (
+    GetDataAccessUseCaseMixin,
+    GetOutputResponseUseCaseMixin,
+    ValidateDataAccessUseCaseMixin,
+    ValidateOutputResponseUseCaseMixin,
+)
+
+
+class StatementUploadUseCase(
+    AbstractStatementUploadUseCase,
+    GetDataAccessUseCaseMixin[AbstractBaseStatementUploadDataAccess],
+    ValidateDataAccessUseCaseMixin,
+    GetOutputResponseUseCaseMixin,
+    ValidateOutputResponseUseCaseMixin,
+):
+    """
+    Use case for importing a bank statement.
+
+    The statement is imported by the ``run_worker`` command; the use case only stores the
+    file and enqueues the job.
+
+    Extends:
+        AbstractStatementUploadUseCase
+        GetDataAccessUseCaseMixin[AbstractBaseStatementUploadDataAccess]
+        ValidateDataAccessUseCaseMixin
+        GetOutputResponseUseCaseMixin
+        ValidateOutputResponseUseCaseMixin
+    """
+
+    data_access: type[AbstractBaseStatementUploadDataAccess] | None = None
+    output_response: type[AbstractBaseOutput] | None = None
+
+    def __init__(self, user_id: int, data: dict, file: Any, format: str, rules: list[dict]):
+        """
+        Initialize the use case.
+
+        Args:
+        ----
+            user_id (int): The ID of the user.
+            data (dict): The request data.
+            file (Any): The uploaded statement.
+            format (str): The format of the statement: csv or ofx.
+            rules (list[dict]): The category rules, each with a ``pattern`` and a ``category`` name.
+        """
+        super().__init__()
+        self.user_id = user_id
+        self.file = file
+        self.format = format
+        self.rules = rules
+
+    def execute(self, *args, **kwargs):
+        """
+        Execute the use case.
+
+        Returns:
+        -------
+            AbstractBaseOutput: The output response.
+        """
+        job = self.data_access().store_statement(self.user_id, self.file, self.format, self.rules)
+        return self._build_output(job.id, job.status)
+
+    def _build_output(self, job_id: str, job_status: str):
+        """
+        Build the output response.
+
+        Args:
+        ----
+            job_id (str): The ID of the enqueued job.
+            job_status (str): The status of the enqueued job.
+
+        Returns:
+        -------
+            AbstractBaseOutput: The output response.
+        """
+        self.output = self.get_output_response()
+        self.output.data = {"message": "Statement import enqueued.", "job_id": job_id, "status": job_status}
+        return self.output
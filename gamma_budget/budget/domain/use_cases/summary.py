@@ -0,0 +1,68 @@
+from budget.domain.data_access.summary import AbstractBaseSummaryDataAccess
+from budget.domain.use_cases.base import AbstractBaseOutput, AbstractSummaryUseCase
+from budget.domain.use_cases.features import (
+    GetDataAccessUseCaseMixin,
+    GetOutputResponseUseCaseMixin,
+    ValidateDataAccessUseCaseMixin,
+    ValidateOutputResponseUseCaseMixin,
+)
+
+
+class SummaryUseCase(
+    AbstractSummaryUseCase,
+    GetDataAccessUseCaseMixin[AbstractBaseSummaryDataAccess],
+    ValidateDataAccessUseCaseMixin,
+    GetOutputResponseUseCaseMixin,
+    ValidateOutputResponseUseCaseMixin,
+):
+    """
+    Use case for summarizing the budget of a user month by month.
+
+    Extends:
+        AbstractSummaryUseCase
+        GetDataAccessUseCaseMixin[AbstractBaseSummaryDataAccess]
+        ValidateDataAccessUseCaseMixin
+        GetOutputResponseUseCaseMixin
+        ValidateOutputResponseUseCaseMixin
+    """
+
+    data_access: type[AbstractBaseSummaryDataAccess] | None = None
+    output_response: type[AbstractBaseOutput] | None = None
+
+    def __init__(self, user_id: int):
+        """
+        Initialize the use case.
+
+        Args:
+        ----
+            user_id (int): The ID of the user.
+        """
+        super().__init__()
+        self.user_id = user_id
+
+    def execute(self, *args, **kwargs):
+        """
+        Execute the use case.
+
+        Returns:
+        -------
+            AbstractBaseOutput: The output response.
+        """
+        summary = self.data_access().get_monthly_summary(self.user_id)
+        return self._build_output([month.to_dict() for month in summary])
+
+    def _build_output(self, summary: list[dict]):
+        """
+        Build the output response.
+
+        Args:
+        ----
+            summary (list[dict]): The totals of each month.
+
+        Returns:
+        -------
+            AbstractBaseOutput: The output response.
+        """
+        self.output = self.get_output_response()
+        self.output.data = summary
+        return self.output
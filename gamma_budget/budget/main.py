@@ -2,57 +2,89 @@ from budget.domain.use_cases import (
     AlertCreateUseCase,
     AlertDeleteUseCase,
     AlertListUseCase,
+    AlertSendEmailUseCase,
     AlertUpdateUseCase,
+    ForecastUseCase,
+    IncomingBulkCreateUseCase,
     IncomingCategoryListUseCase,
     IncomingCreateUseCase,
     IncomingDeleteUseCase,
     IncomingListUseCase,
     IncomingRetrieveUseCase,
     IncomingUpdateUseCase,
+    InstallmentCreateUseCase,
+    InstallmentPayUseCase,
+    InstallmentRetrieveUseCase,
+    JobRetrieveUseCase,
+    LedgerExportUseCase,
     LimitCreateUseCase,
     LimitDeleteUseCase,
     LimitListUseCase,
     LimitUpdateUseCase,
+    MonthlyReportUseCase,
+    RecurringCreateUseCase,
+    RecurringExpandUseCase,
+    RecurringProjectionUseCase,
+    RevenueBulkCreateUseCase,
     RevenueCategoryListUseCase,
     RevenueCreateUseCase,
     RevenueDeleteUseCase,
     RevenueListUseCase,
     RevenueRetrieveUseCase,
     RevenueUpdateUseCase,
+    StatementUploadUseCase,
+    SummaryUseCase,
 )
 from budget.repositories import (
     AlertCreateRepository,
     AlertDeleteRepository,
     AlertListRepository,
     AlertUpdateRepository,
+    ForecastRepository,
+    IncomingBulkCreateRepository,
     IncomingCategoryListRepository,
     IncomingCreateRepository,
     IncomingDeleteRepository,
     IncomingListRepository,
     IncomingRetrieveRepository,
     IncomingUpdateRepository,
+    InstallmentCreateRepository,
+    InstallmentPayRepository,
+    InstallmentRetrieveRepository,
+    JobEnqueueRepository,
+    JobRetrieveRepository,
+    LedgerExportRepository,
     LimitCreateRepository,
     LimitDeleteRepository,
     LimitListRepository,
     LimitUpdateRepository,
+    MonthlyReportRepository,
+    RecurringCreateRepository,
+    RecurringExpandRepository,
+    RecurringProjectionRepository,
+    RevenueBulkCreateRepository,
     RevenueCategoryListRepository,
     RevenueCreateRepository,
     RevenueDeleteRepository,
     RevenueListRepository,
     RevenueRetrieveRepository,
     RevenueUpdateRepository,
+    StatementUploadRepository,
+    SummaryRepository,
 )
 
 
 def configure():
     IncomingListUseCase.data_access = IncomingListRepository
     IncomingCreateUseCase.data_access = IncomingCreateRepository
+    IncomingBulkCreateUseCase.data_access = IncomingBulkCreateRepository
     IncomingRetrieveUseCase.data_access = IncomingRetrieveRepository
     IncomingUpdateUseCase.data_access = IncomingUpdateRepository
     IncomingDeleteUseCase.data_access = IncomingDeleteRepository
 
     RevenueListUseCase.data_access = RevenueListRepository
     RevenueCreateUseCase.data_access = RevenueCreateRepository
+    RevenueBulkCreateUseCase.data_access = RevenueBulkCreateRepository
     RevenueRetrieveUseCase.data_access = RevenueRetrieveRepository
     RevenueUpdateUseCase.data_access = RevenueUpdateRepository
     RevenueDeleteUseCase.data_access = RevenueDeleteRepository
@@ -69,3 +101,21 @@ def configure():
     AlertCreateUseCase.data_access = AlertCreateRepository
     AlertUpdateUseCase.data_access = AlertUpdateRepository
     AlertDeleteUseCase.data_access = AlertDeleteRepository
+    AlertSendEmailUseCase.data_access = JobEnqueueRepository
+
+    InstallmentCreateUseCase.data_access = InstallmentCreateRepository
+    InstallmentRetrieveUseCase.data_access = InstallmentRetrieveRepository
+    InstallmentPayUseCase.data_access = InstallmentPayRepository
+
+    RecurringCreateUseCase.data_access = RecurringCreateRepository
+    RecurringExpandUseCase.data_access = RecurringExpandRepository
+    RecurringProjectionUseCase.data_access = RecurringProjectionRepository
+
+    StatementUploadUseCase.data_access = StatementUploadRepository
+
+    SummaryUseCase.data_access = SummaryRepository
+    ForecastUseCase.data_access = ForecastRepository
+    LedgerExportUseCase.data_access = LedgerExportRepository
+    MonthlyReportUseCase.data_access = MonthlyReportRepository
+
+    JobRetrieveUseCase.data_access = JobRetrieveRepository
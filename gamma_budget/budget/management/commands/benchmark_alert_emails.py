@@ -0,0 +1,44 @@
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+from budget.utils.alert_templates import ALERT_EMAIL_HTML_TEMPLATE, ALERT_EMAIL_TEXT_TEMPLATE, render_alert_email
+from django.core.management.base import BaseCommand
+from django.template import engines
+from django.template.loader import get_template
+
+
+class Command(BaseCommand):
+    """Measure how long rendering alert emails takes.
+
+    Compares the templates compiled once and cached by the sender with compiling the
+    template source for every message, as string-built or ``from_string`` emails do.
+    """
+
+    help = "Benchmark the rendering of alert emails."
+
+    def add_arguments(self, parser):
+        """Add the command arguments."""
+        parser.add_argument("--count", type=int, default=10000, help="Number of alert emails to render.")
+
+    def handle(self, *args, **options):
+        """Render the alerts both ways and report the timings."""
+        count = options["count"]
+        alerts = [
+            {"name": f"Despesa {index}", "expiration_date": date(2024, 1, 1) + timedelta(days=index % 365), "amount": Decimal("1234.56")}
+            for index in range(count)
+        ]
+
+        engine = engines["django"]
+        sources = [get_template(name).template.source for name in (ALERT_EMAIL_TEXT_TEMPLATE, ALERT_EMAIL_HTML_TEMPLATE)]
+
+        cached = self._measure(lambda: [render_alert_email(alert) for alert in alerts])
+        uncached = self._measure(lambda: [[engine.from_string(source).render(alert) for source in sources] for alert in alerts])
+
+        for label, seconds in (("cached templates", cached), ("compiled per message", uncached)):
+            self.stdout.write(f"{label}: {seconds:.3f}s for {count} alerts ({seconds / count * 1e6:.1f}us per alert)")
+
+    def _measure(self, render) -> float:
+        start = time.perf_counter()
+        render()
+        return time.perf_counter() - start
@@ -0,0 +1,127 @@
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+from decimal import Decimal
+
+from budget.domain.entities.recurring import MONTHS, add_periods
+from budget.models import Incoming, IncomingCategory, Installment, Revenue, RevenueCategory
+from budget.repositories import ForecastRepository
+from budget.repositories.rollup import rebuild_monthly_rollups
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+# User seeded by the benchmark, rolled back at the end.
+BENCHMARK_USER_ID = 999_999_999
+
+
+class Command(BaseCommand):
+    """Measure how long projecting the balance of a user with a long history takes.
+
+    Compares ``ForecastRepository``, which sums the buckets in the database and reads the
+    opening balance from the monthly rollups, with loading every record of the user and
+    adding it to its bucket in a Python loop. The dataset is created inside a transaction
+    that is rolled back at the end.
+    """
+
+    help = "Benchmark the cash-flow forecast."
+
+    def add_arguments(self, parser):
+        """Add the command arguments."""
+        parser.add_argument("--rows", type=int, default=20000, help="Number of incomings and revenues to seed.")
+        parser.add_argument("--months", type=int, default=12, help="Number of months to project.")
+
+    def handle(self, *args, **options):
+        """Seed the dataset, project it both ways and report the timings."""
+        rows, months = options["rows"], options["months"]
+        start = date.today().replace(day=1)
+        with transaction.atomic():
+            self._seed(rows, start)
+            rebuild_monthly_rollups([BENCHMARK_USER_ID])
+
+            began = time.perf_counter()
+            loop_balances = self._loop_forecast(start, months)
+            loop_seconds = time.perf_counter() - began
+
+            began = time.perf_counter()
+            forecast = ForecastRepository().get_forecast(BENCHMARK_USER_ID, start, months, "month")
+            bucketed_seconds = time.perf_counter() - began
+            transaction.set_rollback(True)
+
+        if forecast.balances != loop_balances:
+            raise CommandError("The forecast and the loop projection differ.")
+        for label, seconds in (("python loop", loop_seconds), ("database buckets", bucketed_seconds)):
+            self.stdout.write(f"{label}: {seconds * 1000:.1f}ms for {rows * 2} records over {months} months")
+
+    def _seed(self, rows: int, start: date) -> None:
+        incoming_category = IncomingCategory.objects.create(name="Forecast benchmark")
+        revenue_category = RevenueCategory.objects.create(name="Forecast benchmark")
+        # Two years of history before the window and one year inside it.
+        first_day = add_periods(start, -24, MONTHS)
+        days = (add_periods(start, 12, MONTHS) - first_day).days
+        Incoming.objects.bulk_create(
+            (
+                Incoming(
+                    user_id=BENCHMARK_USER_ID,
+                    name="Incoming",
+                    amount=Decimal("100.00"),
+                    launch_date=first_day + timedelta(days=row % days),
+                    category=incoming_category,
+                )
+                for row in range(rows)
+            ),
+            batch_size=1000,
+        )
+        revenues = Revenue.objects.bulk_create(
+            (
+                Revenue(
+                    user_id=BENCHMARK_USER_ID,
+                    name="Revenue",
+                    amount=Decimal("60.00"),
+                    expiration_date=first_day + timedelta(days=row * 7 % days),
+                    paid=row % 2 == 0,
+                    category=revenue_category,
+                )
+                for row in range(rows)
+            ),
+            batch_size=1000,
+        )
+        # Plans bought before and inside the window, with the first installment paid.
+        planned = revenues[:: max(rows // 100, 1)]
+        Installment.objects.bulk_create(
+            Installment(
+                revenue=revenue,
+                amount=Decimal("10.00"),
+                due_date=add_periods(revenue.expiration_date, period, MONTHS),
+                period=period + 1,
+                paid=period == 0,
+            )
+            for revenue in planned
+            for period in range(6)
+        )
+
+    def _loop_forecast(self, start: date, months: int) -> list[Decimal]:
+        end = add_periods(start, months, MONTHS)
+        opening = Decimal("0.00")
+        buckets: defaultdict[date, Decimal] = defaultdict(Decimal)
+        for incoming in Incoming.objects.filter(user_id=BENCHMARK_USER_ID):
+            if incoming.launch_date < start:
+                opening += incoming.amount
+            elif incoming.launch_date < end:
+                buckets[incoming.launch_date.replace(day=1)] += incoming.amount
+        for revenue in Revenue.objects.filter(user_id=BENCHMARK_USER_ID).prefetch_related("installment"):
+            installments = list(revenue.installment.all())
+            if not installments:
+                if revenue.expiration_date < start:
+                    opening -= revenue.amount
+                elif revenue.expiration_date < end:
+                    buckets[revenue.expiration_date.replace(day=1)] -= revenue.amount
+            for installment in installments:
+                if installment.paid or installment.due_date < start:
+                    opening -= installment.amount
+                elif installment.due_date < end:
+                    buckets[installment.due_date.replace(day=1)] -= installment.amount
+        balances = []
+        for index in range(months):
+            opening += buckets[add_periods(start, index, MONTHS)]
+            balances.append(opening)
+        return balances
@@ -0,0 +1,182 @@
+import re
+import uuid
+from collections.abc import Callable
+from datetime import date, timedelta
+from decimal import Decimal
+
+from budget.models import Alert, AlertDelivery, Incoming, IncomingCategory, Limit, Revenue, RevenueCategory
+from budget.repositories import (
+    AlertDeleteRepository,
+    AlertListRepository,
+    IncomingDeleteRepository,
+    IncomingListRepository,
+    IncomingRetrieveRepository,
+    LimitDeleteRepository,
+    LimitListRepository,
+    RevenueDeleteRepository,
+    RevenueListRepository,
+    RevenueRetrieveRepository,
+)
+from budget.repositories.alert_delivery import AlertDeliveryRepository
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+# Tables that grow with user history. Category tables are small lookups and may be scanned.
+LARGE_TABLES = (
+    Revenue._meta.db_table,
+    Incoming._meta.db_table,
+    Limit._meta.db_table,
+    Alert._meta.db_table,
+    AlertDelivery._meta.db_table,
+)
+
+
+class Command(BaseCommand):
+    """Run EXPLAIN on every repository query against a seeded dataset and fail on sequential scans.
+
+    The dataset is created inside a transaction that is rolled back at the end, so the
+    command can be pointed at any database, including a staging copy of production.
+    """
+
+    help = "Check that repository queries use indexes instead of sequential scans."
+
+    def add_arguments(self, parser):
+        """Add the command arguments."""
+        parser.add_argument("--users", type=int, default=100, help="Number of users to seed.")
+        parser.add_argument("--rows", type=int, default=50, help="Number of rows to seed per user and table.")
+
+    def handle(self, *args, **options):
+        """Seed the dataset, explain the repository queries and report sequential scans."""
+        self.verbosity = options["verbosity"]
+        failures: list[str] = []
+        with transaction.atomic():
+            probe = self._seed(options["users"], options["rows"])
+            self._analyze()
+            for label, call in self._get_repository_calls(probe):
+                failures.extend(self._check(label, call))
+            transaction.set_rollback(True)
+
+        if failures:
+            raise CommandError("Sequential scans found:\n" + "\n".join(failures))
+        self.stdout.write(self.style.SUCCESS("All repository queries use indexes."))
+
+    def _seed(self, users: int, rows: int) -> dict:
+        today = date.today()
+        incoming_category = IncomingCategory.objects.create(name="Query plan check")
+        revenue_category = RevenueCategory.objects.create(name="Query plan check")
+        revenues = Revenue.objects.bulk_create(
+            Revenue(
+                user_id=user_id,
+                name="Revenue",
+                amount=Decimal("10.00"),
+                expiration_date=today + timedelta(days=row),
+                category=revenue_category,
+            )
+            for user_id in range(1, users + 1)
+            for row in range(rows)
+        )
+        incomings = Incoming.objects.bulk_create(
+            Incoming(
+                user_id=user_id,
+                name="Incoming",
+                amount=Decimal("10.00"),
+                launch_date=today + timedelta(days=row),
+                category=incoming_category,
+            )
+            for user_id in range(1, users + 1)
+            for row in range(rows)
+        )
+        Limit.objects.bulk_create(
+            Limit(
+                user_id=user_id,
+                limit=Decimal("100.00"),
+                amount=Decimal("10.00"),
+                limit_date=today + timedelta(days=31 * row),
+                category=revenue_category,
+            )
+            for user_id in range(1, users + 1)
+            for row in range(rows)
+        )
+        alerts = Alert.objects.bulk_create(
+            Alert(
+                user_id=revenue.user_id,
+                user_email="query-plan@example.com",
+                revenue=revenue,
+                message="Alert",
+                alert_date=revenue.expiration_date,
+            )
+            for revenue in revenues
+        )
+        AlertDelivery.objects.bulk_create(AlertDelivery(alert=alert, alert_date=alert.alert_date) for alert in alerts)
+        return {
+            "user_id": 1,
+            "revenue_id": revenues[0].id,
+            "incoming_id": incomings[0].id,
+        }
+
+    def _analyze(self):
+        with connection.cursor() as cursor:
+            if connection.vendor == "postgresql":
+                for table in LARGE_TABLES:
+                    cursor.execute(f"ANALYZE {table}")
+            elif connection.vendor == "sqlite":
+                cursor.execute("ANALYZE")
+
+    def _get_repository_calls(self, probe: dict) -> list[tuple[str, Callable]]:
+        user_id = probe["user_id"]
+        missing_id = uuid.uuid4()
+
+        def second_revenue_page():
+            page = RevenueListRepository().get_revenues_page(user_id, page_size=10)
+            return RevenueListRepository().get_revenues_page(user_id, cursor=page.next_cursor, page_size=10)
+
+        return [
+            ("revenue list", lambda: RevenueListRepository().get_revenues(user_id)),
+            ("revenue page", second_revenue_page),
+            ("revenue retrieve", lambda: RevenueRetrieveRepository().get_revenue(probe["revenue_id"], user_id)),
+            ("revenue delete", lambda: RevenueDeleteRepository().delete_revenue(user_id, missing_id)),
+            ("incoming list", lambda: IncomingListRepository().get_incomings(user_id)),
+            ("incoming page", lambda: IncomingListRepository().get_incomings_page(user_id, page_size=10)),
+            ("incoming retrieve", lambda: IncomingRetrieveRepository().get_incoming(probe["incoming_id"], user_id)),
+            ("incoming delete", lambda: IncomingDeleteRepository().delete_incoming(user_id, missing_id)),
+            ("limit list", lambda: LimitListRepository().get_limits(user_id)),
+            ("limit page", lambda: LimitListRepository().get_limits_page(user_id, page_size=10)),
+            ("limit delete", lambda: LimitDeleteRepository().delete_limit(user_id, missing_id)),
+            ("alert list", lambda: AlertListRepository().get_alerts(user_id)),
+            ("alert page", lambda: AlertListRepository().get_alerts_page(user_id, page_size=10)),
+            ("alert delete", lambda: AlertDeleteRepository().delete_alert(user_id, missing_id)),
+            ("alert deliveries", lambda: AlertDeliveryRepository().create_deliveries(date.today())),
+            ("alert delivery claim", lambda: AlertDeliveryRepository().claim_deliveries(date.today(), 10, ["query-plan@example.com"])),
+            ("undelivered alert recipients", lambda: AlertDeliveryRepository().get_undelivered_recipients(date.today())),
+        ]
+
+    def _check(self, label: str, call: Callable) -> list[str]:
+        with CaptureQueriesContext(connection) as context:
+            call()
+        failures: list[str] = []
+        explained: set[str] = set()
+        for query in context.captured_queries:
+            sql = query["sql"]
+            if sql in explained or not sql.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE")):
+                continue
+            explained.add(sql)
+            plan = self._explain(sql)
+            scanned = [table for table in LARGE_TABLES if self._is_sequential_scan(plan, table)]
+            status = self.style.ERROR("SEQ SCAN") if scanned else self.style.SUCCESS("ok")
+            self.stdout.write(f"[{status}] {label}: {sql[:120]}")
+            if self.verbosity > 1:
+                self.stdout.write(plan)
+            failures.extend(f"{label}: sequential scan on {table}\n{plan}" for table in scanned)
+        return failures
+
+    def _explain(self, sql: str) -> str:
+        prefix = "EXPLAIN QUERY PLAN" if connection.vendor == "sqlite" else "EXPLAIN"
+        with connection.cursor() as cursor:
+            cursor.execute(f"{prefix} {sql}")
+            return "\n".join(" ".join(str(column) for column in row) for row in cursor.fetchall())
+
+    def _is_sequential_scan(self, plan: str, table: str) -> bool:
+        if connection.vendor == "sqlite":
+            return re.search(rf"\bSCAN {table}\b", plan) is not None
+        return re.search(rf"Seq Scan on {table}\b", plan) is not None
@@ -0,0 +1,35 @@
+from datetime import date, datetime, timedelta
+
+from budget.utils.reports import generate_monthly_reports
+from django.core.management.base import BaseCommand, CommandError
+
+
+def parse_month(value: str) -> date:
+    """Parse a ``YYYY-MM`` month argument."""
+    try:
+        return datetime.strptime(value, "%Y-%m").date()
+    except ValueError:
+        raise CommandError(f"Invalid month {value!r}, expected YYYY-MM.") from None
+
+
+class Command(BaseCommand):
+    """Render the monthly report PDFs of a month ahead of the first downloads.
+
+    Reports already cached for the current data of the month are skipped, so the
+    command can be run again after late changes and only renders what changed.
+    """
+
+    help = "Pre-generate the cached monthly report PDFs of a month."
+
+    def add_arguments(self, parser):
+        """Add the command arguments."""
+        parser.add_argument("--month", type=parse_month, help="The month as YYYY-MM. Defaults to the previous month.")
+        parser.add_argument("--user", type=int, action="append", dest="user_ids", help="Only render this user. May be repeated.")
+
+    def handle(self, *args, **options):
+        """Render the reports and report how many were rendered."""
+        month = options["month"] or date.today().replace(day=1) - timedelta(days=1)
+        result = generate_monthly_reports(month, options["user_ids"])
+        self.stdout.write(
+            self.style.SUCCESS(f"{result['month']}: {result['rendered']} rendered, {result['cached']} already cached, {result['failed']} failed.")
+        )
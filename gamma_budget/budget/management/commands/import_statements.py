@@ -0,0 +1,47 @@
+import json
+from pathlib import Path
+
+from budget.domain.entities.statement import STATEMENT_FORMATS
+from budget.utils.statements import import_statement_file
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    """Import bank statements in CSV or OFX format for a user.
+
+    Files are streamed and written in batches, so statements with millions of lines
+    import with bounded memory. Lines imported before are skipped, which makes it safe
+    to run the command again on the same files.
+    """
+
+    help = "Import CSV or OFX bank statements as incomings and revenues."
+
+    def add_arguments(self, parser):
+        """Add the command arguments."""
+        parser.add_argument("files", nargs="+", type=Path, help="Statement files to import.")
+        parser.add_argument("--user", type=int, required=True, dest="user_id", help="The user the statements belong to.")
+        parser.add_argument("--format", choices=STATEMENT_FORMATS, help="Format of the files. Defaults to the file extension.")
+        parser.add_argument("--rules", type=Path, help='JSON file with category rules: [{"pattern": "uber", "category": "Transporte"}].')
+        parser.add_argument("--encoding", default=settings.IMPORT_ENCODING, help="Text encoding of the files.")
+        parser.add_argument("--batch-size", type=int, default=settings.IMPORT_BATCH_SIZE, help="Number of lines inserted per batch.")
+
+    def handle(self, *args, **options):
+        """Import every file and report the records created."""
+        rules = json.loads(options["rules"].read_text()) if options["rules"] else []
+        for path in options["files"]:
+            statement_format = options["format"] or path.suffix.lstrip(".").lower()
+            if statement_format not in STATEMENT_FORMATS:
+                raise CommandError(f"Cannot tell the format of {path}; use --format.")
+            with path.open(encoding=options["encoding"], errors="replace", newline="") as stream:
+                try:
+                    result = import_statement_file(options["user_id"], stream, statement_format, rules, options["batch_size"])
+                except ValueError as e:
+                    raise CommandError(f"{path}: {e}") from e
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{path}: {result.incomings} incomings and {result.revenues} revenues created, {result.duplicates} duplicates skipped."
+                )
+            )
+            for error in result.errors:
+                self.stderr.write(f"{path}: {error}")
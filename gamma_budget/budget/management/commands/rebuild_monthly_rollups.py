@@ -0,0 +1,22 @@
+from budget.repositories.rollup import rebuild_monthly_rollups
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    """Recompute the monthly rollup table from the incoming and revenue tables.
+
+    The repositories keep the rollups in sync incrementally; this command repairs them
+    after bulk imports, manual data fixes or the first deploy of the table.
+    """
+
+    help = "Rebuild the monthly budget rollups in bulk."
+
+    def add_arguments(self, parser):
+        """Add the command arguments."""
+        parser.add_argument("--user", type=int, action="append", dest="user_ids", help="Only rebuild this user. May be repeated.")
+        parser.add_argument("--batch-size", type=int, default=1000, help="Number of rollup rows written per statement.")
+
+    def handle(self, *args, **options):
+        """Rebuild the rollups and report how many rows were written."""
+        created = rebuild_monthly_rollups(user_ids=options["user_ids"], batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {created} monthly rollup rows."))
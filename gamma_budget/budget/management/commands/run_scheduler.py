@@ -0,0 +1,53 @@
+from budget.models import ScheduledRun
+from budget.utils.scheduler import Schedule, Scheduler, get_schedules
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+
+class Command(BaseCommand):
+    """Run the periodic tasks, such as the daily alert emails, at their scheduled times.
+
+    The schedules are registered in ``budget.utils.scheduler.get_schedules``. Every run is
+    recorded in the scheduled run table, which also keeps two schedulers from running the
+    same time slot.
+    """
+
+    help = "Run the periodic tasks registered in the scheduler."
+
+    def add_arguments(self, parser):
+        """Add the command arguments."""
+        parser.add_argument("--list", action="store_true", help="List the schedules and their next run, then exit.")
+        parser.add_argument("--run", metavar="NAME", help="Run a schedule now, then exit.")
+        parser.add_argument(
+            "--max-sleep",
+            type=float,
+            default=settings.SCHEDULER_MAX_SLEEP_SECONDS,
+            help="Maximum seconds between two checks of the schedules.",
+        )
+
+    def handle(self, *args, **options):
+        """Run the schedules until stopped."""
+        self.verbosity = options["verbosity"]
+        scheduler = Scheduler(get_schedules())
+        if options["list"]:
+            for schedule in scheduler.schedules:
+                slot, _ = scheduler.next_runs[schedule.name]
+                self.stdout.write(f"{schedule.name}: {schedule.trigger}, next run at {timezone.localtime(slot):%Y-%m-%d %H:%M %Z}")
+            return
+        if options["run"]:
+            schedule = next((schedule for schedule in scheduler.schedules if schedule.name == options["run"]), None)
+            if schedule is None:
+                raise CommandError(f"Unknown schedule: {options['run']}")
+            self._report(schedule, scheduler.run(schedule, timezone.now().replace(microsecond=0)))
+            return
+        self.stdout.write(f"Scheduler started with {len(scheduler.schedules)} schedules.")
+        scheduler.run_forever(options["max_sleep"], on_run=self._report)
+
+    def _report(self, schedule: Schedule, run: ScheduledRun | None):
+        if run is None:
+            self.stdout.write(f"{schedule.name} skipped: the slot is taken or a run is in progress.")
+        elif run.status == ScheduledRun.SUCCEEDED:
+            self.stdout.write(self.style.SUCCESS(f"{schedule.name} succeeded: {run.result}"))
+        else:
+            self.stdout.write(self.style.ERROR(f"{schedule.name} failed: {run.error}"))
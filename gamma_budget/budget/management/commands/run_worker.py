@@ -0,0 +1,48 @@
+import time
+
+from budget.repositories.job import JobQueueRepository
+from budget.utils.jobs import run_job
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+
+class Command(BaseCommand):
+    """Run the background jobs stored in the job table.
+
+    Several workers can run side by side: each job attempt is claimed by exactly one of
+    them, and a job whose worker died is picked up again once its lease expires.
+    """
+
+    help = "Process background jobs from the database queue."
+
+    def add_arguments(self, parser):
+        """Add the command arguments."""
+        parser.add_argument("--once", action="store_true", help="Exit when no job is due instead of polling.")
+        parser.add_argument("--max-jobs", type=int, default=None, help="Exit after running this many jobs.")
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=settings.JOB_POLL_INTERVAL_SECONDS,
+            help="Seconds to wait before polling an empty queue again.",
+        )
+
+    def handle(self, *args, **options):
+        """Claim and run jobs until stopped."""
+        self.verbosity = options["verbosity"]
+        queue = JobQueueRepository()
+        processed = 0
+        while options["max_jobs"] is None or processed < options["max_jobs"]:
+            close_old_connections()
+            job = queue.claim_job()
+            if job is None:
+                if options["once"]:
+                    break
+                time.sleep(options["poll_interval"])
+                continue
+            succeeded = run_job(job, queue)
+            processed += 1
+            if self.verbosity >= 1:
+                outcome = "succeeded" if succeeded else "failed"
+                self.stdout.write(f"Job {job.id} ({job.kind}) {outcome} on attempt {job.attempts}.")
+        self.stdout.write(self.style.SUCCESS(f"Processed {processed} jobs."))
@@ -0,0 +1,33 @@
+# Generated by Django 5.0 on 2026-10-18 13:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("budget", "0008_alter_incoming_incoming_date_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="alert",
+            index=models.Index(fields=["user_id", "created_at", "id"], name="alert_user_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="alert",
+            index=models.Index(fields=["alert_date"], name="alert_date_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="incoming",
+            index=models.Index(fields=["user_id", "launch_date", "id"], name="incoming_user_launch_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="limit",
+            index=models.Index(fields=["user_id", "limit_date", "category"], name="limit_user_date_category_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="revenue",
+            index=models.Index(fields=["user_id", "expiration_date", "id"], name="revenue_user_expiration_idx"),
+        ),
+    ]
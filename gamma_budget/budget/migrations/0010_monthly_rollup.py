@@ -0,0 +1,31 @@
+# Generated by Django 5.0 on 2026-10-18 13:25
+
+import uuid
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("budget", "0009_add_user_scoped_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MonthlyRollup",
+            fields=[
+                ("id", models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ("user_id", models.IntegerField()),
+                ("month", models.DateField()),
+                ("category_id", models.UUIDField()),
+                ("incomings", models.DecimalField(decimal_places=2, default=0, max_digits=15)),
+                ("revenues_paid", models.DecimalField(decimal_places=2, default=0, max_digits=15)),
+                ("revenues_unpaid", models.DecimalField(decimal_places=2, default=0, max_digits=15)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="monthlyrollup",
+            constraint=models.UniqueConstraint(fields=("user_id", "month", "category_id"), name="rollup_user_month_category_uniq"),
+        ),
+    ]
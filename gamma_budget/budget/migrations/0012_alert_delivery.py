@@ -0,0 +1,44 @@
+# Generated by Django 5.0 on 2026-10-18 13:32
+
+import uuid
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("budget", "0011_job_queue"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AlertDelivery",
+            fields=[
+                ("id", models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ("alert_date", models.DateField()),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("pending", "Pending"), ("sending", "Sending"), ("sent", "Sent"), ("failed", "Failed")],
+                        default="pending",
+                        max_length=20,
+                    ),
+                ),
+                ("attempts", models.PositiveIntegerField(default=0)),
+                ("claim_token", models.UUIDField(blank=True, null=True)),
+                ("claimed_until", models.DateTimeField(blank=True, null=True)),
+                ("sent_at", models.DateTimeField(blank=True, null=True)),
+                ("last_error", models.TextField(blank=True, null=True)),
+                ("alert", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="deliveries", to="budget.alert")),
+            ],
+            options={
+                "indexes": [models.Index(fields=["alert_date", "status"], name="alert_delivery_date_status_idx")],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="alertdelivery",
+            constraint=models.UniqueConstraint(fields=("alert", "alert_date"), name="alert_delivery_alert_date_uniq"),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.0 on 2026-10-18 13:37
+
+import uuid
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("budget", "0012_alert_delivery"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ScheduledRun",
+            fields=[
+                ("id", models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ("name", models.CharField(max_length=100)),
+                ("scheduled_for", models.DateTimeField()),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("running", "Running"), ("succeeded", "Succeeded"), ("failed", "Failed"), ("skipped", "Skipped")],
+                        default="running",
+                        max_length=20,
+                    ),
+                ),
+                ("started_at", models.DateTimeField(auto_now_add=True)),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+                ("result", models.JSONField(blank=True, null=True)),
+                ("error", models.TextField(blank=True, null=True)),
+            ],
+            options={
+                "indexes": [models.Index(fields=["name", "status"], name="scheduled_run_name_status_idx")],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="scheduledrun",
+            constraint=models.UniqueConstraint(fields=("name", "scheduled_for"), name="scheduled_run_name_slot_uniq"),
+        ),
+    ]
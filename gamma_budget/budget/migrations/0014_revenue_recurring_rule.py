@@ -0,0 +1,29 @@
+# Generated by Django 5.0 on 2026-10-18 13:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("budget", "0013_scheduled_run"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="revenue",
+            name="recurring_rule",
+            field=models.ForeignKey(
+                blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name="occurrences", to="budget.recurring"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="revenue",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("recurring_rule__isnull", False)),
+                fields=("recurring_rule", "expiration_date"),
+                name="revenue_recurring_occurrence_uniq",
+            ),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.0 on 2026-10-18 13:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("budget", "0014_revenue_recurring_rule"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="installment",
+            constraint=models.UniqueConstraint(fields=("revenue", "period"), name="installment_revenue_period_uniq"),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.0 on 2026-10-18 13:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("budget", "0015_installment_revenue_period"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="incoming",
+            name="import_hash",
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name="revenue",
+            name="import_hash",
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+        migrations.AddConstraint(
+            model_name="incoming",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("import_hash__isnull", False)), fields=("user_id", "import_hash"), name="incoming_user_import_hash_uniq"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="revenue",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("import_hash__isnull", False)), fields=("user_id", "import_hash"), name="revenue_user_import_hash_uniq"
+            ),
+        ),
+    ]
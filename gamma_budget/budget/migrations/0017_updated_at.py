@@ -0,0 +1,34 @@
+# Generated by Django 5.0 on 2026-10-18 16:20
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("budget", "0016_statement_import_hash"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="incoming",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="revenue",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddIndex(
+            model_name="incoming",
+            index=models.Index(fields=["user_id", "updated_at"], name="incoming_user_updated_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="revenue",
+            index=models.Index(fields=["user_id", "updated_at"], name="revenue_user_updated_idx"),
+        ),
+    ]
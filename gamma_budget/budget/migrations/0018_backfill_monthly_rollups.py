@@ -0,0 +1,58 @@
+import uuid
+from decimal import Decimal
+
+from django.db import migrations
+from django.db.models import DecimalField, Q, Sum, Value
+from django.db.models.functions import TruncMonth
+
+BATCH_SIZE = 1000
+
+
+def backfill_monthly_rollups(apps, schema_editor):
+    """Rebuild the monthly rollups from the incomings and revenues already stored."""
+    Incoming = apps.get_model("budget", "Incoming")
+    Revenue = apps.get_model("budget", "Revenue")
+    MonthlyRollup = apps.get_model("budget", "MonthlyRollup")
+    db_alias = schema_editor.connection.alias
+    zero = Value(Decimal("0.00"), output_field=DecimalField(max_digits=15, decimal_places=2))
+    columns = ("user_id", "month", "category_id", "incomings", "revenues_paid", "revenues_unpaid")
+    incomings = (
+        Incoming.objects.using(db_alias)
+        .annotate(month=TruncMonth("launch_date"))
+        .values("user_id", "month", "category_id")
+        .annotate(incomings=Sum("amount"), revenues_paid=zero, revenues_unpaid=zero)
+        .values_list(*columns)
+        .order_by()
+    )
+    revenues = (
+        Revenue.objects.using(db_alias)
+        .annotate(month=TruncMonth("expiration_date"))
+        .values("user_id", "month", "category_id")
+        .annotate(
+            incomings=zero,
+            revenues_paid=Sum("amount", filter=Q(paid=True), default=zero),
+            revenues_unpaid=Sum("amount", filter=Q(paid=False), default=zero),
+        )
+        .values_list(*columns)
+        .order_by()
+    )
+
+    MonthlyRollup.objects.using(db_alias).all().delete()
+    batch = []
+    for row in incomings.union(revenues, all=True).iterator(chunk_size=BATCH_SIZE):
+        batch.append(MonthlyRollup(id=uuid.uuid4(), **dict(zip(columns, row, strict=True))))
+        if len(batch) >= BATCH_SIZE:
+            MonthlyRollup.objects.using(db_alias).bulk_create(batch)
+            batch = []
+    MonthlyRollup.objects.using(db_alias).bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("budget", "0017_updated_at"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_monthly_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0 on 2026-10-18 14:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("budget", "0018_backfill_monthly_rollups"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="recurring",
+            name="expanded_until",
+            field=models.DateField(blank=True, null=True),
+        ),
+    ]
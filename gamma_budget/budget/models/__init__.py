@@ -1,7 +1,11 @@
 from .alert import *
+from .alert_delivery import *
 from .categories import *
 from .incoming import *
 from .installment import *
+from .job import *
 from .limit import *
 from .recurring import *
 from .revenue import *
+from .rollup import *
+from .scheduled_run import *
@@ -1,4 +1,5 @@
 import uuid
+from typing import ClassVar
 
 from django.db import models
 
@@ -25,6 +26,14 @@ class Alert(models.Model):
     alert_date = models.DateField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        """Meta class for Alert."""
+
+        indexes: ClassVar[list[models.Index]] = [
+            models.Index(fields=["user_id", "created_at", "id"], name="alert_user_created_idx"),
+            models.Index(fields=["alert_date"], name="alert_date_idx"),
+        ]
+
     def __str__(self):
         """
         String representation of the alert.
@@ -0,0 +1,66 @@
+import uuid
+from typing import ClassVar
+
+from django.db import models
+
+
+class AlertDelivery(models.Model):
+    """
+    Model for the ledger of alert emails, one row per alert and date.
+
+    A worker claims pending rows before sending, so an email is sent at most once per
+    alert and date even when the dispatch is triggered again or runs on several workers.
+
+    Attributes:
+    ----------
+        id (models.UUIDField): The UUID field for primary key.
+        alert (models.ForeignKey): The alert being delivered.
+        alert_date (models.DateField): The date the alert is delivered for.
+        status (models.CharField): The state of the delivery.
+        attempts (models.PositiveIntegerField): How many times the delivery was claimed.
+        claim_token (models.UUIDField): Identifies the worker that claimed the delivery.
+        claimed_until (models.DateTimeField): End of the lease of the claiming worker.
+        sent_at (models.DateTimeField): The date and time the email was sent.
+        last_error (models.TextField): The error of the last failed attempt.
+    """
+
+    PENDING = "pending"
+    SENDING = "sending"
+    SENT = "sent"
+    FAILED = "failed"
+    STATUS_CHOICES: ClassVar[list[tuple[str, str]]] = [
+        (PENDING, "Pending"),
+        (SENDING, "Sending"),
+        (SENT, "Sent"),
+        (FAILED, "Failed"),
+    ]
+
+    id = models.UUIDField(primary_key=True, editable=False, default=uuid.uuid4)
+    alert = models.ForeignKey("Alert", on_delete=models.CASCADE, related_name="deliveries")
+    alert_date = models.DateField()
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    claim_token = models.UUIDField(blank=True, null=True)
+    claimed_until = models.DateTimeField(blank=True, null=True)
+    sent_at = models.DateTimeField(blank=True, null=True)
+    last_error = models.TextField(blank=True, null=True)
+
+    class Meta:
+        """Meta class for AlertDelivery."""
+
+        constraints: ClassVar[list[models.BaseConstraint]] = [
+            models.UniqueConstraint(fields=["alert", "alert_date"], name="alert_delivery_alert_date_uniq"),
+        ]
+        indexes: ClassVar[list[models.Index]] = [
+            models.Index(fields=["alert_date", "status"], name="alert_delivery_date_status_idx"),
+        ]
+
+    def __str__(self):
+        """
+        String representation of the alert delivery.
+
+        Returns:
+        -------
+            str: The alert, date and status of the delivery.
+        """
+        return f"{self.alert_id} {self.alert_date} ({self.status})"
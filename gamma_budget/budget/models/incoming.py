@@ -1,4 +1,5 @@
 import uuid
+from typing import ClassVar
 
 from django.db import models
 
@@ -17,6 +18,8 @@ class Incoming(models.Model):
         launch_date (models.DateTimeField): The date and time when the transaction was created.
         incoming_date (models.DateTimeField): The date and time when the transaction is extimated to come in.
         category (models.ForeignKey): The category of the transaction.
+        import_hash (models.CharField): The fingerprint of the statement line the transaction was imported from.
+        updated_at (models.DateTimeField): When the transaction was last created or changed.
     """
 
     id = models.UUIDField(primary_key=True, editable=False, default=uuid.uuid4)
@@ -27,6 +30,23 @@ class Incoming(models.Model):
     launch_date = models.DateField(blank=True)
     incoming_date = models.DateField(default=None, blank=True, null=True)
     category = models.ForeignKey("IncomingCategory", on_delete=models.CASCADE, related_name="incoming")
+    import_hash = models.CharField(max_length=64, blank=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        """Meta class for Incoming."""
+
+        indexes: ClassVar[list[models.Index]] = [
+            models.Index(fields=["user_id", "launch_date", "id"], name="incoming_user_launch_idx"),
+            models.Index(fields=["user_id", "updated_at"], name="incoming_user_updated_idx"),
+        ]
+        constraints: ClassVar[list[models.BaseConstraint]] = [
+            models.UniqueConstraint(
+                fields=["user_id", "import_hash"],
+                condition=models.Q(import_hash__isnull=False),
+                name="incoming_user_import_hash_uniq",
+            ),
+        ]
 
     def __str__(self):
         """
@@ -1,4 +1,5 @@
 import uuid
+from typing import ClassVar
 
 from django.db import models
 
@@ -13,10 +14,10 @@ class Installment(models.Model):
         revenue (models.ForeignKey): The revenue associated with the installment.
         amount (models.DecimalField): The amount of the installment.
         due_date (models.DateField): The due date of the installment.
-        period (models.PositiveBigIntegerField): The period of the installment.
+        period (models.PositiveBigIntegerField): The position of the installment in the plan, starting at 1.
         period_unit (models.CharField): The unit of the period.
         paid (models.BooleanField): Flag indicating if the installment is paid.
-        periods_paid (models.PositiveBigIntegerField): The number of periods paid.
+        periods_paid (models.PositiveBigIntegerField): The number of installments of the plan paid.
         payment_method (models.CharField): The payment method for the installment.
     """
 
@@ -30,6 +31,13 @@ class Installment(models.Model):
     periods_paid = models.PositiveBigIntegerField(default=0)
     payment_method = models.CharField(max_length=100, blank=True, null=True)
 
+    class Meta:
+        """Meta class for Installment."""
+
+        constraints: ClassVar[list[models.BaseConstraint]] = [
+            models.UniqueConstraint(fields=["revenue", "period"], name="installment_revenue_period_uniq"),
+        ]
+
     def __str__(self):
         """
         String representation of the installment.
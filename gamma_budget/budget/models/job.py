@@ -0,0 +1,67 @@
+import uuid
+from typing import ClassVar
+
+from django.db import models
+from django.utils import timezone
+
+
+class Job(models.Model):
+    """
+    Model for background jobs run by the ``run_worker`` command.
+
+    Attributes:
+    ----------
+        id (models.UUIDField): The UUID field for primary key.
+        kind (models.CharField): The name of the handler that runs the job.
+        payload (models.JSONField): The arguments of the handler.
+        status (models.CharField): The state of the job.
+        attempts (models.PositiveIntegerField): How many times the job was claimed by a worker.
+        max_attempts (models.PositiveIntegerField): How many attempts are made before the job fails.
+        run_after (models.DateTimeField): The job is not claimed before this moment.
+        locked_until (models.DateTimeField): End of the lease of the worker running the job.
+        result (models.JSONField): The value returned by the handler.
+        last_error (models.TextField): The error of the last failed attempt.
+        created_at (models.DateTimeField): The date and time the job was enqueued.
+        finished_at (models.DateTimeField): The date and time the job succeeded or failed for good.
+    """
+
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    STATUS_CHOICES: ClassVar[list[tuple[str, str]]] = [
+        (PENDING, "Pending"),
+        (RUNNING, "Running"),
+        (SUCCEEDED, "Succeeded"),
+        (FAILED, "Failed"),
+    ]
+
+    id = models.UUIDField(primary_key=True, editable=False, default=uuid.uuid4)
+    kind = models.CharField(max_length=100)
+    payload = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=5)
+    run_after = models.DateTimeField(default=timezone.now)
+    locked_until = models.DateTimeField(blank=True, null=True)
+    result = models.JSONField(blank=True, null=True)
+    last_error = models.TextField(blank=True, null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        """Meta class for Job."""
+
+        indexes: ClassVar[list[models.Index]] = [
+            models.Index(fields=["status", "run_after"], name="job_status_run_after_idx"),
+        ]
+
+    def __str__(self):
+        """
+        String representation of the job.
+
+        Returns:
+        -------
+            str: The kind and status of the job.
+        """
+        return f"{self.kind} ({self.status})"
@@ -1,4 +1,5 @@
 import uuid
+from typing import ClassVar
 
 from django.db import models
 
@@ -27,6 +28,13 @@ class Limit(models.Model):
     category = models.ForeignKey("RevenueCategory", on_delete=models.CASCADE, related_name="limits")
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        """Meta class for Limit."""
+
+        indexes: ClassVar[list[models.Index]] = [
+            models.Index(fields=["user_id", "limit_date", "category"], name="limit_user_date_category_idx"),
+        ]
+
     def __str__(self):
         """
         String representation of the limit transaction.
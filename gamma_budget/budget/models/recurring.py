@@ -17,6 +17,7 @@ class Recurring(models.Model):
         period (models.PositiveBigIntegerField): The period of the recurring payment.
         period_unit (models.CharField): The unit of the period.
         active (models.BooleanField): Flag indicating if the recurring payment is active.
+        expanded_until (models.DateField): The last day already expanded into revenues.
     """
 
     id = models.UUIDField(primary_key=True, editable=False, default=uuid.uuid4)
@@ -27,6 +28,7 @@ class Recurring(models.Model):
     period = models.PositiveBigIntegerField()
     period_unit = models.CharField(max_length=10, default="months")
     active = models.BooleanField(default=True)
+    expanded_until = models.DateField(blank=True, null=True)
 
     def __str__(self):
         """
@@ -1,4 +1,5 @@
 import uuid
+from typing import ClassVar
 
 from django.db import models
 
@@ -18,6 +19,9 @@ class Revenue(models.Model):
         paid (models.BooleanField): Flag indicating if the revenue transaction is paid.
         payment_date (models.DateField): The payment date of the revenue transaction.
         category (models.ForeignKey): The category of the revenue transaction.
+        recurring_rule (models.ForeignKey): The recurring rule that generated the revenue, if any.
+        import_hash (models.CharField): The fingerprint of the statement line the revenue was imported from.
+        updated_at (models.DateTimeField): When the revenue was last created or changed.
     """
 
     id = models.UUIDField(primary_key=True, editable=False, default=uuid.uuid4)
@@ -29,6 +33,29 @@ class Revenue(models.Model):
     paid = models.BooleanField(default=False)
     payment_date = models.DateField(blank=True, null=True)
     category = models.ForeignKey("RevenueCategory", on_delete=models.CASCADE, related_name="revenue")
+    recurring_rule = models.ForeignKey("Recurring", on_delete=models.SET_NULL, related_name="occurrences", blank=True, null=True)
+    import_hash = models.CharField(max_length=64, blank=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        """Meta class for Revenue."""
+
+        indexes: ClassVar[list[models.Index]] = [
+            models.Index(fields=["user_id", "expiration_date", "id"], name="revenue_user_expiration_idx"),
+            models.Index(fields=["user_id", "updated_at"], name="revenue_user_updated_idx"),
+        ]
+        constraints: ClassVar[list[models.BaseConstraint]] = [
+            models.UniqueConstraint(
+                fields=["recurring_rule", "expiration_date"],
+                condition=models.Q(recurring_rule__isnull=False),
+                name="revenue_recurring_occurrence_uniq",
+            ),
+            models.UniqueConstraint(
+                fields=["user_id", "import_hash"],
+                condition=models.Q(import_hash__isnull=False),
+                name="revenue_user_import_hash_uniq",
+            ),
+        ]
 
     def __str__(self):
         """
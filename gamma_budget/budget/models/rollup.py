@@ -0,0 +1,48 @@
+import uuid
+from typing import ClassVar
+
+from django.db import models
+
+
+class MonthlyRollup(models.Model):
+    """
+    Model for the precomputed budget totals of a user, month and category.
+
+    The rows are kept in sync incrementally by the incoming and revenue repositories
+    and can be recomputed from scratch with the ``rebuild_monthly_rollups`` command.
+
+    Attributes:
+    ----------
+        id (models.UUIDField): The UUID field for primary key.
+        user_id (models.IntegerField): The ID of the user.
+        month (models.DateField): The first day of the month.
+        category_id (models.UUIDField): The ID of the incoming or revenue category.
+        incomings (models.DecimalField): The total amount of incomings launched in the month.
+        revenues_paid (models.DecimalField): The total amount of paid revenues expiring in the month.
+        revenues_unpaid (models.DecimalField): The total amount of unpaid revenues expiring in the month.
+    """
+
+    id = models.UUIDField(primary_key=True, editable=False, default=uuid.uuid4)
+    user_id = models.IntegerField()
+    month = models.DateField()
+    category_id = models.UUIDField()
+    incomings = models.DecimalField(max_digits=15, decimal_places=2, default=0)
+    revenues_paid = models.DecimalField(max_digits=15, decimal_places=2, default=0)
+    revenues_unpaid = models.DecimalField(max_digits=15, decimal_places=2, default=0)
+
+    class Meta:
+        """Meta class for MonthlyRollup."""
+
+        constraints: ClassVar[list[models.BaseConstraint]] = [
+            models.UniqueConstraint(fields=["user_id", "month", "category_id"], name="rollup_user_month_category_uniq"),
+        ]
+
+    def __str__(self):
+        """
+        String representation of the monthly rollup.
+
+        Returns:
+        -------
+            str: The user and month of the rollup.
+        """
+        return f"{self.user_id} {self.month:%Y-%m}"
@@ -0,0 +1,64 @@
+import uuid
+from typing import ClassVar
+
+from django.db import models
+
+
+class ScheduledRun(models.Model):
+    """
+    Model for the run history of the ``run_scheduler`` command.
+
+    Every time slot of a schedule gets at most one row, so several schedulers can run side
+    by side without running a task twice.
+
+    Attributes:
+    ----------
+        id (models.UUIDField): The UUID field for primary key.
+        name (models.CharField): The name of the schedule.
+        scheduled_for (models.DateTimeField): The time slot the run belongs to.
+        status (models.CharField): The state of the run.
+        started_at (models.DateTimeField): The date and time the run started.
+        finished_at (models.DateTimeField): The date and time the run finished.
+        result (models.JSONField): The value returned by the task.
+        error (models.TextField): The error raised by the task or the reason it was skipped.
+    """
+
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+    STATUS_CHOICES: ClassVar[list[tuple[str, str]]] = [
+        (RUNNING, "Running"),
+        (SUCCEEDED, "Succeeded"),
+        (FAILED, "Failed"),
+        (SKIPPED, "Skipped"),
+    ]
+
+    id = models.UUIDField(primary_key=True, editable=False, default=uuid.uuid4)
+    name = models.CharField(max_length=100)
+    scheduled_for = models.DateTimeField()
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=RUNNING)
+    started_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+    result = models.JSONField(blank=True, null=True)
+    error = models.TextField(blank=True, null=True)
+
+    class Meta:
+        """Meta class for ScheduledRun."""
+
+        constraints: ClassVar[list[models.BaseConstraint]] = [
+            models.UniqueConstraint(fields=["name", "scheduled_for"], name="scheduled_run_name_slot_uniq"),
+        ]
+        indexes: ClassVar[list[models.Index]] = [
+            models.Index(fields=["name", "status"], name="scheduled_run_name_status_idx"),
+        ]
+
+    def __str__(self):
+        """
+        String representation of the run.
+
+        Returns:
+        -------
+            str: The name, slot and status of the run.
+        """
+        return f"{self.name} {self.scheduled_for:%Y-%m-%d %H:%M} ({self.status})"
@@ -1,5 +1,16 @@
 from .alert import *
+from .alert_delivery import *
 from .categories import *
+from .export import *
+from .forecast import *
 from .incoming import *
+from .installment import *
+from .job import *
 from .limit import *
+from .recurring import *
+from .report import *
 from .revenue import *
+from .rollup import *
+from .scheduled_run import *
+from .statement import *
+from .summary import *
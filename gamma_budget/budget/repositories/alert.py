@@ -4,10 +4,13 @@ from budget.domain.data_access.alert import (
     AbstractBaseAlertListDataAccess,
     AbstractBaseAlertUpdateDataAccess,
 )
-from budget.domain.entities import Alert
+from budget.domain.entities import Alert, Page
 from budget.models import Alert as AlertModel
 from budget.models.revenue import Revenue
+from budget.repositories.pagination import get_keyset_page
 from budget.repositories.parsers.alert import parse_alert_model_to_entity
+from budget.repositories.partial_update import update_returning
+from django.db import transaction
 
 
 class AlertCreateRepository(AbstractBaseAlertCreateDataAccess):
@@ -50,10 +53,25 @@ class AlertListRepository(AbstractBaseAlertListDataAccess):
             list[Alert] | None: A list of Alert instances, or None if no instances found.
         """
         alert_qs = AlertModel.objects.all().filter(user_id=user_id)
-        if not alert_qs.exists():
-            return None
         lista = [parse_alert_model_to_entity(alert) for alert in alert_qs.iterator()]
-        return lista
+        return lista or None
+
+    def get_alerts_page(self, user_id: int, cursor: str | None = None, page_size: int | None = None) -> Page:
+        """Get one keyset paginated page of Alert instances for a user.
+
+        Args:
+        ----
+            user_id (int): The ID of the user.
+            cursor (str | None): The cursor returned with the previous page.
+            page_size (int | None): The number of records per page.
+
+        Returns:
+        -------
+            Page: The Alert instances of the page, ordered by created at and ID.
+        """
+        alert_qs = AlertModel.objects.filter(user_id=user_id)
+        alerts, next_cursor = get_keyset_page(alert_qs, "created_at", cursor, page_size)
+        return Page(items=[parse_alert_model_to_entity(alert) for alert in alerts], next_cursor=next_cursor)
 
 
 class AlertUpdateRepository(AbstractBaseAlertUpdateDataAccess):
@@ -71,8 +89,8 @@ class AlertUpdateRepository(AbstractBaseAlertUpdateDataAccess):
         -------
             Alert | None: The retrieved Alert instance, or None if not found.
         """
-        alert = AlertModel.objects.filter(id=alert_id)
-        if not alert.exists():
+        alert = AlertModel.objects.filter(id=alert_id, user_id=user_id).first()
+        if not alert:
             return None
         return parse_alert_model_to_entity(alert)
 
@@ -89,15 +107,13 @@ class AlertUpdateRepository(AbstractBaseAlertUpdateDataAccess):
         -------
             Alert | None: The updated Alert instance, or None if update failed.
         """
-        revenue = Revenue.objects.get(id=data.get("revenue_id")) if data.get("revenue_id") else None
-        alert = AlertModel.objects.filter(id=alert_id, user_id=user_id).first()
+        values = {field: data[field] for field in ("user_email", "message", "alert_date") if data.get(field)}
+        with transaction.atomic():
+            if data.get("revenue_id"):
+                values["revenue_id"] = Revenue.objects.values_list("id", flat=True).get(id=data["revenue_id"])
+            alert = update_returning(AlertModel.objects.filter(id=alert_id, user_id=user_id), values)
         if not alert:
             return None
-        alert.revenue = revenue if revenue else alert.revenue
-        alert.user_email = data.get("user_email") if data.get("user_email") else alert.user_email
-        alert.message = data.get("message") if data.get("message") else alert.message
-        alert.alert_date = data.get("alert_date") if data.get("alert_date") else alert.alert_date
-        alert.save()
         return parse_alert_model_to_entity(alert)
 
 
@@ -116,8 +132,8 @@ class AlertDeleteRepository(AbstractBaseAlertDeleteDataAccess):
         -------
             Alert | None: The retrieved Alert instance, or None if not found.
         """
-        alert = AlertModel.objects.filter(id=alert_id)
-        if not alert.exists():
+        alert = AlertModel.objects.filter(id=alert_id, user_id=user_id).first()
+        if not alert:
             return None
         return parse_alert_model_to_entity(alert)
 
@@ -133,8 +149,5 @@ class AlertDeleteRepository(AbstractBaseAlertDeleteDataAccess):
         -------
             bool: True if the Alert instance was deleted, False otherwise.
         """
-        alert = AlertModel.objects.filter(user_id=user_id, id=alert_id)
-        if not alert.exists():
-            return False
-        alert.delete()
-        return True
+        deleted, _ = AlertModel.objects.filter(user_id=user_id, id=alert_id).delete()
+        return deleted > 0
@@ -0,0 +1,136 @@
+import uuid
+from collections.abc import Iterable
+from datetime import date, timedelta
+
+from budget.models import Alert, AlertDelivery
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+# Alert and revenue columns needed to render an alert email.
+DELIVERY_COLUMNS = {
+    "user_email": F("alert__user_email"),
+    "revenue_id": F("alert__revenue_id"),
+    "name": F("alert__revenue__name"),
+    "expiration_date": F("alert__revenue__expiration_date"),
+    "amount": F("alert__revenue__amount"),
+}
+
+
+class AlertDeliveryRepository:
+    """Repository for the alert delivery ledger.
+
+    Deliveries move from pending to sending when a worker claims them, then to sent or
+    failed. Failed deliveries are claimed again until they reach ``ALERT_DELIVERY_MAX_ATTEMPTS``
+    and deliveries whose claim lease expired are taken over; sent deliveries never are,
+    so re-triggering the dispatch is a no-op.
+    """
+
+    def create_deliveries(self, alert_date: date, recipients: list[str] | None = None) -> None:
+        """Add a pending delivery for every alert due on a date that has none yet.
+
+        Args:
+        ----
+            alert_date (date): The date of the alerts.
+            recipients (list[str] | None): Only consider alerts sent to these addresses.
+        """
+        alerts = Alert.objects.filter(alert_date=alert_date)
+        if recipients is not None:
+            alerts = alerts.filter(user_email__in=recipients)
+        AlertDelivery.objects.bulk_create(
+            [AlertDelivery(alert_id=alert_id, alert_date=alert_date) for alert_id in alerts.values_list("id", flat=True)],
+            ignore_conflicts=True,
+        )
+
+    def claim_deliveries(self, alert_date: date, limit: int, recipients: list[str] | None = None, exclude: Iterable = ()) -> list[dict]:
+        """Claim up to ``limit`` deliveries of a date for the current worker.
+
+        On PostgreSQL the rows are locked with ``SELECT ... FOR UPDATE SKIP LOCKED`` so
+        concurrent workers take disjoint rows without waiting for each other. SQLite has
+        no row locks; there the claim is a single ``UPDATE`` guarded by the status, which
+        SQLite runs under its database write lock.
+
+        Args:
+        ----
+            alert_date (date): The date of the alerts.
+            limit (int): The maximum number of deliveries to claim.
+            recipients (list[str] | None): Only claim alerts sent to these addresses.
+            exclude (Iterable): IDs of deliveries not to claim, e.g. the ones that already failed in this run.
+
+        Returns:
+        -------
+            list[dict]: The claimed deliveries with the data needed to render the emails.
+        """
+        now = timezone.now()
+        claimable = (
+            Q(status=AlertDelivery.PENDING)
+            | Q(status=AlertDelivery.FAILED, attempts__lt=settings.ALERT_DELIVERY_MAX_ATTEMPTS)
+            | Q(status=AlertDelivery.SENDING, claimed_until__lt=now)
+        )
+        candidates = AlertDelivery.objects.filter(claimable, alert_date=alert_date)
+        if recipients is not None:
+            candidates = candidates.filter(alert__user_email__in=recipients)
+        if exclude:
+            candidates = candidates.exclude(id__in=list(exclude))
+        token = uuid.uuid4()
+        claim = {
+            "status": AlertDelivery.SENDING,
+            "claim_token": token,
+            "claimed_until": now + timedelta(seconds=settings.ALERT_DELIVERY_LEASE_SECONDS),
+            "attempts": F("attempts") + 1,
+        }
+        if connection.features.has_select_for_update_skip_locked:
+            with transaction.atomic():
+                ids = list(candidates.select_for_update(skip_locked=True, of=("self",)).values_list("id", flat=True)[:limit])
+                AlertDelivery.objects.filter(id__in=ids).update(**claim)
+        else:
+            AlertDelivery.objects.filter(claimable, id__in=candidates.values("id")[:limit]).update(**claim)
+        claimed = AlertDelivery.objects.filter(alert_date=alert_date, status=AlertDelivery.SENDING, claim_token=token)
+        return list(claimed.values("id", **DELIVERY_COLUMNS))
+
+    def mark_sent(self, delivery_ids: list) -> None:
+        """Record that the emails of the given deliveries were sent.
+
+        Args:
+        ----
+            delivery_ids (list): The IDs of the delivered alerts.
+        """
+        if delivery_ids:
+            AlertDelivery.objects.filter(id__in=delivery_ids).update(
+                status=AlertDelivery.SENT, sent_at=timezone.now(), claim_token=None, claimed_until=None, last_error=None
+            )
+
+    def mark_failed(self, delivery_id, error: str) -> None:
+        """Record that the email of a delivery failed, so it can be claimed again until it runs out of attempts.
+
+        Args:
+        ----
+            delivery_id: The ID of the delivery.
+            error (str): The error raised while sending.
+        """
+        AlertDelivery.objects.filter(id=delivery_id).update(status=AlertDelivery.FAILED, claim_token=None, claimed_until=None, last_error=error)
+
+    def get_undelivered_recipients(self, alert_date: date, recipients: list[str] | None = None) -> list[str]:
+        """List the addresses of the deliveries of a date that may still be sent.
+
+        These are the pending deliveries, the ones claimed by a worker, and the failed ones
+        that have attempts left.
+
+        Args:
+        ----
+            alert_date (date): The date of the alerts.
+            recipients (list[str] | None): Only consider alerts sent to these addresses.
+
+        Returns:
+        -------
+            list[str]: The distinct addresses, sorted.
+        """
+        undelivered = AlertDelivery.objects.filter(
+            Q(status__in=[AlertDelivery.PENDING, AlertDelivery.SENDING])
+            | Q(status=AlertDelivery.FAILED, attempts__lt=settings.ALERT_DELIVERY_MAX_ATTEMPTS),
+            alert_date=alert_date,
+        )
+        if recipients is not None:
+            undelivered = undelivered.filter(alert__user_email__in=recipients)
+        return sorted(set(undelivered.values_list("alert__user_email", flat=True)))
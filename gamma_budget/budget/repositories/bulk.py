@@ -0,0 +1,20 @@
+from budget.repositories.category_cache import CategoryCache
+
+# Number of rows inserted per statement by the bulk endpoints.
+BULK_CREATE_BATCH_SIZE = 1000
+
+
+def find_unknown_categories(items: list[dict], categories: CategoryCache) -> dict[int, dict[str, list[str]]]:
+    """Check the categories of many records, querying the database at most once.
+
+    Args:
+    ----
+        items (list[dict]): The records, each with a ``category`` ID.
+        categories (CategoryCache): The cached categories of the records.
+
+    Returns:
+    -------
+        dict[int, dict[str, list[str]]]: The error of every record whose category does not exist, by position.
+    """
+    known = categories.get_many(item["category"] for item in items)
+    return {index: {"category": ["Category not found."]} for index, item in enumerate(items) if str(item["category"]) not in known}
@@ -3,19 +3,16 @@ from budget.domain.data_access.categories import (
     AbstractBaseRevenueCategoryListDataAccess,
 )
 from budget.domain.entities.categories import Category
-from budget.models import IncomingCategory, RevenueCategory
-from budget.repositories.parsers.category import (
-    parse_incoming_category_model_to_entity,
-    parse_revenue_category_model_to_entity,
-)
+from budget.repositories.category_cache import incoming_categories, revenue_categories
 
 
 class IncomingCategoryListRepository(AbstractBaseIncomingCategoryListDataAccess):
     """
     Repository for retrieving a list of IncomingCategory instances.
 
-    This repository retrieves IncomingCategory instances from the database, converts them
-    into Category entities, and returns the result as a list.
+    This repository retrieves IncomingCategory instances through the category cache, which
+    only reads the database when the categories are not cached, and returns them as
+    Category entities.
 
     Methods:
     -------
@@ -25,30 +22,27 @@ class IncomingCategoryListRepository(AbstractBaseIncomingCategoryListDataAccess)
 
     def get_incoming_categories(self) -> list[Category]:
         """
-        Retrieves a list of IncomingCategory instances from the database.
+        Retrieves a list of IncomingCategory instances.
 
-        This method retrieves IncomingCategory instances from the database, converts them
-        into Category entities, and returns the result as a list. If no instances are found,
-        an empty list is returned.
+        The categories come from the category cache, which is cleared whenever an
+        IncomingCategory is saved or deleted. If no instances are found, an empty list is
+        returned.
 
         Returns:
         -------
         list[Category]
             A list of incoming category entities.
         """
-        incoming_categories_qs = IncomingCategory.objects.all()
-        if not incoming_categories_qs.exists():
-            return []
-        lista = [parse_incoming_category_model_to_entity(category) for category in incoming_categories_qs.iterator()]
-        return lista
+        return incoming_categories.all()
 
 
 class RevenueCategoryListRepository(AbstractBaseRevenueCategoryListDataAccess):
     """
     Repository for retrieving a list of RevenueCategory instances.
 
-    This repository retrieves RevenueCategory instances from the database, converts them
-    into Category entities, and returns the result as a list.
+    This repository retrieves RevenueCategory instances through the category cache, which
+    only reads the database when the categories are not cached, and returns them as
+    Category entities.
 
     Methods:
     -------
@@ -58,19 +52,15 @@ class RevenueCategoryListRepository(AbstractBaseRevenueCategoryListDataAccess):
 
     def get_revenue_categories(self) -> list[Category]:
         """
-        Retrieves a list of RevenueCategory instances from the database.
+        Retrieves a list of RevenueCategory instances.
 
-        This method retrieves RevenueCategory instances from the database, converts them
-        into Category entities, and returns the result as a list. If no instances are found,
-        an empty list is returned.
+        The categories come from the category cache, which is cleared whenever a
+        RevenueCategory is saved or deleted. If no instances are found, an empty list is
+        returned.
 
         Returns:
         -------
         list[Category]
             A list of revenue category entities.
         """
-        revenue_categories_qs = RevenueCategory.objects.all()
-        if not revenue_categories_qs.exists():
-            return []
-        lista = [parse_revenue_category_model_to_entity(category) for category in revenue_categories_qs.iterator()]
-        return lista
+        return revenue_categories.all()
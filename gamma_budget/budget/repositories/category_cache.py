@@ -0,0 +1,147 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from budget.domain.entities.categories import Category
+from budget.models import IncomingCategory, RevenueCategory
+from budget.repositories.parsers.category import (
+    parse_incoming_category_model_to_entity,
+    parse_revenue_category_model_to_entity,
+)
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import Model
+
+# Entries kept by the in-process cache; the least recently used one is dropped first.
+LOCAL_CACHE_MAXSIZE = 32
+
+# Each entry holds its expiry, the categories and whether it was reloaded for an unknown ID.
+_local: OrderedDict[str, tuple[float, dict[str, Category], bool]] = OrderedDict()
+_local_lock = threading.Lock()
+
+
+class CategoryCache:
+    """Cache of the categories of one model, by ID.
+
+    Categories change only through migrations and the admin, so every process keeps
+    them in an LRU for ``CATEGORY_CACHE_TTL_SECONDS``. When ``CATEGORY_CACHE_ALIAS``
+    names one of ``CACHES``, a process that misses reads them from that cache before
+    querying the database, so the workers share one query. Saving or deleting a
+    category clears both (see ``budget.signals``); other processes see the change when
+    their entry expires, or when they look up an ID they do not know. That lookup reloads
+    the categories at most once per entry, so requests full of unknown IDs cannot force
+    a database read on every call.
+
+    Args:
+    ----
+        model (type[Model]): The category model.
+        parser (Callable[[Model], Category]): Converts an instance of the model into a Category.
+    """
+
+    def __init__(self, model: type[Model], parser: Callable[[Any], Category]):
+        self.model = model
+        self.parser = parser
+        self.key = f"budget:categories:{model._meta.model_name}"
+
+    def all(self) -> list[Category]:
+        """Get every category, in the order of the database.
+
+        Returns:
+        -------
+            list[Category]: The categories.
+        """
+        return list(self._get().values())
+
+    def get(self, category_id: Any) -> Category | None:
+        """Get a category by its ID.
+
+        Args:
+        ----
+            category_id (Any): The ID of the category.
+
+        Returns:
+        -------
+            Category | None: The category, or None if it does not exist.
+        """
+        return self.get_many([category_id]).get(str(category_id))
+
+    def get_many(self, category_ids: Iterable[Any]) -> dict[str, Category]:
+        """Get the categories of many IDs, reading the database at most once.
+
+        Args:
+        ----
+            category_ids (Iterable[Any]): The IDs of the categories.
+
+        Returns:
+        -------
+            dict[str, Category]: The categories that exist, by ID as a string.
+        """
+        category_ids = {str(category_id) for category_id in category_ids}
+        categories, reloaded = self._get_entry()
+        if not category_ids <= categories.keys() and not reloaded:
+            # Categories created by another process are not in the cached entry yet. Later
+            # unknown IDs are answered from the reloaded entry until it expires or is cleared.
+            categories = self._load(reloaded=True)
+        return {category_id: categories[category_id] for category_id in category_ids if category_id in categories}
+
+    def ids_by_name(self) -> dict[str, Any]:
+        """Map the name of every category to its ID.
+
+        Returns:
+        -------
+            dict[str, Any]: The IDs by name.
+        """
+        return {category.name: category.id for category in self.all()}
+
+    def version(self) -> str:
+        """Get a digest of the categories that changes when one is created, renamed or deleted.
+
+        Returns:
+        -------
+            str: The digest.
+        """
+        names = "|".join(f"{category_id}={category.name}" for category_id, category in sorted(self._get().items()))
+        return hashlib.sha256(names.encode()).hexdigest()[:16]
+
+    def clear(self) -> None:
+        """Drop the cached categories of this process and of the shared cache."""
+        with _local_lock:
+            _local.pop(self.key, None)
+        if settings.CATEGORY_CACHE_ALIAS:
+            caches[settings.CATEGORY_CACHE_ALIAS].delete(self.key)
+
+    def _get(self) -> dict[str, Category]:
+        return self._get_entry()[0]
+
+    def _get_entry(self) -> tuple[dict[str, Category], bool]:
+        with _local_lock:
+            entry = _local.get(self.key)
+            if entry and entry[0] > time.monotonic():
+                _local.move_to_end(self.key)
+                return entry[1], entry[2]
+        categories = caches[settings.CATEGORY_CACHE_ALIAS].get(self.key) if settings.CATEGORY_CACHE_ALIAS else None
+        if categories is None:
+            return self._load(), False
+        self._store_local(categories)
+        return categories, False
+
+    def _load(self, reloaded: bool = False) -> dict[str, Category]:
+        categories = {str(category.id): self.parser(category) for category in self.model.objects.all()}
+        if settings.CATEGORY_CACHE_ALIAS:
+            caches[settings.CATEGORY_CACHE_ALIAS].set(self.key, categories, settings.CATEGORY_CACHE_TTL_SECONDS)
+        self._store_local(categories, reloaded)
+        return categories
+
+    def _store_local(self, categories: dict[str, Category], reloaded: bool = False) -> None:
+        with _local_lock:
+            _local[self.key] = (time.monotonic() + settings.CATEGORY_CACHE_TTL_SECONDS, categories, reloaded)
+            _local.move_to_end(self.key)
+            while len(_local) > LOCAL_CACHE_MAXSIZE:
+                _local.popitem(last=False)
+
+
+incoming_categories = CategoryCache(IncomingCategory, parse_incoming_category_model_to_entity)
+revenue_categories = CategoryCache(RevenueCategory, parse_revenue_category_model_to_entity)
@@ -0,0 +1,90 @@
+from collections import defaultdict
+from datetime import date, timedelta
+from decimal import Decimal
+
+from budget.domain.data_access.forecast import AbstractBaseForecastDataAccess
+from budget.domain.entities import Forecast, ForecastBucket
+from budget.domain.entities.forecast import MONTH
+from budget.domain.entities.recurring import MONTHS, add_periods
+from budget.models import Incoming as IncomingModel
+from budget.models import Installment as InstallmentModel
+from budget.models import MonthlyRollup
+from budget.models import Revenue as RevenueModel
+from budget.repositories.recurring import RecurringProjectionRepository
+from django.db.models import DecimalField, Exists, F, OuterRef, Q, QuerySet, Sum, Value
+from django.db.models.functions import Coalesce, TruncMonth
+
+ZERO = Decimal("0.00")
+CENT = Decimal("0.01")
+AMOUNT = DecimalField(max_digits=15, decimal_places=2)
+
+
+def _bucket_totals(queryset: QuerySet, date_field: str, granularity: str) -> dict[date, Decimal]:
+    bucket = TruncMonth(date_field) if granularity == MONTH else F(date_field)
+    totals = queryset.annotate(bucket=bucket).values("bucket").annotate(total=Sum("amount")).order_by().values_list("bucket", "total")
+    return {period: total.quantize(CENT) for period, total in totals}
+
+
+def _total(queryset: QuerySet) -> Decimal:
+    return queryset.aggregate(total=Coalesce(Sum("amount"), Value(ZERO), output_field=AMOUNT))["total"]
+
+
+class ForecastRepository(AbstractBaseForecastDataAccess):
+    """Repository for projecting the balance of a user."""
+
+    def get_forecast(self, user_id: int, start: date, months: int, granularity: str) -> Forecast:
+        """Project the balance of a user month by month or day by day.
+
+        The opening balance is the net of every month before ``start``, read from
+        ``MonthlyRollup``. Inside the window, incomings, revenues and installments are
+        summed per bucket by the database with ``GROUP BY``, so the work done in Python
+        grows with the number of buckets instead of the number of records. A revenue with
+        an installment plan is counted through its installments instead of its amount:
+        unpaid installments on their due date, and paid ones, which are already settled,
+        in the opening balance. The occurrences of recurring rules that are not stored yet
+        are projected in memory.
+
+        Args:
+        ----
+            user_id (int): The ID of the user.
+            start (date): The first day of the first month projected.
+            months (int): The number of months to project.
+            granularity (str): The length of the buckets: month or day.
+
+        Returns:
+        -------
+            Forecast: The projected balance of every bucket.
+        """
+        end = add_periods(start, months, MONTHS)
+        net = F("incomings") - F("revenues_paid") - F("revenues_unpaid")
+        opening_balance = MonthlyRollup.objects.filter(user_id=user_id, month__lt=start).aggregate(
+            balance=Coalesce(Sum(net), Value(ZERO), output_field=AMOUNT)
+        )["balance"]
+        # The rollups hold the full amount of revenues with a plan; swap it for their settled installments.
+        with_plan = InstallmentModel.objects.filter(revenue_id=OuterRef("pk"))
+        planned_before = RevenueModel.objects.filter(user_id=user_id, expiration_date__lt=start).filter(Exists(with_plan))
+        settled = InstallmentModel.objects.filter(revenue__user_id=user_id).filter(Q(paid=True) | Q(due_date__lt=start))
+        opening_balance += _total(planned_before) - _total(settled)
+
+        incomings = _bucket_totals(
+            IncomingModel.objects.filter(user_id=user_id, launch_date__gte=start, launch_date__lt=end), "launch_date", granularity
+        )
+        revenues: defaultdict[date, Decimal] = defaultdict(lambda: ZERO)
+        revenue_qs = RevenueModel.objects.filter(user_id=user_id, expiration_date__gte=start, expiration_date__lt=end).filter(~Exists(with_plan))
+        installment_qs = InstallmentModel.objects.filter(revenue__user_id=user_id, paid=False, due_date__gte=start, due_date__lt=end)
+        for totals in (
+            _bucket_totals(revenue_qs, "expiration_date", granularity),
+            _bucket_totals(installment_qs, "due_date", granularity),
+        ):
+            for period, total in totals.items():
+                revenues[period] += total
+        for occurrence in RecurringProjectionRepository().get_projection(user_id, start, end - timedelta(days=1)):
+            period = occurrence.expiration_date.replace(day=1) if granularity == MONTH else occurrence.expiration_date
+            revenues[period] += occurrence.amount
+
+        if granularity == MONTH:
+            periods = [add_periods(start, index, MONTHS) for index in range(months)]
+        else:
+            periods = [start + timedelta(days=index) for index in range((end - start).days)]
+        buckets = [ForecastBucket(period, incomings.get(period, ZERO), revenues[period]) for period in periods]
+        return Forecast(granularity=granularity, opening_balance=opening_balance.quantize(CENT), buckets=buckets)
@@ -1,14 +1,23 @@
+from asgiref.sync import sync_to_async
 from budget.domain.data_access.incoming import (
+    AbstractBaseIncomingBulkCreateDataAccess,
     AbstractBaseIncomingCreateDataAccess,
     AbstractBaseIncomingDeleteDataAccess,
     AbstractBaseIncomingListDataAccess,
     AbstractBaseIncomingRetrieveDataAccess,
     AbstractBaseIncomingUpdateDataAccess,
 )
-from budget.domain.entities import Incoming
+from budget.domain.entities import BulkCreateResult, Incoming, Page
 from budget.models import Incoming as IncomingModel
 from budget.models.categories import IncomingCategory
+from budget.repositories.bulk import BULK_CREATE_BATCH_SIZE
+from budget.repositories.category_cache import incoming_categories
+from budget.repositories.pagination import aget_keyset_page, get_keyset_page
 from budget.repositories.parsers.incoming import parse_incoming_model_to_entity
+from budget.repositories.partial_update import update_returning
+from budget.repositories.rollup import INCOMING_ROLLUP_FIELDS, apply_rollup_deltas, incoming_rollup
+from django.db import transaction
+from django.db.models import Count, Max
 
 
 class IncomingCreateRepository(AbstractBaseIncomingCreateDataAccess):
@@ -29,17 +38,72 @@ class IncomingCreateRepository(AbstractBaseIncomingCreateDataAccess):
         category = IncomingCategory.objects.get(id=data.get("category"))
         if not category:
             return None
-        incoming = IncomingModel.objects.create(
-            user_id=user_id,
-            name=data.get("name"),
-            description=data.get("description"),
-            amount=data.get("amount"),
-            # incoming_date=data.get("incoming_date"),
-            launch_date=data.get("launch_date"),
-            category=category,
-        )
+        with transaction.atomic():
+            incoming = IncomingModel.objects.create(
+                user_id=user_id,
+                name=data.get("name"),
+                description=data.get("description"),
+                amount=data.get("amount"),
+                # incoming_date=data.get("incoming_date"),
+                launch_date=data.get("launch_date"),
+                category=category,
+            )
+            apply_rollup_deltas(incoming_rollup(user_id, incoming.amount, incoming.launch_date, category.id))
         return parse_incoming_model_to_entity(incoming)
 
+    async def acreate_incoming(self, data: dict, user_id: int) -> Incoming | None:
+        """Create a Incoming instance from async code.
+
+        The insert and the rollup update share a transaction, which Django only runs in
+        sync code, so they run through ``sync_to_async`` in the thread of the request.
+
+        Args:
+        ----
+            data (dict): The data for creating the Incoming instance.
+            user_id (int): The ID of the user creating the Incoming instance.
+
+        Returns:
+        -------
+            Incoming | None: The created Incoming instance, or None if creation failed.
+        """
+        return await sync_to_async(self.create_incoming)(data, user_id)
+
+
+class IncomingBulkCreateRepository(AbstractBaseIncomingBulkCreateDataAccess):
+    """Repository for creating many Incoming instances at once."""
+
+    def create_incomings(self, items: list[dict], user_id: int) -> BulkCreateResult:
+        """Create many Incoming instances in one transaction.
+
+        The items must already be validated, categories included, by the bulk create
+        serializer. The incomings are inserted with ``bulk_create`` and added to the
+        monthly rollups with one upsert.
+
+        Args:
+        ----
+            items (list[dict]): The data for creating each Incoming instance.
+            user_id (int): The ID of the user creating the Incoming instances.
+
+        Returns:
+        -------
+            BulkCreateResult: The IDs of the created incomings.
+        """
+        incomings = [
+            IncomingModel(
+                user_id=user_id,
+                name=item["name"],
+                description=item.get("description"),
+                amount=item["amount"],
+                launch_date=item["launch_date"],
+                category_id=item["category"],
+            )
+            for item in items
+        ]
+        with transaction.atomic():
+            IncomingModel.objects.bulk_create(incomings, batch_size=BULK_CREATE_BATCH_SIZE)
+            apply_rollup_deltas(*(incoming_rollup(user_id, incoming.amount, incoming.launch_date, incoming.category_id) for incoming in incomings))
+        return BulkCreateResult(ids=[str(incoming.id) for incoming in incomings])
+
 
 class IncomingListRepository(AbstractBaseIncomingListDataAccess):
     """Repository for listing Incoming instances."""
@@ -55,11 +119,76 @@ class IncomingListRepository(AbstractBaseIncomingListDataAccess):
         -------
             list[Incoming] | None: A list of Incoming instances, or None if no instances found.
         """
-        incoming_qs = IncomingModel.objects.all().filter(user_id=user_id)
-        if not incoming_qs.exists():
-            return None
+        incoming_qs = IncomingModel.objects.filter(user_id=user_id)
         lista = [parse_incoming_model_to_entity(incoming) for incoming in incoming_qs.iterator()]
-        return lista
+        return lista or None
+
+    def get_incomings_page(self, user_id: int, cursor: str | None = None, page_size: int | None = None) -> Page:
+        """Get one keyset paginated page of Incoming instances for a user.
+
+        Args:
+        ----
+            user_id (int): The ID of the user.
+            cursor (str | None): The cursor returned with the previous page.
+            page_size (int | None): The number of records per page.
+
+        Returns:
+        -------
+            Page: The Incoming instances of the page, ordered by launch date and ID.
+        """
+        incoming_qs = IncomingModel.objects.filter(user_id=user_id)
+        incomings, next_cursor = get_keyset_page(incoming_qs, "launch_date", cursor, page_size)
+        return Page(items=[parse_incoming_model_to_entity(incoming) for incoming in incomings], next_cursor=next_cursor)
+
+    def get_incomings_version(self, user_id: int) -> str:
+        """Get a version of the Incoming instances of a user that changes whenever the list does.
+
+        Creating, changing or deleting a Incoming moves the number of rows or the latest
+        ``updated_at``, both read by one aggregate over ``incoming_user_updated_idx``; renaming a
+        category changes the digest of the cached categories.
+
+        Args:
+        ----
+            user_id (int): The ID of the user.
+
+        Returns:
+        -------
+            str: The version.
+        """
+        latest = IncomingModel.objects.filter(user_id=user_id).aggregate(count=Count("id"), updated_at=Max("updated_at"))
+        return f"{latest['count']}:{latest['updated_at']}:{incoming_categories.version()}"
+
+    async def aget_incomings(self, user_id: int) -> list[Incoming] | None:
+        """Get a list of Incoming instances for a user without blocking the event loop.
+
+        Args:
+        ----
+            user_id (int): The ID of the user.
+
+        Returns:
+        -------
+            list[Incoming] | None: A list of Incoming instances, or None if no instances found.
+        """
+        incoming_qs = IncomingModel.objects.select_related("category").filter(user_id=user_id)
+        lista = [parse_incoming_model_to_entity(incoming) async for incoming in incoming_qs.aiterator()]
+        return lista or None
+
+    async def aget_incomings_page(self, user_id: int, cursor: str | None = None, page_size: int | None = None) -> Page:
+        """Get one keyset paginated page of Incoming instances for a user without blocking the event loop.
+
+        Args:
+        ----
+            user_id (int): The ID of the user.
+            cursor (str | None): The cursor returned with the previous page.
+            page_size (int | None): The number of records per page.
+
+        Returns:
+        -------
+            Page: The Incoming instances of the page, ordered by launch date and ID.
+        """
+        incoming_qs = IncomingModel.objects.select_related("category").filter(user_id=user_id)
+        incomings, next_cursor = await aget_keyset_page(incoming_qs, "launch_date", cursor, page_size)
+        return Page(items=[parse_incoming_model_to_entity(incoming) for incoming in incomings], next_cursor=next_cursor)
 
 
 class IncomingRetrieveRepository(AbstractBaseIncomingRetrieveDataAccess):
@@ -77,10 +206,45 @@ class IncomingRetrieveRepository(AbstractBaseIncomingRetrieveDataAccess):
         -------
             Incoming | None: The retrieved Incoming instance, or None if not found.
         """
-        incoming = IncomingModel.objects.filter(id=incoming_id, user_id=user_id)
-        if not incoming.exists():
+        incoming = IncomingModel.objects.filter(id=incoming_id, user_id=user_id).first()
+        if not incoming:
+            return None
+        return parse_incoming_model_to_entity(incoming)
+
+    def get_incoming_version(self, incoming_id: int, user_id: int) -> str | None:
+        """Get a version of a Incoming instance that changes whenever the instance does.
+
+        Args:
+        ----
+            incoming_id (int): The ID of the Incoming instance.
+            user_id (int): The ID of the user.
+
+        Returns:
+        -------
+            str | None: The version, or None if not found.
+        """
+        row = IncomingModel.objects.filter(id=incoming_id, user_id=user_id).values_list("updated_at", "category_id").first()
+        if not row:
+            return None
+        category = incoming_categories.get(row[1])
+        return f"{row[0]}:{category.name if category else ''}"
+
+    async def aget_incoming(self, incoming_id: int, user_id: int) -> Incoming | None:
+        """Retrieve a Incoming instance by its ID and user ID without blocking the event loop.
+
+        Args:
+        ----
+            incoming_id (int): The ID of the Incoming instance.
+            user_id (int): The ID of the user.
+
+        Returns:
+        -------
+            Incoming | None: The retrieved Incoming instance, or None if not found.
+        """
+        incoming = await IncomingModel.objects.select_related("category").filter(id=incoming_id, user_id=user_id).afirst()
+        if not incoming:
             return None
-        return parse_incoming_model_to_entity(incoming.first())
+        return parse_incoming_model_to_entity(incoming)
 
 
 class IncomingUpdateRepository(AbstractBaseIncomingUpdateDataAccess):
@@ -98,8 +262,8 @@ class IncomingUpdateRepository(AbstractBaseIncomingUpdateDataAccess):
         -------
             Incoming | None: The retrieved Incoming instance, or None if not found.
         """
-        incoming = IncomingModel.objects.filter(id=incoming_id)
-        if not incoming.exists():
+        incoming = IncomingModel.objects.filter(id=incoming_id, user_id=user_id).first()
+        if not incoming:
             return None
         return parse_incoming_model_to_entity(incoming)
 
@@ -116,19 +280,42 @@ class IncomingUpdateRepository(AbstractBaseIncomingUpdateDataAccess):
         -------
             Incoming | None: The updated Incoming instance, or None if update failed.
         """
-        category = IncomingCategory.objects.get(id=data["category"]) if data.get("category") else None
-        incoming = IncomingModel.objects.filter(id=incoming_id, user_id=user_id).first()
+        values = {field: data[field] for field in ("name", "description", "amount", "launch_date") if data.get(field)}
+        with transaction.atomic():
+            if data.get("category"):
+                values["category"] = IncomingCategory.objects.get(id=data["category"])
+            incoming_qs = IncomingModel.objects.filter(id=incoming_id, user_id=user_id)
+            previous = None
+            if values.keys() & {"amount", "launch_date", "category"}:
+                previous = incoming_qs.select_for_update().values_list(*INCOMING_ROLLUP_FIELDS).first()
+            incoming = update_returning(incoming_qs, values)
+            if incoming and previous:
+                current = [getattr(incoming, field) for field in INCOMING_ROLLUP_FIELDS]
+                apply_rollup_deltas(incoming_rollup(user_id, *previous, sign=-1), incoming_rollup(user_id, *current))
         if not incoming:
             return None
-        incoming.name = data.get("name") if data.get("name") else incoming.name
-        incoming.description = data.get("description") if data.get("description") else incoming.description
-        incoming.amount = data.get("amount") if data.get("amount") else incoming.amount
-        # incoming.incoming_date = data.get("incoming_date") if data.get("incoming_date") else incoming.incoming_date
-        incoming.launch_date = data.get("launch_date") if data.get("launch_date") else incoming.launch_date
-        incoming.category = category if category else incoming.category
-        incoming.save()
+        if "category" in values:
+            incoming.category = values["category"]
         return parse_incoming_model_to_entity(incoming)
 
+    async def aupdate_incoming(self, user_id: int, incoming_id: str, data: dict) -> Incoming | None:
+        """Update a Incoming instance from async code.
+
+        The update and the rollup changes share a transaction, which Django only runs in
+        sync code, so they run through ``sync_to_async`` in the thread of the request.
+
+        Args:
+        ----
+            user_id (int): The ID of the user.
+            incoming_id (str): The ID of the Incoming instance.
+            data (dict): The data for updating the Incoming instance.
+
+        Returns:
+        -------
+            Incoming | None: The updated Incoming instance, or None if update failed.
+        """
+        return await sync_to_async(self.update_incoming)(user_id, incoming_id, data)
+
 
 class IncomingDeleteRepository(AbstractBaseIncomingDeleteDataAccess):
     """Repository for deleting an Incoming instance."""
@@ -145,8 +332,8 @@ class IncomingDeleteRepository(AbstractBaseIncomingDeleteDataAccess):
         -------
             Incoming | None: The retrieved Incoming instance, or None if not found.
         """
-        incoming = IncomingModel.objects.filter(id=incoming_id)
-        if not incoming.exists():
+        incoming = IncomingModel.objects.filter(id=incoming_id, user_id=user_id).first()
+        if not incoming:
             return None
         return parse_incoming_model_to_entity(incoming)
 
@@ -162,8 +349,28 @@ class IncomingDeleteRepository(AbstractBaseIncomingDeleteDataAccess):
         -------
             bool: True if the Incoming instance was deleted, False otherwise.
         """
-        incoming = IncomingModel.objects.filter(user_id=user_id, id=incoming_id)
-        if not incoming.exists():
-            return False
-        incoming.delete()
+        incoming_qs = IncomingModel.objects.filter(user_id=user_id, id=incoming_id)
+        with transaction.atomic():
+            previous = incoming_qs.select_for_update().values_list(*INCOMING_ROLLUP_FIELDS).first()
+            if not previous:
+                return False
+            incoming_qs.delete()
+            apply_rollup_deltas(incoming_rollup(user_id, *previous, sign=-1))
         return True
+
+    async def adelete_incoming(self, user_id: int, incoming_id: str) -> bool:
+        """Delete a Incoming instance from async code.
+
+        The delete and the rollup update share a transaction, which Django only runs in
+        sync code, so they run through ``sync_to_async`` in the thread of the request.
+
+        Args:
+        ----
+            user_id (int): The ID of the user.
+            incoming_id (str): The ID of the Incoming instance.
+
+        Returns:
+        -------
+            bool: True if the Incoming instance was deleted, False otherwise.
+        """
+        return await sync_to_async(self.delete_incoming)(user_id, incoming_id)
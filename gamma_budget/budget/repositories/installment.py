@@ -0,0 +1,120 @@
+from decimal import Decimal
+
+from budget.domain.data_access.installment import (
+    AbstractBaseInstallmentCreateDataAccess,
+    AbstractBaseInstallmentPayDataAccess,
+    AbstractBaseInstallmentRetrieveDataAccess,
+)
+from budget.domain.entities import InstallmentPlan
+from budget.domain.entities.installment import split_amount
+from budget.domain.entities.recurring import MONTHS, add_periods
+from budget.models import Installment as InstallmentModel
+from budget.models import Revenue as RevenueModel
+from budget.repositories.parsers.installment import parse_installment_models_to_plan
+from django.db import IntegrityError, transaction
+from django.db.models import Case, Count, F, Subquery, Value, When
+from django.db.models.functions import Least
+
+
+def _get_plan(revenue_id: str, user_id: int) -> InstallmentPlan | None:
+    installments = list(InstallmentModel.objects.select_related("revenue").filter(revenue_id=revenue_id, revenue__user_id=user_id).order_by("period"))
+    if not installments:
+        return None
+    return parse_installment_models_to_plan(installments[0].revenue, installments)
+
+
+class InstallmentCreateRepository(AbstractBaseInstallmentCreateDataAccess):
+    """Repository for creating installment plans."""
+
+    def create_installment_plan(self, data: dict, user_id: int) -> InstallmentPlan | None:
+        """Split one of the user's revenues into installments.
+
+        Every installment is built in memory and all of them are inserted by one
+        ``bulk_create``. The amounts add up to the plan amount exactly; the cents left over
+        by the division go to the first installments.
+
+        Args:
+        ----
+            data (dict): The plan data: revenue, periods, amount, first_due_date, period_unit and payment_method.
+            user_id (int): User ID associated with the revenue.
+
+        Returns:
+        -------
+            InstallmentPlan | None: The created plan, or None if the revenue was not found.
+
+        Raises:
+        ------
+            ValueError: If the revenue already has an installment plan.
+        """
+        revenue = RevenueModel.objects.filter(id=data["revenue"], user_id=user_id).first()
+        if not revenue:
+            return None
+        first_due_date = data.get("first_due_date") or revenue.expiration_date
+        period_unit = data.get("period_unit") or MONTHS
+        amounts = split_amount(Decimal(data.get("amount") or revenue.amount), data["periods"])
+        installments = [
+            InstallmentModel(
+                revenue=revenue,
+                amount=amount,
+                due_date=add_periods(first_due_date, index, period_unit),
+                period=index + 1,
+                period_unit=period_unit,
+                payment_method=data.get("payment_method"),
+            )
+            for index, amount in enumerate(amounts)
+        ]
+        try:
+            with transaction.atomic():
+                InstallmentModel.objects.bulk_create(installments)
+        except IntegrityError:
+            raise ValueError("The revenue already has an installment plan.") from None
+        return parse_installment_models_to_plan(revenue, installments)
+
+
+class InstallmentRetrieveRepository(AbstractBaseInstallmentRetrieveDataAccess):
+    """Repository for retrieving installment plans."""
+
+    def get_installment_plan(self, revenue_id: str, user_id: int) -> InstallmentPlan | None:
+        """Get the installment plan of a revenue.
+
+        Args:
+        ----
+            revenue_id (str): The ID of the revenue.
+            user_id (int): User ID associated with the revenue.
+
+        Returns:
+        -------
+            InstallmentPlan | None: The plan, or None if the revenue has none.
+        """
+        return _get_plan(revenue_id, user_id)
+
+
+class InstallmentPayRepository(AbstractBaseInstallmentPayDataAccess):
+    """Repository for paying installments."""
+
+    def pay_installments(self, revenue_id: str, user_id: int, count: int) -> InstallmentPlan | None:
+        """Mark the next installments of a plan as paid.
+
+        Every installment row carries the number of installments paid, so the next ones
+        are those numbered up to ``periods_paid + count``. A single ``UPDATE`` marks them
+        paid and moves the counter of every row, capped at the size of the plan.
+
+        Args:
+        ----
+            revenue_id (str): The ID of the revenue.
+            user_id (int): User ID associated with the revenue.
+            count (int): The number of installments to pay.
+
+        Returns:
+        -------
+            InstallmentPlan | None: The updated plan, or None if the revenue has none.
+        """
+        plan_size = InstallmentModel.objects.filter(revenue_id=revenue_id).order_by().values("revenue_id").annotate(size=Count("id")).values("size")
+        periods_paid = Least(F("periods_paid") + count, Subquery(plan_size))
+        updated = InstallmentModel.objects.filter(revenue_id=revenue_id, revenue__user_id=user_id).update(
+            paid=Case(When(period__lte=periods_paid, then=Value(True)), default=F("paid")),
+            periods_paid=periods_paid,
+        )
+        if not updated:
+            return None
+        return _get_plan(revenue_id, user_id)
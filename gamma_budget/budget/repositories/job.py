@@ -0,0 +1,121 @@
+from datetime import timedelta
+from typing import Any
+
+from budget.domain.data_access.job import AbstractBaseJobEnqueueDataAccess, AbstractBaseJobRetrieveDataAccess
+from budget.domain.entities import Job
+from budget.models import Job as JobModel
+from budget.repositories.parsers.job import parse_job_model_to_entity
+from django.conf import settings
+from django.db.models import F, Q
+from django.utils import timezone
+
+
+class JobEnqueueRepository(AbstractBaseJobEnqueueDataAccess):
+    """Repository for enqueueing background jobs."""
+
+    def enqueue_job(self, kind: str, payload: dict[str, Any]) -> Job:
+        """Add a job to the queue.
+
+        Args:
+        ----
+            kind (str): The name of the handler that runs the job.
+            payload (dict[str, Any]): The arguments of the handler.
+
+        Returns:
+        -------
+            Job: The enqueued job.
+        """
+        job = JobModel.objects.create(kind=kind, payload=payload, max_attempts=settings.JOB_MAX_ATTEMPTS)
+        return parse_job_model_to_entity(job)
+
+
+class JobRetrieveRepository(AbstractBaseJobRetrieveDataAccess):
+    """Repository for retrieving a background job."""
+
+    def get_job(self, job_id: str) -> Job | None:
+        """Retrieve a job by its ID.
+
+        Args:
+        ----
+            job_id (str): The ID of the job.
+
+        Returns:
+        -------
+            Job | None: The job, or None if not found.
+        """
+        job = JobModel.objects.filter(id=job_id).first()
+        if not job:
+            return None
+        return parse_job_model_to_entity(job)
+
+
+class JobQueueRepository:
+    """Repository used by the worker to claim, complete and retry jobs.
+
+    A claimed job is leased for ``JOB_LEASE_SECONDS``. If the worker dies, the job can be
+    claimed again after the lease ends. Claims and state changes are compare-and-set
+    updates on the job's status and attempt count, so two workers never run the same
+    attempt. No broker is needed beyond the database.
+    """
+
+    def claim_job(self) -> JobModel | None:
+        """Claim the next job that is due.
+
+        Returns:
+        -------
+            JobModel | None: The claimed job, or None when the queue is empty.
+        """
+        while True:
+            now = timezone.now()
+            due = Q(status=JobModel.PENDING, run_after__lte=now) | Q(status=JobModel.RUNNING, locked_until__lt=now)
+            job = JobModel.objects.filter(due).order_by("run_after").first()
+            if not job:
+                return None
+            locked_until = now + timedelta(seconds=settings.JOB_LEASE_SECONDS)
+            claimed = JobModel.objects.filter(id=job.id, status=job.status, attempts=job.attempts).update(
+                status=JobModel.RUNNING, attempts=F("attempts") + 1, locked_until=locked_until
+            )
+            if claimed:
+                job.status, job.attempts, job.locked_until = JobModel.RUNNING, job.attempts + 1, locked_until
+                return job
+
+    def complete_job(self, job: JobModel, result: Any) -> bool:
+        """Mark a claimed job as succeeded.
+
+        Args:
+        ----
+            job (JobModel): The job returned by claim_job.
+            result (Any): The JSON serializable value returned by the handler.
+
+        Returns:
+        -------
+            bool: False if the lease was lost and another worker owns the job.
+        """
+        return bool(self._owned(job).update(status=JobModel.SUCCEEDED, result=result, locked_until=None, finished_at=timezone.now()))
+
+    def fail_job(self, job: JobModel, error: str, payload: dict[str, Any] | None = None, retry: bool = True) -> bool:
+        """Schedule a retry of a claimed job with exponential backoff, or fail it for good.
+
+        Args:
+        ----
+            job (JobModel): The job returned by claim_job.
+            error (str): The error of the attempt.
+            payload (dict[str, Any] | None): Replaces the payload of the retry, e.g. to retry only part of the work.
+            retry (bool): False to fail the job for good regardless of the attempts left.
+
+        Returns:
+        -------
+            bool: False if the lease was lost and another worker owns the job.
+        """
+        values: dict[str, Any] = {"last_error": error, "locked_until": None}
+        if payload is not None:
+            values["payload"] = payload
+        if not retry or job.attempts >= job.max_attempts:
+            values.update(status=JobModel.FAILED, finished_at=timezone.now())
+        else:
+            delay = min(settings.JOB_RETRY_BACKOFF_SECONDS * 2 ** (job.attempts - 1), settings.JOB_RETRY_MAX_BACKOFF_SECONDS)
+            values.update(status=JobModel.PENDING, run_after=timezone.now() + timedelta(seconds=delay))
+        return bool(self._owned(job).update(**values))
+
+    def _owned(self, job: JobModel):
+        return JobModel.objects.filter(id=job.id, status=JobModel.RUNNING, attempts=job.attempts)
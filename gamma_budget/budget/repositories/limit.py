@@ -4,10 +4,42 @@ from budget.domain.data_access.limit import (
     AbstractBaseLimitListDataAccess,
     AbstractBaseLimitUpdateDataAccess,
 )
-from budget.domain.entities import Limit
+from budget.domain.entities import Limit, Page
 from budget.models import Limit as LimitModel
+from budget.models import MonthlyRollup
 from budget.models.categories import RevenueCategory
+from budget.repositories.pagination import get_keyset_page
 from budget.repositories.parsers.limit import parse_limit_model_to_entity
+from budget.repositories.partial_update import update_returning
+from django.db.models import DecimalField, F, OuterRef, QuerySet, Subquery, Value
+from django.db.models.functions import Coalesce, TruncMonth
+
+
+def annotate_consumption(limit_qs: QuerySet) -> QuerySet:
+    """Annotate each limit with the revenues of its category in the limit month.
+
+    The total is read from the monthly rollup of the limit's user, month and category,
+    which the revenue repositories keep in sync, so every limit costs one indexed lookup
+    inside the same query instead of a scan over the user's revenues.
+
+    Args:
+    ----
+        limit_qs (QuerySet): A queryset of Limit instances.
+
+    Returns:
+    -------
+        QuerySet: The queryset with a ``consumed`` annotation.
+    """
+    decimal = DecimalField(max_digits=15, decimal_places=2)
+    rollup = MonthlyRollup.objects.filter(
+        user_id=OuterRef("user_id"),
+        month=OuterRef("limit_month"),
+        category_id=OuterRef("category_id"),
+    ).values(
+        total=F("revenues_paid") + F("revenues_unpaid")
+    )[:1]
+    limit_qs = limit_qs.annotate(limit_month=TruncMonth("limit_date"))
+    return limit_qs.annotate(consumed=Coalesce(Subquery(rollup, output_field=decimal), Value(0, output_field=decimal)))
 
 
 class LimitCreateRepository(AbstractBaseLimitCreateDataAccess):
@@ -52,11 +84,26 @@ class LimitListRepository(AbstractBaseLimitListDataAccess):
         -------
             list[Limit] | None: A list of Limit instances, or None if no instances found.
         """
-        limit_qs = LimitModel.objects.all().filter(user_id=user_id)
-        if not limit_qs.exists():
-            return None
+        limit_qs = annotate_consumption(LimitModel.objects.select_related("category").filter(user_id=user_id))
         lista = [parse_limit_model_to_entity(limit) for limit in limit_qs.iterator()]
-        return lista
+        return lista or None
+
+    def get_limits_page(self, user_id: int, cursor: str | None = None, page_size: int | None = None) -> Page:
+        """Get one keyset paginated page of Limit instances for a user.
+
+        Args:
+        ----
+            user_id (int): The ID of the user.
+            cursor (str | None): The cursor returned with the previous page.
+            page_size (int | None): The number of records per page.
+
+        Returns:
+        -------
+            Page: The Limit instances of the page, ordered by limit date and ID.
+        """
+        limit_qs = annotate_consumption(LimitModel.objects.select_related("category").filter(user_id=user_id))
+        limits, next_cursor = get_keyset_page(limit_qs, "limit_date", cursor, page_size)
+        return Page(items=[parse_limit_model_to_entity(limit) for limit in limits], next_cursor=next_cursor)
 
 
 class LimitUpdateRepository(AbstractBaseLimitUpdateDataAccess):
@@ -74,8 +121,8 @@ class LimitUpdateRepository(AbstractBaseLimitUpdateDataAccess):
         -------
             Limit | None: The retrieved Limit instance, or None if not found.
         """
-        limit = LimitModel.objects.filter(id=limit_id)
-        if not limit.exists():
+        limit = LimitModel.objects.select_related("category").filter(id=limit_id, user_id=user_id).first()
+        if not limit:
             return None
         return parse_limit_model_to_entity(limit)
 
@@ -92,10 +139,10 @@ class LimitUpdateRepository(AbstractBaseLimitUpdateDataAccess):
         -------
             Limit | None: The updated Limit instance, or None if update failed.
         """
-        limit = LimitModel.objects.filter(id=limit_id, user_id=user_id).first()
-        limit.limit = data.get("limit") if data.get("limit") else limit.limit
-        limit.amount = data.get("amount") if data.get("amount") else limit.amount
-        limit.save()
+        values = {field: data[field] for field in ("limit", "amount") if data.get(field)}
+        limit = update_returning(LimitModel.objects.filter(id=limit_id, user_id=user_id), values)
+        if not limit:
+            return None
         return parse_limit_model_to_entity(limit)
 
 
@@ -114,8 +161,8 @@ class LimitDeleteRepository(AbstractBaseLimitDeleteDataAccess):
         -------
             Limit | None: The retrieved Limit instance, or None if not found.
         """
-        limit = LimitModel.objects.filter(id=limit_id)
-        if not limit.exists():
+        limit = LimitModel.objects.select_related("category").filter(id=limit_id, user_id=user_id).first()
+        if not limit:
             return None
         return parse_limit_model_to_entity(limit)
 
@@ -131,8 +178,5 @@ class LimitDeleteRepository(AbstractBaseLimitDeleteDataAccess):
         -------
             bool: True if the Limit instance was deleted, False otherwise.
         """
-        limit = LimitModel.objects.filter(user_id=user_id, id=limit_id)
-        if not limit.exists():
-            return False
-        limit.delete()
-        return True
+        deleted, _ = LimitModel.objects.filter(user_id=user_id, id=limit_id).delete()
+        return deleted > 0
@@ -0,0 +1,129 @@
+import base64
+import binascii
+import json
+import uuid
+from datetime import datetime
+from typing import Any
+
+from django.conf import settings
+from django.db.models import Model, Q, QuerySet
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def encode_cursor(date_value: Any, record_id: Any) -> str:
+    """Encode the sort key of the last record of a page into an opaque cursor.
+
+    Args:
+    ----
+        date_value (Any): The value of the date column used for ordering.
+        record_id (Any): The primary key of the record.
+
+    Returns:
+    -------
+        str: A url-safe cursor.
+    """
+    payload = json.dumps([date_value.isoformat(), str(record_id)])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[str, str]:
+    """Decode a cursor produced by ``encode_cursor``.
+
+    Args:
+    ----
+        cursor (str): The opaque cursor.
+
+    Returns:
+    -------
+        tuple[str, str]: The ISO formatted date and the record ID.
+
+    Raises:
+    ------
+        InvalidCursorError: If the cursor is malformed.
+    """
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        date_value, record_id = json.loads(payload)
+        datetime.fromisoformat(date_value)
+        uuid.UUID(record_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError, AttributeError) as e:
+        raise InvalidCursorError("Invalid cursor.") from e
+    return date_value, record_id
+
+
+def get_page_size(page_size: int | None) -> int:
+    """Resolve the requested page size against the configured default and maximum.
+
+    Args:
+    ----
+        page_size (int | None): The page size requested by the client.
+
+    Returns:
+    -------
+        int: The page size to apply.
+    """
+    if not page_size:
+        return settings.BUDGET_LIST_PAGE_SIZE
+    return min(page_size, settings.BUDGET_LIST_MAX_PAGE_SIZE)
+
+
+def get_keyset_page(queryset: QuerySet, date_field: str, cursor: str | None, page_size: int | None) -> tuple[list[Model], str | None]:
+    """Fetch one page of a queryset ordered by ``(date_field, id)``.
+
+    The page is located with a ``WHERE (date, id) > (cursor)`` condition instead of an
+    OFFSET, so the cost of a page does not depend on how deep into the history it is.
+
+    Args:
+    ----
+        queryset (QuerySet): The user-scoped queryset to paginate.
+        date_field (str): The date column used as the primary sort key.
+        cursor (str | None): The cursor returned with the previous page.
+        page_size (int | None): The requested number of records.
+
+    Returns:
+    -------
+        tuple[list[Model], str | None]: The records of the page and the cursor of the next page.
+    """
+    queryset, page_size = _keyset_slice(queryset, date_field, cursor, page_size)
+    return _build_page(list(queryset), date_field, page_size)
+
+
+async def aget_keyset_page(queryset: QuerySet, date_field: str, cursor: str | None, page_size: int | None) -> tuple[list[Model], str | None]:
+    """Fetch one page of a queryset ordered by ``(date_field, id)`` without blocking the event loop.
+
+    The async counterpart of ``get_keyset_page``.
+
+    Args:
+    ----
+        queryset (QuerySet): The user-scoped queryset to paginate.
+        date_field (str): The date column used as the primary sort key.
+        cursor (str | None): The cursor returned with the previous page.
+        page_size (int | None): The requested number of records.
+
+    Returns:
+    -------
+        tuple[list[Model], str | None]: The records of the page and the cursor of the next page.
+    """
+    queryset, page_size = _keyset_slice(queryset, date_field, cursor, page_size)
+    return _build_page([record async for record in queryset], date_field, page_size)
+
+
+def _keyset_slice(queryset: QuerySet, date_field: str, cursor: str | None, page_size: int | None) -> tuple[QuerySet, int]:
+    page_size = get_page_size(page_size)
+    queryset = queryset.order_by(date_field, "id")
+    if cursor:
+        date_value, record_id = decode_cursor(cursor)
+        queryset = queryset.filter(Q(**{f"{date_field}__gt": date_value}) | Q(**{date_field: date_value, "id__gt": record_id}))
+    # One extra record tells whether there is a next page.
+    return queryset[: page_size + 1], page_size
+
+
+def _build_page(records: list[Model], date_field: str, page_size: int) -> tuple[list[Model], str | None]:
+    if len(records) <= page_size:
+        return records, None
+    records = records[:page_size]
+    last_record = records[-1]
+    return records, encode_cursor(getattr(last_record, date_field), last_record.id)
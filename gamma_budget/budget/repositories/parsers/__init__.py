@@ -1,4 +1,7 @@
 from .alert import *
 from .incoming import *
+from .installment import *
+from .job import *
 from .limit import *
+from .recurring import *
 from .revenue import *
@@ -7,7 +7,7 @@ def parse_alert_model_to_entity(alert: AlertModel) -> Alert:
         id=alert.id,
         user_id=alert.user_id,
         user_email=alert.user_email,
-        revenue_id=alert.revenue.id,
+        revenue_id=alert.revenue_id,
         message=alert.message,
         alert_date=alert.alert_date,
     )
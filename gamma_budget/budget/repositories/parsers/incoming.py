@@ -1,5 +1,14 @@
 from budget.domain.entities import Incoming
 from budget.models import Incoming as IncomingModel
+from budget.repositories.category_cache import incoming_categories
+
+
+def parse_incoming_category_name(incoming: IncomingModel) -> str:
+    """Get the category name of an incoming, from the category cache unless it was already loaded."""
+    if IncomingModel.category.is_cached(incoming):
+        return incoming.category.name
+    category = incoming_categories.get(incoming.category_id)
+    return category.name if category else incoming.category.name
 
 
 def parse_incoming_model_to_entity(incoming: IncomingModel) -> Incoming:
@@ -12,7 +21,7 @@ def parse_incoming_model_to_entity(incoming: IncomingModel) -> Incoming:
         launch_date=incoming.launch_date,
         incoming_date=incoming.incoming_date,
         category={
-            "id": incoming.category.id,
-            "name": incoming.category.name,
+            "id": incoming.category_id,
+            "name": parse_incoming_category_name(incoming),
         },
     )
@@ -0,0 +1,18 @@
+from budget.domain.entities import Installment, InstallmentPlan
+from budget.models import Installment as InstallmentModel
+from budget.models import Revenue as RevenueModel
+
+
+def parse_installment_models_to_plan(revenue: RevenueModel, installments: list[InstallmentModel]) -> InstallmentPlan:
+    first = installments[0]
+    return InstallmentPlan(
+        revenue_id=revenue.id,
+        name=revenue.name,
+        period_unit=first.period_unit,
+        payment_method=first.payment_method,
+        periods_paid=first.periods_paid,
+        installments=[
+            Installment(id=installment.id, number=installment.period, amount=installment.amount, due_date=installment.due_date, paid=installment.paid)
+            for installment in installments
+        ],
+    )
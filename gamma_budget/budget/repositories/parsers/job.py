@@ -0,0 +1,16 @@
+from budget.domain.entities import Job
+from budget.models import Job as JobModel
+
+
+def parse_job_model_to_entity(job: JobModel) -> Job:
+    return Job(
+        id=job.id,
+        kind=job.kind,
+        status=job.status,
+        attempts=job.attempts,
+        run_after=job.run_after,
+        result=job.result,
+        last_error=job.last_error,
+        created_at=job.created_at,
+        finished_at=job.finished_at,
+    )
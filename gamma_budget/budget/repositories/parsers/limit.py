@@ -10,4 +10,5 @@ def parse_limit_model_to_entity(limit: LimitModel) -> Limit:
         amount=limit.amount,
         limit_date=limit.limit_date,
         category=limit.category.name,
+        consumed=getattr(limit, "consumed", None),
     )
@@ -0,0 +1,22 @@
+from budget.domain.entities import Recurring
+from budget.models import Recurring as RecurringModel
+
+
+def parse_recurring_model_to_entity(recurring: RecurringModel) -> Recurring:
+    return Recurring(
+        id=recurring.id,
+        user_id=recurring.revenue.user_id,
+        revenue_id=recurring.revenue_id,
+        name=recurring.revenue.name,
+        category={
+            "id": recurring.revenue.category.id,
+            "name": recurring.revenue.category.name,
+        },
+        amount=recurring.amount,
+        payment_method=recurring.payment_method,
+        payment_date=recurring.payment_date or recurring.revenue.expiration_date,
+        period=recurring.period,
+        period_unit=recurring.period_unit,
+        active=recurring.active,
+        expanded_until=recurring.expanded_until,
+    )
@@ -1,5 +1,14 @@
 from budget.domain.entities import Revenue
 from budget.models import Revenue as RevenueModel
+from budget.repositories.category_cache import revenue_categories
+
+
+def parse_revenue_category_name(revenue: RevenueModel) -> str:
+    """Get the category name of a revenue, from the category cache unless it was already loaded."""
+    if RevenueModel.category.is_cached(revenue):
+        return revenue.category.name
+    category = revenue_categories.get(revenue.category_id)
+    return category.name if category else revenue.category.name
 
 
 def parse_revenue_model_to_entity(revenue: RevenueModel) -> Revenue:
@@ -13,7 +22,7 @@ def parse_revenue_model_to_entity(revenue: RevenueModel) -> Revenue:
         paid=revenue.paid,
         payment_date=revenue.payment_date if revenue.paid else None,
         category={
-            "id": revenue.category.id,
-            "name": revenue.category.name,
+            "id": revenue.category_id,
+            "name": parse_revenue_category_name(revenue),
         },
     )
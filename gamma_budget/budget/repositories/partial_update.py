@@ -0,0 +1,72 @@
+import sqlite3
+
+from django.db import connections
+from django.db.models import Model, QuerySet, sql
+from django.utils import timezone
+
+
+def supports_update_returning(connection) -> bool:
+    """Tell whether a database connection can run ``UPDATE ... RETURNING``.
+
+    Django has no feature flag for it: ``can_return_rows_from_bulk_insert`` only covers
+    ``INSERT`` and is also true on MariaDB, which does not support ``UPDATE ... RETURNING``.
+
+    Args:
+    ----
+        connection: The database connection.
+
+    Returns:
+    -------
+        bool: True on PostgreSQL and on SQLite 3.35+.
+    """
+    if connection.vendor == "postgresql":
+        return True
+    return connection.vendor == "sqlite" and sqlite3.sqlite_version_info >= (3, 35)
+
+
+def update_returning(queryset: QuerySet, values: dict) -> Model | None:
+    """Update the rows of a queryset with a single statement and return the updated row.
+
+    Only the columns in ``values`` are written, plus the ``auto_now`` fields, which are
+    set to the current time as ``save()`` would. On backends that support ``UPDATE ... RETURNING``
+    (PostgreSQL and SQLite 3.35+) the updated row is read back from the same statement; other
+    backends fall back to an ``UPDATE`` followed by a ``SELECT``.
+
+    Args:
+    ----
+        queryset (QuerySet): A queryset matching at most one row, e.g. filtered by ID and user ID.
+        values (dict): The field values to update.
+
+    Returns:
+    -------
+        Model | None: The updated model instance, or None if no row matched.
+    """
+    model = queryset.model
+    connection = connections[queryset.db]
+    if not values:
+        return queryset.first()
+    values = {**values, **{field.name: timezone.now() for field in model._meta.concrete_fields if getattr(field, "auto_now", False)}}
+    if not supports_update_returning(connection):
+        if not queryset.update(**values):
+            return None
+        return queryset.first()
+
+    # Compile the UPDATE the way QuerySet.update() does, then append RETURNING to it.
+    query = queryset.query.chain(sql.UpdateQuery)
+    query.add_update_values(values)
+    update_sql, params = query.get_compiler(queryset.db).as_sql()
+    fields = model._meta.concrete_fields
+    columns = ", ".join(connection.ops.quote_name(field.column) for field in fields)
+    with connection.cursor() as cursor:
+        cursor.execute(f"{update_sql} RETURNING {columns}", params)
+        row = cursor.fetchone()
+    if row is None:
+        return None
+
+    converted = []
+    for field, value in zip(fields, row, strict=True):
+        expression = field.get_col(model._meta.db_table)
+        for converter in connection.ops.get_db_converters(expression) + field.get_db_converters(connection):
+            value = converter(value, expression, connection)
+        converted.append(value)
+    return model.from_db(queryset.db, [field.attname for field in fields], converted)
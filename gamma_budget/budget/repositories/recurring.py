@@ -0,0 +1,159 @@
+from datetime import date
+
+from budget.domain.data_access.recurring import (
+    AbstractBaseRecurringCreateDataAccess,
+    AbstractBaseRecurringExpandDataAccess,
+    AbstractBaseRecurringProjectionDataAccess,
+)
+from budget.domain.entities import Recurring, RecurringOccurrence
+from budget.models import Recurring as RecurringModel
+from budget.models import Revenue as RevenueModel
+from budget.repositories.parsers.recurring import parse_recurring_model_to_entity
+from budget.repositories.rollup import apply_rollup_deltas, revenue_rollup
+from django.db import transaction
+from django.db.models import Q
+
+# Number of revenues inserted per statement by the expansion.
+EXPAND_BATCH_SIZE = 1000
+
+
+def _get_rules(user_id: int | None = None, lock: bool = False) -> list[Recurring]:
+    rules_qs = RecurringModel.objects.select_related("revenue__category").filter(active=True)
+    if user_id is not None:
+        rules_qs = rules_qs.filter(revenue__user_id=user_id)
+    if lock:
+        rules_qs = rules_qs.select_for_update(of=("self",))
+    return [parse_recurring_model_to_entity(recurring) for recurring in rules_qs]
+
+
+def _get_occurrence_dates(rules: list[Recurring], start: date, end: date) -> set[tuple]:
+    revenue_qs = RevenueModel.objects.filter(recurring_rule_id__in=[rule.id for rule in rules], expiration_date__range=(start, end))
+    return set(revenue_qs.values_list("recurring_rule_id", "expiration_date"))
+
+
+class RecurringCreateRepository(AbstractBaseRecurringCreateDataAccess):
+    """Repository for creating recurring revenue rules."""
+
+    def create_recurring(self, data: dict, user_id: int) -> Recurring | None:
+        """Create a rule repeating one of the user's revenues.
+
+        The revenue becomes the occurrence of its own expiration date, so expanding the
+        rule never creates a copy of it.
+
+        Args:
+        ----
+            data (dict): Data for creating the rule.
+            user_id (int): User ID associated with the revenue.
+
+        Returns:
+        -------
+            Recurring | None: Created rule or None if the revenue was not found.
+        """
+        revenue = RevenueModel.objects.select_related("category").filter(id=data["revenue"], user_id=user_id).first()
+        if not revenue:
+            return None
+        with transaction.atomic():
+            recurring = RecurringModel.objects.create(
+                revenue=revenue,
+                amount=data.get("amount") or revenue.amount,
+                payment_method=data.get("payment_method"),
+                payment_date=data.get("payment_date") or revenue.expiration_date,
+                period=data["period"],
+                period_unit=data["period_unit"],
+            )
+            RevenueModel.objects.filter(id=revenue.id, recurring_rule__isnull=True).update(recurring_rule=recurring)
+        return parse_recurring_model_to_entity(recurring)
+
+
+class RecurringExpandRepository(AbstractBaseRecurringExpandDataAccess):
+    """Repository for materializing recurring revenues as Revenue rows."""
+
+    def expand_recurring(self, until: date, user_id: int | None = None) -> int:
+        """Create the missing revenues of the active rules up to a date.
+
+        Each rule is expanded from the day after its ``expanded_until`` mark, which then
+        moves to ``until``, so an occurrence deleted or rescheduled by the user is never
+        created again. Each user is expanded in its own transaction that locks only the
+        rules of that user, and the occurrences already stored are skipped, so running
+        the expansion again, or concurrently, creates nothing new. The revenues are
+        inserted with ``bulk_create`` and added to the monthly rollups with one upsert.
+
+        Args:
+        ----
+            until (date): The last day of the expansion horizon.
+            user_id (int | None): Only expand the rules of this user, or every user if None.
+
+        Returns:
+        -------
+            int: The number of revenues created.
+        """
+        if user_id is not None:
+            return self._expand_user(until, user_id)
+        user_ids = (
+            RecurringModel.objects.filter(active=True)
+            .filter(Q(expanded_until__isnull=True) | Q(expanded_until__lt=until))
+            .values_list("revenue__user_id", flat=True)
+            .distinct()
+            .order_by("revenue__user_id")
+        )
+        return sum(self._expand_user(until, user) for user in list(user_ids))
+
+    def _expand_user(self, until: date, user_id: int) -> int:
+        with transaction.atomic():
+            rules = [rule for rule in _get_rules(user_id, lock=True) if rule.first_unexpanded_day() <= until]
+            if not rules:
+                return 0
+            existing = _get_occurrence_dates(rules, min(rule.first_unexpanded_day() for rule in rules), until)
+            revenues = [
+                RevenueModel(
+                    user_id=rule.user_id,
+                    name=rule.name,
+                    amount=rule.amount,
+                    expiration_date=day,
+                    paid=False,
+                    category_id=rule.category["id"],
+                    recurring_rule_id=rule.id,
+                )
+                for rule in rules
+                for day in rule.occurrences_between(rule.first_unexpanded_day(), until)
+                if (rule.id, day) not in existing
+            ]
+            RevenueModel.objects.bulk_create(revenues, batch_size=EXPAND_BATCH_SIZE)
+            apply_rollup_deltas(
+                *(revenue_rollup(revenue.user_id, revenue.amount, revenue.expiration_date, revenue.category_id, revenue.paid) for revenue in revenues)
+            )
+            RecurringModel.objects.filter(id__in=[rule.id for rule in rules]).update(expanded_until=until)
+        return len(revenues)
+
+
+class RecurringProjectionRepository(AbstractBaseRecurringProjectionDataAccess):
+    """Repository for projecting future recurring revenues without storing them."""
+
+    def get_projection(self, user_id: int, start: date, end: date) -> list[RecurringOccurrence]:
+        """Compute the occurrences of the user's active rules inside a window.
+
+        Occurrences already expanded, whether their revenue is still stored or not, are
+        left out, so the projection can be added to the stored revenues without counting
+        anything twice or bringing back a deleted occurrence.
+
+        Args:
+        ----
+            user_id (int): The ID of the user.
+            start (date): The first day of the window.
+            end (date): The last day of the window.
+
+        Returns:
+        -------
+            list[RecurringOccurrence]: The occurrences ordered by date.
+        """
+        rules = _get_rules(user_id)
+        if not rules:
+            return []
+        existing = _get_occurrence_dates(rules, start, end)
+        occurrences = [
+            RecurringOccurrence(recurring_id=rule.id, name=rule.name, category=rule.category, amount=rule.amount, expiration_date=day)
+            for rule in rules
+            for day in rule.occurrences_between(max(start, rule.first_unexpanded_day()), end)
+            if (rule.id, day) not in existing
+        ]
+        return sorted(occurrences, key=lambda occurrence: occurrence.expiration_date)
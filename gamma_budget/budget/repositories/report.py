@@ -0,0 +1,69 @@
+from datetime import date
+
+from budget.domain.data_access.report import AbstractBaseMonthlyReportDataAccess
+from budget.domain.entities import MonthlyReport, ReportCategory, ReportLimit
+from budget.domain.entities.recurring import MONTHS, add_periods
+from budget.models import Limit, MonthlyRollup
+from budget.models.categories import IncomingCategory, RevenueCategory
+from django.db.models import F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def _month_rollups(month: date):
+    return MonthlyRollup.objects.filter(month=month).exclude(incomings=0, revenues_paid=0, revenues_unpaid=0)
+
+
+def get_report_user_ids(month: date) -> list[int]:
+    """Get the users with records in a month, whose reports are generated at month close.
+
+    Args:
+    ----
+        month (date): The first day of the month.
+
+    Returns:
+    -------
+        list[int]: The IDs of the users, in order.
+    """
+    return list(_month_rollups(month).order_by("user_id").values_list("user_id", flat=True).distinct())
+
+
+class MonthlyReportRepository(AbstractBaseMonthlyReportDataAccess):
+    """Repository for building monthly reports from the rollup table."""
+
+    def get_monthly_report(self, user_id: int, month: date) -> MonthlyReport:
+        """Get the category totals and the limits of a user in a month.
+
+        The totals come from ``MonthlyRollup``, with the category names looked up in the
+        same query, so the report takes two queries whatever the number of records.
+
+        Args:
+        ----
+            user_id (int): The ID of the user.
+            month (date): The first day of the month.
+
+        Returns:
+        -------
+            MonthlyReport: The report of the month.
+        """
+        category_name = Coalesce(
+            Subquery(IncomingCategory.objects.filter(id=OuterRef("category_id")).values("name")),
+            Subquery(RevenueCategory.objects.filter(id=OuterRef("category_id")).values("name")),
+        )
+        rollups = (
+            _month_rollups(month)
+            .filter(user_id=user_id)
+            .annotate(name=category_name)
+            .values("name", "incomings", "revenues_paid", "revenues_unpaid")
+            .order_by("name")
+        )
+        limits = (
+            Limit.objects.filter(user_id=user_id, limit_date__gte=month, limit_date__lt=add_periods(month, 1, MONTHS))
+            .values("limit", "amount", category_name=F("category__name"))
+            .order_by("category__name", "limit_date")
+        )
+        return MonthlyReport(
+            user_id=user_id,
+            month=month,
+            categories=[ReportCategory(**rollup) for rollup in rollups],
+            limits=[ReportLimit(**limit) for limit in limits],
+        )
@@ -1,14 +1,23 @@
+from asgiref.sync import sync_to_async
 from budget.domain.data_access.revenue import (
+    AbstractBaseRevenueBulkCreateDataAccess,
     AbstractBaseRevenueCreateDataAccess,
     AbstractBaseRevenueDeleteDataAccess,
     AbstractBaseRevenueListDataAccess,
     AbstractBaseRevenueRetrieveDataAccess,
     AbstractBaseRevenueUpdateDataAccess,
 )
-from budget.domain.entities import Revenue
+from budget.domain.entities import BulkCreateResult, Page, Revenue
 from budget.models import Revenue as RevenueModel
 from budget.models.categories import RevenueCategory
+from budget.repositories.bulk import BULK_CREATE_BATCH_SIZE
+from budget.repositories.category_cache import revenue_categories
+from budget.repositories.pagination import aget_keyset_page, get_keyset_page
 from budget.repositories.parsers.revenue import parse_revenue_model_to_entity
+from budget.repositories.partial_update import update_returning
+from budget.repositories.rollup import REVENUE_ROLLUP_FIELDS, apply_rollup_deltas, revenue_rollup
+from django.db import transaction
+from django.db.models import Count, Max
 
 
 class RevenueCreateRepository(AbstractBaseRevenueCreateDataAccess):
@@ -34,18 +43,77 @@ class RevenueCreateRepository(AbstractBaseRevenueCreateDataAccess):
         category = RevenueCategory.objects.get(id=data["category"])
         if not category:
             return None
-        revenue = RevenueModel.objects.create(
-            user_id=user_id,
-            name=data.get("name"),
-            description=data.get("description"),
-            amount=data.get("amount"),
-            expiration_date=data.get("expiration_date"),
-            paid=data.get("paid"),
-            payment_date=data.get("payment_date"),
-            category=category,
-        )
+        with transaction.atomic():
+            revenue = RevenueModel.objects.create(
+                user_id=user_id,
+                name=data.get("name"),
+                description=data.get("description"),
+                amount=data.get("amount"),
+                expiration_date=data.get("expiration_date"),
+                paid=data.get("paid"),
+                payment_date=data.get("payment_date"),
+                category=category,
+            )
+            apply_rollup_deltas(revenue_rollup(user_id, revenue.amount, revenue.expiration_date, category.id, revenue.paid))
         return parse_revenue_model_to_entity(revenue)
 
+    async def acreate_revenue(self, data: dict, user_id: int) -> Revenue | None:
+        """Create a Revenue instance from async code.
+
+        The insert and the rollup update share a transaction, which Django only runs in
+        sync code, so they run through ``sync_to_async`` in the thread of the request.
+
+        Args:
+        ----
+            data (dict): The data for creating the Revenue instance.
+            user_id (int): The ID of the user creating the Revenue instance.
+
+        Returns:
+        -------
+            Revenue | None: The created Revenue instance, or None if creation failed.
+        """
+        return await sync_to_async(self.create_revenue)(data, user_id)
+
+
+class RevenueBulkCreateRepository(AbstractBaseRevenueBulkCreateDataAccess):
+    """Repository for creating many Revenue instances at once."""
+
+    def create_revenues(self, items: list[dict], user_id: int) -> BulkCreateResult:
+        """Create many revenue instances in one transaction.
+
+        The items must already be validated, categories included, by the bulk create
+        serializer. The revenues are inserted with ``bulk_create`` and added to the
+        monthly rollups with one upsert.
+
+        Args:
+        ----
+            items (list[dict]): Data for creating each revenue.
+            user_id (int): User ID associated with the revenues.
+
+        Returns:
+        -------
+            BulkCreateResult: The IDs of the created revenues.
+        """
+        revenues = [
+            RevenueModel(
+                user_id=user_id,
+                name=item["name"],
+                description=item.get("description"),
+                amount=item["amount"],
+                expiration_date=item["expiration_date"],
+                paid=item["paid"],
+                payment_date=item.get("payment_date") if item["paid"] else None,
+                category_id=item["category"],
+            )
+            for item in items
+        ]
+        with transaction.atomic():
+            RevenueModel.objects.bulk_create(revenues, batch_size=BULK_CREATE_BATCH_SIZE)
+            apply_rollup_deltas(
+                *(revenue_rollup(user_id, revenue.amount, revenue.expiration_date, revenue.category_id, revenue.paid) for revenue in revenues)
+            )
+        return BulkCreateResult(ids=[str(revenue.id) for revenue in revenues])
+
 
 class RevenueListRepository(AbstractBaseRevenueListDataAccess):
     """Repository for listing Revenue instances.
@@ -66,11 +134,76 @@ class RevenueListRepository(AbstractBaseRevenueListDataAccess):
         -------
             list[Revenue] | None: List of Revenue instances or None if no revenues found.
         """
-        revenue_qs = RevenueModel.objects.all().filter(user_id=user_id)
-        if not revenue_qs.exists():
-            return None
+        revenue_qs = RevenueModel.objects.filter(user_id=user_id)
         lista = [parse_revenue_model_to_entity(revenue) for revenue in revenue_qs.iterator()]
-        return lista
+        return lista or None
+
+    def get_revenues_page(self, user_id: int, cursor: str | None = None, page_size: int | None = None) -> Page:
+        """Get one keyset paginated page of Revenue instances for a user.
+
+        Args:
+        ----
+            user_id (int): The ID of the user.
+            cursor (str | None): The cursor returned with the previous page.
+            page_size (int | None): The number of records per page.
+
+        Returns:
+        -------
+            Page: The Revenue instances of the page, ordered by expiration date and ID.
+        """
+        revenue_qs = RevenueModel.objects.filter(user_id=user_id)
+        revenues, next_cursor = get_keyset_page(revenue_qs, "expiration_date", cursor, page_size)
+        return Page(items=[parse_revenue_model_to_entity(revenue) for revenue in revenues], next_cursor=next_cursor)
+
+    def get_revenues_version(self, user_id: int) -> str:
+        """Get a version of the Revenue instances of a user that changes whenever the list does.
+
+        Creating, changing or deleting a Revenue moves the number of rows or the latest
+        ``updated_at``, both read by one aggregate over ``revenue_user_updated_idx``; renaming a
+        category changes the digest of the cached categories.
+
+        Args:
+        ----
+            user_id (int): The ID of the user.
+
+        Returns:
+        -------
+            str: The version.
+        """
+        latest = RevenueModel.objects.filter(user_id=user_id).aggregate(count=Count("id"), updated_at=Max("updated_at"))
+        return f"{latest['count']}:{latest['updated_at']}:{revenue_categories.version()}"
+
+    async def aget_revenues(self, user_id: int) -> list[Revenue] | None:
+        """Get a list of Revenue instances for a user without blocking the event loop.
+
+        Args:
+        ----
+            user_id (int): The ID of the user.
+
+        Returns:
+        -------
+            list[Revenue] | None: A list of Revenue instances, or None if no instances found.
+        """
+        revenue_qs = RevenueModel.objects.select_related("category").filter(user_id=user_id)
+        lista = [parse_revenue_model_to_entity(revenue) async for revenue in revenue_qs.aiterator()]
+        return lista or None
+
+    async def aget_revenues_page(self, user_id: int, cursor: str | None = None, page_size: int | None = None) -> Page:
+        """Get one keyset paginated page of Revenue instances for a user without blocking the event loop.
+
+        Args:
+        ----
+            user_id (int): The ID of the user.
+            cursor (str | None): The cursor returned with the previous page.
+            page_size (int | None): The number of records per page.
+
+        Returns:
+        -------
+            Page: The Revenue instances of the page, ordered by expiration date and ID.
+        """
+        revenue_qs = RevenueModel.objects.select_related("category").filter(user_id=user_id)
+        revenues, next_cursor = await aget_keyset_page(revenue_qs, "expiration_date", cursor, page_size)
+        return Page(items=[parse_revenue_model_to_entity(revenue) for revenue in revenues], next_cursor=next_cursor)
 
 
 class RevenueRetrieveRepository(AbstractBaseRevenueRetrieveDataAccess):
@@ -93,10 +226,45 @@ class RevenueRetrieveRepository(AbstractBaseRevenueRetrieveDataAccess):
         -------
             Revenue | None: Retrieved Revenue instance or None if not found.
         """
-        revenue = RevenueModel.objects.filter(id=revenue_id, user_id=user_id)
-        if not revenue.exists():
+        revenue = RevenueModel.objects.filter(id=revenue_id, user_id=user_id).first()
+        if not revenue:
+            return None
+        return parse_revenue_model_to_entity(revenue)
+
+    def get_revenue_version(self, revenue_id: int, user_id: int) -> str | None:
+        """Get a version of a Revenue instance that changes whenever the instance does.
+
+        Args:
+        ----
+            revenue_id (int): The ID of the Revenue instance.
+            user_id (int): The ID of the user.
+
+        Returns:
+        -------
+            str | None: The version, or None if not found.
+        """
+        row = RevenueModel.objects.filter(id=revenue_id, user_id=user_id).values_list("updated_at", "category_id").first()
+        if not row:
+            return None
+        category = revenue_categories.get(row[1])
+        return f"{row[0]}:{category.name if category else ''}"
+
+    async def aget_revenue(self, revenue_id: int, user_id: int) -> Revenue | None:
+        """Retrieve a Revenue instance by its ID and user ID without blocking the event loop.
+
+        Args:
+        ----
+            revenue_id (int): The ID of the Revenue instance.
+            user_id (int): The ID of the user.
+
+        Returns:
+        -------
+            Revenue | None: The retrieved Revenue instance, or None if not found.
+        """
+        revenue = await RevenueModel.objects.select_related("category").filter(id=revenue_id, user_id=user_id).afirst()
+        if not revenue:
             return None
-        return parse_revenue_model_to_entity(revenue.first())
+        return parse_revenue_model_to_entity(revenue)
 
 
 class RevenueUpdateRepository(AbstractBaseRevenueUpdateDataAccess):
@@ -119,8 +287,8 @@ class RevenueUpdateRepository(AbstractBaseRevenueUpdateDataAccess):
         -------
             Revenue | None: Retrieved Revenue instance for update or None if not found.
         """
-        revenue = RevenueModel.objects.filter(id=revenue_id)
-        if not revenue.exists():
+        revenue = RevenueModel.objects.filter(id=revenue_id, user_id=user_id).first()
+        if not revenue:
             return None
         return parse_revenue_model_to_entity(revenue)
 
@@ -137,20 +305,44 @@ class RevenueUpdateRepository(AbstractBaseRevenueUpdateDataAccess):
         -------
             Revenue | None: Updated Revenue instance or None if update fails.
         """
-        revenue = RevenueModel.objects.filter(id=revenue_id, user_id=user_id).first()
-        category = RevenueCategory.objects.get(id=data["category"]) if data.get("category") else None
+        values = {field: data[field] for field in ("name", "description", "amount", "expiration_date", "payment_date") if data.get(field)}
+        if data.get("paid") is not None:
+            values["paid"] = data["paid"]
+        with transaction.atomic():
+            if data.get("category"):
+                values["category"] = RevenueCategory.objects.get(id=data["category"])
+            revenue_qs = RevenueModel.objects.filter(id=revenue_id, user_id=user_id)
+            previous = None
+            if values.keys() & {"amount", "expiration_date", "category", "paid"}:
+                previous = revenue_qs.select_for_update().values_list(*REVENUE_ROLLUP_FIELDS).first()
+            revenue = update_returning(revenue_qs, values)
+            if revenue and previous:
+                current = [getattr(revenue, field) for field in REVENUE_ROLLUP_FIELDS]
+                apply_rollup_deltas(revenue_rollup(user_id, *previous, sign=-1), revenue_rollup(user_id, *current))
         if not revenue:
             return None
-        revenue.name = data.get("name") if data.get("name") else revenue.name
-        revenue.description = data.get("description") if data.get("description") else revenue.description
-        revenue.amount = data.get("amount") if data.get("amount") else revenue.amount
-        revenue.expiration_date = data.get("expiration_date") if data.get("expiration_date") else revenue.expiration_date
-        revenue.paid = data.get("paid")
-        revenue.payment_date = data.get("payment_date") if data.get("payment_date") else revenue.payment_date
-        revenue.category = category if category else revenue.category
-        revenue.save()
+        if "category" in values:
+            revenue.category = values["category"]
         return parse_revenue_model_to_entity(revenue)
 
+    async def aupdate_revenue(self, user_id: int, revenue_id: str, data: dict) -> Revenue | None:
+        """Update a Revenue instance from async code.
+
+        The update and the rollup changes share a transaction, which Django only runs in
+        sync code, so they run through ``sync_to_async`` in the thread of the request.
+
+        Args:
+        ----
+            user_id (int): The ID of the user.
+            revenue_id (str): The ID of the Revenue instance.
+            data (dict): The data for updating the Revenue instance.
+
+        Returns:
+        -------
+            Revenue | None: The updated Revenue instance, or None if update failed.
+        """
+        return await sync_to_async(self.update_revenue)(user_id, revenue_id, data)
+
 
 class RevenueDeleteRepository(AbstractBaseRevenueDeleteDataAccess):
     """Repository for deleting Revenue instances.
@@ -172,8 +364,8 @@ class RevenueDeleteRepository(AbstractBaseRevenueDeleteDataAccess):
         -------
             Revenue | None: Retrieved Revenue instance for deletion or None if not found.
         """
-        revenue = RevenueModel.objects.filter(id=revenue_id)
-        if not revenue.exists():
+        revenue = RevenueModel.objects.filter(id=revenue_id, user_id=user_id).first()
+        if not revenue:
             return None
         return parse_revenue_model_to_entity(revenue)
 
@@ -189,8 +381,28 @@ class RevenueDeleteRepository(AbstractBaseRevenueDeleteDataAccess):
         -------
             bool: True if deletion is successful, False otherwise.
         """
-        revenue = RevenueModel.objects.filter(user_id=user_id, id=revenue_id)
-        if not revenue.exists():
-            return False
-        revenue.delete()
+        revenue_qs = RevenueModel.objects.filter(user_id=user_id, id=revenue_id)
+        with transaction.atomic():
+            previous = revenue_qs.select_for_update().values_list(*REVENUE_ROLLUP_FIELDS).first()
+            if not previous:
+                return False
+            revenue_qs.delete()
+            apply_rollup_deltas(revenue_rollup(user_id, *previous, sign=-1))
         return True
+
+    async def adelete_revenue(self, user_id: int, revenue_id: str) -> bool:
+        """Delete a Revenue instance from async code.
+
+        The delete and the rollup update share a transaction, which Django only runs in
+        sync code, so they run through ``sync_to_async`` in the thread of the request.
+
+        Args:
+        ----
+            user_id (int): The ID of the user.
+            revenue_id (str): The ID of the Revenue instance.
+
+        Returns:
+        -------
+            bool: True if the Revenue instance was deleted, False otherwise.
+        """
+        return await sync_to_async(self.delete_revenue)(user_id, revenue_id)
@@ -0,0 +1,208 @@
+import uuid
+from collections.abc import Iterable
+from datetime import date
+from decimal import Decimal
+from typing import Any
+
+from budget.models import Incoming as IncomingModel
+from budget.models import MonthlyRollup
+from budget.models import Revenue as RevenueModel
+from django.db import IntegrityError, connection, models, transaction
+from django.db.models import DecimalField, F, Q, Sum, Value
+from django.db.models.functions import TruncMonth
+
+ZERO = Decimal("0.00")
+TOTAL_FIELDS = ("incomings", "revenues_paid", "revenues_unpaid")
+
+# The incoming/revenue columns that feed the rollup, in the argument order of incoming_rollup/revenue_rollup.
+INCOMING_ROLLUP_FIELDS = ("amount", "launch_date", "category_id")
+REVENUE_ROLLUP_FIELDS = ("amount", "expiration_date", "category_id", "paid")
+
+RollupKey = tuple[int, date, uuid.UUID]
+RollupDelta = tuple[RollupKey, tuple[Decimal, Decimal, Decimal]]
+
+
+def _rollup_key(user_id: int, day: Any, category_id: Any) -> RollupKey:
+    month = models.DateField().to_python(day).replace(day=1)
+    return (user_id, month, models.UUIDField().to_python(category_id))
+
+
+def incoming_rollup(user_id: int, amount: Any, launch_date: Any, category_id: Any, sign: int = 1) -> RollupDelta:
+    """Build the rollup change caused by an incoming.
+
+    Args:
+    ----
+        user_id (int): The ID of the user.
+        amount (Any): The amount of the incoming.
+        launch_date (Any): The launch date of the incoming.
+        category_id (Any): The ID of the incoming category.
+        sign (int): 1 to add the incoming to the rollup, -1 to remove it.
+
+    Returns:
+    -------
+        RollupDelta: The rollup key and the change of its totals.
+    """
+    amount = models.DecimalField().to_python(amount) * sign
+    return _rollup_key(user_id, launch_date, category_id), (amount, ZERO, ZERO)
+
+
+def revenue_rollup(user_id: int, amount: Any, expiration_date: Any, category_id: Any, paid: Any, sign: int = 1) -> RollupDelta:
+    """Build the rollup change caused by a revenue.
+
+    Args:
+    ----
+        user_id (int): The ID of the user.
+        amount (Any): The amount of the revenue.
+        expiration_date (Any): The expiration date of the revenue.
+        category_id (Any): The ID of the revenue category.
+        paid (Any): Whether the revenue is paid.
+        sign (int): 1 to add the revenue to the rollup, -1 to remove it.
+
+    Returns:
+    -------
+        RollupDelta: The rollup key and the change of its totals.
+    """
+    amount = models.DecimalField().to_python(amount) * sign
+    if models.BooleanField().to_python(paid):
+        return _rollup_key(user_id, expiration_date, category_id), (ZERO, amount, ZERO)
+    return _rollup_key(user_id, expiration_date, category_id), (ZERO, ZERO, amount)
+
+
+def apply_rollup_deltas(*deltas: RollupDelta) -> None:
+    """Add the given changes to the monthly rollups, creating missing rows.
+
+    Changes to the same key are merged first, so moving a record inside its month costs
+    nothing. On backends with ``INSERT ... ON CONFLICT DO UPDATE`` (PostgreSQL and SQLite)
+    every row is incremented by a single statement; other backends update each key and
+    insert it when the update matched no row.
+
+    Args:
+    ----
+        *deltas (RollupDelta): The rollup changes built by incoming_rollup and revenue_rollup.
+    """
+    merged: dict[RollupKey, list[Decimal]] = {}
+    for key, change in deltas:
+        current = merged.setdefault(key, [ZERO, ZERO, ZERO])
+        for index, value in enumerate(change):
+            current[index] += value
+    changes = {key: totals for key, totals in merged.items() if any(totals)}
+    if not changes:
+        return
+    if connection.features.supports_update_conflicts_with_target:
+        _upsert(changes)
+        return
+    for (user_id, month, category_id), totals in changes.items():
+        increments = {field: F(field) + value for field, value in zip(TOTAL_FIELDS, totals, strict=True)}
+        rollup = MonthlyRollup.objects.filter(user_id=user_id, month=month, category_id=category_id)
+        if rollup.update(**increments):
+            continue
+        try:
+            with transaction.atomic():
+                MonthlyRollup.objects.create(user_id=user_id, month=month, category_id=category_id, **dict(zip(TOTAL_FIELDS, totals, strict=True)))
+        except IntegrityError:
+            rollup.update(**increments)
+
+
+def _upsert(changes: dict[RollupKey, list[Decimal]]) -> None:
+    opts = MonthlyRollup._meta
+    fields = [opts.get_field(name) for name in ("id", "user_id", "month", "category_id", *TOTAL_FIELDS)]
+    table = connection.ops.quote_name(opts.db_table)
+    columns = ", ".join(connection.ops.quote_name(field.column) for field in fields)
+    conflict = ", ".join(connection.ops.quote_name(name) for name in ("user_id", "month", "category_id"))
+    increments = ", ".join(
+        f"{connection.ops.quote_name(name)} = {table}.{connection.ops.quote_name(name)} + EXCLUDED.{connection.ops.quote_name(name)}"
+        for name in TOTAL_FIELDS
+    )
+    placeholders = ", ".join(["(" + ", ".join(["%s"] * len(fields)) + ")"] * len(changes))
+    params: list[Any] = []
+    for (user_id, month, category_id), totals in changes.items():
+        row = (uuid.uuid4(), user_id, month, category_id, *totals)
+        params.extend(field.get_db_prep_save(value, connection) for field, value in zip(fields, row, strict=True))
+    with connection.cursor() as cursor:
+        cursor.execute(f"INSERT INTO {table} ({columns}) VALUES {placeholders} ON CONFLICT ({conflict}) DO UPDATE SET {increments}", params)
+
+
+def rebuild_monthly_rollups(user_ids: Iterable[int] | None = None, batch_size: int = 1000) -> int:
+    """Recompute the monthly rollups from the incoming and revenue tables.
+
+    Users are rebuilt one at a time, each in its own short transaction, so live writes
+    of other users never wait on the rebuild. See ``rebuild_user_rollups``.
+
+    Args:
+    ----
+        user_ids (Iterable[int] | None): The users to rebuild, or None to rebuild every user.
+        batch_size (int): The number of rows written per statement.
+
+    Returns:
+    -------
+        int: The number of rollup rows of the rebuilt users.
+    """
+    if user_ids is None:
+        user_ids = (
+            IncomingModel.objects.values_list("user_id", flat=True)
+            .union(RevenueModel.objects.values_list("user_id", flat=True), MonthlyRollup.objects.values_list("user_id", flat=True))
+            .order_by()
+        )
+    return sum(rebuild_user_rollups(user_id, batch_size) for user_id in sorted(set(user_ids)))
+
+
+def rebuild_user_rollups(user_id: int, batch_size: int = 1000) -> int:
+    """Recompute the monthly rollups of one user.
+
+    The rollup rows of the user are locked first, so a write of the user that commits
+    during the rebuild applies its delta after the new totals are stored instead of being
+    overwritten. The totals are aggregated in the database with ``GROUP BY month,
+    category_id`` and the rows are updated in place: missing rows are inserted and rows
+    left without records are deleted. Incoming and revenue categories live in different
+    tables, so each aggregated row maps to exactly one rollup row.
+
+    Args:
+    ----
+        user_id (int): The ID of the user.
+        batch_size (int): The number of rows written per statement.
+
+    Returns:
+    -------
+        int: The number of rollup rows of the user.
+    """
+    zero = Value(ZERO, output_field=DecimalField(max_digits=15, decimal_places=2))
+    columns = ("month", "category_id", *TOTAL_FIELDS)
+    incomings = (
+        IncomingModel.objects.filter(user_id=user_id)
+        .annotate(month=TruncMonth("launch_date"))
+        .values("month", "category_id")
+        .annotate(incomings=Sum("amount"), revenues_paid=zero, revenues_unpaid=zero)
+        .values_list(*columns)
+        .order_by()
+    )
+    revenues = (
+        RevenueModel.objects.filter(user_id=user_id)
+        .annotate(month=TruncMonth("expiration_date"))
+        .values("month", "category_id")
+        .annotate(
+            incomings=zero,
+            revenues_paid=Sum("amount", filter=Q(paid=True), default=zero),
+            revenues_unpaid=Sum("amount", filter=Q(paid=False), default=zero),
+        )
+        .values_list(*columns)
+        .order_by()
+    )
+
+    with transaction.atomic():
+        existing = {(rollup.month, rollup.category_id): rollup for rollup in MonthlyRollup.objects.select_for_update().filter(user_id=user_id)}
+        created: list[MonthlyRollup] = []
+        updated: list[MonthlyRollup] = []
+        rows = 0
+        for month, category_id, *totals in incomings.union(revenues, all=True):
+            rows += 1
+            rollup = existing.pop((month, category_id), None)
+            if rollup is None:
+                created.append(MonthlyRollup(user_id=user_id, month=month, category_id=category_id, **dict(zip(TOTAL_FIELDS, totals, strict=True))))
+            elif [getattr(rollup, field) for field in TOTAL_FIELDS] != totals:
+                for field, value in zip(TOTAL_FIELDS, totals, strict=True):
+                    setattr(rollup, field, value)
+                updated.append(rollup)
+        MonthlyRollup.objects.bulk_create(created, batch_size=batch_size)
+        MonthlyRollup.objects.bulk_update(updated, TOTAL_FIELDS, batch_size=batch_size)
+        MonthlyRollup.objects.filter(id__in=[rollup.id for rollup in existing.values()]).delete()
+    return rows
@@ -0,0 +1,77 @@
+from datetime import datetime, timedelta
+from typing import Any
+
+from budget.models import ScheduledRun
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+
+class ScheduledRunRepository:
+    """Repository for the run history of the scheduler.
+
+    Starting a run inserts the row of its time slot. The unique ``(name, scheduled_for)``
+    constraint makes the insert the lock: when several schedulers reach the same slot,
+    only the one whose insert succeeds runs the task.
+    """
+
+    def start_run(self, name: str, scheduled_for: datetime) -> ScheduledRun | None:
+        """Claim a time slot of a schedule.
+
+        A slot is skipped while an earlier run of the same schedule is still running and
+        younger than ``SCHEDULER_RUN_TIMEOUT_SECONDS``; older runs are treated as dead.
+
+        Args:
+        ----
+            name (str): The name of the schedule.
+            scheduled_for (datetime): The time slot to run.
+
+        Returns:
+        -------
+            ScheduledRun | None: The started run, or None if the slot must not run here.
+        """
+        cutoff = timezone.now() - timedelta(seconds=settings.SCHEDULER_RUN_TIMEOUT_SECONDS)
+        running = ScheduledRun.objects.filter(name=name, status=ScheduledRun.RUNNING, started_at__gt=cutoff).exists()
+        status = ScheduledRun.SKIPPED if running else ScheduledRun.RUNNING
+        try:
+            with transaction.atomic():
+                run = ScheduledRun.objects.create(
+                    name=name,
+                    scheduled_for=scheduled_for,
+                    status=status,
+                    error="The previous run is still running." if running else None,
+                    finished_at=timezone.now() if running else None,
+                )
+        except IntegrityError:
+            return None
+        return None if running else run
+
+    def finish_run(self, run: ScheduledRun, result: Any = None, error: str | None = None) -> None:
+        """Record the outcome of a run.
+
+        Args:
+        ----
+            run (ScheduledRun): The run returned by start_run.
+            result (Any): The value returned by the task.
+            error (str | None): The error raised by the task, if any.
+        """
+        run.status = ScheduledRun.FAILED if error else ScheduledRun.SUCCEEDED
+        run.result = result
+        run.error = error
+        run.finished_at = timezone.now()
+        run.save(update_fields=["status", "result", "error", "finished_at"])
+
+    def prune_runs(self, name: str) -> int:
+        """Delete the finished runs of a schedule older than ``SCHEDULER_RUN_RETENTION_DAYS``.
+
+        Args:
+        ----
+            name (str): The name of the schedule.
+
+        Returns:
+        -------
+            int: The number of runs deleted.
+        """
+        cutoff = timezone.now() - timedelta(days=settings.SCHEDULER_RUN_RETENTION_DAYS)
+        deleted, _ = ScheduledRun.objects.filter(name=name, started_at__lt=cutoff).exclude(status=ScheduledRun.RUNNING).delete()
+        return deleted
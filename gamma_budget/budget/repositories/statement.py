@@ -0,0 +1,164 @@
+import hashlib
+import uuid
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from pathlib import PurePosixPath
+from typing import Any
+
+from budget.domain.data_access.statement import AbstractBaseStatementImportDataAccess, AbstractBaseStatementUploadDataAccess
+from budget.domain.entities import Job, StatementImportResult, StatementLine
+from budget.domain.entities.job import IMPORT_STATEMENT
+from budget.models import Incoming as IncomingModel
+from budget.models import Revenue as RevenueModel
+from budget.repositories.category_cache import incoming_categories, revenue_categories
+from budget.repositories.job import JobEnqueueRepository
+from budget.repositories.rollup import apply_rollup_deltas, incoming_rollup, revenue_rollup
+from django.conf import settings
+from django.core.files.storage import storages
+from django.db import transaction
+
+
+def fingerprint_lines(lines: Iterable[StatementLine]) -> Iterator[tuple[str, StatementLine]]:
+    """Pair every statement line with the hash that identifies it across imports.
+
+    Lines with a bank ID are identified by it. Other lines are identified by their date,
+    amount and description, numbered among the identical lines of the same day, so two
+    equal purchases on one day are both kept while importing the file again matches
+    the same hashes. The count of every distinct line is kept, so the lines of a day
+    need not be next to each other in the file.
+
+    Args:
+    ----
+        lines (Iterable[StatementLine]): The lines, in the order of the file.
+
+    Yields:
+    ------
+        tuple[str, StatementLine]: The hex SHA-256 of the line and the line.
+    """
+    seen: Counter[str] = Counter()
+    for line in lines:
+        key = f"{line.date.isoformat()}|{line.amount}|{' '.join(line.description.casefold().split())}"
+        if line.bank_id:
+            key = f"{key}|id:{line.bank_id}"
+        else:
+            seen[key] += 1
+            key = f"{key}|{seen[key]}"
+        yield hashlib.sha256(key.encode()).hexdigest(), line
+
+
+class StatementUploadRepository(AbstractBaseStatementUploadDataAccess):
+    """Repository for storing uploaded statements and enqueueing their import."""
+
+    def store_statement(self, user_id: int, upload: Any, statement_format: str, rules: list[dict]) -> Job:
+        """Save an uploaded statement to ``IMPORT_STORAGE`` and enqueue its import.
+
+        Args:
+        ----
+            user_id (int): The ID of the user.
+            upload (Any): The uploaded file.
+            statement_format (str): The format of the statement: csv or ofx.
+            rules (list[dict]): The category rules of the import.
+
+        Returns:
+        -------
+            Job: The enqueued import job.
+        """
+        name = str(PurePosixPath(settings.IMPORT_UPLOAD_DIR) / f"{uuid.uuid4()}.{statement_format}")
+        path = storages[settings.IMPORT_STORAGE].save(name, upload)
+        payload = {"user_id": user_id, "path": path, "format": statement_format, "rules": rules}
+        return JobEnqueueRepository().enqueue_job(IMPORT_STATEMENT, payload)
+
+
+class StatementImportRepository(AbstractBaseStatementImportDataAccess):
+    """Repository for importing bank statement lines as incomings and revenues."""
+
+    def __init__(self, batch_size: int | None = None):
+        self.batch_size = batch_size or settings.IMPORT_BATCH_SIZE
+
+    def import_statement(self, user_id: int, lines: Iterable[StatementLine], rules: list[dict]) -> StatementImportResult:
+        """Create the incomings and revenues of a statement that were not imported yet.
+
+        Positive lines become incomings and negative lines paid revenues. The category of
+        a line is the first rule whose pattern is in its description, or
+        ``IMPORT_DEFAULT_CATEGORY``; names are resolved through the category cache. The
+        lines are consumed in batches of ``batch_size``: every batch looks up the hashes
+        already imported with one query per table and is inserted with ``bulk_create`` in
+        its own transaction, so memory stays bounded and an interrupted import can simply
+        be run again.
+
+        Args:
+        ----
+            user_id (int): The ID of the user.
+            lines (Iterable[StatementLine]): The statement lines; may be a generator.
+            rules (list[dict]): The category rules, each with a ``pattern`` and a ``category`` name.
+
+        Returns:
+        -------
+            StatementImportResult: The number of records created and of duplicates skipped.
+
+        Raises:
+        ------
+            ValueError: If the default category does not exist.
+        """
+        incoming_category_ids = incoming_categories.ids_by_name()
+        revenue_category_ids = revenue_categories.ids_by_name()
+        default = settings.IMPORT_DEFAULT_CATEGORY
+        if default not in incoming_category_ids or default not in revenue_category_ids:
+            raise ValueError(f"The default category {default!r} does not exist.")
+        patterns = [(rule["pattern"].casefold(), rule["category"]) for rule in rules]
+
+        def categorize(description: str, categories: dict[str, Any]) -> Any:
+            description = description.casefold()
+            for pattern, category in patterns:
+                if pattern in description and category in categories:
+                    return categories[category]
+            return categories[default]
+
+        result = StatementImportResult()
+        fingerprinted = fingerprint_lines(lines)
+        while batch := list(islice(fingerprinted, self.batch_size)):
+            hashes = [import_hash for import_hash, _ in batch]
+            imported = set(IncomingModel.objects.filter(user_id=user_id, import_hash__in=hashes).values_list("import_hash", flat=True))
+            imported.update(RevenueModel.objects.filter(user_id=user_id, import_hash__in=hashes).values_list("import_hash", flat=True))
+            incomings, revenues = [], []
+            for import_hash, line in batch:
+                if import_hash in imported:
+                    result.duplicates += 1
+                    continue
+                imported.add(import_hash)
+                name = line.description[:100] or "Importado"
+                if line.amount >= 0:
+                    incomings.append(
+                        IncomingModel(
+                            user_id=user_id,
+                            name=name,
+                            amount=line.amount,
+                            launch_date=line.date,
+                            category_id=categorize(line.description, incoming_category_ids),
+                            import_hash=import_hash,
+                        )
+                    )
+                else:
+                    revenues.append(
+                        RevenueModel(
+                            user_id=user_id,
+                            name=name,
+                            amount=-line.amount,
+                            expiration_date=line.date,
+                            paid=True,
+                            payment_date=line.date,
+                            category_id=categorize(line.description, revenue_category_ids),
+                            import_hash=import_hash,
+                        )
+                    )
+            with transaction.atomic():
+                IncomingModel.objects.bulk_create(incomings)
+                RevenueModel.objects.bulk_create(revenues)
+                apply_rollup_deltas(
+                    *(incoming_rollup(user_id, incoming.amount, incoming.launch_date, incoming.category_id) for incoming in incomings),
+                    *(revenue_rollup(user_id, revenue.amount, revenue.expiration_date, revenue.category_id, True) for revenue in revenues),
+                )
+            result.incomings += len(incomings)
+            result.revenues += len(revenues)
+        return result
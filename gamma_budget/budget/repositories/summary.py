@@ -0,0 +1,32 @@
+from budget.domain.data_access.summary import AbstractBaseSummaryDataAccess
+from budget.domain.entities import MonthlySummary
+from budget.models import MonthlyRollup
+from django.db.models import Sum
+
+
+class SummaryRepository(AbstractBaseSummaryDataAccess):
+    """Repository for reading the monthly totals of a user from the rollup table."""
+
+    def get_monthly_summary(self, user_id: int) -> list[MonthlySummary]:
+        """Get the incoming and revenue totals of every month with records for a user.
+
+        The totals come from ``MonthlyRollup``, which holds one row per month and
+        category, so the read is proportional to the number of months instead of
+        the number of incoming and revenue records.
+
+        Args:
+        ----
+            user_id (int): The ID of the user.
+
+        Returns:
+        -------
+            list[MonthlySummary]: The totals of each month, ordered by month.
+        """
+        months = (
+            MonthlyRollup.objects.filter(user_id=user_id)
+            .exclude(incomings=0, revenues_paid=0, revenues_unpaid=0)
+            .values("month")
+            .annotate(incomings=Sum("incomings"), revenues_paid=Sum("revenues_paid"), revenues_unpaid=Sum("revenues_unpaid"))
+            .order_by("month")
+        )
+        return [MonthlySummary(**month) for month in months]
@@ -0,0 +1,27 @@
+from budget.models import IncomingCategory, MonthlyRollup, RevenueCategory
+from budget.repositories.category_cache import incoming_categories, revenue_categories
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+
+@receiver([post_save, post_delete], sender=IncomingCategory)
+def clear_incoming_categories(using, **kwargs):
+    """Drop the cached incoming categories once the save or delete of one of them is committed.
+
+    Clearing before the commit would let a concurrent request cache the old rows again.
+    """
+    transaction.on_commit(incoming_categories.clear, using=using)
+
+
+@receiver([post_save, post_delete], sender=RevenueCategory)
+def clear_revenue_categories(using, **kwargs):
+    """Drop the cached revenue categories once the save or delete of one of them is committed."""
+    transaction.on_commit(revenue_categories.clear, using=using)
+
+
+@receiver(post_delete, sender=IncomingCategory)
+@receiver(post_delete, sender=RevenueCategory)
+def delete_category_rollups(instance, **kwargs):
+    """Drop the rollups of a deleted category, whose records were deleted in cascade."""
+    MonthlyRollup.objects.filter(category_id=instance.id).delete()
@@ -1 +1,2 @@
+from .jobs import *
 from .send_email import *
@@ -0,0 +1,42 @@
+from functools import cache
+
+from django.template import Template
+from django.template.loader import get_template
+from django.utils import translation
+
+ALERT_EMAIL_TEXT_TEMPLATE = "budget/emails/alert.txt"
+ALERT_EMAIL_HTML_TEMPLATE = "budget/emails/alert.html"
+ALERT_EMAIL_LANGUAGE = "pt-br"
+
+
+@cache
+def get_alert_email_templates() -> tuple[Template, Template]:
+    """Load and compile the alert email templates once per process.
+
+    Returns:
+    -------
+        tuple[Template, Template]: The plain-text and the HTML templates.
+    """
+    return get_template(ALERT_EMAIL_TEXT_TEMPLATE), get_template(ALERT_EMAIL_HTML_TEMPLATE)
+
+
+def render_alert_email(alert: dict) -> tuple[str, str, str]:
+    """Render the subject and the plain-text and HTML bodies of an alert email.
+
+    Dates and amounts are formatted for pt-br, e.g. ``18/10/2026`` and ``R$ 1.200,00``.
+
+    Args:
+    ----
+        alert (dict): The ``name``, ``expiration_date`` and ``amount`` of the revenue.
+
+    Returns:
+    -------
+        tuple[str, str, str]: The subject, the plain-text body and the HTML body.
+    """
+    text_template, html_template = get_alert_email_templates()
+    with translation.override(ALERT_EMAIL_LANGUAGE):
+        return (
+            f"Alerta de despesa {alert['name']} - GammaBudget",
+            text_template.render(alert),
+            html_template.render(alert),
+        )
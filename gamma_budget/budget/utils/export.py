@@ -0,0 +1,160 @@
+import csv
+import io
+import json
+import zlib
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from typing import Any
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+# Encoded output is sent in chunks of about this many bytes.
+EXPORT_BUFFER_SIZE = 64 * 1024
+
+
+def csv_chunks(rows: Iterable[dict[str, Any]], columns: tuple[str, ...]) -> Iterator[bytes]:
+    """Write rows as CSV, yielding the header at once and then chunks of about ``EXPORT_BUFFER_SIZE`` bytes.
+
+    Args:
+    ----
+        rows (Iterable[dict[str, Any]]): The rows; keys missing from a row are written empty.
+        columns (tuple[str, ...]): The header and the order of the columns.
+
+    Yields:
+    ------
+        bytes: UTF-8 encoded CSV.
+    """
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns, extrasaction="ignore")
+    writer.writeheader()
+    # The header goes out before the first row is read.
+    yield _drain(buffer)
+    for row in rows:
+        writer.writerow(row)
+        if buffer.tell() >= EXPORT_BUFFER_SIZE:
+            yield _drain(buffer)
+    yield _drain(buffer)
+
+
+def _drain(buffer: io.StringIO) -> bytes:
+    value = buffer.getvalue().encode()
+    buffer.seek(0)
+    buffer.truncate()
+    return value
+
+
+def ndjson_chunks(rows: Iterable[dict[str, Any]]) -> Iterator[bytes]:
+    """Write rows as newline-delimited JSON, in chunks of about ``EXPORT_BUFFER_SIZE`` bytes.
+
+    Args:
+    ----
+        rows (Iterable[dict[str, Any]]): The rows.
+
+    Yields:
+    ------
+        bytes: UTF-8 encoded NDJSON.
+    """
+    buffer: list[str] = []
+    size = 0
+    for row in rows:
+        line = _ndjson_line(row)
+        buffer.append(line)
+        size += len(line)
+        if size >= EXPORT_BUFFER_SIZE:
+            yield "".join(buffer).encode()
+            buffer, size = [], 0
+    yield "".join(buffer).encode()
+
+
+def _ndjson_line(row: dict[str, Any]) -> str:
+    return json.dumps(row, cls=DjangoJSONEncoder, ensure_ascii=False) + "\n"
+
+
+def gzip_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Compress a stream of chunks into a single gzip member.
+
+    Args:
+    ----
+        chunks (Iterable[bytes]): The uncompressed chunks.
+
+    Yields:
+    ------
+        bytes: The gzip stream; chunks are skipped while the compressor buffers.
+    """
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    for index, chunk in enumerate(chunks):
+        compressed = compressor.compress(chunk)
+        if index == 0:
+            # Push the first chunk out instead of waiting for the compressor to fill up.
+            compressed += compressor.flush(zlib.Z_SYNC_FLUSH)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+async def acsv_chunks(rows: AsyncIterable[dict[str, Any]], columns: tuple[str, ...]) -> AsyncIterator[bytes]:
+    """Write rows read from an async iterable as CSV, like ``csv_chunks``.
+
+    Args:
+    ----
+        rows (AsyncIterable[dict[str, Any]]): The rows; keys missing from a row are written empty.
+        columns (tuple[str, ...]): The header and the order of the columns.
+
+    Yields:
+    ------
+        bytes: UTF-8 encoded CSV.
+    """
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns, extrasaction="ignore")
+    writer.writeheader()
+    yield _drain(buffer)
+    async for row in rows:
+        writer.writerow(row)
+        if buffer.tell() >= EXPORT_BUFFER_SIZE:
+            yield _drain(buffer)
+    yield _drain(buffer)
+
+
+async def andjson_chunks(rows: AsyncIterable[dict[str, Any]]) -> AsyncIterator[bytes]:
+    """Write rows read from an async iterable as newline-delimited JSON, like ``ndjson_chunks``.
+
+    Args:
+    ----
+        rows (AsyncIterable[dict[str, Any]]): The rows.
+
+    Yields:
+    ------
+        bytes: UTF-8 encoded NDJSON.
+    """
+    buffer: list[str] = []
+    size = 0
+    async for row in rows:
+        line = _ndjson_line(row)
+        buffer.append(line)
+        size += len(line)
+        if size >= EXPORT_BUFFER_SIZE:
+            yield "".join(buffer).encode()
+            buffer, size = [], 0
+    yield "".join(buffer).encode()
+
+
+async def agzip_chunks(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    """Compress an async stream of chunks into a single gzip member, like ``gzip_chunks``.
+
+    Args:
+    ----
+        chunks (AsyncIterable[bytes]): The uncompressed chunks.
+
+    Yields:
+    ------
+        bytes: The gzip stream; chunks are skipped while the compressor buffers.
+    """
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    first = True
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if first:
+            compressed += compressor.flush(zlib.Z_SYNC_FLUSH)
+            first = False
+        if compressed:
+            yield compressed
+    yield compressor.flush()
@@ -0,0 +1,106 @@
+from collections.abc import Callable
+from datetime import date
+from typing import Any
+
+from budget.domain.entities.job import IMPORT_STATEMENT, SEND_ALERT_EMAILS
+from budget.models import Job
+from budget.repositories.alert_delivery import AlertDeliveryRepository
+from budget.repositories.job import JobQueueRepository
+from budget.utils.send_email import SendEmail
+from budget.utils.statements import delete_uploaded_statement, import_uploaded_statement
+
+
+class JobRetryError(Exception):
+    """Raised by a job handler to retry the job, optionally with a narrower payload.
+
+    Args:
+    ----
+        message (str): The error stored on the job.
+        payload (dict[str, Any] | None): The payload of the next attempt.
+    """
+
+    def __init__(self, message: str, payload: dict[str, Any] | None = None):
+        super().__init__(message)
+        self.payload = payload
+
+
+def send_alert_emails(payload: dict[str, Any]) -> dict[str, Any]:
+    """Send the alert emails of a date and retry only the recipients not delivered yet.
+
+    The job fails while any delivery of the date is pending, claimed by a worker or failed
+    with attempts left, so an attempt that could not reach the email server or found the
+    deliveries leased elsewhere is retried instead of reported as done.
+
+    Args:
+    ----
+        payload (dict[str, Any]): ``alert_date`` in ISO format and optionally ``recipients``.
+
+    Returns:
+    -------
+        dict[str, Any]: The delivery outcome of each alert.
+    """
+    alert_date = date.fromisoformat(payload["alert_date"])
+    results = SendEmail().send_alerts(alert_date, payload.get("recipients"))
+    undelivered = AlertDeliveryRepository().get_undelivered_recipients(alert_date, payload.get("recipients"))
+    if undelivered:
+        failed = sum(not result.sent for result in results)
+        raise JobRetryError(
+            f"{len(undelivered)} alert recipients are not delivered yet; {failed} of {len(results)} emails failed.",
+            payload={**payload, "recipients": undelivered},
+        )
+    return {"results": [result.to_dict() for result in results]}
+
+
+JOB_HANDLERS: dict[str, Callable[[dict[str, Any]], Any]] = {
+    SEND_ALERT_EMAILS: send_alert_emails,
+    IMPORT_STATEMENT: import_uploaded_statement,
+}
+
+# Called with the payload once a job succeeded or failed for good, to release what it holds.
+JOB_CLEANUPS: dict[str, Callable[[dict[str, Any]], None]] = {
+    IMPORT_STATEMENT: delete_uploaded_statement,
+}
+
+
+def run_job(job: Job, queue: JobQueueRepository | None = None) -> bool:
+    """Run a claimed job with its handler and record the outcome.
+
+    A ``ValueError`` means the payload is invalid, e.g. a statement that cannot be parsed,
+    and fails the same way on every attempt, so the job fails without a retry. Once the
+    job will not run again, its cleanup from ``JOB_CLEANUPS`` is called.
+
+    Args:
+    ----
+        job (Job): The job returned by JobQueueRepository.claim_job.
+        queue (JobQueueRepository | None): The queue the job was claimed from.
+
+    Returns:
+    -------
+        bool: True if the job succeeded.
+    """
+    queue = queue or JobQueueRepository()
+    handler = JOB_HANDLERS.get(job.kind)
+    if handler is None:
+        queue.fail_job(job, f"Unknown job kind: {job.kind}", retry=False)
+        return False
+    finished = True
+    try:
+        try:
+            result = handler(job.payload)
+        except JobRetryError as e:
+            finished = job.attempts >= job.max_attempts
+            queue.fail_job(job, str(e), payload=e.payload)
+            return False
+        except ValueError as e:
+            queue.fail_job(job, f"{e.__class__.__name__}: {e}", retry=False)
+            return False
+        except Exception as e:
+            finished = job.attempts >= job.max_attempts
+            queue.fail_job(job, f"{e.__class__.__name__}: {e}")
+            return False
+        queue.complete_job(job, result)
+        return True
+    finally:
+        cleanup = JOB_CLEANUPS.get(job.kind)
+        if finished and cleanup is not None:
+            cleanup(job.payload)
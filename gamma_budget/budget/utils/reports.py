@@ -0,0 +1,173 @@
+import datetime
+import subprocess
+from functools import cache
+from pathlib import PurePosixPath
+
+from budget.domain.entities.report import MonthlyReport
+from budget.repositories.report import MonthlyReportRepository, get_report_user_ids
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import storages
+from django.template import Template
+from django.template.loader import get_template
+from django.utils import translation
+
+MONTHLY_REPORT_TEMPLATE = "budget/reports/monthly.html"
+MONTHLY_REPORT_LANGUAGE = "pt-br"
+# Part of the name of the cached PDFs; bump it when the template changes so they are rendered again.
+MONTHLY_REPORT_VERSION = 1
+
+
+@cache
+def get_monthly_report_template() -> Template:
+    """Load and compile the monthly report template once per process.
+
+    Returns:
+    -------
+        Template: The HTML template.
+    """
+    return get_template(MONTHLY_REPORT_TEMPLATE)
+
+
+def render_report_html(report: MonthlyReport) -> str:
+    """Render a monthly report as an HTML page, formatted for pt-br.
+
+    Args:
+    ----
+        report (MonthlyReport): The report.
+
+    Returns:
+    -------
+        str: The HTML page.
+    """
+    context = {**report.to_dict(), "month": report.month}
+    with translation.override(MONTHLY_REPORT_LANGUAGE):
+        return get_monthly_report_template().render(context)
+
+
+def html_to_pdf(html: str) -> bytes:
+    """Convert an HTML page to PDF with ``wkhtmltopdf``.
+
+    Args:
+    ----
+        html (str): The HTML page.
+
+    Returns:
+    -------
+        bytes: The PDF document.
+
+    Raises:
+    ------
+        RuntimeError: If ``wkhtmltopdf`` fails or takes longer than ``REPORT_RENDER_TIMEOUT_SECONDS``.
+    """
+    command = [settings.WKHTMLTOPDF_CMD, "--quiet", "--encoding", "utf-8", "-", "-"]
+    try:
+        process = subprocess.run(command, input=html.encode(), capture_output=True, timeout=settings.REPORT_RENDER_TIMEOUT_SECONDS)
+    except (OSError, subprocess.TimeoutExpired) as e:
+        raise RuntimeError(f"Could not run wkhtmltopdf: {e}") from e
+    if process.returncode != 0 or not process.stdout:
+        raise RuntimeError(f"wkhtmltopdf failed: {process.stderr.decode(errors='replace').strip()}")
+    return process.stdout
+
+
+def report_pdf_path(report: MonthlyReport) -> str:
+    """Return the path in ``REPORT_STORAGE`` of the cached PDF of a report.
+
+    The name holds the content hash of the report, so a month whose data changed gets
+    a new file while an unchanged month keeps being served from the cache.
+
+    Args:
+    ----
+        report (MonthlyReport): The report.
+
+    Returns:
+    -------
+        str: The path of the PDF.
+    """
+    name = f"{report.month:%Y-%m}-v{MONTHLY_REPORT_VERSION}-{report.content_hash}.pdf"
+    return str(PurePosixPath(settings.REPORT_CACHE_DIR) / str(report.user_id) / name)
+
+
+def get_report_pdf(report: MonthlyReport) -> tuple[str, bool]:
+    """Return the cached PDF of a report, rendering it if the month's data changed.
+
+    PDFs of older data of the month are left in place, since a concurrent request may
+    be about to serve one of them; ``prune_report_pdfs`` deletes them at month close.
+
+    Args:
+    ----
+        report (MonthlyReport): The report.
+
+    Returns:
+    -------
+        tuple[str, bool]: The path of the PDF in ``REPORT_STORAGE`` and whether it was rendered now.
+    """
+    storage = storages[settings.REPORT_STORAGE]
+    path = report_pdf_path(report)
+    if storage.exists(path):
+        return path, False
+    pdf = html_to_pdf(render_report_html(report))
+    saved = storage.save(path, ContentFile(pdf))
+    if saved != path:
+        # Another process stored the same report meanwhile.
+        storage.delete(saved)
+    return path, True
+
+
+def prune_report_pdfs(report: MonthlyReport, path: str) -> int:
+    """Delete the PDFs of a month stored before the current one.
+
+    Files written after the current one, by a request that read newer data, are kept.
+
+    Args:
+    ----
+        report (MonthlyReport): The report.
+        path (str): The path of its current PDF in ``REPORT_STORAGE``.
+
+    Returns:
+    -------
+        int: The number of PDFs deleted.
+    """
+    storage = storages[settings.REPORT_STORAGE]
+    current = PurePosixPath(path)
+    current_modified = storage.get_modified_time(path)
+    _, files = storage.listdir(str(current.parent))
+    stale = [
+        str(current.parent / name)
+        for name in files
+        if name.startswith(f"{report.month:%Y-%m}-")
+        and name != current.name
+        and storage.get_modified_time(str(current.parent / name)) <= current_modified
+    ]
+    for stale_path in stale:
+        storage.delete(stale_path)
+    return len(stale)
+
+
+def generate_monthly_reports(month: datetime.date, user_ids: list[int] | None = None) -> dict[str, int | str]:
+    """Render the PDFs of a month that are not cached yet and delete the older ones.
+
+    Meant to run at month close, so the first downloads are served from the cache.
+
+    Args:
+    ----
+        month (datetime.date): A day of the month.
+        user_ids (list[int] | None): The users; defaults to every user with records in the month.
+
+    Returns:
+    -------
+        dict[str, int | str]: The month and the number of reports rendered, already cached and failed.
+    """
+    month = month.replace(day=1)
+    repository = MonthlyReportRepository()
+    counts = {"rendered": 0, "cached": 0, "failed": 0}
+    for user_id in get_report_user_ids(month) if user_ids is None else user_ids:
+        report = repository.get_monthly_report(user_id, month)
+        try:
+            path, rendered = get_report_pdf(report)
+        except RuntimeError:
+            counts["failed"] += 1
+            continue
+        prune_report_pdfs(report, path)
+        counts["rendered" if rendered else "cached"] += 1
+    return {"month": f"{month:%Y-%m}", **counts}
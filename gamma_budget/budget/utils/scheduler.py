@@ -0,0 +1,335 @@
+import random
+import time
+from collections.abc import Callable
+from datetime import UTC, date, datetime, timedelta, tzinfo
+from typing import Any
+
+from budget.domain.use_cases import AlertSendEmailUseCase
+from budget.domain.use_cases.base.base import AbstractBaseOutput
+from budget.models import ScheduledRun
+from budget.repositories.recurring import RecurringExpandRepository
+from budget.repositories.rollup import rebuild_monthly_rollups
+from budget.repositories.scheduled_run import ScheduledRunRepository
+from budget.utils.reports import generate_monthly_reports
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils import timezone
+
+
+class Interval:
+    """Trigger that fires every ``seconds`` seconds.
+
+    The slots are aligned to the Unix epoch, so every scheduler computes the same slots.
+
+    Args:
+    ----
+        seconds (int): The length of the interval.
+    """
+
+    def __init__(self, seconds: int):
+        if seconds <= 0:
+            raise ValueError("The interval must be positive.")
+        self.seconds = seconds
+
+    def next_after(self, moment: datetime) -> datetime:
+        """Return the first slot after a moment.
+
+        Args:
+        ----
+            moment (datetime): An aware datetime.
+
+        Returns:
+        -------
+            datetime: The next slot.
+        """
+        timestamp = int(moment.timestamp()) // self.seconds * self.seconds + self.seconds
+        return datetime.fromtimestamp(timestamp, tz=UTC)
+
+    def __str__(self):
+        return f"every {self.seconds}s"
+
+
+class Cron:
+    """Trigger for a five-field cron expression: minute, hour, day of month, month and day of week.
+
+    Fields accept ``*``, numbers, ranges (``1-5``), lists (``1,15``) and steps (``*/10``);
+    Sunday is 0 or 7. As in cron, when both day fields are restricted a day matching
+    either of them fires.
+
+    Args:
+    ----
+        expression (str): The cron expression.
+        tz (tzinfo | None): The time zone of the expression. Defaults to ``TIME_ZONE``.
+    """
+
+    RANGES = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+
+    def __init__(self, expression: str, tz: tzinfo | None = None):
+        fields = expression.split()
+        if len(fields) != len(self.RANGES):
+            raise ValueError(f"Expected 5 fields in cron expression {expression!r}.")
+        self.expression = expression
+        self.tz = tz
+        self.minutes, self.hours, self.days, self.months, weekdays = (
+            self._parse_field(field, low, high) for field, (low, high) in zip(fields, self.RANGES, strict=True)
+        )
+        self.weekdays = {weekday % 7 for weekday in weekdays}
+        self.any_day = fields[2] == "*"
+        self.any_weekday = fields[4] == "*"
+
+    @staticmethod
+    def _parse_field(field: str, low: int, high: int) -> set[int]:
+        values: set[int] = set()
+        for part in field.split(","):
+            part, _, step = part.partition("/")
+            if part == "*":
+                start, end = low, high
+            elif "-" in part:
+                start, end = (int(bound) for bound in part.split("-", 1))
+            else:
+                start = end = int(part)
+                if step:
+                    end = high
+            if not low <= start <= end <= high:
+                raise ValueError(f"Cron field {field!r} is out of range {low}-{high}.")
+            values.update(range(start, end + 1, int(step) if step else 1))
+        return values
+
+    def _day_matches(self, moment: datetime) -> bool:
+        day = moment.day in self.days
+        weekday = (moment.weekday() + 1) % 7 in self.weekdays
+        if self.any_day or self.any_weekday:
+            return day and weekday
+        return day or weekday
+
+    def next_after(self, moment: datetime) -> datetime:
+        """Return the first minute after a moment that matches the expression.
+
+        Args:
+        ----
+            moment (datetime): An aware datetime.
+
+        Returns:
+        -------
+            datetime: The next matching minute.
+        """
+        tz = self.tz or timezone.get_default_timezone()
+        candidate = timezone.localtime(moment, tz).replace(tzinfo=None, second=0, microsecond=0) + timedelta(minutes=1)
+        # Skip whole months, days and hours that cannot match instead of testing every minute.
+        limit = candidate + timedelta(days=366 * 5)
+        while candidate < limit:
+            if candidate.month not in self.months:
+                candidate = (candidate.replace(day=1) + timedelta(days=32)).replace(day=1, hour=0, minute=0)
+            elif not self._day_matches(candidate):
+                candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+            elif candidate.hour not in self.hours:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+            elif candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+            else:
+                return timezone.make_aware(candidate, tz)
+        raise ValueError(f"Cron expression {self.expression!r} never matches.")
+
+    def __str__(self):
+        return f"cron {self.expression!r}"
+
+
+class Schedule:
+    """A task run periodically by the scheduler.
+
+    Args:
+    ----
+        name (str): The unique name of the schedule, stored in the run history.
+        trigger (Interval | Cron): When the task runs.
+        task (Callable[[], Any]): The task; its return value must be JSON serializable.
+        jitter (float): Maximum random delay in seconds added to every run.
+    """
+
+    def __init__(self, name: str, trigger: Interval | Cron, task: Callable[[], Any], jitter: float = 0):
+        self.name = name
+        self.trigger = trigger
+        self.task = task
+        self.jitter = jitter
+
+
+class TaskOutput(AbstractBaseOutput):
+    """Output of the use cases run by scheduled tasks."""
+
+    def __init__(self, *args, **kwargs):
+        self._data = None
+
+    @property
+    def data(self) -> dict:
+        return self._data
+
+    @data.setter
+    def data(self, value: dict):
+        self._data = value
+
+
+def enqueue_alert_emails() -> dict[str, str]:
+    """Enqueue the job that sends the alert emails due today.
+
+    Returns:
+    -------
+        dict[str, str]: The ID and status of the enqueued job.
+    """
+    AlertSendEmailUseCase.output_response = TaskOutput
+    output = AlertSendEmailUseCase(data={}).execute()
+    return {"job_id": str(output.data["job_id"]), "status": output.data["status"]}
+
+
+def expand_recurring_revenues() -> dict[str, Any]:
+    """Store the recurring revenues of every user up to ``RECURRING_HORIZON_DAYS`` ahead, one user per transaction.
+
+    Returns:
+    -------
+        dict[str, Any]: The number of revenues created and the horizon.
+    """
+    until = date.today() + timedelta(days=settings.RECURRING_HORIZON_DAYS)
+    return {"created": RecurringExpandRepository().expand_recurring(until), "until": until.isoformat()}
+
+
+def rebuild_rollups() -> dict[str, int]:
+    """Recompute the monthly rollups of every user, one user per transaction.
+
+    Returns:
+    -------
+        dict[str, int]: The number of rollup rows created.
+    """
+    return {"rows": rebuild_monthly_rollups()}
+
+
+def generate_previous_month_reports() -> dict[str, int | str]:
+    """Render the monthly report PDFs of the month that just closed.
+
+    Returns:
+    -------
+        dict[str, int | str]: The month and the number of reports rendered, already cached and failed.
+    """
+    return generate_monthly_reports(date.today().replace(day=1) - timedelta(days=1))
+
+
+def get_schedules() -> list[Schedule]:
+    """Return the periodic tasks run by the ``run_scheduler`` command.
+
+    Returns:
+    -------
+        list[Schedule]: The registered schedules.
+    """
+    return [
+        Schedule("alert_emails", Cron(settings.SCHEDULER_ALERT_EMAILS_CRON), enqueue_alert_emails, jitter=settings.SCHEDULER_JITTER_SECONDS),
+        Schedule(
+            "expand_recurring",
+            Cron(settings.SCHEDULER_EXPAND_RECURRING_CRON),
+            expand_recurring_revenues,
+            jitter=settings.SCHEDULER_JITTER_SECONDS,
+        ),
+        Schedule("rebuild_rollups", Cron(settings.SCHEDULER_REBUILD_ROLLUPS_CRON), rebuild_rollups, jitter=settings.SCHEDULER_JITTER_SECONDS),
+        Schedule(
+            "monthly_reports",
+            Cron(settings.SCHEDULER_MONTHLY_REPORTS_CRON),
+            generate_previous_month_reports,
+            jitter=settings.SCHEDULER_JITTER_SECONDS,
+        ),
+    ]
+
+
+class Scheduler:
+    """Run schedules at their time slots and record every run.
+
+    Tasks run one after the other in the scheduler process. The next slot of a schedule is
+    planned after its task finishes, so slots that passed during a long run are skipped
+    instead of piling up, and the run history rejects a slot already taken by another
+    scheduler.
+
+    Args:
+    ----
+        schedules (list[Schedule]): The schedules to run.
+        repository (ScheduledRunRepository | None): Where runs are recorded.
+        clock (Callable[[], datetime]): Returns the current aware datetime.
+    """
+
+    def __init__(
+        self,
+        schedules: list[Schedule],
+        repository: ScheduledRunRepository | None = None,
+        clock: Callable[[], datetime] = timezone.now,
+    ):
+        self.schedules = schedules
+        self.repository = repository or ScheduledRunRepository()
+        self.clock = clock
+        now = clock()
+        self.next_runs = {schedule.name: self._plan(schedule, now) for schedule in schedules}
+
+    def _plan(self, schedule: Schedule, after: datetime) -> tuple[datetime, datetime]:
+        slot = schedule.trigger.next_after(after)
+        return slot, slot + timedelta(seconds=random.uniform(0, schedule.jitter))
+
+    def run(self, schedule: Schedule, scheduled_for: datetime) -> ScheduledRun | None:
+        """Run a schedule for a time slot unless the slot is taken or a run is in progress.
+
+        Once the run is recorded, the runs of the schedule older than the retention period
+        are deleted.
+
+        Args:
+        ----
+            schedule (Schedule): The schedule to run.
+            scheduled_for (datetime): The time slot of the run.
+
+        Returns:
+        -------
+            ScheduledRun | None: The finished run, or None if the task did not run.
+        """
+        run = self.repository.start_run(schedule.name, scheduled_for)
+        if run is None:
+            return None
+        try:
+            result = schedule.task()
+        except Exception as e:
+            self.repository.finish_run(run, error=f"{e.__class__.__name__}: {e}")
+        else:
+            self.repository.finish_run(run, result=result)
+        self.repository.prune_runs(schedule.name)
+        return run
+
+    def run_pending(self) -> list[tuple[Schedule, ScheduledRun | None]]:
+        """Run every schedule whose next run is due.
+
+        Returns:
+        -------
+            list[tuple[Schedule, ScheduledRun | None]]: The schedules that were due and their runs.
+        """
+        ran = []
+        for schedule in self.schedules:
+            slot, due_at = self.next_runs[schedule.name]
+            if due_at > self.clock():
+                continue
+            ran.append((schedule, self.run(schedule, slot)))
+            self.next_runs[schedule.name] = self._plan(schedule, max(slot, self.clock()))
+        return ran
+
+    def seconds_until_next_run(self) -> float:
+        """Return how long to wait for the next due schedule.
+
+        Returns:
+        -------
+            float: The number of seconds, zero if a schedule is already due.
+        """
+        next_due = min(due_at for _, due_at in self.next_runs.values())
+        return max((next_due - self.clock()).total_seconds(), 0.0)
+
+    def run_forever(self, max_sleep: float, on_run: Callable[[Schedule, ScheduledRun | None], None] | None = None) -> None:
+        """Run the schedules until the process is stopped.
+
+        Args:
+        ----
+            max_sleep (float): Maximum seconds between two checks, which bounds the effect of clock changes.
+            on_run (Callable | None): Called with every schedule that was due and its run.
+        """
+        while True:
+            close_old_connections()
+            for schedule, run in self.run_pending():
+                if on_run:
+                    on_run(schedule, run)
+            time.sleep(min(self.seconds_until_next_run(), max_sleep))
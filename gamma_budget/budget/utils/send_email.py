@@ -1,94 +1,167 @@
 import os
 from datetime import date
 
-from budget.models.alert import Alert
-from budget.models.revenue import Revenue
-from django.core.mail import send_mail
-
-
-class SendEmail:  # noqa: D101
-    def _send_alert_email(
-        self,
-        subject,
-        from_email,
-        recipient_list,
-        revenue: dict,
-        fail_silently=False,
-        message=None,
-        auth_user=None,
-        auth_password=None,
-        connection=None,
-    ):
-        return send_mail(
-            subject,
-            message,
-            from_email,
-            recipient_list,
-            fail_silently,
-            auth_user,
-            auth_password,
-            connection,
-            html_message=self._get_html_message_alert_email(revenue),
-        )
+from budget.repositories.alert_delivery import AlertDeliveryRepository
+from budget.utils.alert_templates import render_alert_email
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
 
-    def _get_html_message_alert_email(self, revenue: dict):
-        return (
-            '<html lang="pt-br">'
-            "<header>"
-            '<meta charset="utf-8"/>'
-            "</header>"
-            "<body>"
-            "<p><strong>Alerta de despesa GammaBudget</strong></p>"
-            "<p>Despesa: " + revenue["name"] + "</p>"
-            "<p>Data de vencimento: " + str(revenue["expiration_date"]) + "</p>"
-            "<p><strong>Valor da despesa: {}</strong></p>".format(str(revenue["amount"]) + "</body></html>")
-        )
 
-    def _get_alerts_to_send_email_today(self):
-        alerts = Alert.objects.filter(alert_date__exact=date.today())
-        if not alerts:
-            print("No alerts to send email today.")
-            return None
-        alerts_data = []
-        for alert in alerts:
-            alert_data = {
-                "user_email": alert.user_email,
-                "revenue_id": alert.revenue.id,
-            }
-            alerts_data.append(alert_data)
-        return alerts_data
-
-    def _get_revenue(self, revenue_id):
-        revenue = Revenue.objects.get(id=revenue_id)
-        if not revenue:
-            print("Revenue was not found.")
-            return None
-        data = {
-            "name": revenue.name,
-            "expiration_date": revenue.expiration_date,
-            "amount": revenue.amount,
+class AlertEmailResult:
+    """
+    Class representing the delivery outcome of one alert email.
+
+    Attributes:
+    ----------
+        recipient (str): The email address of the alert.
+        revenue_id (str): The ID of the revenue the alert refers to.
+        sent (bool): Whether the email was accepted by the email backend.
+        error (str | None): The error raised while sending, if any.
+    """
+
+    def __init__(self, recipient: str, revenue_id: str, sent: bool, error: str | None = None) -> None:
+        """
+        Initialize the result.
+
+        Args:
+        ----
+            recipient (str): The email address of the alert.
+            revenue_id (str): The ID of the revenue the alert refers to.
+            sent (bool): Whether the email was accepted by the email backend.
+            error (str | None): The error raised while sending, if any.
+        """
+        self.recipient = recipient
+        self.revenue_id = revenue_id
+        self.sent = sent
+        self.error = error
+
+    def to_dict(self) -> dict:
+        """
+        Convert the result to a dictionary.
+
+        Returns:
+        -------
+            dict: A dictionary representation of the result.
+        """
+        return {
+            "recipient": self.recipient,
+            "revenue_id": str(self.revenue_id),
+            "sent": self.sent,
+            "error": self.error,
         }
-        return data
 
-    def _send_email(self, alert: dict):
-        revenue = {}
-        revenue = self._get_revenue(alert.get("revenue_id"))
-        self._send_alert_email(
-            subject=f"Alerta de despesa `{revenue.get('name')} - GammaBudget",
+
+class SendEmail:
+    """Send the alert emails due today.
+
+    Every alert due on a date gets a row in the ``AlertDelivery`` ledger. The sender claims
+    the pending rows in batches, together with the alert and revenue data, and records the
+    outcome of each email, so running the dispatch again or on several workers at once
+    never sends an alert twice. Every email goes through one reused email backend and each
+    batch of ``ALERT_EMAIL_BATCH_SIZE`` messages is sent over a single SMTP session, so the
+    number of handshakes grows with the number of batches instead of the number of alerts.
+    """
+
+    def __init__(self, connection=None, batch_size: int | None = None):
+        """
+        Initialize the sender.
+
+        Args:
+        ----
+            connection: An open email backend to reuse. Defaults to ``get_connection()``.
+            batch_size (int | None): The number of messages sent per SMTP session.
+        """
+        self.connection = connection
+        self.batch_size = batch_size or settings.ALERT_EMAIL_BATCH_SIZE
+
+    def _build_message(self, alert: dict) -> EmailMultiAlternatives:
+        subject, text, html = render_alert_email(alert)
+        message = EmailMultiAlternatives(
+            subject=subject,
+            body=text,
             from_email=os.getenv("EMAIL_HOST_USER"),
-            recipient_list=[alert.get("user_email")],
-            revenue=revenue,
+            to=[alert["user_email"]],
+            connection=self.connection,
         )
+        message.attach_alternative(html, "text/html")
+        return message
+
+    def _send_batch(self, batch: list[tuple[dict, EmailMultiAlternatives]]) -> tuple[list[AlertEmailResult], bool]:
+        # SMTP transmits one message at a time anyway, so handing the messages to the open
+        # session one by one costs no extra round trip and tells which recipient failed.
+        try:
+            self.connection.open()
+        except Exception as e:
+            return self._fail_all(batch, f"Could not connect to the email server: {e}"), False
+        results = []
+        try:
+            for index, (alert, message) in enumerate(batch):
+                try:
+                    sent = bool(self.connection.send_messages([message]))
+                except Exception as e:
+                    results.append(AlertEmailResult(alert["user_email"], alert["revenue_id"], sent=False, error=str(e)))
+                    # The session may be broken after a failure; start a new one for the rest of the batch.
+                    try:
+                        self.connection.close()
+                        self.connection.open()
+                    except Exception as reconnect_error:
+                        results.extend(self._fail_all(batch[index + 1 :], f"Could not reconnect to the email server: {reconnect_error}"))
+                        return results, False
+                    continue
+                results.append(AlertEmailResult(alert["user_email"], alert["revenue_id"], sent=sent))
+        finally:
+            self.connection.close()
+        return results, True
+
+    def _fail_all(self, batch: list[tuple[dict, EmailMultiAlternatives]], error: str) -> list[AlertEmailResult]:
+        return [AlertEmailResult(alert["user_email"], alert["revenue_id"], sent=False, error=error) for alert, _ in batch]
 
-    def send_today_alerts(self):
+    def send_today_alerts(self) -> list[AlertEmailResult]:
+        """
+        Send the emails of every alert due today.
+
+        Returns:
+        -------
+            list[AlertEmailResult]: The delivery outcome of each alert.
+        """
+        return self.send_alerts(date.today())
+
+    def send_alerts(self, alert_date: date, recipients: list[str] | None = None) -> list[AlertEmailResult]:
+        """
+        Send the emails of the alerts due on a date.
+
+        Args:
+        ----
+            alert_date (date): The date of the alerts.
+            recipients (list[str] | None): Only send to these addresses, e.g. when retrying failures.
+
+        Returns:
+        -------
+            list[AlertEmailResult]: The delivery outcome of each alert.
+        """
         print("Checking for alerts to send email...")
-        alerts = self._get_alerts_to_send_email_today()
-        print("ALERTS: ", alerts)
-        if not alerts:
-            return None
-        for alert in alerts:
-            email_sent = self._send_email(alert)
-            if not email_sent:
-                print("Email sent successfully to {}".format(alert.get("user_email")))
+        ledger = AlertDeliveryRepository()
+        ledger.create_deliveries(alert_date, recipients)
+        results: list[AlertEmailResult] = []
+        attempted: set = set()
+        while deliveries := ledger.claim_deliveries(alert_date, self.batch_size, recipients, exclude=attempted):
+            if self.connection is None:
+                self.connection = get_connection()
+            batch_results, connected = self._send_batch([(delivery, self._build_message(delivery)) for delivery in deliveries])
+            ledger.mark_sent([delivery["id"] for delivery, result in zip(deliveries, batch_results, strict=True) if result.sent])
+            for delivery, result in zip(deliveries, batch_results, strict=True):
+                if not result.sent:
+                    ledger.mark_failed(delivery["id"], result.error or "The email backend did not accept the message.")
+            attempted.update(delivery["id"] for delivery in deliveries)
+            results.extend(batch_results)
+            if not connected:
+                # Leave the remaining deliveries pending for the next run instead of failing them one by one.
+                break
+        if not results:
+            print("No alerts to send email today.")
+        for result in results:
+            if result.sent:
+                print(f"Email sent successfully to {result.recipient}")
             else:
-                print("Failed to send email to {}".format(alert.get("user_email")))
+                print(f"Failed to send email to {result.recipient}: {result.error}")
+        return results
@@ -0,0 +1,210 @@
+import csv
+import html
+import io
+import re
+from collections.abc import Iterator
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from functools import partial
+from itertools import chain
+from typing import IO, Any
+
+from budget.domain.entities.statement import CSV, OFX, StatementImportResult, StatementLine
+from budget.repositories.statement import StatementImportRepository
+from django.conf import settings
+from django.core.files.storage import storages
+
+# Header names accepted for each CSV column, compared case-insensitively.
+CSV_COLUMNS = {
+    "date": ("date", "data"),
+    "description": ("description", "descrição", "descricao", "histórico", "historico", "memo"),
+    "amount": ("amount", "valor"),
+    "bank_id": ("id", "fitid"),
+}
+CSV_DATE_FORMATS = ("%Y-%m-%d", "%d/%m/%Y", "%d/%m/%y")
+
+# OFX is read in chunks; only the text after the last complete transaction is kept.
+OFX_CHUNK_SIZE = 64 * 1024
+OFX_TRANSACTION = re.compile(r"<STMTTRN>(.*?)</STMTTRN>", re.DOTALL | re.IGNORECASE)
+OFX_FIELD = re.compile(r"<(\w+)>([^<\r\n]*)")
+
+# Number of unreadable lines described in the import result.
+MAX_REPORTED_ERRORS = 100
+
+
+def parse_amount(text: str) -> Decimal:
+    """Parse an amount written with either a comma or a dot as decimal separator.
+
+    Args:
+    ----
+        text (str): The amount, such as ``-1.234,56``, ``1234.56`` or ``R$ 10,00``.
+
+    Returns:
+    -------
+        Decimal: The amount rounded to the cent.
+
+    Raises:
+    ------
+        ValueError: If the text is not an amount.
+    """
+    text = text.replace("R$", "").replace(" ", "").strip()
+    if "," in text:
+        # The separator that comes last is the decimal one; the other groups thousands.
+        text = text.replace(".", "").replace(",", ".") if text.rfind(",") > text.rfind(".") else text.replace(",", "")
+    try:
+        return Decimal(text).quantize(Decimal("0.01"))
+    except InvalidOperation:
+        raise ValueError(f"Invalid amount {text!r}.") from None
+
+
+def parse_date(text: str, formats: tuple[str, ...] = CSV_DATE_FORMATS) -> date:
+    """Parse a date in the first of the given formats that matches.
+
+    Args:
+    ----
+        text (str): The date.
+        formats (tuple[str, ...]): The ``strptime`` formats to try.
+
+    Returns:
+    -------
+        date: The parsed date.
+
+    Raises:
+    ------
+        ValueError: If no format matches.
+    """
+    for date_format in formats:
+        try:
+            return datetime.strptime(text.strip(), date_format).date()
+        except ValueError:
+            continue
+    raise ValueError(f"Invalid date {text!r}.")
+
+
+class StatementReader:
+    """Read the transactions of a bank statement one at a time.
+
+    The statement is never loaded whole: CSV files are read line by line and OFX files
+    in chunks of ``OFX_CHUNK_SIZE`` characters. Lines that cannot be read are skipped
+    and described in ``errors``, up to ``MAX_REPORTED_ERRORS``.
+
+    Args:
+    ----
+        stream (IO[str]): The statement, opened in text mode.
+        statement_format (str): The format of the statement: csv or ofx.
+    """
+
+    def __init__(self, stream: IO[str], statement_format: str):
+        if statement_format not in (CSV, OFX):
+            raise ValueError(f"Unknown statement format {statement_format!r}.")
+        self.stream = stream
+        self.statement_format = statement_format
+        self.errors: list[str] = []
+
+    def __iter__(self) -> Iterator[StatementLine]:
+        return self._read_csv() if self.statement_format == CSV else self._read_ofx()
+
+    def _error(self, message: str) -> None:
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(message)
+
+    def _read_csv(self) -> Iterator[StatementLine]:
+        header = self.stream.readline()
+        delimiter = ";" if header.count(";") > header.count(",") else ","
+        rows = csv.reader(chain([header], self.stream), delimiter=delimiter)
+        names = [name.strip().casefold() for name in next(rows, [])]
+        date_column, description_column, amount_column, id_column = (
+            next((names.index(name) for name in aliases if name in names), None) for aliases in CSV_COLUMNS.values()
+        )
+        if date_column is None or description_column is None or amount_column is None:
+            raise ValueError("The CSV header must have date, description and amount columns.")
+        for row in rows:
+            if not any(row):
+                continue
+            try:
+                bank_id = row[id_column].strip() if id_column is not None else None
+                yield StatementLine(
+                    line_number=rows.line_num,
+                    date=parse_date(row[date_column]),
+                    amount=parse_amount(row[amount_column]),
+                    description=row[description_column].strip(),
+                    bank_id=bank_id or None,
+                )
+            except (IndexError, ValueError) as e:
+                self._error(f"Line {rows.line_num}: {e}")
+
+    def _read_ofx(self) -> Iterator[StatementLine]:
+        buffer = ""
+        number = 0
+        for chunk in iter(partial(self.stream.read, OFX_CHUNK_SIZE), ""):
+            buffer += chunk
+            end = 0
+            for match in OFX_TRANSACTION.finditer(buffer):
+                end = match.end()
+                number += 1
+                fields = {tag.upper(): html.unescape(value.strip()) for tag, value in OFX_FIELD.findall(match.group(1))}
+                try:
+                    yield StatementLine(
+                        line_number=number,
+                        date=parse_date(fields.get("DTPOSTED", "")[:8], ("%Y%m%d",)),
+                        amount=parse_amount(fields.get("TRNAMT", "")),
+                        description=fields.get("MEMO") or fields.get("NAME") or "",
+                        bank_id=fields.get("FITID") or None,
+                    )
+                except ValueError as e:
+                    self._error(f"Transaction {number}: {e}")
+            buffer = buffer[end:]
+            start = buffer.upper().find("<STMTTRN>")
+            buffer = buffer[start:] if start != -1 else buffer[-len("<STMTTRN>") :]
+
+
+def import_statement_file(
+    user_id: int, stream: IO[str], statement_format: str, rules: list[dict] | None = None, batch_size: int | None = None
+) -> StatementImportResult:
+    """Import a statement read from a text stream.
+
+    Args:
+    ----
+        user_id (int): The ID of the user.
+        stream (IO[str]): The statement, opened in text mode.
+        statement_format (str): The format of the statement: csv or ofx.
+        rules (list[dict] | None): The category rules, each with a ``pattern`` and a ``category`` name.
+        batch_size (int | None): The number of lines inserted per batch. Defaults to ``IMPORT_BATCH_SIZE``.
+
+    Returns:
+    -------
+        StatementImportResult: The outcome of the import, with the lines that could not be read.
+    """
+    reader = StatementReader(stream, statement_format)
+    result = StatementImportRepository(batch_size).import_statement(user_id, reader, rules or [])
+    result.errors = reader.errors
+    return result
+
+
+def import_uploaded_statement(payload: dict[str, Any]) -> dict[str, Any]:
+    """Import a statement saved by the upload endpoint.
+
+    The file is kept for the retries of the job and deleted by ``delete_uploaded_statement``.
+
+    Args:
+    ----
+        payload (dict[str, Any]): ``user_id``, ``path`` in ``IMPORT_STORAGE``, ``format`` and ``rules``.
+
+    Returns:
+    -------
+        dict[str, Any]: The outcome of the import.
+    """
+    with storages[settings.IMPORT_STORAGE].open(payload["path"], "rb") as file:
+        stream = io.TextIOWrapper(file, encoding=settings.IMPORT_ENCODING, errors="replace", newline="")
+        result = import_statement_file(payload["user_id"], stream, payload["format"], payload.get("rules"))
+    return result.to_dict()
+
+
+def delete_uploaded_statement(payload: dict[str, Any]) -> None:
+    """Delete the file of a statement import that will not run again.
+
+    Args:
+    ----
+        payload (dict[str, Any]): The payload of the import job, with the ``path`` in ``IMPORT_STORAGE``.
+    """
+    storages[settings.IMPORT_STORAGE].delete(payload["path"])
@@ -1 +1,28 @@
-# Create your views here.
+import os
+
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import JsonResponse
+from django.views.decorators.http import require_GET
+from project.postgresql_pool.base import pool_stats
+
+
+@require_GET
+@staff_member_required
+def db_pool_metrics(request):
+    """
+    Report the usage of the database connection pools of the worker that served the request.
+
+    Every gunicorn worker has its own pools, so the response carries the ``pid`` of the
+    worker; scrape it several times to sample all of them. ``pools`` is empty unless
+    ``DB_POOL`` is enabled. Like the admin, only staff users may read it; other requests
+    are redirected to the admin login.
+
+    Args:
+    ----
+        request: HTTP request object.
+
+    Returns:
+    -------
+        JsonResponse: The process ID and the statistics of each pool.
+    """
+    return JsonResponse({"pid": os.getpid(), "pools": pool_stats()})
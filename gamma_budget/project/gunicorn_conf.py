@@ -0,0 +1,79 @@
+"""
+Gunicorn configuration for gamma_budget.
+
+Used by ``scripts/run.sh`` in the ``wsgi`` and ``asgi`` server modes. Every setting can
+be overridden with the environment variable named in its comment.
+
+For more information on this file, see
+https://docs.gunicorn.org/en/stable/settings.html
+"""
+
+import math
+import os
+from pathlib import Path
+
+CGROUP_ROOT = Path("/sys/fs/cgroup")
+
+
+def cpu_limit(cgroup_root: Path = CGROUP_ROOT) -> float:
+    """Return the number of CPUs the container may use.
+
+    The limit set by ``deploy.resources.limits.cpus`` in ``docker-compose.yml`` is read
+    from the cgroup CPU quota (v2 ``cpu.max`` or v1 ``cpu.cfs_quota_us``); without a
+    quota the CPUs the process may run on are used.
+
+    Args:
+    ----
+        cgroup_root (Path): The mount point of the cgroup filesystem.
+
+    Returns:
+    -------
+        float: The number of CPUs, possibly fractional.
+    """
+    cpus = float(len(os.sched_getaffinity(0)))
+    try:
+        quota, period = (cgroup_root / "cpu.max").read_text().split()
+    except (OSError, ValueError):
+        try:
+            quota = (cgroup_root / "cpu" / "cpu.cfs_quota_us").read_text().strip()
+            period = (cgroup_root / "cpu" / "cpu.cfs_period_us").read_text().strip()
+        except OSError:
+            return cpus
+    if quota in ("max", "-1"):
+        return cpus
+    return min(int(quota) / int(period), cpus)
+
+
+def default_workers(cpus: float) -> int:
+    """Return the usual ``2 * cores + 1`` workers for a CPU limit, counting partial cores as whole."""
+    return 2 * max(math.ceil(cpus), 1) + 1
+
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.environ.get("GUNICORN_WORKERS", 0)) or default_workers(cpu_limit())
+# Threads only apply to the WSGI mode; the ASGI mode overrides worker_class with uvicorn.
+threads = int(os.environ.get("GUNICORN_THREADS", 2))
+worker_class = os.environ.get("GUNICORN_WORKER_CLASS", "gthread")
+
+# Import Django, and run budget.main.configure() from BudgetConfig.ready, once in the
+# master: the workers are forked with the app loaded and share its memory.
+preload_app = os.environ.get("GUNICORN_PRELOAD", "true").lower() == "true"
+reload = os.environ.get("GUNICORN_RELOAD", "false").lower() == "true"
+
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 60))
+graceful_timeout = int(os.environ.get("GUNICORN_GRACEFUL_TIMEOUT", 30))
+keepalive = int(os.environ.get("GUNICORN_KEEPALIVE", 5))
+# Recycle workers now and then so slow leaks cannot grow without bound.
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", 1000))
+max_requests_jitter = int(os.environ.get("GUNICORN_MAX_REQUESTS_JITTER", 100))
+
+accesslog = os.environ.get("GUNICORN_ACCESS_LOG", "-")
+errorlog = "-"
+loglevel = os.environ.get("GUNICORN_LOG_LEVEL", "info")
+
+
+def post_fork(server, worker):
+    """Drop any database connection inherited from the master so workers never share a socket."""
+    from django.db import connections
+
+    connections.close_all()
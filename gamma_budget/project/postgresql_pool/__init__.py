@@ -0,0 +1,5 @@
+"""
+PostgreSQL backend that checks connections out of an in-process psycopg pool.
+
+Enabled by ``DB_POOL=true``; see ``DATABASES`` in ``project/settings.py``.
+"""
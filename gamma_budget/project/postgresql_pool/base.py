@@ -0,0 +1,91 @@
+import threading
+from typing import Any, ClassVar
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.postgresql import base
+from psycopg import IsolationLevel
+from psycopg_pool import ConnectionPool
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """PostgreSQL connection that is taken from and given back to a psycopg ``ConnectionPool``.
+
+    The pool options are read from ``OPTIONS["pool"]``, as in Django 5.1's built-in pool
+    support, so moving to it later only means changing ``ENGINE``. There is one pool per
+    database alias and process, opened on the first checkout so that gunicorn workers
+    never share the connections of a pool created before fork. Closing the Django
+    connection at the end of a request returns it to the pool instead of disconnecting.
+    """
+
+    _pools: ClassVar[dict[str, ConnectionPool]] = {}
+    _pools_lock = threading.Lock()
+
+    @property
+    def pool(self) -> ConnectionPool:
+        """The pool of this database alias, created on first use."""
+        with self._pools_lock:
+            if self.alias not in self._pools:
+                if self.settings_dict["CONN_MAX_AGE"] != 0:
+                    raise ImproperlyConfigured("The connection pool does not support persistent connections; set CONN_MAX_AGE to 0.")
+                connect_kwargs = self.get_connection_params()
+                # Django sets the autocommit mode of every connection it checks out.
+                connect_kwargs["autocommit"] = True
+                self._pools[self.alias] = ConnectionPool(
+                    kwargs=connect_kwargs,
+                    open=False,
+                    check=ConnectionPool.check_connection if self.settings_dict["CONN_HEALTH_CHECKS"] else None,
+                    name=self.alias,
+                    **self.settings_dict["OPTIONS"].get("pool", {}),
+                )
+            return self._pools[self.alias]
+
+    def get_connection_params(self) -> dict[str, Any]:
+        conn_params = super().get_connection_params()
+        conn_params.pop("pool", None)
+        return conn_params
+
+    def get_new_connection(self, conn_params):
+        options = self.settings_dict["OPTIONS"]
+        try:
+            self.isolation_level = IsolationLevel(options.get("isolation_level", IsolationLevel.READ_COMMITTED))
+        except ValueError:
+            raise ImproperlyConfigured(
+                f"Invalid transaction isolation level {options['isolation_level']} specified. Use one of the psycopg.IsolationLevel values."
+            ) from None
+        pool = self.pool
+        pool.open()
+        connection = pool.getconn()
+        if "isolation_level" in options:
+            connection.isolation_level = self.isolation_level
+        return connection
+
+    def _close(self):
+        if self.connection is not None:
+            with self.wrap_database_errors:
+                self.pool.putconn(self.connection)
+                self.connection = None
+
+
+def pool_stats() -> dict[str, dict[str, Any]]:
+    """Return the usage of the connection pools of this process.
+
+    Besides the psycopg counters, every pool reports its ``saturation``, the share of
+    ``pool_max`` connections that are checked out, and ``checkout_wait_ms_avg``, the
+    average time a request waited for a connection. The counters are cumulative since
+    the pool was created.
+
+    Returns:
+    -------
+        dict[str, dict[str, Any]]: The statistics of each database alias with a pool.
+    """
+    stats = {}
+    for alias, pool in DatabaseWrapper._pools.items():
+        pool_stats = pool.get_stats()
+        in_use = pool_stats.get("pool_size", 0) - pool_stats.get("pool_available", 0)
+        requests = pool_stats.get("requests_num", 0)
+        stats[alias] = {
+            **pool_stats,
+            "saturation": round(in_use / pool.max_size, 4),
+            "checkout_wait_ms_avg": round(pool_stats.get("requests_wait_ms", 0) / requests, 3) if requests else 0.0,
+        }
+    return stats
@@ -94,7 +94,7 @@ WSGI_APPLICATION = "project.wsgi.application"
 # https://docs.djangoproject.com/en/5.0/ref/settings/#databases
 
 
-DATABASES = {
+DATABASES: dict[str, Any] = {
     "default": (
         dj_database_url.parse(os.environ.get("DATABASE_URL", ""))
         if "DATABASE_URL" in os.environ
@@ -115,6 +115,38 @@ DATABASES = {
     },
 }
 
+# Persistent connections are reused for DB_CONN_MAX_AGE seconds and checked before reuse.
+# DB_POOL=true replaces them with an in-process psycopg pool per worker (PostgreSQL only).
+# Under SERVER_MODE=asgi the sync database work of each request runs in its own thread, so
+# a persistent connection would be left open per request: connections are closed after
+# every request there, and DB_POOL is the way to reuse them.
+SERVER_MODE = os.environ.get("SERVER_MODE", "wsgi")
+DB_CONN_MAX_AGE = 0 if SERVER_MODE == "asgi" else int(os.environ.get("DB_CONN_MAX_AGE", 60))
+DB_CONN_HEALTH_CHECKS = os.environ.get("DB_CONN_HEALTH_CHECKS", "true").lower() == "true"
+DB_POOL = os.environ.get("DB_POOL", "false").lower() == "true"
+DB_POOL_MIN_SIZE = int(os.environ.get("DB_POOL_MIN_SIZE", 2))
+DB_POOL_MAX_SIZE = int(os.environ.get("DB_POOL_MAX_SIZE", 10))
+DB_POOL_TIMEOUT = float(os.environ.get("DB_POOL_TIMEOUT", 10))
+DB_POOL_MAX_IDLE = float(os.environ.get("DB_POOL_MAX_IDLE", 600))
+DB_POOL_MAX_LIFETIME = float(os.environ.get("DB_POOL_MAX_LIFETIME", 3600))
+
+DATABASES["default"]["CONN_MAX_AGE"] = DB_CONN_MAX_AGE
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = DB_CONN_HEALTH_CHECKS
+if DB_POOL and DATABASES["default"]["ENGINE"] == "django.db.backends.postgresql":
+    DATABASES["default"]["ENGINE"] = "project.postgresql_pool"
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"].setdefault("OPTIONS", {})["pool"] = {
+        "min_size": DB_POOL_MIN_SIZE,
+        "max_size": DB_POOL_MAX_SIZE,
+        "timeout": DB_POOL_TIMEOUT,
+        "max_idle": DB_POOL_MAX_IDLE,
+        "max_lifetime": DB_POOL_MAX_LIFETIME,
+    }
+
+
+# The incoming and revenue CRUD endpoints have async views, which wait on the database
+# without holding a thread; enable them when serving with SERVER_MODE=asgi.
+BUDGET_ASYNC_VIEWS = os.environ.get("BUDGET_ASYNC_VIEWS", "false").lower() == "true"
 
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
@@ -191,6 +223,10 @@ REST_FRAMEWORK: dict[str, Any] = {
     "PAGE_SIZE": 300,
 }
 
+# Keyset pagination for the budget list endpoints (?cursor=...&page_size=...)
+BUDGET_LIST_PAGE_SIZE = int(os.environ.get("BUDGET_LIST_PAGE_SIZE", 50))
+BUDGET_LIST_MAX_PAGE_SIZE = int(os.environ.get("BUDGET_LIST_MAX_PAGE_SIZE", REST_FRAMEWORK["PAGE_SIZE"]))
+
 if DEBUG:
     REST_FRAMEWORK["DEFAULT_AUTHENTICATION_CLASSES"].append("rest_framework.authentication.SessionAuthentication")
 
@@ -220,6 +256,61 @@ EMAIL_HOST = "smtp.gmail.com"
 EMAIL_PORT = 587
 EMAIL_HOST_PASSWORD = os.environ.get("EMAIL_HOST_PASSWORD", "")
 EMAIL_USE_TLS = True
+# Number of alert emails sent per send_messages() call over the shared SMTP connection
+ALERT_EMAIL_BATCH_SIZE = int(os.environ.get("ALERT_EMAIL_BATCH_SIZE", 100))
+# Seconds a worker holds the alert deliveries it claimed before others may take them over
+ALERT_DELIVERY_LEASE_SECONDS = int(os.environ.get("ALERT_DELIVERY_LEASE_SECONDS", 300))
+# Number of attempts after which a failed alert delivery is no longer retried
+ALERT_DELIVERY_MAX_ATTEMPTS = int(os.environ.get("ALERT_DELIVERY_MAX_ATTEMPTS", 5))
+
+# Background job queue (python manage.py run_worker)
+JOB_MAX_ATTEMPTS = int(os.environ.get("JOB_MAX_ATTEMPTS", 5))
+JOB_RETRY_BACKOFF_SECONDS = int(os.environ.get("JOB_RETRY_BACKOFF_SECONDS", 30))
+JOB_RETRY_MAX_BACKOFF_SECONDS = int(os.environ.get("JOB_RETRY_MAX_BACKOFF_SECONDS", 3600))
+JOB_LEASE_SECONDS = int(os.environ.get("JOB_LEASE_SECONDS", 600))
+JOB_POLL_INTERVAL_SECONDS = float(os.environ.get("JOB_POLL_INTERVAL_SECONDS", 5))
+
+# Days ahead of today that recurring revenues are stored for and projected over
+RECURRING_HORIZON_DAYS = int(os.environ.get("RECURRING_HORIZON_DAYS", 90))
+
+# Largest number of records accepted by the create-bulk endpoints
+BULK_CREATE_MAX_ITEMS = int(os.environ.get("BULK_CREATE_MAX_ITEMS", 5000))
+
+# Category lists are cached in each process for CATEGORY_CACHE_TTL_SECONDS and, when
+# CATEGORY_CACHE_ALIAS names one of CACHES, shared between processes through it
+CATEGORY_CACHE_ALIAS = os.environ.get("CATEGORY_CACHE_ALIAS", "")
+CATEGORY_CACHE_TTL_SECONDS = int(os.environ.get("CATEGORY_CACHE_TTL_SECONDS", 300))
+
+# Bank statement import (upload endpoint and python manage.py import_statements)
+IMPORT_BATCH_SIZE = int(os.environ.get("IMPORT_BATCH_SIZE", 1000))
+IMPORT_DEFAULT_CATEGORY = os.environ.get("IMPORT_DEFAULT_CATEGORY", "Outros")
+IMPORT_ENCODING = os.environ.get("IMPORT_ENCODING", "utf-8-sig")
+IMPORT_STORAGE = os.environ.get("IMPORT_STORAGE", "mediafiles")
+IMPORT_UPLOAD_DIR = os.environ.get("IMPORT_UPLOAD_DIR", "imports")
+
+# Rows fetched per round trip by the ledger export
+EXPORT_CHUNK_SIZE = int(os.environ.get("EXPORT_CHUNK_SIZE", 2000))
+
+# Monthly statements: PDFs rendered by wkhtmltopdf are cached in REPORT_STORAGE
+REPORT_STORAGE = os.environ.get("REPORT_STORAGE", "mediafiles")
+REPORT_CACHE_DIR = os.environ.get("REPORT_CACHE_DIR", "reports")
+REPORT_RENDER_TIMEOUT_SECONDS = int(os.environ.get("REPORT_RENDER_TIMEOUT_SECONDS", 60))
+WKHTMLTOPDF_CMD = os.environ.get("WKHTMLTOPDF_CMD", "wkhtmltopdf")
+
+# Longest window accepted by the forecast endpoint
+FORECAST_MAX_MONTHS = int(os.environ.get("FORECAST_MAX_MONTHS", 36))
+# Longest window, in days, accepted by the recurring revenue expansion and projection endpoints
+RECURRING_MAX_DAYS = int(os.environ.get("RECURRING_MAX_DAYS", 1096))
+
+# Periodic tasks (python manage.py run_scheduler); cron expressions use TIME_ZONE
+SCHEDULER_ALERT_EMAILS_CRON = os.environ.get("SCHEDULER_ALERT_EMAILS_CRON", "0 8 * * *")
+SCHEDULER_EXPAND_RECURRING_CRON = os.environ.get("SCHEDULER_EXPAND_RECURRING_CRON", "0 2 * * *")
+SCHEDULER_REBUILD_ROLLUPS_CRON = os.environ.get("SCHEDULER_REBUILD_ROLLUPS_CRON", "30 3 * * 0")
+SCHEDULER_MONTHLY_REPORTS_CRON = os.environ.get("SCHEDULER_MONTHLY_REPORTS_CRON", "0 5 1 * *")
+SCHEDULER_JITTER_SECONDS = int(os.environ.get("SCHEDULER_JITTER_SECONDS", 60))
+SCHEDULER_RUN_TIMEOUT_SECONDS = int(os.environ.get("SCHEDULER_RUN_TIMEOUT_SECONDS", 3600))
+SCHEDULER_RUN_RETENTION_DAYS = int(os.environ.get("SCHEDULER_RUN_RETENTION_DAYS", 30))
+SCHEDULER_MAX_SLEEP_SECONDS = float(os.environ.get("SCHEDULER_MAX_SLEEP_SECONDS", 60))
 
 # Cors configuration session
 CORS_ORIGIN_ALLOW_ALL = True
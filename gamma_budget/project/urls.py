@@ -16,6 +16,7 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 
+from core.views import db_pool_metrics
 from django.conf import settings
 from django.conf.urls.static import static
 from django.contrib import admin
@@ -42,6 +43,7 @@ urlpatterns = [
     path("o/", include("oauth2_provider.urls", namespace="oauth2_provider")),
     path("", include("core.api.urls.base_urls")),
     path("budget/", include("budget.api.urls.base_urls")),
+    path("metrics/db-pool/", db_pool_metrics, name="db-pool-metrics"),
     path("swagger<format>/", schema_view.without_ui(cache_timeout=0), name="schema-json"),
     path("swagger/", schema_view.with_ui("swagger", cache_timeout=0), name="schema-swagger-ui"),
     path("", schema_view.with_ui("swagger", cache_timeout=0), name="schema-swagger-ui"),
@@ -6,4 +6,21 @@
 python3 manage.py collectstatic --noinput
 python3 manage.py migrate
 # python3 manage.py createsuperuser --noinput --email ${DJANGO_SUPERUSER_EMAIL}
-python3 manage.py runserver 0.0.0.0:8000
+
+# SERVER_MODE selects how the application is served:
+#   wsgi (default) - gunicorn with threaded workers running project.wsgi
+#   asgi           - gunicorn with uvicorn workers running project.asgi
+#   dev            - Django's single-process development server, with autoreload
+# Workers, threads and timeouts are set in project/gunicorn_conf.py. exec makes gunicorn
+# PID 1, so docker stop and kill -HUP reach it and workers are replaced gracefully.
+case "${SERVER_MODE:-wsgi}" in
+    dev)
+        exec python3 manage.py runserver 0.0.0.0:8000
+        ;;
+    asgi)
+        exec gunicorn --config project/gunicorn_conf.py --worker-class uvicorn.workers.UvicornWorker project.asgi:application
+        ;;
+    *)
+        exec gunicorn --config project/gunicorn_conf.py project.wsgi:application
+        ;;
+esac
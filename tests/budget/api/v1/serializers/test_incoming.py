@@ -1,5 +1,6 @@
 import pytest
 from budget.api.v1.serializers.incoming import (
+    IncomingBulkCreateSerializer,
     IncomingCreateSerializer,
 )
 from budget.models.categories import IncomingCategory
@@ -93,3 +94,22 @@ def test_incoming_create_serializer():
 #     assert data["description"] == incoming.description
 #     assert data["amount"] == str(incoming.amount)
 #     assert data["category"] == str(incoming.category)
+
+
+def test_incoming_bulk_create_serializer_reports_errors_by_item():
+    valid = {"name": "Salário", "amount": "100.00", "category": "9d8d8ea1-48a0-4bbd-a6b5-63c7c1d2e1e7", "launch_date": "2024-01-05"}
+    serializer = IncomingBulkCreateSerializer(data={"items": [valid, {**valid, "amount": "abc"}, valid]})
+
+    assert not serializer.is_valid()
+    assert list(serializer.errors["items"]) == [1]
+    assert "amount" in serializer.errors["items"][1]
+
+
+@pytest.mark.django_db
+def test_incoming_bulk_create_serializer_reports_unknown_categories_by_item():
+    category = IncomingCategory.objects.create(name="Salário")
+    valid = {"name": "Salário", "amount": "100.00", "category": str(category.id), "launch_date": "2024-01-05"}
+    serializer = IncomingBulkCreateSerializer(data={"items": [valid, {**valid, "category": "9d8d8ea1-48a0-4bbd-a6b5-63c7c1d2e1e7"}]})
+
+    assert not serializer.is_valid()
+    assert serializer.errors == {"items": {1: {"category": ["Category not found."]}}}
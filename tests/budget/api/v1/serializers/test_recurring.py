@@ -0,0 +1,38 @@
+import pytest
+from budget.api.v1.serializers.recurring import RecurringExpandSerializer, RecurringProjectionQuerySerializer
+from rest_framework.test import APIClient
+
+
+@pytest.mark.parametrize(
+    ("serializer", "data", "field"),
+    [
+        (RecurringExpandSerializer, {"until": "9999-12-31"}, "until"),
+        (RecurringProjectionQuerySerializer, {"start": "2024-01-01", "end": "2025-01-02"}, "end"),
+    ],
+)
+def test_recurring_windows_are_capped(settings, serializer, data, field):
+    settings.RECURRING_MAX_DAYS = 365
+
+    instance = serializer(data=data)
+
+    assert not instance.is_valid()
+    assert field in instance.errors
+
+
+def test_recurring_projection_accepts_the_longest_window(settings):
+    settings.RECURRING_MAX_DAYS = 365
+
+    assert RecurringProjectionQuerySerializer(data={"start": "2024-01-01", "end": "2024-12-31"}).is_valid()
+
+
+@pytest.mark.django_db
+def test_recurring_endpoints_reject_windows_over_the_cap():
+    client = APIClient()
+
+    expand = client.post("/budget/v1/recurring/expand/1/", {"until": "9999-12-31"}, format="json")
+    projection = client.get("/budget/v1/recurring/projection/1/", {"start": "2024-01-01", "end": "9999-12-31"})
+
+    assert expand.status_code == 400
+    assert "until" in expand.data
+    assert projection.status_code == 400
+    assert "end" in projection.data
@@ -0,0 +1,114 @@
+import json
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from asgiref.sync import async_to_sync
+from budget.api.v1.views.incoming import (
+    IncomingCreateAsyncAPIView,
+    IncomingDeleteAsyncAPIView,
+    IncomingDetailAsyncAPIView,
+    IncomingListAsyncAPIView,
+    IncomingUpdateAsyncAPIView,
+)
+from budget.api.v1.views.revenue import RevenueListAsyncAPIView
+from budget.models import Incoming, IncomingCategory, MonthlyRollup, Revenue, RevenueCategory
+from budget.repositories.incoming import IncomingListRepository, IncomingRetrieveRepository
+from rest_framework.test import APIRequestFactory
+
+factory = APIRequestFactory()
+
+
+@pytest.fixture
+def category():
+    return IncomingCategory.objects.create(name="Salário")
+
+
+@pytest.fixture
+def incoming(category):
+    return Incoming.objects.create(user_id=1, name="Salário", amount=Decimal("3000.00"), launch_date=date(2024, 1, 5), category=category)
+
+
+def call(view_class, request, **kwargs):
+    response = async_to_sync(view_class.as_view())(request, **kwargs)
+    return response.status_code, json.loads(response.render().content)
+
+
+@pytest.mark.parametrize(
+    "view_class",
+    [IncomingCreateAsyncAPIView, IncomingDeleteAsyncAPIView, IncomingDetailAsyncAPIView, IncomingListAsyncAPIView, RevenueListAsyncAPIView],
+)
+def test_async_views_are_coroutines(view_class):
+    assert view_class.view_is_async
+
+
+@pytest.mark.django_db
+def test_async_list_returns_every_incoming_of_the_user(incoming):
+    Incoming.objects.create(user_id=2, name="Outro", amount=Decimal("1.00"), launch_date=date(2024, 1, 5), category=incoming.category)
+
+    status_code, data = call(IncomingListAsyncAPIView, factory.get("/"), user_id=1)
+
+    assert status_code == 200
+    assert [item["id"] for item in data] == [str(incoming.id)]
+
+
+@pytest.mark.django_db
+def test_async_list_is_keyset_paginated(category):
+    for day in (1, 2, 3):
+        Incoming.objects.create(user_id=1, name=f"Dia {day}", amount=Decimal("1.00"), launch_date=date(2024, 1, day), category=category)
+
+    status_code, first = call(IncomingListAsyncAPIView, factory.get("/", {"page_size": 2}), user_id=1)
+    _, second = call(IncomingListAsyncAPIView, factory.get("/", {"page_size": 2, "cursor": first["next_cursor"]}), user_id=1)
+
+    assert status_code == 200
+    assert [item["name"] for item in first["results"] + second["results"]] == ["Dia 1", "Dia 2", "Dia 3"]
+    assert second["next_cursor"] is None
+
+
+@pytest.mark.django_db
+def test_async_list_of_revenues():
+    revenue_category = RevenueCategory.objects.create(name="Casa")
+    Revenue.objects.create(user_id=1, name="Aluguel", amount=Decimal("1200.00"), expiration_date=date(2024, 1, 10), category=revenue_category)
+
+    status_code, data = call(RevenueListAsyncAPIView, factory.get("/"), user_id=1)
+
+    assert status_code == 200
+    assert [item["name"] for item in data] == ["Aluguel"]
+
+
+@pytest.mark.django_db
+def test_async_create_update_and_delete_keep_rollups(category):
+    payload = {"name": "Salário", "amount": "1000.00", "launch_date": "2024-01-05", "category": str(category.id)}
+
+    status_code, created = call(IncomingCreateAsyncAPIView, factory.post("/", payload, format="json"), user_id=1)
+    assert status_code == 200
+    assert MonthlyRollup.objects.get(user_id=1).incomings == Decimal("1000.00")
+
+    update = factory.put("/", {**payload, "amount": "1500.00"}, format="json")
+    status_code, updated = call(IncomingUpdateAsyncAPIView, update, user_id=1, id=created["id"])
+    assert status_code == 200
+    assert Decimal(str(updated["amount"])) == Decimal("1500.00")
+    assert MonthlyRollup.objects.get(user_id=1).incomings == Decimal("1500.00")
+
+    status_code, deleted = call(IncomingDeleteAsyncAPIView, factory.delete("/"), user_id=1, id=created["id"])
+    assert status_code == 200
+    assert deleted == {"message": "Incoming deleted successfully."}
+    assert not Incoming.objects.exists()
+    assert MonthlyRollup.objects.get(user_id=1).incomings == Decimal("0.00")
+
+
+@pytest.mark.django_db
+def test_async_create_rejects_invalid_payload():
+    status_code, errors = call(IncomingCreateAsyncAPIView, factory.post("/", {"name": "Salário"}, format="json"), user_id=1)
+
+    assert status_code == 400
+    assert "amount" in errors
+
+
+@pytest.mark.django_db
+def test_async_repository_reads_match_sync_reads(incoming):
+    repository = IncomingRetrieveRepository()
+
+    assert async_to_sync(repository.aget_incoming)(incoming.id, 1).to_dict() == repository.get_incoming(incoming.id, 1).to_dict()
+    assert async_to_sync(repository.aget_incoming)(incoming.id, 2) is None
+    assert async_to_sync(IncomingListRepository().aget_incomings)(2) is None
@@ -0,0 +1,45 @@
+import uuid
+
+import pytest
+from budget.models import MonthlyRollup, Revenue, RevenueCategory
+from rest_framework.test import APIClient
+
+
+@pytest.fixture
+def category():
+    return RevenueCategory.objects.create(name="Casa")
+
+
+def revenue_item(category_id, **overrides) -> dict:
+    return {
+        "name": "Aluguel",
+        "amount": "300.00",
+        "expiration_date": "2024-01-10",
+        "paid": False,
+        "payment_date": "2024-01-09",
+        "category": str(category_id),
+        **overrides,
+    }
+
+
+@pytest.mark.django_db
+def test_bulk_create_returns_the_created_ids(category):
+    response = APIClient().post("/budget/v1/revenue/create-bulk/1/", {"items": [revenue_item(category.id)] * 2}, format="json")
+
+    assert response.status_code == 200
+    assert response.json()["created"] == 2
+    assert sorted(response.json()["ids"]) == sorted(str(revenue_id) for revenue_id in Revenue.objects.values_list("id", flat=True))
+
+
+@pytest.mark.django_db
+def test_bulk_create_rejects_unknown_categories_like_other_field_errors(category):
+    items = [revenue_item(category.id), revenue_item(uuid.uuid4()), revenue_item(category.id, amount="abc")]
+
+    unknown = APIClient().post("/budget/v1/revenue/create-bulk/1/", {"items": items[:2]}, format="json")
+    invalid = APIClient().post("/budget/v1/revenue/create-bulk/1/", {"items": [items[0], items[2]]}, format="json")
+
+    assert unknown.status_code == invalid.status_code == 400
+    assert unknown.json() == {"items": {"1": {"category": ["Category not found."]}}}
+    assert list(invalid.json()["items"]) == ["1"]
+    assert not Revenue.objects.exists()
+    assert not MonthlyRollup.objects.exists()
@@ -0,0 +1,125 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from asgiref.sync import async_to_sync
+from budget.api.v1.views.incoming import IncomingDetailAPIView, IncomingListAsyncAPIView
+from budget.models import Incoming, IncomingCategory, Revenue, RevenueCategory
+from budget.repositories.category_cache import incoming_categories
+from rest_framework.test import APIClient, APIRequestFactory
+
+USER_ID = 1
+
+
+@pytest.fixture
+def client():
+    return APIClient()
+
+
+@pytest.fixture
+def category():
+    return IncomingCategory.objects.create(name="Salário")
+
+
+@pytest.fixture
+def incoming(category):
+    return Incoming.objects.create(user_id=USER_ID, name="Salário", amount=Decimal("3000.00"), launch_date=date(2024, 1, 5), category=category)
+
+
+def list_url(incoming=None):
+    return f"/budget/v1/incoming/list/{USER_ID}/"
+
+
+def detail_url(incoming):
+    return f"/budget/v1/incoming/detail/{USER_ID}/{incoming.id}/"
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url", [list_url, detail_url])
+def test_unchanged_reads_are_not_modified(client, incoming, url, django_assert_num_queries):
+    response = client.get(url(incoming))
+    etag = response["ETag"]
+    incoming_categories.all()
+
+    with django_assert_num_queries(1):
+        not_modified = client.get(url(incoming), HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 200
+    assert etag.startswith('"')
+    assert "no-cache" in response["Cache-Control"]
+    assert not_modified.status_code == 304
+    assert not_modified["ETag"] == etag
+    assert not not_modified.content
+
+
+@pytest.mark.django_db
+def test_writes_change_the_etag(client, incoming, category):
+    etags = [client.get(list_url())["ETag"]]
+    payload = {"name": "Salário", "amount": "3500.00", "launch_date": "2024-01-05", "category": str(category.id)}
+
+    client.put(f"/budget/v1/incoming/update/{USER_ID}/{incoming.id}/", payload, format="json")
+    etags.append(client.get(list_url())["ETag"])
+    client.post(f"/budget/v1/incoming/create/{USER_ID}/", payload, format="json")
+    etags.append(client.get(list_url())["ETag"])
+    client.delete(f"/budget/v1/incoming/delete/{USER_ID}/{incoming.id}/")
+    etags.append(client.get(list_url())["ETag"])
+
+    assert len(set(etags)) == 4
+    assert client.get(list_url(), HTTP_IF_NONE_MATCH=etags[0]).status_code == 200
+
+
+@pytest.mark.django_db
+def test_renaming_the_category_changes_the_etag(client, incoming, category, django_capture_on_commit_callbacks):
+    etag = client.get(detail_url(incoming))["ETag"]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        category.name = "Bônus"
+        category.save()
+
+    response = client.get(detail_url(incoming), HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response.json()["category"]["name"] == "Bônus"
+
+
+@pytest.mark.django_db
+def test_etag_depends_on_the_query_string(client, incoming):
+    etag = client.get(list_url())["ETag"]
+
+    assert client.get(list_url(), {"page_size": 1}, HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+
+@pytest.mark.django_db
+def test_if_none_match_accepts_weak_and_wildcard_etags(client, incoming):
+    etag = client.get(list_url())["ETag"]
+
+    assert client.get(list_url(), HTTP_IF_NONE_MATCH=f'"other", W/{etag}').status_code == 304
+    assert client.get(list_url(), HTTP_IF_NONE_MATCH="*").status_code == 304
+
+
+@pytest.mark.django_db
+def test_missing_record_has_no_etag():
+    view = IncomingDetailAPIView()
+    request = APIRequestFactory().get("/", HTTP_IF_NONE_MATCH="*")
+
+    assert view.get_etag(request, id="00000000-0000-0000-0000-000000000000", user_id=USER_ID) is None
+
+
+@pytest.mark.django_db
+def test_revenue_list_is_not_modified(client):
+    category = RevenueCategory.objects.create(name="Casa")
+    Revenue.objects.create(user_id=USER_ID, name="Aluguel", amount=Decimal("1200.00"), expiration_date=date(2024, 1, 10), category=category)
+    etag = client.get(f"/budget/v1/revenue/list/{USER_ID}/")["ETag"]
+
+    assert client.get(f"/budget/v1/revenue/list/{USER_ID}/", HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+
+@pytest.mark.django_db
+def test_async_list_is_not_modified(incoming):
+    factory = APIRequestFactory()
+    view = async_to_sync(IncomingListAsyncAPIView.as_view())
+    etag = view(factory.get(list_url()), user_id=USER_ID)["ETag"]
+
+    response = view(factory.get(list_url(), HTTP_IF_NONE_MATCH=etag), user_id=USER_ID)
+
+    assert response.status_code == 304
+    assert response["ETag"] == etag
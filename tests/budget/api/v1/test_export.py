@@ -0,0 +1,100 @@
+import csv
+import gzip
+import io
+import json
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from asgiref.sync import async_to_sync
+from budget.api.v1.views.export import LedgerExportAPIView
+from budget.models import Alert, Incoming, IncomingCategory, Limit, Revenue, RevenueCategory
+from django.core.handlers.asgi import ASGIRequest
+from django.test import AsyncRequestFactory
+from rest_framework.test import APIClient
+
+
+@pytest.fixture
+def ledger():
+    incoming_category = IncomingCategory.objects.create(name="Salário")
+    revenue_category = RevenueCategory.objects.create(name="Casa")
+    revenue = Revenue.objects.create(
+        user_id=1, name="Aluguel", amount=Decimal("1200.00"), expiration_date=date(2024, 1, 10), category=revenue_category
+    )
+    Revenue.objects.create(user_id=2, name="Outro", amount=Decimal("1.00"), expiration_date=date(2024, 1, 10), category=revenue_category)
+    Incoming.objects.create(user_id=1, name="Salário", amount=Decimal("3000.00"), launch_date=date(2024, 1, 5), category=incoming_category)
+    Limit.objects.create(user_id=1, limit=Decimal("500.00"), amount=Decimal("0.00"), limit_date=date(2024, 1, 1), category=revenue_category)
+    Alert.objects.create(user_id=1, user_email="user@example.com", revenue=revenue, message="Vence amanhã", alert_date=date(2024, 1, 9))
+
+
+def download(response) -> bytes:
+    assert response.status_code == 200
+    return b"".join(response.streaming_content)
+
+
+@pytest.mark.django_db
+def test_export_streams_every_record_of_the_user_as_csv(ledger, django_assert_num_queries):
+    response = APIClient().get("/budget/v1/export/1/")
+
+    # Nothing is read until the content is consumed, then one query per table.
+    with django_assert_num_queries(4):
+        content = download(response)
+
+    assert response["Content-Disposition"] == 'attachment; filename="ledger-1.csv"'
+    rows = list(csv.DictReader(io.StringIO(content.decode())))
+    assert [(row["record_type"], row["date"]) for row in rows] == [
+        ("revenue", "2024-01-10"),
+        ("incoming", "2024-01-05"),
+        ("limit", "2024-01-01"),
+        ("alert", "2024-01-09"),
+    ]
+    assert rows[0]["category_name"] == "Casa"
+    assert rows[0]["amount"] == "1200.00"
+    assert rows[3]["revenue_id"] == str(Revenue.objects.get(name="Aluguel").id)
+
+
+@pytest.mark.django_db
+def test_export_as_gzipped_ndjson(ledger):
+    response = APIClient().get("/budget/v1/export/1/?file_format=ndjson&gzip=true")
+
+    lines = gzip.decompress(download(response)).decode().splitlines()
+
+    assert response["Content-Type"] == "application/gzip"
+    assert response["Content-Disposition"] == 'attachment; filename="ledger-1.ndjson.gz"'
+    records = [json.loads(line) for line in lines]
+    assert [record["record_type"] for record in records] == ["revenue", "incoming", "limit", "alert"]
+    assert records[1] == {
+        "record_type": "incoming",
+        "id": records[1]["id"],
+        "name": "Salário",
+        "description": None,
+        "amount": "3000.00",
+        "date": "2024-01-05",
+        "category_name": "Salário",
+    }
+
+
+@pytest.mark.django_db
+def test_export_rejects_unknown_formats():
+    response = APIClient().get("/budget/v1/export/1/?file_format=xml")
+
+    assert response.status_code == 400
+
+
+@async_to_sync
+async def adownload(response) -> bytes:
+    assert response.status_code == 200
+    assert response.is_async
+    return b"".join([chunk async for chunk in response.streaming_content])
+
+
+@pytest.mark.django_db(transaction=True)
+def test_export_streams_asgi_requests_with_an_async_iterator(ledger):
+    request = AsyncRequestFactory().get("/budget/v1/export/1/")
+    assert isinstance(request, ASGIRequest)
+
+    response = LedgerExportAPIView.as_view()(request, user_id=1)
+
+    rows = list(csv.DictReader(io.StringIO(adownload(response).decode())))
+    assert [row["record_type"] for row in rows] == ["revenue", "incoming", "limit", "alert"]
+    assert rows[1]["amount"] == "3000.00"
@@ -0,0 +1,216 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from budget.models import Alert, Incoming, IncomingCategory, Installment, Job, Limit, Recurring, Revenue, RevenueCategory
+from budget.repositories.category_cache import incoming_categories, revenue_categories
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+USER_ID = 1
+
+
+@pytest.fixture
+def client():
+    return APIClient()
+
+
+@pytest.fixture
+def records():
+    incoming_category = IncomingCategory.objects.create(name="Salário")
+    revenue_category = RevenueCategory.objects.create(name="Casa")
+    revenues = [
+        Revenue.objects.create(
+            user_id=USER_ID,
+            name=f"Revenue {index}",
+            amount=Decimal("10.00"),
+            expiration_date=date.today(),
+            category=revenue_category,
+        )
+        for index in range(3)
+    ]
+    incomings = [
+        Incoming.objects.create(
+            user_id=USER_ID,
+            name=f"Incoming {index}",
+            amount=Decimal("10.00"),
+            launch_date=date.today(),
+            category=incoming_category,
+        )
+        for index in range(3)
+    ]
+    limits = [
+        Limit.objects.create(
+            user_id=USER_ID,
+            limit=Decimal("100.00"),
+            amount=Decimal("10.00"),
+            limit_date=date.today(),
+            category=revenue_category,
+        )
+        for _ in range(3)
+    ]
+    alerts = [
+        Alert.objects.create(
+            user_id=USER_ID,
+            user_email="user@example.com",
+            revenue=revenue,
+            message="Alert",
+            alert_date=date(2000, 1, 1),
+        )
+        for revenue in revenues
+    ]
+    Installment.objects.bulk_create(
+        Installment(revenue=revenues[2], amount=Decimal("5.00"), due_date=date.today(), period=number, period_unit="months") for number in (1, 2)
+    )
+    # A running worker has the categories cached; budgets are for that steady state.
+    incoming_categories.all()
+    revenue_categories.all()
+    return {
+        "incoming_category": incoming_category,
+        "revenue_category": revenue_category,
+        "revenue": revenues[0],
+        "incoming": incomings[0],
+        "limit": limits[0],
+        "alert": alerts[0],
+        "job": Job.objects.create(kind="send_alert_emails", payload={}),
+        "installment_revenue": revenues[2],
+        "recurring": Recurring.objects.create(revenue=revenues[1], amount=Decimal("10.00"), payment_date=date.today(), period=1),
+    }
+
+
+def revenue_payload(records):
+    return {
+        "name": "Revenue",
+        "description": "Description",
+        "amount": "10.00",
+        "expiration_date": "2024-01-01",
+        "paid": "false",
+        "payment_date": None,
+        "category": str(records["revenue_category"].id),
+    }
+
+
+def incoming_payload(records):
+    return {
+        "name": "Incoming",
+        "description": "Description",
+        "amount": "10.00",
+        "launch_date": "2024-01-01",
+        "category": str(records["incoming_category"].id),
+    }
+
+
+def revenue_bulk_payload(records):
+    return {"items": [{**revenue_payload(records), "paid": index % 2 == 0} for index in range(50)]}
+
+
+def incoming_bulk_payload(records):
+    return {"items": [incoming_payload(records)] * 50}
+
+
+def limit_payload(records):
+    return {
+        "user_id": USER_ID,
+        "limit": "100.00",
+        "amount": "10.00",
+        "limit_date": "2024-01-01",
+        "category": str(records["revenue_category"].id),
+    }
+
+
+def recurring_payload(records):
+    return {
+        "revenue": str(records["revenue"].id),
+        "period": 1,
+        "period_unit": "months",
+    }
+
+
+def installment_payload(records):
+    return {
+        "revenue": str(records["revenue"].id),
+        "periods": 12,
+    }
+
+
+def alert_payload(records):
+    return {
+        "user_id": USER_ID,
+        "user_email": "user@example.com",
+        "revenue_id": str(records["revenue"].id),
+        "message": "Alert",
+        "alert_date": "2024-01-01",
+    }
+
+
+# Writes to incomings and revenues also upsert the monthly rollup in one statement;
+# updates and deletes read the previous amount, date and category first. Category
+# lists and category names come from the category cache. Incoming and revenue reads
+# first query the version behind their ETag.
+ENDPOINTS = [
+    pytest.param("get", lambda r: "/budget/v1/incoming/list-categories/", None, 0, id="incoming-list-categories"),
+    pytest.param("get", lambda r: f"/budget/v1/incoming/list/{USER_ID}/", None, 2, id="incoming-list"),
+    pytest.param("get", lambda r: f"/budget/v1/incoming/list/{USER_ID}/?page_size=2", None, 2, id="incoming-list-page"),
+    pytest.param("post", lambda r: f"/budget/v1/incoming/create/{USER_ID}/", incoming_payload, 3, id="incoming-create"),
+    # Fifty items are checked against the cached categories, inserted in one statement and upsert the rollups once.
+    pytest.param("post", lambda r: f"/budget/v1/incoming/create-bulk/{USER_ID}/", incoming_bulk_payload, 2, id="incoming-create-bulk"),
+    pytest.param("get", lambda r: f"/budget/v1/incoming/detail/{USER_ID}/{r['incoming'].id}/", None, 2, id="incoming-detail"),
+    pytest.param("put", lambda r: f"/budget/v1/incoming/update/{USER_ID}/{r['incoming'].id}/", incoming_payload, 4, id="incoming-update"),
+    pytest.param("delete", lambda r: f"/budget/v1/incoming/delete/{USER_ID}/{r['incoming'].id}/", None, 3, id="incoming-delete"),
+    pytest.param("get", lambda r: "/budget/v1/revenue/list-categories/", None, 0, id="revenue-list-categories"),
+    pytest.param("get", lambda r: f"/budget/v1/revenue/list/{USER_ID}/", None, 2, id="revenue-list"),
+    pytest.param("get", lambda r: f"/budget/v1/revenue/list/{USER_ID}/?page_size=2", None, 2, id="revenue-list-page"),
+    pytest.param("post", lambda r: f"/budget/v1/revenue/create/{USER_ID}/", revenue_payload, 3, id="revenue-create"),
+    # Fifty items are checked against the cached categories, inserted in one statement and upsert the rollups once.
+    pytest.param("post", lambda r: f"/budget/v1/revenue/create-bulk/{USER_ID}/", revenue_bulk_payload, 2, id="revenue-create-bulk"),
+    pytest.param("get", lambda r: f"/budget/v1/revenue/detail/{USER_ID}/{r['revenue'].id}/", None, 2, id="revenue-detail"),
+    pytest.param("put", lambda r: f"/budget/v1/revenue/update/{USER_ID}/{r['revenue'].id}/", revenue_payload, 4, id="revenue-update"),
+    # Deleting a revenue also cascades to its alerts and their deliveries, installments and recurring rules.
+    pytest.param("delete", lambda r: f"/budget/v1/revenue/delete/{USER_ID}/{r['revenue'].id}/", None, 9, id="revenue-delete"),
+    pytest.param("get", lambda r: f"/budget/v1/limit/list/{USER_ID}/", None, 1, id="limit-list"),
+    pytest.param("get", lambda r: f"/budget/v1/limit/list/{USER_ID}/?page_size=2", None, 1, id="limit-list-page"),
+    pytest.param("post", lambda r: f"/budget/v1/limit/create/{USER_ID}/", limit_payload, 2, id="limit-create"),
+    pytest.param("put", lambda r: f"/budget/v1/limit/update/{USER_ID}/{r['limit'].id}/", limit_payload, 2, id="limit-update"),
+    pytest.param("delete", lambda r: f"/budget/v1/limit/delete/{USER_ID}/{r['limit'].id}/", None, 1, id="limit-delete"),
+    pytest.param("get", lambda r: f"/budget/v1/alert/list/{USER_ID}/", None, 1, id="alert-list"),
+    pytest.param("get", lambda r: f"/budget/v1/alert/list/{USER_ID}/?page_size=2", None, 1, id="alert-list-page"),
+    pytest.param("post", lambda r: f"/budget/v1/alert/create/{USER_ID}/", alert_payload, 1, id="alert-create"),
+    pytest.param("put", lambda r: f"/budget/v1/alert/update/{USER_ID}/{r['alert'].id}/", alert_payload, 2, id="alert-update"),
+    # Deleting an alert also cascades to its delivery ledger rows.
+    pytest.param("delete", lambda r: f"/budget/v1/alert/delete/{USER_ID}/{r['alert'].id}/", None, 3, id="alert-delete"),
+    # The forecast reads the rollups and the installment adjustments of the opening balance,
+    # one grouped query per table and the recurring rules with their stored occurrences.
+    pytest.param("get", lambda r: f"/budget/v1/forecast/{USER_ID}/?months=36", None, 8, id="forecast"),
+    pytest.param("get", lambda r: f"/budget/v1/forecast/{USER_ID}/?granularity=day", None, 8, id="forecast-daily"),
+    # Installment plans are inserted by one bulk statement and paid by one UPDATE.
+    pytest.param("post", lambda r: f"/budget/v1/installment/create/{USER_ID}/", installment_payload, 2, id="installment-create"),
+    pytest.param("get", lambda r: f"/budget/v1/installment/detail/{USER_ID}/{r['installment_revenue'].id}/", None, 1, id="installment-detail"),
+    pytest.param(
+        "post", lambda r: f"/budget/v1/installment/pay/{USER_ID}/{r['installment_revenue'].id}/", lambda r: {"count": 1}, 2, id="installment-pay"
+    ),
+    pytest.param("post", lambda r: f"/budget/v1/recurring/create/{USER_ID}/", recurring_payload, 3, id="recurring-create"),
+    # Expanding locks the rules, reads the stored occurrences, bulk inserts, upserts the rollups
+    # and moves the expanded_until mark of the rules.
+    pytest.param("post", lambda r: f"/budget/v1/recurring/expand/{USER_ID}/", lambda r: {}, 5, id="recurring-expand"),
+    pytest.param("get", lambda r: f"/budget/v1/recurring/projection/{USER_ID}/", None, 2, id="recurring-projection"),
+    pytest.param("get", lambda r: f"/budget/v1/summary/{USER_ID}/", None, 1, id="summary"),
+    pytest.param("get", lambda r: f"/budget/v1/job/{r['job'].id}/", None, 1, id="job-status"),
+    pytest.param("post", lambda r: "/budget/v1/alert/trigger-email/", lambda r: {"send_email": True}, 1, id="alert-trigger-email"),
+]
+
+
+def count_statements(context: CaptureQueriesContext) -> int:
+    # Savepoints come from the transaction wrapping each test, not from the endpoint itself.
+    return sum(1 for query in context.captured_queries if "SAVEPOINT" not in query["sql"])
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(("method", "url", "payload", "queries"), ENDPOINTS)
+def test_endpoint_query_budget(client, records, method, url, payload, queries):
+    data = payload(records) if payload else None
+    with CaptureQueriesContext(connection) as context:
+        response = getattr(client, method)(url(records), data=data, format="json")
+
+    assert response.status_code == 200, response.data
+    assert count_statements(context) == queries, [query["sql"] for query in context.captured_queries]
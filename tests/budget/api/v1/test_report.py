@@ -0,0 +1,46 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from budget.models import Incoming, IncomingCategory
+from budget.repositories.rollup import rebuild_monthly_rollups
+from budget.utils import reports
+from rest_framework.test import APIClient
+
+
+@pytest.fixture
+def january():
+    category = IncomingCategory.objects.create(name="Salário")
+    Incoming.objects.create(user_id=1, name="Salário", amount=Decimal("3000.00"), launch_date=date(2024, 1, 5), category=category)
+    rebuild_monthly_rollups([1])
+
+
+@pytest.mark.django_db
+def test_report_as_html(january):
+    response = APIClient().get("/budget/v1/report/1/?month=2024-01&file_format=html")
+
+    assert response.status_code == 200
+    assert response["Content-Type"] == "text/html; charset=utf-8"
+    assert "R$ 3.000,00" in response.content.decode()
+
+
+@pytest.mark.django_db
+def test_report_as_pdf_is_served_from_the_cache(january, settings, tmp_path, mocker):
+    settings.MEDIA_ROOT = tmp_path
+    html_to_pdf = mocker.patch.object(reports, "html_to_pdf", return_value=b"%PDF-1.4")
+
+    for _ in range(2):
+        response = APIClient().get("/budget/v1/report/1/?month=2024-01")
+        assert response.status_code == 200
+        assert b"".join(response.streaming_content) == b"%PDF-1.4"
+
+    assert response["Content-Type"] == "application/pdf"
+    assert response["Content-Disposition"] == 'attachment; filename="statement-1-2024-01.pdf"'
+    assert html_to_pdf.call_count == 1
+
+
+@pytest.mark.django_db
+def test_report_requires_a_month():
+    response = APIClient().get("/budget/v1/report/1/?month=2024-13")
+
+    assert response.status_code == 400
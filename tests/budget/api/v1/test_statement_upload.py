@@ -0,0 +1,82 @@
+import pytest
+from budget.models import Job, Revenue
+from budget.repositories.job import JobQueueRepository
+from budget.utils import statements
+from budget.utils.jobs import run_job
+from django.core.files.uploadedfile import SimpleUploadedFile
+from rest_framework.test import APIClient
+
+OFX = b"""OFXHEADER:100
+DATA:OFXSGML
+
+<OFX><BANKTRANLIST>
+<STMTTRN><DTPOSTED>20240105<TRNAMT>-59.90<FITID>9001<MEMO>Farmacia</STMTTRN>
+</BANKTRANLIST></OFX>
+"""
+
+
+@pytest.mark.django_db
+def test_statement_upload_enqueues_an_import_run_by_the_worker(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    upload = SimpleUploadedFile("extrato.ofx", OFX)
+
+    response = APIClient().post("/budget/v1/statement/import/1/", {"file": upload, "rules": '[{"pattern": "farm", "category": "Saúde"}]'})
+
+    assert response.status_code == 200, response.data
+    job = Job.objects.get(id=response.data["job_id"])
+    assert run_job(JobQueueRepository().claim_job())
+    job.refresh_from_db()
+    assert job.result == {"incomings": 0, "revenues": 1, "duplicates": 0, "errors": []}
+    assert Revenue.objects.get().category.name == "Saúde"
+    assert not list((tmp_path / "imports").iterdir())
+
+
+@pytest.mark.django_db
+def test_statement_upload_rejects_unknown_formats():
+    response = APIClient().post("/budget/v1/statement/import/1/", {"file": SimpleUploadedFile("extrato.pdf", b"%PDF")})
+
+    assert response.status_code == 400
+    assert "format" in response.data
+
+
+def upload_statement(name, content):
+    response = APIClient().post("/budget/v1/statement/import/1/", {"file": SimpleUploadedFile(name, content)})
+    assert response.status_code == 200, response.data
+    return Job.objects.get(id=response.data["job_id"])
+
+
+@pytest.mark.django_db
+def test_unreadable_statements_fail_without_retry_and_are_deleted(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    job = upload_statement("extrato.csv", b"foo;bar\n1;2\n")
+
+    assert not run_job(JobQueueRepository().claim_job())
+
+    job.refresh_from_db()
+    assert job.status == Job.FAILED
+    assert job.attempts == 1
+    assert "header" in job.last_error
+    assert not list((tmp_path / "imports").iterdir())
+
+
+@pytest.mark.django_db
+def test_statements_are_kept_until_the_last_attempt(settings, tmp_path, monkeypatch):
+    settings.MEDIA_ROOT = tmp_path
+    settings.JOB_MAX_ATTEMPTS = 2
+    settings.JOB_RETRY_BACKOFF_SECONDS = 0
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("database unavailable")
+
+    monkeypatch.setattr(statements, "import_statement_file", fail)
+    job = upload_statement("extrato.ofx", OFX)
+
+    assert not run_job(JobQueueRepository().claim_job())
+    job.refresh_from_db()
+    assert job.status == Job.PENDING
+    assert len(list((tmp_path / "imports").iterdir())) == 1
+
+    assert not run_job(JobQueueRepository().claim_job())
+    job.refresh_from_db()
+    assert job.status == Job.FAILED
+    assert not list((tmp_path / "imports").iterdir())
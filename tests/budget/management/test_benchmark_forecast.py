@@ -0,0 +1,13 @@
+import pytest
+from budget.models import Incoming
+from django.core.management import call_command
+
+
+@pytest.mark.django_db
+def test_benchmark_forecast_reports_both_timings_and_rolls_back(capsys):
+    call_command("benchmark_forecast", rows=200, months=6)
+
+    out = capsys.readouterr().out
+    assert "python loop:" in out
+    assert "database buckets:" in out
+    assert not Incoming.objects.exists()
@@ -0,0 +1,17 @@
+import pytest
+from budget.models import Revenue
+from django.core.management import call_command
+
+
+@pytest.mark.django_db
+def test_check_query_plans_passes_with_indexes(capsys):
+    call_command("check_query_plans", users=100, rows=5)
+
+    assert "All repository queries use indexes." in capsys.readouterr().out
+
+
+@pytest.mark.django_db
+def test_check_query_plans_rolls_back_seeded_rows():
+    call_command("check_query_plans", users=100, rows=2)
+
+    assert not Revenue.objects.exists()
@@ -0,0 +1,21 @@
+from datetime import date
+
+import pytest
+from django.core.management import CommandError, call_command
+
+
+def test_generate_monthly_reports_prints_the_counts(mocker, capsys):
+    generate = mocker.patch(
+        "budget.management.commands.generate_monthly_reports.generate_monthly_reports",
+        return_value={"month": "2024-01", "rendered": 2, "cached": 1, "failed": 0},
+    )
+
+    call_command("generate_monthly_reports", "--month", "2024-01", "--user", "1")
+
+    generate.assert_called_once_with(date(2024, 1, 1), [1])
+    assert "2024-01: 2 rendered, 1 already cached, 0 failed." in capsys.readouterr().out
+
+
+def test_generate_monthly_reports_rejects_invalid_months():
+    with pytest.raises(CommandError):
+        call_command("generate_monthly_reports", "--month", "january")
@@ -0,0 +1,31 @@
+import json
+
+import pytest
+from budget.models import Incoming, Revenue
+from django.core.management import CommandError, call_command
+
+
+@pytest.mark.django_db
+def test_import_statements_imports_files_once(tmp_path, capsys):
+    statement = tmp_path / "extrato.csv"
+    statement.write_text("date,description,amount\n2024-01-05,Salario,3000.00\n2024-01-06,Netflix,-39.90\n2024-01-07,Mercado,oops\n")
+    rules = tmp_path / "rules.json"
+    rules.write_text(json.dumps([{"pattern": "netflix", "category": "Assinaturas e serviços"}]))
+
+    call_command("import_statements", str(statement), "--user", "1", "--rules", str(rules))
+    call_command("import_statements", str(statement), "--user", "1")
+
+    captured = capsys.readouterr()
+    assert "1 incomings and 1 revenues created, 0 duplicates skipped." in captured.out
+    assert "0 incomings and 0 revenues created, 2 duplicates skipped." in captured.out
+    assert "Line 4: Invalid amount 'oops'." in captured.err
+    assert Incoming.objects.count() == 1
+    assert Revenue.objects.get().category.name == "Assinaturas e serviços"
+
+
+def test_import_statements_rejects_unknown_extensions(tmp_path):
+    statement = tmp_path / "extrato.txt"
+    statement.write_text("")
+
+    with pytest.raises(CommandError, match="--format"):
+        call_command("import_statements", str(statement), "--user", "1")
@@ -0,0 +1,26 @@
+import pytest
+from budget.models import Job, ScheduledRun
+from django.core.management import CommandError, call_command
+
+
+def test_run_scheduler_lists_schedules(capsys):
+    call_command("run_scheduler", list=True)
+
+    out = capsys.readouterr().out
+    assert "alert_emails: cron '0 8 * * *', next run at" in out
+    assert "rebuild_rollups" in out
+
+
+@pytest.mark.django_db
+def test_run_scheduler_runs_a_schedule_now(capsys):
+    call_command("run_scheduler", run="alert_emails")
+
+    run = ScheduledRun.objects.get()
+    assert run.status == ScheduledRun.SUCCEEDED
+    assert run.result["job_id"] == str(Job.objects.get().id)
+    assert "alert_emails succeeded" in capsys.readouterr().out
+
+
+def test_run_scheduler_rejects_unknown_schedule():
+    with pytest.raises(CommandError):
+        call_command("run_scheduler", run="missing")
@@ -0,0 +1,110 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from smtplib import SMTPRecipientsRefused
+
+import pytest
+from budget.models import Alert, AlertDelivery, Job, Revenue, RevenueCategory
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+
+def refuse_second_recipient(messages):
+    for message in messages:
+        if "user1@example.com" in message.to:
+            raise SMTPRecipientsRefused({"user1@example.com": (550, b"refused")})
+    mail.outbox.extend(messages)
+    return len(messages)
+
+
+@pytest.fixture
+def alerts():
+    category = RevenueCategory.objects.create(name="Casa")
+    revenue = Revenue.objects.create(user_id=1, name="Aluguel", amount=Decimal("1200.00"), expiration_date=date.today(), category=category)
+    for index in range(3):
+        Alert.objects.create(user_id=1, user_email=f"user{index}@example.com", revenue=revenue, message="", alert_date=date.today())
+
+
+@pytest.mark.django_db
+def test_trigger_enqueues_and_worker_sends(alerts):
+    client = APIClient()
+
+    response = client.post("/budget/v1/alert/trigger-email/", data={"send_email": True}, format="json")
+    job_id = response.data["job_id"]
+
+    assert response.data["status"] == Job.PENDING
+    assert mail.outbox == []
+
+    call_command("run_worker", once=True)
+
+    status = client.get(f"/budget/v1/job/{job_id}/")
+    assert status.data["status"] == Job.SUCCEEDED
+    assert len(status.data["result"]["results"]) == 3
+    assert len(mail.outbox) == 3
+
+
+@pytest.mark.django_db
+@override_settings(JOB_RETRY_BACKOFF_SECONDS=0)
+def test_worker_retries_only_failed_recipients(alerts, monkeypatch):
+    monkeypatch.setattr(EmailBackend, "send_messages", lambda self, messages: refuse_second_recipient(messages))
+    APIClient().post("/budget/v1/alert/trigger-email/", data={"send_email": True}, format="json")
+
+    call_command("run_worker", max_jobs=1)
+    job = Job.objects.get()
+    assert job.status == Job.PENDING
+    assert job.payload["recipients"] == ["user1@example.com"]
+    assert len(mail.outbox) == 2
+
+    monkeypatch.undo()
+    call_command("run_worker", once=True)
+    job.refresh_from_db()
+    assert job.status == Job.SUCCEEDED
+    assert [message.to for message in mail.outbox[2:]] == [["user1@example.com"]]
+
+
+def refuse_connections(self):
+    raise ConnectionRefusedError("connection refused")
+
+
+@pytest.mark.django_db
+@override_settings(JOB_RETRY_BACKOFF_SECONDS=0)
+def test_worker_retries_when_the_email_server_is_unreachable(alerts, monkeypatch):
+    monkeypatch.setattr(EmailBackend, "open", refuse_connections)
+    APIClient().post("/budget/v1/alert/trigger-email/", data={"send_email": True}, format="json")
+
+    call_command("run_worker", max_jobs=1)
+    job = Job.objects.get()
+    assert job.status == Job.PENDING
+    assert not AlertDelivery.objects.filter(status=AlertDelivery.SENDING).exists()
+
+    monkeypatch.undo()
+    call_command("run_worker", once=True)
+    job.refresh_from_db()
+    assert job.status == Job.SUCCEEDED
+    assert len(mail.outbox) == 3
+
+
+@pytest.mark.django_db
+def test_worker_does_not_succeed_while_deliveries_are_leased(alerts):
+    for alert in Alert.objects.all():
+        AlertDelivery.objects.create(
+            alert=alert, alert_date=date.today(), status=AlertDelivery.SENDING, claimed_until=timezone.now() + timedelta(minutes=5)
+        )
+    APIClient().post("/budget/v1/alert/trigger-email/", data={"send_email": True}, format="json")
+
+    call_command("run_worker", max_jobs=1)
+
+    job = Job.objects.get()
+    assert job.status == Job.PENDING
+    assert job.payload["recipients"] == [f"user{index}@example.com" for index in range(3)]
+    assert mail.outbox == []
+
+
+@pytest.mark.django_db
+def test_job_status_not_found():
+    response = APIClient().get("/budget/v1/job/00000000-0000-0000-0000-000000000000/")
+
+    assert response.status_code == 404
@@ -0,0 +1,55 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from budget.models import Alert, Revenue, RevenueCategory
+from budget.repositories.alert import AlertListRepository
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+def create_alerts(user_id: int, total: int):
+    category = RevenueCategory.objects.create(name="Test Category")
+    revenue = Revenue.objects.create(
+        user_id=user_id,
+        name="Test Revenue",
+        amount=Decimal("10.00"),
+        expiration_date=date.today(),
+        category=category,
+    )
+    Alert.objects.bulk_create(
+        [
+            Alert(
+                user_id=user_id,
+                user_email="user@example.com",
+                revenue=revenue,
+                message=f"Alert {index}",
+                alert_date=date.today(),
+            )
+            for index in range(total)
+        ]
+    )
+    return revenue
+
+
+def count_list_queries(user_id: int) -> int:
+    with CaptureQueriesContext(connection) as context:
+        AlertListRepository().get_alerts(user_id)
+    return len(context.captured_queries)
+
+
+@pytest.mark.django_db
+def test_get_alerts_query_count_does_not_grow_with_rows():
+    create_alerts(user_id=1, total=1)
+    create_alerts(user_id=2, total=25)
+
+    assert count_list_queries(1) == count_list_queries(2)
+
+
+@pytest.mark.django_db
+def test_get_alerts_returns_revenue_id():
+    revenue = create_alerts(user_id=1, total=1)
+
+    alerts = AlertListRepository().get_alerts(1)
+
+    assert alerts[0].revenue_id == revenue.id
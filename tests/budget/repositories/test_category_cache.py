@@ -0,0 +1,106 @@
+import pytest
+from budget.models import IncomingCategory, RevenueCategory
+from budget.repositories import category_cache
+from budget.repositories.category_cache import incoming_categories, revenue_categories
+
+
+@pytest.mark.django_db
+def test_categories_are_read_from_the_database_once(django_assert_num_queries):
+    category = IncomingCategory.objects.create(name="Salário")
+
+    with django_assert_num_queries(1):
+        incoming_categories.all()
+    with django_assert_num_queries(0):
+        names = [cached.name for cached in incoming_categories.all()]
+        assert incoming_categories.get(category.id).name == "Salário"
+        assert incoming_categories.ids_by_name()["Salário"] == category.id
+
+    assert "Salário" in names
+
+
+@pytest.mark.django_db
+def test_saving_or_deleting_a_category_clears_the_cache(django_capture_on_commit_callbacks):
+    category = RevenueCategory.objects.create(name="Casa")
+    category_id = category.id
+    assert revenue_categories.get(category_id).name == "Casa"
+
+    with django_capture_on_commit_callbacks(execute=True):
+        category.name = "Moradia"
+        category.save()
+    assert revenue_categories.get(category_id).name == "Moradia"
+
+    with django_capture_on_commit_callbacks(execute=True):
+        category.delete()
+    assert revenue_categories.get(category_id) is None
+
+
+@pytest.mark.django_db
+def test_the_cache_is_cleared_when_the_change_is_committed(django_capture_on_commit_callbacks):
+    category = RevenueCategory.objects.create(name="Casa")
+    revenue_categories.all()
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        category.name = "Moradia"
+        category.save()
+        # A request reading before the commit caches what it reads; clearing now would
+        # let it store the old rows again, so the cache is only cleared by the commit.
+        assert revenue_categories.get(category.id).name == "Casa"
+
+    assert callbacks == [revenue_categories.clear]
+    assert revenue_categories.get(category.id).name == "Moradia"
+
+
+@pytest.mark.django_db
+def test_unknown_ids_reload_the_categories_once(django_assert_num_queries):
+    incoming_categories.all()
+    # bulk_create sends no signals, like a category created by another process.
+    created = IncomingCategory.objects.bulk_create([IncomingCategory(name="Bônus"), IncomingCategory(name="Prêmio")])
+
+    with django_assert_num_queries(1):
+        found = incoming_categories.get_many([category.id for category in created] + ["00000000-0000-0000-0000-000000000000"])
+
+    assert sorted(category.name for category in found.values()) == ["Bônus", "Prêmio"]
+
+
+@pytest.mark.django_db
+def test_unknown_ids_reload_the_categories_once_per_entry(django_assert_num_queries, django_capture_on_commit_callbacks):
+    incoming_categories.all()
+    with django_assert_num_queries(1):
+        assert incoming_categories.get("00000000-0000-0000-0000-000000000000") is None
+
+    with django_assert_num_queries(0):
+        assert incoming_categories.get("00000000-0000-0000-0000-000000000000") is None
+        assert incoming_categories.get_many(["00000000-0000-0000-0000-000000000001"]) == {}
+
+    # Saving a category clears the entry, so the next unknown ID may reload again.
+    with django_capture_on_commit_callbacks(execute=True):
+        category = IncomingCategory.objects.create(name="Bônus")
+    with django_assert_num_queries(1):
+        assert incoming_categories.get(category.id).name == "Bônus"
+
+
+@pytest.mark.django_db
+def test_categories_expire_after_the_ttl(settings, django_assert_num_queries):
+    settings.CATEGORY_CACHE_TTL_SECONDS = 0
+    incoming_categories.all()
+
+    with django_assert_num_queries(1):
+        incoming_categories.all()
+
+
+@pytest.mark.django_db
+def test_shared_cache_serves_other_processes(settings, django_assert_num_queries, django_capture_on_commit_callbacks):
+    settings.CATEGORY_CACHE_ALIAS = "default"
+    category = IncomingCategory.objects.create(name="Salário")
+    category_id = category.id
+    incoming_categories.all()
+    # Another process starts with an empty in-process cache.
+    category_cache._local.clear()
+
+    with django_assert_num_queries(0):
+        assert incoming_categories.get(category_id).name == "Salário"
+
+    with django_capture_on_commit_callbacks(execute=True):
+        category.delete()
+    category_cache._local.clear()
+    assert incoming_categories.get(category_id) is None
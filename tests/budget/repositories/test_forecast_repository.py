@@ -0,0 +1,105 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from budget.models import Incoming, IncomingCategory, Installment, Recurring, Revenue, RevenueCategory
+from budget.repositories import ForecastRepository
+from budget.repositories.rollup import rebuild_monthly_rollups
+
+
+@pytest.fixture
+def history():
+    incoming_category = IncomingCategory.objects.create(name="Salário")
+    revenue_category = RevenueCategory.objects.create(name="Casa")
+    Incoming.objects.bulk_create(
+        [
+            Incoming(user_id=1, name="Salário", amount=Decimal("1000.00"), launch_date=date(2023, 12, 5), category=incoming_category),
+            Incoming(user_id=1, name="Salário", amount=Decimal("1000.00"), launch_date=date(2024, 1, 5), category=incoming_category),
+            Incoming(user_id=1, name="Bônus", amount=Decimal("200.00"), launch_date=date(2024, 1, 20), category=incoming_category),
+            Incoming(user_id=1, name="Salário", amount=Decimal("1000.00"), launch_date=date(2024, 3, 5), category=incoming_category),
+            Incoming(user_id=2, name="Salário", amount=Decimal("9000.00"), launch_date=date(2024, 1, 5), category=incoming_category),
+        ]
+    )
+    Revenue.objects.bulk_create(
+        [
+            Revenue(user_id=1, name="Aluguel", amount=Decimal("300.00"), expiration_date=date(2023, 12, 10), paid=True, category=revenue_category),
+            Revenue(user_id=1, name="Luz", amount=Decimal("100.00"), expiration_date=date(2024, 1, 10), category=revenue_category),
+            Revenue(user_id=1, name="Água", amount=Decimal("50.00"), expiration_date=date(2024, 2, 10), category=revenue_category),
+        ]
+    )
+    television = Revenue.objects.create(user_id=1, name="TV", amount=Decimal("600.00"), expiration_date=date(2024, 1, 15), category=revenue_category)
+    Installment.objects.bulk_create(
+        Installment(revenue=television, amount=Decimal("200.00"), due_date=date(2024, month, 15), period=month) for month in (1, 2, 3)
+    )
+    rebuild_monthly_rollups([1, 2])
+
+
+@pytest.mark.django_db
+def test_get_forecast_sums_each_month_and_accumulates_the_balance(history):
+    forecast = ForecastRepository().get_forecast(1, date(2024, 1, 1), 3, "month")
+
+    # December 2023 is only read from the rollups: 1000 launched and 300 paid.
+    assert forecast.opening_balance == Decimal("700.00")
+    assert [bucket.period for bucket in forecast.buckets] == [date(2024, 1, 1), date(2024, 2, 1), date(2024, 3, 1)]
+    assert [bucket.incomings for bucket in forecast.buckets] == [Decimal("1200.00"), Decimal("0.00"), Decimal("1000.00")]
+    # The TV is counted through its installments instead of its full amount.
+    assert [bucket.revenues for bucket in forecast.buckets] == [Decimal("300.00"), Decimal("250.00"), Decimal("200.00")]
+    assert forecast.balances == [Decimal("1600.00"), Decimal("1350.00"), Decimal("2150.00")]
+
+
+@pytest.mark.django_db
+def test_get_forecast_by_day_has_a_bucket_for_every_day(history):
+    forecast = ForecastRepository().get_forecast(1, date(2024, 1, 1), 1, "day")
+
+    assert len(forecast.buckets) == 31
+    assert forecast.to_dict()["buckets"][4] == {
+        "period": "2024-01-05",
+        "incomings": Decimal("1000.00"),
+        "revenues": Decimal("0.00"),
+        "net": Decimal("1000.00"),
+        "balance": Decimal("1700.00"),
+    }
+    assert forecast.balances[-1] == Decimal("1600.00")
+
+
+@pytest.mark.django_db
+def test_get_forecast_adds_the_recurring_revenues_not_stored_yet(history):
+    rent = Revenue.objects.get(name="Aluguel")
+    Recurring.objects.create(revenue=rent, amount=Decimal("300.00"), payment_date=date(2023, 12, 10), period=1, period_unit="months")
+
+    forecast = ForecastRepository().get_forecast(1, date(2024, 1, 1), 3, "month")
+
+    assert [bucket.revenues for bucket in forecast.buckets] == [Decimal("600.00"), Decimal("550.00"), Decimal("500.00")]
+
+
+@pytest.mark.django_db
+def test_get_forecast_query_count_does_not_grow_with_the_history(history, django_assert_num_queries):
+    # Opening balance and its two installment adjustments, incomings, revenues, installments and the recurring rules.
+    with django_assert_num_queries(7):
+        ForecastRepository().get_forecast(1, date(2024, 1, 1), 36, "month")
+
+
+@pytest.mark.django_db
+def test_get_forecast_balance_does_not_depend_on_the_start_month():
+    category = RevenueCategory.objects.create(name="Casa")
+    computer = Revenue.objects.create(user_id=1, name="PC", amount=Decimal("1200.00"), expiration_date=date(2024, 1, 15), category=category)
+    Installment.objects.bulk_create(
+        Installment(revenue=computer, amount=Decimal("100.00"), due_date=date(2024, month, 15), period=month, paid=month == 4)
+        for month in range(1, 13)
+    )
+    rebuild_monthly_rollups([1])
+
+    from_january = ForecastRepository().get_forecast(1, date(2024, 1, 1), 3, "month")
+    from_march = ForecastRepository().get_forecast(1, date(2024, 3, 1), 1, "month")
+
+    # The paid April installment is settled before the window; January to March are due in it.
+    assert from_january.opening_balance == Decimal("-100.00")
+    assert str(from_march.opening_balance) == "-300.00"
+    assert from_march.balances[0] == from_january.balances[2] == Decimal("-400.00")
+
+
+@pytest.mark.django_db
+def test_get_forecast_quantizes_an_empty_opening_balance():
+    forecast = ForecastRepository().get_forecast(1, date(2024, 1, 1), 1, "month")
+
+    assert str(forecast.opening_balance) == "0.00"
@@ -0,0 +1,53 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from budget.models import Incoming, IncomingCategory, MonthlyRollup
+from budget.repositories.category_cache import incoming_categories
+from budget.repositories.incoming import IncomingBulkCreateRepository, IncomingListRepository
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+def create_incomings(user_id: int, total: int):
+    category = IncomingCategory.objects.create(name="Test Category")
+    Incoming.objects.bulk_create(
+        [
+            Incoming(
+                user_id=user_id,
+                name=f"Incoming {index}",
+                amount=Decimal("10.00"),
+                launch_date=date.today(),
+                category=category,
+            )
+            for index in range(total)
+        ]
+    )
+
+
+def count_list_queries(user_id: int) -> int:
+    # Category names come from the category cache, loaded once per process.
+    incoming_categories.all()
+    with CaptureQueriesContext(connection) as context:
+        IncomingListRepository().get_incomings(user_id)
+    return len(context.captured_queries)
+
+
+@pytest.mark.django_db
+def test_get_incomings_query_count_does_not_grow_with_rows():
+    create_incomings(user_id=1, total=1)
+    create_incomings(user_id=2, total=25)
+
+    assert count_list_queries(1) == count_list_queries(2)
+
+
+@pytest.mark.django_db
+def test_create_incomings_inserts_every_item_and_updates_rollups():
+    category = IncomingCategory.objects.create(name="Salário")
+    items = [{"name": "Salário", "amount": Decimal("1000.00"), "launch_date": date(2024, month, 5), "category": category.id} for month in (1, 1, 2)]
+
+    result = IncomingBulkCreateRepository().create_incomings(items, user_id=1)
+
+    assert sorted(result.ids) == sorted(str(incoming_id) for incoming_id in Incoming.objects.values_list("id", flat=True))
+    rollups = dict(MonthlyRollup.objects.filter(user_id=1).values_list("month", "incomings"))
+    assert rollups == {date(2024, 1, 1): Decimal("2000.00"), date(2024, 2, 1): Decimal("1000.00")}
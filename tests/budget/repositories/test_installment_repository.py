@@ -0,0 +1,75 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from budget.domain.entities.installment import split_amount
+from budget.models import Installment, Revenue, RevenueCategory
+from budget.repositories.installment import InstallmentCreateRepository, InstallmentPayRepository, InstallmentRetrieveRepository
+
+
+@pytest.mark.parametrize(
+    ("total", "count", "expected"),
+    [
+        ("100.00", 3, ["33.34", "33.33", "33.33"]),
+        ("100.00", 4, ["25.00", "25.00", "25.00", "25.00"]),
+        ("0.05", 3, ["0.02", "0.02", "0.01"]),
+        ("1999.99", 12, ["166.67"] * 7 + ["166.66"] * 5),
+    ],
+)
+def test_split_amount_distributes_the_cents(total, count, expected):
+    amounts = split_amount(Decimal(total), count)
+
+    assert amounts == [Decimal(amount) for amount in expected]
+    assert sum(amounts) == Decimal(total)
+
+
+@pytest.fixture
+def revenue():
+    category = RevenueCategory.objects.create(name="Casa")
+    return Revenue.objects.create(user_id=1, name="Geladeira", amount=Decimal("1000.00"), expiration_date=date(2024, 1, 31), category=category)
+
+
+@pytest.mark.django_db
+def test_create_installment_plan_inserts_all_installments_at_once(revenue, django_assert_num_queries):
+    # Read the revenue and insert every installment, plus the savepoint pair of the transaction.
+    with django_assert_num_queries(4):
+        plan = InstallmentCreateRepository().create_installment_plan({"revenue": revenue.id, "periods": 3}, user_id=1)
+
+    assert [installment.due_date for installment in plan.installments] == [date(2024, 1, 31), date(2024, 2, 29), date(2024, 3, 31)]
+    assert [installment.amount for installment in plan.installments] == [Decimal("333.34"), Decimal("333.33"), Decimal("333.33")]
+    assert plan.amount == Decimal("1000.00")
+    assert Installment.objects.count() == 3
+
+
+@pytest.mark.django_db
+def test_create_installment_plan_rejects_a_second_plan(revenue):
+    InstallmentCreateRepository().create_installment_plan({"revenue": revenue.id, "periods": 2}, user_id=1)
+
+    with pytest.raises(ValueError):
+        InstallmentCreateRepository().create_installment_plan({"revenue": revenue.id, "periods": 2}, user_id=1)
+    assert InstallmentCreateRepository().create_installment_plan({"revenue": revenue.id, "periods": 2}, user_id=2) is None
+
+
+@pytest.mark.django_db
+def test_pay_installments_marks_the_next_ones_in_one_update(revenue, django_assert_num_queries):
+    InstallmentCreateRepository().create_installment_plan({"revenue": revenue.id, "periods": 4, "amount": "400.00"}, user_id=1)
+    InstallmentPayRepository().pay_installments(revenue.id, 1, 1)
+
+    with django_assert_num_queries(2):
+        plan = InstallmentPayRepository().pay_installments(revenue.id, 1, 2)
+
+    assert plan.periods_paid == 3
+    assert [installment.paid for installment in plan.installments] == [True, True, True, False]
+    assert plan.amount_paid == Decimal("300.00")
+
+
+@pytest.mark.django_db
+def test_pay_installments_stops_at_the_size_of_the_plan(revenue):
+    InstallmentCreateRepository().create_installment_plan({"revenue": revenue.id, "periods": 2}, user_id=1)
+
+    plan = InstallmentPayRepository().pay_installments(revenue.id, 1, 5)
+
+    assert plan.periods_paid == 2
+    assert all(installment.paid for installment in plan.installments)
+    assert InstallmentPayRepository().pay_installments(revenue.id, 2, 1) is None
+    assert InstallmentRetrieveRepository().get_installment_plan(revenue.id, 2) is None
@@ -0,0 +1,65 @@
+from datetime import timedelta
+
+import pytest
+from budget.models import Job
+from budget.repositories.job import JobEnqueueRepository, JobQueueRepository
+from django.test import override_settings
+from django.utils import timezone
+
+
+@pytest.fixture
+def job():
+    return JobEnqueueRepository().enqueue_job("noop", {"value": 1})
+
+
+@pytest.mark.django_db
+def test_claim_job_leases_the_job_once(job):
+    queue = JobQueueRepository()
+
+    claimed = queue.claim_job()
+
+    assert claimed.id == job.id
+    assert (claimed.status, claimed.attempts) == (Job.RUNNING, 1)
+    assert queue.claim_job() is None
+
+
+@pytest.mark.django_db
+def test_claim_job_skips_jobs_scheduled_later(job):
+    Job.objects.update(run_after=timezone.now() + timedelta(minutes=5))
+
+    assert JobQueueRepository().claim_job() is None
+
+
+@pytest.mark.django_db
+def test_expired_lease_is_claimed_again_and_stale_worker_cannot_finish(job):
+    queue = JobQueueRepository()
+    stale = queue.claim_job()
+    Job.objects.update(locked_until=timezone.now() - timedelta(seconds=1))
+
+    reclaimed = queue.claim_job()
+
+    assert reclaimed.attempts == 2
+    assert queue.complete_job(stale, {"done": True}) is False
+    assert queue.complete_job(reclaimed, {"done": True}) is True
+    assert Job.objects.get(id=job.id).result == {"done": True}
+
+
+@pytest.mark.django_db
+@override_settings(JOB_RETRY_BACKOFF_SECONDS=10, JOB_MAX_ATTEMPTS=2)
+def test_fail_job_backs_off_then_fails_for_good():
+    JobEnqueueRepository().enqueue_job("noop", {})
+    queue = JobQueueRepository()
+
+    first = queue.claim_job()
+    queue.fail_job(first, "boom", payload={"retry": True})
+    retried = Job.objects.get(id=first.id)
+    assert retried.status == Job.PENDING
+    assert retried.payload == {"retry": True}
+    assert retried.run_after > timezone.now() + timedelta(seconds=5)
+
+    Job.objects.update(run_after=timezone.now())
+    second = queue.claim_job()
+    queue.fail_job(second, "boom again")
+    failed = Job.objects.get(id=first.id)
+    assert (failed.status, failed.attempts, failed.last_error) == (Job.FAILED, 2, "boom again")
+    assert failed.finished_at is not None
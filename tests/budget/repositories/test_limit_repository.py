@@ -0,0 +1,73 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from budget.models import Limit, RevenueCategory
+from budget.repositories.limit import LimitListRepository
+from budget.repositories.revenue import RevenueCreateRepository
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+def create_limits(user_id: int, total: int):
+    category = RevenueCategory.objects.create(name="Test Category")
+    Limit.objects.bulk_create(
+        [
+            Limit(
+                user_id=user_id,
+                limit=Decimal("100.00"),
+                amount=Decimal("10.00"),
+                limit_date=date.today(),
+                category=category,
+            )
+            for _ in range(total)
+        ]
+    )
+
+
+def count_list_queries(user_id: int) -> int:
+    with CaptureQueriesContext(connection) as context:
+        LimitListRepository().get_limits(user_id)
+    return len(context.captured_queries)
+
+
+@pytest.mark.django_db
+def test_get_limits_query_count_does_not_grow_with_rows():
+    create_limits(user_id=1, total=1)
+    create_limits(user_id=2, total=25)
+
+    assert count_list_queries(1) == count_list_queries(2)
+
+
+@pytest.mark.django_db
+def test_get_limits_returns_consumption_of_the_limit_month(django_assert_num_queries):
+    category = RevenueCategory.objects.create(name="Casa")
+    other_category = RevenueCategory.objects.create(name="Lazer")
+    Limit.objects.create(user_id=1, limit=Decimal("100.00"), amount=0, limit_date=date(2024, 1, 15), category=category)
+    Limit.objects.create(user_id=1, limit=Decimal("500.00"), amount=0, limit_date=date(2024, 2, 1), category=category)
+    for amount, expiration_date, revenue_category in [
+        ("60.00", date(2024, 1, 1), category),
+        ("70.00", date(2024, 1, 31), category),
+        ("999.00", date(2024, 1, 10), other_category),
+        ("10.00", date(2024, 2, 5), category),
+    ]:
+        RevenueCreateRepository().create_revenue(
+            {"name": "Revenue", "amount": amount, "expiration_date": expiration_date, "paid": False, "category": revenue_category.id}, user_id=1
+        )
+
+    with django_assert_num_queries(1):
+        limits = LimitListRepository().get_limits(1)
+
+    assert [(limit.consumed, limit.over_limit) for limit in sorted(limits, key=lambda limit: limit.limit_date)] == [
+        (Decimal("130.00"), True),
+        (Decimal("10.00"), False),
+    ]
+
+
+@pytest.mark.django_db
+def test_get_limits_without_revenues_consumes_nothing():
+    create_limits(user_id=1, total=1)
+
+    [limit] = LimitListRepository().get_limits(1)
+
+    assert (limit.consumed, limit.over_limit) == (Decimal("0"), False)
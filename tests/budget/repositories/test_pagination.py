@@ -0,0 +1,62 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from budget.models import Revenue, RevenueCategory
+from budget.repositories.pagination import InvalidCursorError, decode_cursor, encode_cursor
+from budget.repositories.revenue import RevenueListRepository
+
+
+@pytest.fixture
+def revenues():
+    category = RevenueCategory.objects.create(name="Test Category")
+    return Revenue.objects.bulk_create(
+        [
+            Revenue(
+                user_id=1,
+                name=f"Revenue {index}",
+                amount=Decimal("10.00"),
+                expiration_date=date(2024, 1, 1) + timedelta(days=index % 3),
+                category=category,
+            )
+            for index in range(7)
+        ]
+    )
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor(date(2024, 1, 1), "6f0c3c1e-6a55-4c0b-9a51-0d1b1b0c6c1a")
+
+    assert decode_cursor(cursor) == ("2024-01-01", "6f0c3c1e-6a55-4c0b-9a51-0d1b1b0c6c1a")
+
+
+def test_decode_cursor_rejects_garbage():
+    with pytest.raises(InvalidCursorError):
+        decode_cursor("not-a-cursor")
+
+
+@pytest.mark.django_db
+def test_get_revenues_page_walks_every_record_once(revenues):
+    repository = RevenueListRepository()
+    seen = []
+    cursor = None
+    while True:
+        page = repository.get_revenues_page(1, cursor=cursor, page_size=3)
+        seen.extend(page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert len(seen) == len(revenues)
+    assert len({revenue.id for revenue in seen}) == len(revenues)
+    assert [(revenue.expiration_date, str(revenue.id)) for revenue in seen] == sorted(
+        (revenue.expiration_date, str(revenue.id)) for revenue in revenues
+    )
+
+
+@pytest.mark.django_db
+def test_get_revenues_page_last_page_has_no_cursor(revenues):
+    page = RevenueListRepository().get_revenues_page(1, page_size=len(revenues))
+
+    assert len(page.items) == len(revenues)
+    assert page.next_cursor is None
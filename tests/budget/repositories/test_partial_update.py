@@ -0,0 +1,69 @@
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from budget.models import Revenue, RevenueCategory
+from budget.repositories import partial_update
+from budget.repositories.partial_update import supports_update_returning, update_returning
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+@pytest.fixture
+def revenue():
+    category = RevenueCategory.objects.create(name="Test Category")
+    return Revenue.objects.create(
+        user_id=1,
+        name="Rent",
+        description="Monthly rent",
+        amount=Decimal("1000.00"),
+        expiration_date=date(2024, 1, 10),
+        category=category,
+    )
+
+
+@pytest.mark.django_db
+def test_update_returning_writes_only_supplied_fields(revenue):
+    updated = update_returning(Revenue.objects.filter(id=revenue.id, user_id=1), {"amount": Decimal("1200.50")})
+
+    assert updated.amount == Decimal("1200.50")
+    assert updated.name == "Rent"
+    assert updated.expiration_date == date(2024, 1, 10)
+    assert Revenue.objects.get(id=revenue.id).amount == Decimal("1200.50")
+
+
+@pytest.mark.django_db
+def test_update_returning_uses_a_single_statement(revenue):
+    with CaptureQueriesContext(connection) as context:
+        update_returning(Revenue.objects.filter(id=revenue.id, user_id=1), {"paid": True})
+
+    expected = 1 if supports_update_returning(connection) else 2
+    assert len(context.captured_queries) == expected
+
+
+@pytest.mark.django_db
+def test_update_returning_returns_none_for_another_user(revenue):
+    assert update_returning(Revenue.objects.filter(id=revenue.id, user_id=2), {"name": "Other"}) is None
+    assert Revenue.objects.get(id=revenue.id).name == "Rent"
+
+
+@pytest.mark.parametrize(
+    ("vendor", "sqlite_version", "expected"),
+    [("postgresql", (3, 0, 0), True), ("sqlite", (3, 35, 0), True), ("sqlite", (3, 34, 1), False), ("mysql", (3, 45, 0), False)],
+)
+def test_update_returning_is_only_used_where_supported(monkeypatch, vendor, sqlite_version, expected):
+    monkeypatch.setattr(partial_update.sqlite3, "sqlite_version_info", sqlite_version)
+
+    assert supports_update_returning(SimpleNamespace(vendor=vendor)) is expected
+
+
+@pytest.mark.django_db
+def test_update_returning_falls_back_to_update_then_select(monkeypatch, revenue):
+    monkeypatch.setattr(partial_update, "supports_update_returning", lambda connection: False)
+
+    with CaptureQueriesContext(connection) as context:
+        updated = update_returning(Revenue.objects.filter(id=revenue.id, user_id=1), {"paid": True})
+
+    assert updated.paid is True
+    assert [query["sql"].split()[0] for query in context.captured_queries] == ["UPDATE", "SELECT"]
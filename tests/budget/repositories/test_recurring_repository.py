@@ -0,0 +1,122 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from budget.domain.entities import Recurring as RecurringEntity
+from budget.models import Recurring, Revenue, RevenueCategory
+from budget.repositories.recurring import RecurringCreateRepository, RecurringExpandRepository, RecurringProjectionRepository
+
+
+def rule(period: int, period_unit: str, payment_date: date) -> RecurringEntity:
+    return RecurringEntity(
+        id="rule",
+        user_id=1,
+        revenue_id="revenue",
+        name="Aluguel",
+        category={},
+        amount=Decimal("100.00"),
+        payment_method=None,
+        payment_date=payment_date,
+        period=period,
+        period_unit=period_unit,
+        active=True,
+    )
+
+
+@pytest.mark.parametrize(
+    ("period", "period_unit", "payment_date", "start", "end", "expected"),
+    [
+        (
+            1,
+            "months",
+            date(2024, 1, 31),
+            date(2024, 1, 1),
+            date(2024, 4, 30),
+            [date(2024, 1, 31), date(2024, 2, 29), date(2024, 3, 31), date(2024, 4, 30)],
+        ),
+        (2, "weeks", date(2024, 1, 1), date(2024, 1, 10), date(2024, 2, 1), [date(2024, 1, 15), date(2024, 1, 29)]),
+        (10, "days", date(2020, 1, 1), date(2024, 1, 1), date(2024, 1, 20), [date(2024, 1, 10), date(2024, 1, 20)]),
+        (
+            1,
+            "years",
+            date(2020, 2, 29),
+            date(2021, 1, 1),
+            date(2024, 12, 31),
+            [date(2021, 2, 28), date(2022, 2, 28), date(2023, 2, 28), date(2024, 2, 29)],
+        ),
+        (3, "months", date(2024, 6, 15), date(2024, 1, 1), date(2024, 6, 14), []),
+    ],
+)
+def test_occurrences_between(period, period_unit, payment_date, start, end, expected):
+    assert list(rule(period, period_unit, payment_date).occurrences_between(start, end)) == expected
+
+
+@pytest.fixture
+def recurring():
+    category = RevenueCategory.objects.create(name="Casa")
+    revenue = Revenue.objects.create(user_id=1, name="Aluguel", amount=Decimal("1200.00"), expiration_date=date(2024, 1, 10), category=category)
+    entity = RecurringCreateRepository().create_recurring({"revenue": revenue.id, "period": 1, "period_unit": "months"}, user_id=1)
+    return Recurring.objects.get(id=entity.id)
+
+
+@pytest.mark.django_db
+def test_create_recurring_links_the_revenue_as_first_occurrence(recurring):
+    assert recurring.payment_date == date(2024, 1, 10)
+    assert recurring.amount == Decimal("1200.00")
+    assert Revenue.objects.get().recurring_rule == recurring
+
+
+@pytest.mark.django_db
+def test_create_recurring_requires_a_revenue_of_the_user(recurring):
+    assert RecurringCreateRepository().create_recurring({"revenue": recurring.revenue_id, "period": 1, "period_unit": "months"}, user_id=2) is None
+
+
+@pytest.mark.django_db
+def test_expand_recurring_is_idempotent(recurring, django_assert_num_queries):
+    # Find the users with rules to expand, then in a transaction (the savepoint pair): lock and
+    # read the rules, read the stored occurrences, bulk insert, upsert the rollups and move the mark.
+    with django_assert_num_queries(8):
+        created = RecurringExpandRepository().expand_recurring(date(2024, 4, 30))
+
+    assert created == 3
+    assert sorted(Revenue.objects.values_list("expiration_date", flat=True)) == [date(2024, month, 10) for month in range(1, 5)]
+    assert Recurring.objects.get().expanded_until == date(2024, 4, 30)
+    with django_assert_num_queries(1):
+        assert RecurringExpandRepository().expand_recurring(date(2024, 4, 30)) == 0
+    assert Revenue.objects.count() == 4
+
+
+@pytest.mark.django_db
+def test_expand_recurring_never_recreates_deleted_or_moved_occurrences(recurring):
+    RecurringExpandRepository().expand_recurring(date(2024, 3, 31))
+    Revenue.objects.filter(expiration_date=date(2024, 2, 10)).delete()
+    Revenue.objects.filter(expiration_date=date(2024, 3, 10)).update(expiration_date=date(2024, 3, 15))
+
+    assert RecurringExpandRepository().expand_recurring(date(2024, 5, 31)) == 2
+    assert sorted(Revenue.objects.values_list("expiration_date", flat=True)) == [
+        date(2024, 1, 10),
+        date(2024, 3, 15),
+        date(2024, 4, 10),
+        date(2024, 5, 10),
+    ]
+    projection = RecurringProjectionRepository().get_projection(1, date(2024, 1, 1), date(2024, 6, 30))
+    assert [occurrence.expiration_date for occurrence in projection] == [date(2024, 6, 10)]
+
+
+@pytest.mark.django_db
+def test_expand_recurring_runs_one_transaction_per_user(recurring, monkeypatch):
+    revenue = Revenue.objects.create(
+        user_id=2, name="Escola", amount=Decimal("500.00"), expiration_date=date(2024, 1, 5), category=recurring.revenue.category
+    )
+    RecurringCreateRepository().create_recurring({"revenue": revenue.id, "period": 1, "period_unit": "months"}, user_id=2)
+    expanded_users = []
+    expand_user = RecurringExpandRepository._expand_user
+
+    def record(self, until, user_id):
+        expanded_users.append(user_id)
+        return expand_user(self, until, user_id)
+
+    monkeypatch.setattr(RecurringExpandRepository, "_expand_user", record)
+
+    assert RecurringExpandRepository().expand_recurring(date(2024, 2, 29)) == 2
+    assert expanded_users == [1, 2]
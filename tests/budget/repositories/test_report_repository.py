@@ -0,0 +1,55 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from budget.models import Incoming, IncomingCategory, Limit, Revenue, RevenueCategory
+from budget.repositories import MonthlyReportRepository
+from budget.repositories.report import get_report_user_ids
+from budget.repositories.rollup import rebuild_monthly_rollups
+
+
+@pytest.fixture
+def month():
+    salary = IncomingCategory.objects.create(name="Salário")
+    home = RevenueCategory.objects.create(name="Casa")
+    Incoming.objects.create(user_id=1, name="Salário", amount=Decimal("3000.00"), launch_date=date(2024, 1, 5), category=salary)
+    Incoming.objects.create(user_id=1, name="Salário", amount=Decimal("3000.00"), launch_date=date(2024, 2, 5), category=salary)
+    Revenue.objects.create(user_id=1, name="Aluguel", amount=Decimal("1200.00"), expiration_date=date(2024, 1, 10), paid=True, category=home)
+    Revenue.objects.create(user_id=1, name="Luz", amount=Decimal("150.00"), expiration_date=date(2024, 1, 20), category=home)
+    Revenue.objects.create(user_id=3, name="Luz", amount=Decimal("10.00"), expiration_date=date(2024, 1, 20), category=home)
+    Limit.objects.create(user_id=1, limit=Decimal("1000.00"), amount=Decimal("1350.00"), limit_date=date(2024, 1, 1), category=home)
+    Limit.objects.create(user_id=1, limit=Decimal("1000.00"), amount=Decimal("0.00"), limit_date=date(2024, 2, 1), category=home)
+    rebuild_monthly_rollups()
+
+
+@pytest.mark.django_db
+def test_get_monthly_report_reads_the_rollups_and_limits_of_the_month(month, django_assert_num_queries):
+    with django_assert_num_queries(2):
+        report = MonthlyReportRepository().get_monthly_report(1, date(2024, 1, 1))
+
+    assert [category.to_dict() for category in report.categories] == [
+        {"name": "Casa", "incomings": Decimal("0.00"), "revenues_paid": Decimal("1200.00"), "revenues_unpaid": Decimal("150.00")},
+        {"name": "Salário", "incomings": Decimal("3000.00"), "revenues_paid": Decimal("0.00"), "revenues_unpaid": Decimal("0.00")},
+    ]
+    assert [limit.to_dict() for limit in report.limits] == [
+        {"category_name": "Casa", "limit": Decimal("1000.00"), "amount": Decimal("1350.00"), "exceeded": True},
+    ]
+    assert report.net == Decimal("1650.00")
+
+
+@pytest.mark.django_db
+def test_content_hash_changes_only_with_the_data(month):
+    repository = MonthlyReportRepository()
+    report = repository.get_monthly_report(1, date(2024, 1, 1))
+
+    assert repository.get_monthly_report(1, date(2024, 1, 1)).content_hash == report.content_hash
+    Revenue.objects.filter(name="Luz", user_id=1).update(paid=True)
+    rebuild_monthly_rollups([1])
+    assert repository.get_monthly_report(1, date(2024, 1, 1)).content_hash != report.content_hash
+
+
+@pytest.mark.django_db
+def test_get_report_user_ids_lists_users_with_records_in_the_month(month):
+    assert get_report_user_ids(date(2024, 1, 1)) == [1, 3]
+    assert get_report_user_ids(date(2024, 2, 1)) == [1]
+    assert get_report_user_ids(date(2024, 3, 1)) == []
@@ -0,0 +1,79 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from budget.models import MonthlyRollup, Revenue, RevenueCategory
+from budget.repositories.category_cache import revenue_categories
+from budget.repositories.revenue import RevenueBulkCreateRepository, RevenueListRepository
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+def create_revenues(user_id: int, total: int):
+    category = RevenueCategory.objects.create(name="Test Category")
+    Revenue.objects.bulk_create(
+        [
+            Revenue(
+                user_id=user_id,
+                name=f"Revenue {index}",
+                amount=Decimal("10.00"),
+                expiration_date=date.today(),
+                category=category,
+            )
+            for index in range(total)
+        ]
+    )
+
+
+def count_list_queries(user_id: int) -> int:
+    # Category names come from the category cache, loaded once per process.
+    revenue_categories.all()
+    with CaptureQueriesContext(connection) as context:
+        RevenueListRepository().get_revenues(user_id)
+    return len(context.captured_queries)
+
+
+@pytest.mark.django_db
+def test_get_revenues_query_count_does_not_grow_with_rows():
+    create_revenues(user_id=1, total=1)
+    create_revenues(user_id=2, total=25)
+
+    assert count_list_queries(1) == count_list_queries(2)
+
+
+@pytest.mark.django_db
+def test_get_revenues_returns_category():
+    create_revenues(user_id=1, total=2)
+
+    revenues = RevenueListRepository().get_revenues(1)
+
+    assert len(revenues) == 2
+    assert revenues[0].category["name"] == "Test Category"
+
+
+def revenue_item(category_id, **overrides) -> dict:
+    return {
+        "name": "Aluguel",
+        "amount": Decimal("300.00"),
+        "expiration_date": date(2024, 1, 10),
+        "paid": True,
+        "payment_date": date(2024, 1, 9),
+        "category": category_id,
+        **overrides,
+    }
+
+
+@pytest.mark.django_db
+def test_create_revenues_inserts_every_item_in_one_statement(django_assert_num_queries):
+    category = RevenueCategory.objects.create(name="Casa")
+    items = [revenue_item(category.id, expiration_date=date(2024, month, 10), paid=month == 1) for month in range(1, 13)] * 5
+
+    # Insert the revenues and upsert the rollups, plus the savepoint pair.
+    with django_assert_num_queries(4):
+        result = RevenueBulkCreateRepository().create_revenues(items, user_id=1)
+
+    assert len(result.ids) == 60
+    assert Revenue.objects.filter(user_id=1).count() == 60
+    assert Revenue.objects.filter(paid=False, payment_date__isnull=False).count() == 0
+    january = MonthlyRollup.objects.get(user_id=1, month=date(2024, 1, 1))
+    assert (january.revenues_paid, january.revenues_unpaid) == (Decimal("1500.00"), Decimal("0.00"))
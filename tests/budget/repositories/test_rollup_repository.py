@@ -0,0 +1,176 @@
+import importlib
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from budget.models import Incoming, IncomingCategory, MonthlyRollup, Revenue, RevenueCategory
+from budget.repositories import (
+    IncomingCreateRepository,
+    IncomingDeleteRepository,
+    IncomingUpdateRepository,
+    RevenueCreateRepository,
+    RevenueDeleteRepository,
+    RevenueUpdateRepository,
+)
+from budget.repositories.rollup import apply_rollup_deltas, incoming_rollup, rebuild_monthly_rollups
+from django.apps import apps
+from django.contrib import admin
+from django.core.management import call_command
+from django.db import connection
+
+
+def snapshot() -> dict:
+    rows = MonthlyRollup.objects.exclude(incomings=0, revenues_paid=0, revenues_unpaid=0)
+    return {
+        (row.user_id, row.month, row.category_id): (row.incomings, row.revenues_paid, row.revenues_unpaid)
+        for row in rows.order_by("user_id", "month")
+    }
+
+
+@pytest.fixture
+def categories():
+    return IncomingCategory.objects.create(name="Salário"), RevenueCategory.objects.create(name="Casa")
+
+
+@pytest.mark.django_db
+def test_repositories_keep_rollups_in_sync(categories):
+    incoming_category, revenue_category = categories
+    other_category = RevenueCategory.objects.create(name="Lazer")
+    incoming = IncomingCreateRepository().create_incoming(
+        {"name": "Salary", "amount": "1000.00", "launch_date": "2024-01-05", "category": incoming_category.id}, user_id=1
+    )
+    IncomingCreateRepository().create_incoming(
+        {"name": "Bonus", "amount": "250.00", "launch_date": "2024-01-20", "category": incoming_category.id}, user_id=1
+    )
+    revenue = RevenueCreateRepository().create_revenue(
+        {"name": "Rent", "amount": "300.00", "expiration_date": "2024-01-10", "paid": False, "category": revenue_category.id}, user_id=1
+    )
+    RevenueCreateRepository().create_revenue(
+        {"name": "Power", "amount": "80.00", "expiration_date": "2024-02-01", "paid": True, "category": revenue_category.id}, user_id=1
+    )
+
+    RevenueUpdateRepository().update_revenue(1, revenue.id, {"paid": True, "expiration_date": "2024-02-10", "category": other_category.id})
+    IncomingUpdateRepository().update_incoming(1, incoming.id, {"amount": "1100.00"})
+    IncomingUpdateRepository().update_incoming(1, incoming.id, {"name": "Renamed"})
+    IncomingDeleteRepository().delete_incoming(1, incoming.id)
+
+    incremental = snapshot()
+    rebuild_monthly_rollups()
+
+    assert incremental == snapshot()
+    assert incremental == {
+        (1, date(2024, 1, 1), incoming_category.id): (Decimal("250.00"), Decimal("0.00"), Decimal("0.00")),
+        (1, date(2024, 2, 1), revenue_category.id): (Decimal("0.00"), Decimal("80.00"), Decimal("0.00")),
+        (1, date(2024, 2, 1), other_category.id): (Decimal("0.00"), Decimal("300.00"), Decimal("0.00")),
+    }
+
+
+@pytest.mark.django_db
+def test_delete_missing_record_leaves_rollups_untouched(categories):
+    _, revenue_category = categories
+    RevenueCreateRepository().create_revenue(
+        {"name": "Rent", "amount": "300.00", "expiration_date": "2024-01-10", "paid": False, "category": revenue_category.id}, user_id=1
+    )
+    before = snapshot()
+
+    assert RevenueDeleteRepository().delete_revenue(2, "00000000-0000-0000-0000-000000000000") is False
+    assert snapshot() == before
+
+
+@pytest.mark.django_db
+def test_rebuild_command_only_touches_selected_users(categories, capsys):
+    incoming_category, _ = categories
+    for user_id in (1, 2):
+        IncomingCreateRepository().create_incoming(
+            {"name": "Salary", "amount": "1000.00", "launch_date": "2024-01-05", "category": incoming_category.id}, user_id=user_id
+        )
+    MonthlyRollup.objects.update(incomings=0)
+
+    call_command("rebuild_monthly_rollups", user_ids=[1], batch_size=1)
+
+    assert "Rebuilt 1 monthly rollup rows." in capsys.readouterr().out
+    assert MonthlyRollup.objects.get(user_id=1).incomings == Decimal("1000.00")
+    assert MonthlyRollup.objects.get(user_id=2).incomings == Decimal("0.00")
+
+
+@pytest.mark.django_db
+def test_apply_rollup_deltas_without_upsert_support(categories, monkeypatch):
+    incoming_category, _ = categories
+    monkeypatch.setattr(connection.features, "supports_update_conflicts_with_target", False)
+    for amount in ("100.00", "50.00"):
+        apply_rollup_deltas(incoming_rollup(1, amount, "2024-01-05", incoming_category.id))
+
+    assert MonthlyRollup.objects.get(user_id=1).incomings == Decimal("150.00")
+
+
+@pytest.mark.django_db
+def test_admin_changes_keep_rollups_in_sync(categories, rf):
+    incoming_category, revenue_category = categories
+    incoming_admin, revenue_admin = admin.site._registry[Incoming], admin.site._registry[Revenue]
+    request = rf.post("/")
+    incoming = Incoming(user_id=1, name="Salary", amount=Decimal("1000.00"), launch_date=date(2024, 1, 5), category=incoming_category)
+    incoming_admin.save_model(request, incoming, None, change=False)
+    revenue = Revenue(user_id=1, name="Rent", amount=Decimal("300.00"), expiration_date=date(2024, 1, 10), category=revenue_category)
+    revenue_admin.save_model(request, revenue, None, change=False)
+
+    revenue.paid = True
+    revenue.expiration_date = date(2024, 2, 10)
+    revenue_admin.save_model(request, revenue, None, change=True)
+    incoming_admin.delete_model(request, incoming)
+    assert snapshot() == {(1, date(2024, 2, 1), revenue_category.id): (Decimal("0.00"), Decimal("300.00"), Decimal("0.00"))}
+
+    revenue_admin.delete_queryset(request, Revenue.objects.all())
+    assert snapshot() == {}
+
+
+@pytest.mark.django_db
+def test_deleting_a_category_drops_its_rollups(categories):
+    incoming_category, revenue_category = categories
+    IncomingCreateRepository().create_incoming(
+        {"name": "Salary", "amount": "1000.00", "launch_date": "2024-01-05", "category": incoming_category.id}, user_id=1
+    )
+    RevenueCreateRepository().create_revenue(
+        {"name": "Rent", "amount": "300.00", "expiration_date": "2024-01-10", "paid": False, "category": revenue_category.id}, user_id=1
+    )
+
+    revenue_category.delete()
+
+    assert list(MonthlyRollup.objects.values_list("category_id", flat=True)) == [incoming_category.id]
+
+
+@pytest.mark.django_db
+def test_backfill_migration_rebuilds_the_rollups(categories):
+    incoming_category, revenue_category = categories
+    Incoming.objects.create(user_id=1, name="Salary", amount=Decimal("1000.00"), launch_date=date(2024, 1, 5), category=incoming_category)
+    Revenue.objects.create(user_id=2, name="Rent", amount=Decimal("300.00"), expiration_date=date(2024, 1, 10), category=revenue_category)
+    migration = importlib.import_module("budget.migrations.0018_backfill_monthly_rollups")
+
+    migration.backfill_monthly_rollups(apps, SimpleNamespace(connection=connection))
+
+    assert snapshot() == {
+        (1, date(2024, 1, 1), incoming_category.id): (Decimal("1000.00"), Decimal("0.00"), Decimal("0.00")),
+        (2, date(2024, 1, 1), revenue_category.id): (Decimal("0.00"), Decimal("0.00"), Decimal("300.00")),
+    }
+
+
+@pytest.mark.django_db
+def test_rebuild_fixes_each_user_in_place(categories):
+    incoming_category, revenue_category = categories
+    IncomingCreateRepository().create_incoming(
+        {"name": "Salary", "amount": "1000.00", "launch_date": "2024-01-05", "category": incoming_category.id}, user_id=1
+    )
+    RevenueCreateRepository().create_revenue(
+        {"name": "Rent", "amount": "300.00", "expiration_date": "2024-01-10", "paid": False, "category": revenue_category.id}, user_id=2
+    )
+    expected = snapshot()
+    kept = MonthlyRollup.objects.get(user_id=1).id
+    MonthlyRollup.objects.filter(user_id=1).update(incomings=0)
+    MonthlyRollup.objects.filter(user_id=2).delete()
+    apply_rollup_deltas(incoming_rollup(3, "50.00", "2024-01-05", incoming_category.id))
+
+    assert rebuild_monthly_rollups() == 2
+
+    assert snapshot() == expected
+    assert MonthlyRollup.objects.get(user_id=1).id == kept
+    assert not MonthlyRollup.objects.filter(user_id=3).exists()
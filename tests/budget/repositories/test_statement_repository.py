@@ -0,0 +1,72 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from budget.domain.entities import StatementLine
+from budget.models import Incoming, MonthlyRollup, Revenue
+from budget.repositories.statement import StatementImportRepository, fingerprint_lines
+
+
+def line(day: int, amount: str, description: str, bank_id: str | None = None) -> StatementLine:
+    return StatementLine(line_number=day, date=date(2024, 1, day), amount=Decimal(amount), description=description, bank_id=bank_id)
+
+
+def test_fingerprint_lines_keeps_equal_lines_of_the_same_day_apart():
+    hashes = [import_hash for import_hash, _ in fingerprint_lines([line(5, "-8.00", "Café"), line(5, "-8.00", "CAFÉ "), line(6, "-8.00", "Café")])]
+
+    assert len(set(hashes)) == 3
+    assert hashes == [
+        import_hash for import_hash, _ in fingerprint_lines([line(5, "-8.00", "Café"), line(5, "-8.00", "Café"), line(6, "-8.00", "Café")])
+    ]
+
+
+@pytest.mark.django_db
+def test_import_statement_keeps_equal_lines_of_a_day_that_are_not_adjacent():
+    lines = [line(5, "-8.00", "Café"), line(6, "-8.00", "Café"), line(5, "-8.00", "Café")]
+
+    assert len({import_hash for import_hash, _ in fingerprint_lines(lines)}) == 3
+    assert StatementImportRepository().import_statement(1, lines, []).to_dict()["duplicates"] == 0
+    assert StatementImportRepository().import_statement(1, lines, []).to_dict()["duplicates"] == 3
+
+
+@pytest.mark.django_db
+def test_import_statement_maps_lines_with_rules_and_updates_rollups():
+    lines = [line(5, "3000.00", "Salario ACME"), line(6, "-25.90", "UBER *TRIP"), line(7, "-99.00", "Loja qualquer")]
+    rules = [{"pattern": "uber", "category": "Transporte"}]
+
+    result = StatementImportRepository().import_statement(1, lines, rules)
+
+    assert result.to_dict() == {"incomings": 1, "revenues": 2, "duplicates": 0, "errors": []}
+    assert Incoming.objects.get().category.name == "Outros"
+    revenues = {revenue.name: revenue for revenue in Revenue.objects.select_related("category")}
+    assert revenues["UBER *TRIP"].category.name == "Transporte"
+    assert revenues["UBER *TRIP"].amount == Decimal("25.90")
+    assert revenues["UBER *TRIP"].paid
+    assert revenues["Loja qualquer"].category.name == "Outros"
+    totals = MonthlyRollup.objects.filter(user_id=1).values_list("incomings", "revenues_paid")
+    assert sum(incomings for incomings, _ in totals) == Decimal("3000.00")
+    assert sum(paid for _, paid in totals) == Decimal("124.90")
+
+
+@pytest.mark.django_db
+def test_import_statement_skips_lines_already_imported():
+    StatementImportRepository().import_statement(1, [line(5, "-8.00", "Café"), line(6, "-12.00", "Pão", bank_id="A1")], [])
+
+    result = StatementImportRepository().import_statement(
+        1, [line(5, "-8.00", "Café"), line(5, "-8.00", "Café"), line(6, "-12.00", "Pão", bank_id="A1")], []
+    )
+
+    assert (result.revenues, result.duplicates) == (1, 2)
+    assert Revenue.objects.count() == 3
+
+
+@pytest.mark.django_db
+def test_import_statement_query_count_grows_with_batches_not_lines(django_assert_num_queries):
+    lines = (line(day, "-1.00" if day % 2 else "1.00", f"Item {day}") for day in range(1, 31))
+
+    # Two category lookups, then per batch of 10: two hash lookups, two inserts, one rollup
+    # upsert and the savepoint pair.
+    with django_assert_num_queries(2 + 3 * 7):
+        result = StatementImportRepository(batch_size=10).import_statement(1, lines, [])
+
+    assert (result.incomings, result.revenues) == (15, 15)
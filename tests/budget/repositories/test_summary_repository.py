@@ -0,0 +1,66 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from budget.models import Incoming, IncomingCategory, Revenue, RevenueCategory
+from budget.repositories.rollup import rebuild_monthly_rollups
+from budget.repositories.summary import SummaryRepository
+
+
+@pytest.fixture
+def categories():
+    return IncomingCategory.objects.create(name="Salário"), RevenueCategory.objects.create(name="Casa")
+
+
+def create_incoming(category, user_id: int, amount: str, launch_date: date):
+    Incoming.objects.create(user_id=user_id, name="Incoming", amount=Decimal(amount), launch_date=launch_date, category=category)
+
+
+def create_revenue(category, user_id: int, amount: str, expiration_date: date, paid: bool = False):
+    Revenue.objects.create(
+        user_id=user_id,
+        name="Revenue",
+        amount=Decimal(amount),
+        expiration_date=expiration_date,
+        paid=paid,
+        category=category,
+    )
+
+
+@pytest.mark.django_db
+def test_get_monthly_summary_groups_totals_by_month(categories, django_assert_num_queries):
+    incoming_category, revenue_category = categories
+    create_incoming(incoming_category, 1, "1000.00", date(2024, 1, 5))
+    create_incoming(incoming_category, 1, "500.00", date(2024, 1, 20))
+    create_revenue(revenue_category, 1, "300.00", date(2024, 1, 10), paid=True)
+    create_revenue(revenue_category, 1, "200.00", date(2024, 1, 15))
+    create_revenue(revenue_category, 1, "80.00", date(2024, 2, 1))
+    create_incoming(incoming_category, 2, "999.00", date(2024, 1, 5))
+    rebuild_monthly_rollups()
+
+    with django_assert_num_queries(1):
+        summary = SummaryRepository().get_monthly_summary(1)
+
+    assert [month.to_dict() for month in summary] == [
+        {
+            "month": "2024-01",
+            "incomings": Decimal("1500.00"),
+            "revenues": Decimal("500.00"),
+            "revenues_paid": Decimal("300.00"),
+            "revenues_unpaid": Decimal("200.00"),
+            "net": Decimal("1000.00"),
+        },
+        {
+            "month": "2024-02",
+            "incomings": Decimal("0.00"),
+            "revenues": Decimal("80.00"),
+            "revenues_paid": Decimal("0.00"),
+            "revenues_unpaid": Decimal("80.00"),
+            "net": Decimal("-80.00"),
+        },
+    ]
+
+
+@pytest.mark.django_db
+def test_get_monthly_summary_is_empty_without_records():
+    assert SummaryRepository().get_monthly_summary(1) == []
@@ -0,0 +1,39 @@
+from datetime import date
+from decimal import Decimal
+
+from budget.utils.alert_templates import get_alert_email_templates, render_alert_email
+from django.core.management import call_command
+
+ALERT = {"name": "Aluguel <casa>", "expiration_date": date(2024, 3, 5), "amount": Decimal("1234.56")}
+
+
+def test_render_alert_email_formats_for_pt_br():
+    subject, text, html = render_alert_email(ALERT)
+
+    assert subject == "Alerta de despesa Aluguel <casa> - GammaBudget"
+    assert "Data de vencimento: 05/03/2024" in text
+    assert "R$ 1.234,56" in text
+    assert "R$ 1.234,56" in html
+
+
+def test_render_alert_email_escapes_only_the_html_body():
+    _, text, html = render_alert_email(ALERT)
+
+    assert "Despesa: Aluguel <casa>" in text
+    assert "Aluguel &lt;casa&gt;" in html
+
+
+def test_alert_email_templates_are_compiled_once():
+    get_alert_email_templates.cache_clear()
+    render_alert_email(ALERT)
+    render_alert_email(ALERT)
+
+    assert get_alert_email_templates.cache_info().misses == 1
+
+
+def test_benchmark_alert_emails_reports_both_renderers(capsys):
+    call_command("benchmark_alert_emails", count=20)
+
+    out = capsys.readouterr().out
+    assert "cached templates" in out
+    assert "compiled per message" in out
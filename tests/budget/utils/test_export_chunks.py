@@ -0,0 +1,54 @@
+import gzip
+import zlib
+
+import pytest
+from asgiref.sync import async_to_sync
+from budget.utils import export
+from budget.utils.export import acsv_chunks, agzip_chunks, andjson_chunks, csv_chunks, gzip_chunks, ndjson_chunks
+
+
+def test_csv_chunks_sends_the_header_before_reading_rows():
+    def rows():
+        raise AssertionError("rows read before the header was sent")
+        yield {}
+
+    assert next(csv_chunks(rows(), ("a", "b"))) == b"a,b\r\n"
+
+
+def test_csv_chunks_splits_large_exports(monkeypatch):
+    monkeypatch.setattr(export, "EXPORT_BUFFER_SIZE", 10)
+
+    chunks = list(csv_chunks(({"a": index} for index in range(20)), ("a",)))
+
+    assert len(chunks) > 3
+    assert b"".join(chunks).decode().split() == ["a", *map(str, range(20))]
+
+
+def test_gzip_chunks_flushes_the_first_chunk():
+    chunks = gzip_chunks(iter([b"header\n", b"row\n"]))
+
+    first = next(chunks)
+    decompressor = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+    assert decompressor.decompress(first) == b"header\n"
+    assert decompressor.decompress(b"".join(chunks)) == b"row\n"
+
+
+async def arows(rows):
+    for row in rows:
+        yield row
+
+
+@async_to_sync
+async def collect(chunks):
+    return [chunk async for chunk in chunks]
+
+
+@pytest.mark.parametrize("buffer_size", [10, 64 * 1024])
+def test_async_chunks_match_the_sync_ones(monkeypatch, buffer_size):
+    monkeypatch.setattr(export, "EXPORT_BUFFER_SIZE", buffer_size)
+    rows = [{"a": index, "b": f"row {index}"} for index in range(20)]
+
+    assert collect(acsv_chunks(arows(rows), ("a", "b"))) == list(csv_chunks(rows, ("a", "b")))
+    assert collect(andjson_chunks(arows(rows))) == list(ndjson_chunks(rows))
+    compressed = b"".join(collect(agzip_chunks(andjson_chunks(arows(rows)))))
+    assert gzip.decompress(compressed) == b"".join(ndjson_chunks(rows))
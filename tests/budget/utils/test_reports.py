@@ -0,0 +1,97 @@
+import os
+import subprocess
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from budget.domain.entities import MonthlyReport, ReportCategory, ReportLimit
+from budget.models import Incoming, IncomingCategory
+from budget.repositories.rollup import rebuild_monthly_rollups
+from budget.utils import reports
+from budget.utils.reports import generate_monthly_reports, get_report_pdf, html_to_pdf, prune_report_pdfs, render_report_html
+
+
+@pytest.fixture
+def report():
+    return MonthlyReport(
+        user_id=1,
+        month=date(2024, 1, 1),
+        categories=[ReportCategory("Casa", Decimal("0.00"), Decimal("1200.00"), Decimal("150.00"))],
+        limits=[ReportLimit("Casa", Decimal("1000.00"), Decimal("1350.00"))],
+    )
+
+
+@pytest.fixture
+def pdf_renderer(settings, tmp_path, mocker):
+    settings.MEDIA_ROOT = tmp_path
+    return mocker.patch.object(reports, "html_to_pdf", return_value=b"%PDF-1.4")
+
+
+def test_render_report_html_formats_for_pt_br(report):
+    html = render_report_html(report)
+
+    assert "Extrato de Janeiro/2024" in html
+    assert "R$ 1.200,00" in html
+    assert "R$ -1.350,00" in html
+    assert '<tr class="exceeded">' in html
+
+
+def test_get_report_pdf_is_rendered_once_per_content(report, pdf_renderer, tmp_path):
+    path, rendered = get_report_pdf(report)
+    assert rendered
+    assert (tmp_path / path).read_bytes() == b"%PDF-1.4"
+
+    assert get_report_pdf(report) == (path, False)
+    assert pdf_renderer.call_count == 1
+
+    report.categories[0].revenues_unpaid = Decimal("0.00")
+    new_path, rendered = get_report_pdf(report)
+    assert rendered
+    assert new_path != path
+    # The PDF of the previous data may still be served by a concurrent request.
+    assert (tmp_path / path).exists()
+
+
+def test_prune_report_pdfs_keeps_newer_pdfs(report, pdf_renderer, tmp_path):
+    old_path, _ = get_report_pdf(report)
+    report.categories[0].revenues_unpaid = Decimal("0.00")
+    current_path, _ = get_report_pdf(report)
+    report.categories[0].revenues_unpaid = Decimal("1.00")
+    newer_path, _ = get_report_pdf(report)
+    os.utime(tmp_path / old_path, (1, 1))
+    os.utime(tmp_path / current_path, (2, 2))
+    report.categories[0].revenues_unpaid = Decimal("0.00")
+
+    assert prune_report_pdfs(report, current_path) == 1
+    assert sorted(file.name for file in (tmp_path / "reports" / "1").iterdir()) == sorted(
+        path.rsplit("/", 1)[1] for path in (current_path, newer_path)
+    )
+
+
+def test_html_to_pdf_reports_wkhtmltopdf_errors(settings, mocker):
+    mocker.patch.object(subprocess, "run", return_value=subprocess.CompletedProcess([], 1, b"", b"Exit with code 1"))
+    with pytest.raises(RuntimeError, match="Exit with code 1"):
+        html_to_pdf("<p>report</p>")
+
+    mocker.stopall()
+    settings.WKHTMLTOPDF_CMD = "/missing/wkhtmltopdf"
+    with pytest.raises(RuntimeError, match="Could not run wkhtmltopdf"):
+        html_to_pdf("<p>report</p>")
+
+
+@pytest.mark.django_db
+def test_generate_monthly_reports_skips_cached_reports(pdf_renderer, tmp_path):
+    category = IncomingCategory.objects.create(name="Salário")
+    for user_id in (1, 2):
+        Incoming.objects.create(user_id=user_id, name="Salário", amount=Decimal("10.00"), launch_date=date(2024, 1, 5), category=category)
+    rebuild_monthly_rollups()
+
+    assert generate_monthly_reports(date(2024, 1, 31)) == {"month": "2024-01", "rendered": 2, "cached": 0, "failed": 0}
+    stale = tmp_path / "reports" / "1" / "2024-01-stale.pdf"
+    stale.write_bytes(b"%PDF-1.4")
+    os.utime(stale, (1, 1))
+    assert generate_monthly_reports(date(2024, 1, 1)) == {"month": "2024-01", "rendered": 0, "cached": 2, "failed": 0}
+    assert not stale.exists()
+
+    pdf_renderer.side_effect = RuntimeError("wkhtmltopdf failed")
+    assert generate_monthly_reports(date(2024, 1, 1), [3]) == {"month": "2024-01", "rendered": 0, "cached": 0, "failed": 1}
@@ -0,0 +1,140 @@
+from datetime import UTC, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+from budget.models import Job, ScheduledRun
+from budget.repositories.scheduled_run import ScheduledRunRepository
+from budget.utils.scheduler import Cron, Interval, Schedule, Scheduler, enqueue_alert_emails
+
+SAO_PAULO = ZoneInfo("America/Sao_Paulo")
+
+
+class FakeClock:
+    """Clock returning a time the test can move forward."""
+
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_interval_slots_are_aligned():
+    assert Interval(300).next_after(datetime(2024, 1, 1, 10, 7, 30, tzinfo=UTC)) == datetime(2024, 1, 1, 10, 10, tzinfo=UTC)
+
+
+@pytest.mark.parametrize(
+    ("expression", "after", "expected"),
+    [
+        ("0 8 * * *", datetime(2024, 1, 1, 7, 59), datetime(2024, 1, 1, 8, 0)),
+        ("0 8 * * *", datetime(2024, 1, 1, 8, 0), datetime(2024, 1, 2, 8, 0)),
+        ("*/15 * * * *", datetime(2024, 1, 1, 10, 16), datetime(2024, 1, 1, 10, 30)),
+        ("30 3 * * 0", datetime(2024, 1, 1, 12, 0), datetime(2024, 1, 7, 3, 30)),
+        ("0 0 1 2 *", datetime(2024, 3, 1, 0, 0), datetime(2025, 2, 1, 0, 0)),
+        ("0 9 1-7 * 1", datetime(2024, 1, 2, 10, 0), datetime(2024, 1, 3, 9, 0)),
+    ],
+)
+def test_cron_next_after(expression, after, expected):
+    cron = Cron(expression, tz=SAO_PAULO)
+
+    assert cron.next_after(after.replace(tzinfo=SAO_PAULO)) == expected.replace(tzinfo=SAO_PAULO)
+
+
+@pytest.mark.parametrize("expression", ["* * * *", "60 * * * *", "0 0 31 2 *"])
+def test_cron_rejects_invalid_expressions(expression):
+    with pytest.raises(ValueError):
+        Cron(expression, tz=SAO_PAULO).next_after(datetime(2024, 1, 1, tzinfo=SAO_PAULO))
+
+
+@pytest.mark.django_db
+def test_scheduler_runs_due_schedules_and_records_them():
+    calls = []
+    clock = FakeClock(datetime(2024, 1, 1, 10, 0, 30, tzinfo=UTC))
+    scheduler = Scheduler([Schedule("tick", Interval(60), lambda: calls.append(clock()) or {"ok": True})], clock=clock)
+
+    assert scheduler.run_pending() == []
+    assert scheduler.seconds_until_next_run() == 30
+
+    clock.now += timedelta(seconds=30)
+    [(_, run)] = scheduler.run_pending()
+
+    assert len(calls) == 1
+    assert run.status == ScheduledRun.SUCCEEDED
+    assert run.result == {"ok": True}
+    assert run.scheduled_for == datetime(2024, 1, 1, 10, 1, tzinfo=UTC)
+    assert scheduler.next_runs["tick"][0] == datetime(2024, 1, 1, 10, 2, tzinfo=UTC)
+
+
+@pytest.mark.django_db
+def test_scheduler_records_failures():
+    def fail():
+        raise RuntimeError("boom")
+
+    clock = FakeClock(datetime(2024, 1, 1, 10, 0, tzinfo=UTC))
+    scheduler = Scheduler([Schedule("fail", Interval(60), fail)], clock=clock)
+    clock.now += timedelta(minutes=1)
+
+    [(_, run)] = scheduler.run_pending()
+
+    assert run.status == ScheduledRun.FAILED
+    assert run.error == "RuntimeError: boom"
+
+
+@pytest.mark.django_db
+def test_scheduler_coalesces_slots_missed_by_a_long_run():
+    clock = FakeClock(datetime(2024, 1, 1, 10, 0, tzinfo=UTC))
+
+    def slow():
+        clock.now += timedelta(minutes=5, seconds=10)
+
+    scheduler = Scheduler([Schedule("slow", Interval(60), slow)], clock=clock)
+    clock.now += timedelta(minutes=1)
+    scheduler.run_pending()
+
+    assert scheduler.next_runs["slow"][0] == datetime(2024, 1, 1, 10, 7, tzinfo=UTC)
+    assert ScheduledRun.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_slot_runs_once_across_schedulers():
+    calls = []
+    schedule = Schedule("once", Interval(60), lambda: calls.append(1))
+    slot = datetime(2024, 1, 1, 10, 0, tzinfo=UTC)
+
+    assert Scheduler([schedule]).run(schedule, slot) is not None
+    assert Scheduler([schedule]).run(schedule, slot) is None
+    assert calls == [1]
+
+
+@pytest.mark.django_db
+def test_run_is_skipped_while_previous_run_is_in_progress():
+    ScheduledRun.objects.create(name="busy", scheduled_for=datetime(2024, 1, 1, 10, 0, tzinfo=UTC))
+
+    assert ScheduledRunRepository().start_run("busy", datetime(2024, 1, 1, 10, 1, tzinfo=UTC)) is None
+    assert ScheduledRun.objects.get(scheduled_for=datetime(2024, 1, 1, 10, 1, tzinfo=UTC)).status == ScheduledRun.SKIPPED
+
+
+@pytest.mark.django_db
+def test_enqueue_alert_emails_runs_the_use_case():
+    result = enqueue_alert_emails()
+
+    assert Job.objects.get(id=result["job_id"]).status == Job.PENDING
+
+
+@pytest.mark.django_db
+def test_scheduler_prunes_runs_older_than_the_retention(settings):
+    settings.SCHEDULER_RUN_RETENTION_DAYS = 30
+    repository = ScheduledRunRepository()
+    for name in ("tick", "other"):
+        old = repository.start_run(name, datetime(2024, 1, 1, 10, 0, tzinfo=UTC))
+        repository.finish_run(old, result={})
+    ScheduledRun.objects.update(started_at=datetime(2000, 1, 1, tzinfo=UTC))
+    clock = FakeClock(datetime(2024, 1, 1, 10, 1, tzinfo=UTC))
+    scheduler = Scheduler([Schedule("tick", Interval(60), dict)], clock=clock)
+
+    scheduler.run(scheduler.schedules[0], clock())
+
+    assert sorted(ScheduledRun.objects.values_list("name", "scheduled_for")) == [
+        ("other", datetime(2024, 1, 1, 10, 0, tzinfo=UTC)),
+        ("tick", datetime(2024, 1, 1, 10, 1, tzinfo=UTC)),
+    ]
@@ -0,0 +1,166 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from smtplib import SMTPRecipientsRefused
+
+import pytest
+from budget.models import Alert, AlertDelivery, Revenue, RevenueCategory
+from budget.repositories.alert_delivery import AlertDeliveryRepository
+from budget.utils import SendEmail
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.utils import timezone
+
+
+class RecordingBackend(EmailBackend):
+    """In-memory email backend that counts SMTP sessions and refuses some recipients."""
+
+    def __init__(self, refused=(), **kwargs):
+        super().__init__(**kwargs)
+        self.refused = set(refused)
+        self.sessions = 0
+
+    def open(self):
+        self.sessions += 1
+        return True
+
+    def send_messages(self, messages):
+        for message in messages:
+            if self.refused & set(message.to):
+                raise SMTPRecipientsRefused({address: (550, b"refused") for address in message.to})
+        return super().send_messages(messages)
+
+
+class DisconnectingBackend(RecordingBackend):
+    """Backend whose server goes away after the first session."""
+
+    def open(self):
+        if self.sessions:
+            raise ConnectionRefusedError("connection refused")
+        return super().open()
+
+
+class UnreachableBackend(RecordingBackend):
+    """Backend whose server cannot be reached."""
+
+    def open(self):
+        raise ConnectionRefusedError("connection refused")
+
+
+@pytest.fixture
+def alerts():
+    category = RevenueCategory.objects.create(name="Casa")
+    revenue = Revenue.objects.create(user_id=1, name="Aluguel", amount=Decimal("1200.00"), expiration_date=date.today(), category=category)
+    for index in range(5):
+        Alert.objects.create(user_id=1, user_email=f"user{index}@example.com", revenue=revenue, message="", alert_date=date.today())
+    Alert.objects.create(user_id=1, user_email="later@example.com", revenue=revenue, message="", alert_date=date.today() + timedelta(days=1))
+
+
+@pytest.mark.django_db
+def test_send_today_alerts_queries_and_sessions_grow_with_batches(alerts, django_assert_num_queries):
+    backend = RecordingBackend()
+
+    # Ledger rows are created with two queries; each of the 3 batches is claimed, loaded
+    # and marked sent with three, and a last claim finds nothing left.
+    with django_assert_num_queries(2 + 3 * 3 + 2):
+        results = SendEmail(connection=backend, batch_size=2).send_today_alerts()
+
+    assert len(mail.outbox) == 5
+    assert backend.sessions == 3
+    assert all(result.sent for result in results)
+    assert "later@example.com" not in {result.recipient for result in results}
+    assert "Aluguel" in mail.outbox[0].alternatives[0][0]
+
+
+@pytest.mark.django_db
+def test_send_today_alerts_reports_failures_per_recipient(alerts):
+    backend = RecordingBackend(refused={"user1@example.com"})
+
+    results = SendEmail(connection=backend, batch_size=10).send_today_alerts()
+
+    failed = [result.to_dict() for result in results if not result.sent]
+    assert [result["recipient"] for result in failed] == ["user1@example.com"]
+    assert failed[0]["error"]
+    assert len(mail.outbox) == 4
+
+
+@pytest.mark.django_db
+def test_send_today_alerts_without_alerts():
+    assert SendEmail(connection=RecordingBackend()).send_today_alerts() == []
+
+
+@pytest.mark.django_db
+def test_send_today_alerts_twice_sends_each_alert_once(alerts):
+    SendEmail(connection=RecordingBackend()).send_today_alerts()
+
+    assert SendEmail(connection=RecordingBackend()).send_today_alerts() == []
+    assert len(mail.outbox) == 5
+    assert AlertDelivery.objects.filter(status=AlertDelivery.SENT).count() == 5
+
+
+@pytest.mark.django_db
+def test_failed_deliveries_are_retried_without_resending_the_others(alerts):
+    SendEmail(connection=RecordingBackend(refused={"user1@example.com"})).send_today_alerts()
+
+    retried = SendEmail(connection=RecordingBackend()).send_today_alerts()
+
+    assert [result.recipient for result in retried] == ["user1@example.com"]
+    assert len(mail.outbox) == 5
+
+
+@pytest.mark.django_db
+def test_concurrent_claims_never_overlap(alerts):
+    ledger = AlertDeliveryRepository()
+    ledger.create_deliveries(date.today())
+
+    first = ledger.claim_deliveries(date.today(), limit=3)
+    second = ledger.claim_deliveries(date.today(), limit=3)
+
+    assert len(first) == 3
+    assert len(second) == 2
+    assert not {delivery["id"] for delivery in first} & {delivery["id"] for delivery in second}
+    assert ledger.claim_deliveries(date.today(), limit=3) == []
+
+
+@pytest.mark.django_db
+def test_expired_claims_are_taken_over(alerts):
+    ledger = AlertDeliveryRepository()
+    ledger.create_deliveries(date.today())
+    ledger.claim_deliveries(date.today(), limit=5)
+    AlertDelivery.objects.update(claimed_until=timezone.now() - timedelta(seconds=1))
+
+    assert len(ledger.claim_deliveries(date.today(), limit=5)) == 5
+
+
+@pytest.mark.django_db
+def test_failed_deliveries_stop_after_the_maximum_attempts(alerts, settings):
+    settings.ALERT_DELIVERY_MAX_ATTEMPTS = 2
+    refusing = RecordingBackend(refused={"user1@example.com"})
+
+    attempts = [len(SendEmail(connection=refusing).send_today_alerts()) for _ in range(3)]
+
+    assert attempts == [5, 1, 0]
+    delivery = AlertDelivery.objects.get(alert__user_email="user1@example.com")
+    assert (delivery.status, delivery.attempts) == (AlertDelivery.FAILED, 2)
+
+
+@pytest.mark.django_db
+def test_failed_reconnect_fails_the_rest_of_the_batch_and_stops(alerts):
+    refused = {f"user{index}@example.com" for index in range(5)}
+
+    results = SendEmail(connection=DisconnectingBackend(refused=refused), batch_size=3).send_today_alerts()
+
+    assert [result.sent for result in results] == [False, False, False]
+    assert all("Could not reconnect" in result.error for result in results[1:])
+    assert AlertDelivery.objects.filter(status=AlertDelivery.FAILED).count() == 3
+    assert AlertDelivery.objects.filter(status=AlertDelivery.PENDING).count() == 2
+
+
+@pytest.mark.django_db
+def test_failed_open_fails_the_claimed_batch_and_stops(alerts):
+    results = SendEmail(connection=UnreachableBackend(), batch_size=3).send_today_alerts()
+
+    assert len(results) == 3
+    assert all(not result.sent and "Could not connect" in result.error for result in results)
+    assert not AlertDelivery.objects.filter(status=AlertDelivery.SENDING).exists()
+    assert AlertDelivery.objects.filter(status=AlertDelivery.FAILED).count() == 3
+    assert AlertDeliveryRepository().get_undelivered_recipients(date.today()) == [f"user{index}@example.com" for index in range(5)]
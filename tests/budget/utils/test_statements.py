@@ -0,0 +1,56 @@
+import io
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from budget.utils import statements
+from budget.utils.statements import StatementReader, parse_amount
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("-1.234,56", "-1234.56"),
+        ("1,234.56", "1234.56"),
+        ("R$ 10,5", "10.50"),
+        ("-42", "-42.00"),
+    ],
+)
+def test_parse_amount_accepts_both_decimal_separators(text, expected):
+    assert parse_amount(text) == Decimal(expected)
+
+
+def test_read_csv_maps_columns_by_header_and_reports_bad_lines():
+    stream = io.StringIO("Data;Histórico;Valor\n05/01/2024;SALARIO;3.000,00\n06/01/2024;UBER;abc\n\n07/01/2024;MERCADO;-150,30\n")
+    reader = StatementReader(stream, "csv")
+
+    lines = list(reader)
+
+    assert [(line.date, line.amount, line.description) for line in lines] == [
+        (date(2024, 1, 5), Decimal("3000.00"), "SALARIO"),
+        (date(2024, 1, 7), Decimal("-150.30"), "MERCADO"),
+    ]
+    assert reader.errors == ["Line 3: Invalid amount 'abc'."]
+
+
+def test_read_csv_requires_the_amount_column():
+    with pytest.raises(ValueError, match="header"):
+        list(StatementReader(io.StringIO("date,description\n2024-01-05,SALARIO\n"), "csv"))
+
+
+def test_read_ofx_finds_transactions_split_across_chunks(monkeypatch):
+    monkeypatch.setattr(statements, "OFX_CHUNK_SIZE", 16)
+    transactions = "".join(
+        f"<STMTTRN>\n<TRNTYPE>DEBIT\n<DTPOSTED>2024010{day}120000[-3:BRT]\n<TRNAMT>-{day}0.00\n<FITID>{day}\n<MEMO>Compra &amp; cia\n</STMTTRN>\n"
+        for day in (1, 2, 3)
+    )
+    stream = io.StringIO(f"OFXHEADER:100\nDATA:OFXSGML\n\n<OFX><BANKTRANLIST>{transactions}</BANKTRANLIST></OFX>")
+
+    lines = list(StatementReader(stream, "ofx"))
+
+    assert [(line.date, line.amount, line.bank_id) for line in lines] == [
+        (date(2024, 1, 1), Decimal("-10.00"), "1"),
+        (date(2024, 1, 2), Decimal("-20.00"), "2"),
+        (date(2024, 1, 3), Decimal("-30.00"), "3"),
+    ]
+    assert lines[0].description == "Compra & cia"
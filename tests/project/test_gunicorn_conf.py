@@ -0,0 +1,34 @@
+import os
+
+import pytest
+from project.gunicorn_conf import cpu_limit, default_workers
+
+
+@pytest.fixture
+def cpus():
+    return float(len(os.sched_getaffinity(0)))
+
+
+def test_cpu_limit_reads_the_cgroup_v2_quota(tmp_path, cpus):
+    (tmp_path / "cpu.max").write_text("50000 100000\n")
+
+    assert cpu_limit(tmp_path) == min(0.5, cpus)
+
+
+def test_cpu_limit_reads_the_cgroup_v1_quota(tmp_path, cpus):
+    (tmp_path / "cpu").mkdir()
+    (tmp_path / "cpu" / "cpu.cfs_quota_us").write_text("25000\n")
+    (tmp_path / "cpu" / "cpu.cfs_period_us").write_text("100000\n")
+
+    assert cpu_limit(tmp_path) == min(0.25, cpus)
+
+
+def test_cpu_limit_without_quota_uses_the_available_cpus(tmp_path, cpus):
+    assert cpu_limit(tmp_path) == cpus
+    (tmp_path / "cpu.max").write_text("max 100000\n")
+    assert cpu_limit(tmp_path) == cpus
+
+
+@pytest.mark.parametrize(("limit", "workers"), [(0.25, 3), (1, 3), (1.5, 5), (4, 9)])
+def test_default_workers_counts_partial_cores_as_whole(limit, workers):
+    assert default_workers(limit) == workers
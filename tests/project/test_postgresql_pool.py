@@ -0,0 +1,81 @@
+import os
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ImproperlyConfigured
+from django.test import Client
+from project.postgresql_pool.base import DatabaseWrapper, pool_stats
+
+
+@pytest.fixture
+def wrapper():
+    settings_dict = {
+        "ENGINE": "project.postgresql_pool",
+        "NAME": "postgres",
+        "USER": "postgres",
+        "PASSWORD": "postgres",
+        "HOST": "localhost",
+        "PORT": 5432,
+        "OPTIONS": {"pool": {"min_size": 0, "max_size": 4, "timeout": 1}},
+        "CONN_MAX_AGE": 0,
+        "CONN_HEALTH_CHECKS": True,
+        "TIME_ZONE": None,
+        "AUTOCOMMIT": True,
+        "ATOMIC_REQUESTS": False,
+        "TEST": {},
+    }
+    wrapper = DatabaseWrapper(settings_dict, alias="pooled")
+    yield wrapper
+    pool = DatabaseWrapper._pools.pop("pooled", None)
+    if pool is not None:
+        pool.close()
+
+
+def test_pool_is_created_closed_with_the_pool_options(wrapper):
+    pool = wrapper.pool
+
+    assert pool is wrapper.pool
+    assert pool.closed
+    assert (pool.min_size, pool.max_size, pool.timeout) == (0, 4, 1)
+    assert pool.kwargs["autocommit"] is True
+    assert "pool" not in pool.kwargs
+
+
+def test_pool_rejects_persistent_connections(wrapper):
+    wrapper.settings_dict["CONN_MAX_AGE"] = 60
+
+    with pytest.raises(ImproperlyConfigured):
+        _ = wrapper.pool
+
+
+def test_pool_stats_reports_saturation_and_wait_time(wrapper):
+    assert wrapper.pool.closed
+
+    stats = pool_stats()["pooled"]
+
+    assert stats["pool_max"] == 4
+    assert stats["saturation"] == 0
+    assert stats["checkout_wait_ms_avg"] == 0
+
+
+@pytest.mark.django_db
+def test_db_pool_metrics_view(wrapper):
+    assert wrapper.pool.closed
+    client = Client()
+    client.force_login(get_user_model().objects.create_user("staff", "staff@example.com", is_staff=True))
+
+    response = client.get("/metrics/db-pool/")
+
+    assert response.status_code == 200
+    assert response.json()["pid"] == os.getpid()
+    assert response.json()["pools"]["pooled"]["pool_max"] == 4
+
+
+@pytest.mark.django_db
+def test_db_pool_metrics_view_is_staff_only():
+    client = Client()
+    anonymous = client.get("/metrics/db-pool/")
+    client.force_login(get_user_model().objects.create_user("user", "user@example.com"))
+
+    assert anonymous.status_code == 302
+    assert client.get("/metrics/db-pool/").status_code == 302
@@ -0,0 +1,23 @@
+import importlib
+
+import pytest
+from project import settings as project_settings
+
+
+@pytest.fixture
+def reload_settings(monkeypatch):
+    def reload(**environ):
+        for name, value in environ.items():
+            monkeypatch.setenv(name, value)
+        return importlib.reload(project_settings)
+
+    yield reload
+    monkeypatch.undo()
+    importlib.reload(project_settings)
+
+
+@pytest.mark.parametrize(("server_mode", "conn_max_age"), [("wsgi", 60), ("asgi", 0)])
+def test_asgi_closes_connections_after_every_request(reload_settings, server_mode, conn_max_age):
+    settings = reload_settings(SERVER_MODE=server_mode, DB_CONN_MAX_AGE="60", DB_POOL="false")
+
+    assert settings.DATABASES["default"]["CONN_MAX_AGE"] == conn_max_age